@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Ağ paylaşımları için klasör değişiklik zamanlarına bakan uyarlamalı yoklama modülü
+"""
+
+import os
+import logging
+import sys
+import threading
+from watchdog.events import FileCreatedEvent
+
+
+logger = logging.getLogger(__name__)
+
+
+# GetDriveType'ın ağ sürücüsü için döndürdüğü değer
+DRIVE_REMOTE = 4
+
+# Linux'ta ağ üzerinden bağlanan dosya sistemi türleri
+NETWORK_FILESYSTEMS = {"cifs", "smb3", "smbfs", "nfs", "nfs4", "sshfs", "fuse.sshfs", "9p"}
+
+
+def is_network_path(path):
+    """Yolun ağ paylaşımında (UNC yolu, eşlenmiş sürücü ya da ağ bağlama noktası) olup olmadığını döndürür"""
+    if path.startswith(("\\\\", "//")):
+        return True
+    path = os.path.abspath(path)
+    if sys.platform == "win32":
+        import ctypes
+        drive = os.path.splitdrive(path)[0]
+        return bool(drive) and ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+    
+    # En uzun eşleşen bağlama noktasının dosya sistemi türüne bakılır
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f if len(line.split()) >= 3]
+    except OSError:
+        return False
+    best, best_type = "", None
+    for mount_point, fs_type in mounts:
+        if (path == mount_point or path.startswith(mount_point.rstrip("/") + "/")) and len(mount_point) > len(best):
+            best, best_type = mount_point, fs_type
+    return best_type in NETWORK_FILESYSTEMS
+
+
+class AdaptivePoller(threading.Thread):
+    """Klasör ağacını yalnızca değişiklik zamanı değişen klasörleri listeleyerek yoklayan izleyici
+
+    Bir klasöre dosya eklenince, silinince ya da adı değişince klasörün değişiklik zamanı
+    güncellenir. Her turda klasör başına tek bir stat yapılır; yalnızca değişen klasörler
+    yeniden listelenir ve yeni dosyalar olay işleyicisine watchdog olayı olarak verilir.
+    Observer ile aynı start/stop/join arayüzünü sunar.
+    """
+    
+    def __init__(self, folder, handler, interval=5.0, max_depth=None):
+        super().__init__(name=f"AdaptivePoller-{os.path.basename(folder) or folder}", daemon=True)
+        self.folder = folder
+        self.handler = handler
+        self.interval = interval
+        self.max_depth = max_depth
+        self.directories = {}  # klasör -> (değişiklik zamanı, derinlik, alt klasörler, dosyalar)
+        self.available = True
+        self.last_stat_count = 0  # son turda yapılan stat sayısı
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        """İlk taramada mevcut dosyaları bildirmeden kaydeder, ardından aralıklarla yoklar"""
+        self._scan_directory(self.folder, 0, report=False)
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # Beklenmeyen bir hata izlemeyi sonlandırmaz, sonraki turda yeniden denenir
+                logger.error("Klasör yoklama hatası (%s): %s", self.folder, e)
+    
+    def stop(self):
+        """Yoklamayı durdurur"""
+        self._stop_event.set()
+    
+    def poll(self):
+        """Bir yoklama turu yapar; değişen klasörleri listeler ve yeni dosyaları bildirir"""
+        stat_count = 0
+        for path in list(self.directories):
+            entry = self.directories.get(path)
+            if entry is None:
+                # Bu turda üst klasörüyle birlikte silindi
+                continue
+            stat_count += 1
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError as e:
+                if path == self.folder:
+                    # Ağ bağlantısı koptu; bilinen durum korunur, bağlantı gelince kaldığı yerden sürer
+                    if self.available:
+                        logger.warning("İzlenen klasöre erişilemiyor: %s: %s", self.folder, e)
+                        self.available = False
+                    break
+                self._forget(path)
+                continue
+            
+            if path == self.folder and not self.available:
+                logger.info("İzlenen klasöre yeniden erişildi: %s", self.folder)
+                self.available = True
+            if mtime != entry[0]:
+                self._scan_directory(path, entry[1], report=True)
+        self.last_stat_count = stat_count
+    
+    def _scan_directory(self, path, depth, report):
+        """Klasörü listeler, yeni dosyaları bildirir ve alt klasörleri derinlik sınırına kadar izlemeye alır"""
+        try:
+            # Değişiklik zamanı listelemeden önce okunur; listeleme sırasında gelen dosya sonraki turda görülür
+            mtime = os.stat(path).st_mtime_ns
+            with os.scandir(path) as iterator:
+                entries = list(iterator)
+        except OSError:
+            return
+        
+        files, subdirs = set(), set()
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.add(entry.path)
+                else:
+                    files.add(entry.path)
+            except OSError:
+                continue
+        
+        previous = self.directories.get(path)
+        old_subdirs, old_files = (previous[2], previous[3]) if previous else (set(), set())
+        self.directories[path] = (mtime, depth, subdirs, files)
+        
+        if report:
+            for file_path in sorted(files - old_files):
+                self.handler.dispatch(FileCreatedEvent(file_path))
+        for removed in old_subdirs - subdirs:
+            self._forget(removed)
+        if self.max_depth is None or depth < self.max_depth:
+            for subdir in sorted(subdirs - old_subdirs):
+                self._scan_directory(subdir, depth + 1, report)
+    
+    def _forget(self, path):
+        """Silinen klasörü ve altındaki tüm klasörleri izlemeden çıkarır"""
+        entry = self.directories.pop(path, None)
+        if entry is not None:
+            for subdir in entry[2]:
+                self._forget(subdir)
\ No newline at end of file
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Çok sayıda küçük dosyayı tek biriktirici işinde basmak için PDF birleştirme modülü
+"""
+
+import io
+import os
+from PIL import Image, ImageDraw
+from PyPDF2 import PdfReader, PdfWriter
+
+from imposition import PAPER_SIZES_PT
+from raster_pdf import page_pixels, page_to_pdf, mm_to_pixels
+from text_renderer import load_font
+
+
+# Ayraç sayfası yalnızca yazı içerdiğinden düşük çözünürlükte çizilir
+SEPARATOR_DPI = 150
+
+# Ayraç sayfasındaki yazı boyutları (nokta)
+SEPARATOR_TITLE_SIZE = 20
+SEPARATOR_TEXT_SIZE = 12
+
+# Ayraç sayfasında denenen yazı tipleri (Windows, ardından Linux)
+SEPARATOR_FONTS = ["arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"]
+
+
+def render_separator_page(file_name, index, total, page_count, paper_size="A4", dpi=SEPARATOR_DPI):
+    """Birleştirilmiş işte dosyanın başına konan, adını ve sırasını gösteren ayraç sayfasını çizer"""
+    width, height = page_pixels(paper_size, dpi)
+    margin = mm_to_pixels(20, dpi)
+    page = Image.new("1", (width, height), 1)
+    draw = ImageDraw.Draw(page)
+    title_font = load_font(None, round(SEPARATOR_TITLE_SIZE * dpi / 72.0), SEPARATOR_FONTS)
+    text_font = load_font(None, round(SEPARATOR_TEXT_SIZE * dpi / 72.0), SEPARATOR_FONTS)
+    
+    # Uzun dosya adları sayfa genişliğine sığacak şekilde kısaltılır
+    name = file_name
+    while len(name) > 4 and draw.textlength(name, font=title_font) > width - 2 * margin:
+        name = name[:-4] + "…"
+    
+    y = height // 3
+    draw.text((width // 2, y), f"{index}/{total}", fill=0, font=text_font, anchor="mm")
+    y += title_font.size * 2
+    draw.text((width // 2, y), name, fill=0, font=title_font, anchor="mm")
+    y += title_font.size * 2
+    draw.text((width // 2, y), f"{page_count} sayfa", fill=0, font=text_font, anchor="mm")
+    draw.line((margin, y + text_font.size * 2, width - margin, y + text_font.size * 2), fill=0, width=3)
+    return page
+
+
+def merge_documents(sources, output_path, paper_size="A4", separator_pages=False, duplex=False):
+    """PDF'leri sırayla tek dosyada birleştirir ve her dosyanın sayfa hesabını döndürür
+    
+    sources (dosya_yolu, pdf_yolu) çiftlerinden oluşur. Arkalı önlü basımda her dosya
+    ve ayraç yeni bir kağıdın ön yüzünden başlasın diye gerekirse boş sayfa eklenir.
+    Dönen liste her dosya için (dosya_yolu, ilk_sayfa, sayfa_sayısı) içerir.
+    """
+    paper_width, paper_height = PAPER_SIZES_PT.get(paper_size, PAPER_SIZES_PT["A4"])
+    writer = PdfWriter()
+    accounting = []
+    
+    def start_on_front():
+        if duplex and len(writer.pages) % 2:
+            writer.add_blank_page(paper_width, paper_height)
+    
+    for index, (file_path, pdf_path) in enumerate(sources, start=1):
+        reader = PdfReader(pdf_path)
+        page_count = len(reader.pages)
+        
+        if separator_pages:
+            start_on_front()
+            separator = render_separator_page(
+                os.path.basename(file_path), index, len(sources), page_count, paper_size
+            )
+            writer.add_page(PdfReader(io.BytesIO(page_to_pdf(separator, SEPARATOR_DPI))).pages[0])
+            separator.close()
+        
+        start_on_front()
+        accounting.append((file_path, len(writer.pages), page_count))
+        for page in reader.pages:
+            writer.add_page(page)
+    
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    return accounting
\ No newline at end of file
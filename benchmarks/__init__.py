@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Klasör izleme, yazdırma kuyruğu ve dönüştürme hızını ölçen kıyaslama paketi
+
+Yazıcı gerekmez; işler bellek içi biriktiriciye (LocalSpooler) gönderilir.
+Kullanım (depo kökünden):
+    python -m benchmarks run --output sonuc.json
+    python -m benchmarks compare eski.json yeni.json
+"""
\ No newline at end of file
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Kıyaslama paketinin komut satırı arayüzü (çalıştırma ve sonuç karşılaştırma)
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+
+
+# Depo kökü; paket "python -m benchmarks" ile kökten çalıştırılır
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tam ve hızlı çalıştırma ölçekleri
+FULL_SCALE = {"watch_files": 25, "queue_jobs": 200, "repeats": 3, "gui_files": 30}
+QUICK_SCALE = {"watch_files": 8, "queue_jobs": 50, "repeats": 1, "gui_files": 12}
+
+# Karşılaştırmada yön belirtmeyen (bilgi amaçlı) alanlar
+INFO_KEYS = {"count", "files", "size", "depth", "jobs", "printers", "workers", "repeats", "file_size",
+             "spool_jobs", "spool_submissions", "detected", "missed", "unexpected", "completed", "failed",
+             "unfinished", "failures", "peak_spool_concurrency", "speed", "events", "trace_seconds",
+             "substituted", "submit_errors", "beats", "jobs_finished", "stall_threshold_ms"}
+
+SUITES = ("watcher", "queue", "conversion", "gui")
+
+# Uygulamanın trafik izi; ev dizini yalıtılmadan önce çözülür (traffic_recorder.TRAFFIC_FILE ile aynı)
+TRAFFIC_FILE = os.path.join(os.path.expanduser("~"), ".mukaprint", "traffic.jsonl")
+
+
+def _isolate_home():
+    """Önbellek, günlük ve iz dosyaları gerçek ~/.mukaprint'e yazılmasın diye geçici ev dizini kullanır
+    
+    Modüller yolları içe aktarılırken hesapladığından bu işlem içe aktarmalardan önce yapılır.
+    """
+    home = tempfile.mkdtemp(prefix="mukaprint_bench_home_")
+    os.environ["HOME"] = home
+    os.environ["USERPROFILE"] = home
+    return home
+
+
+def _prepare_run():
+    """Ev dizinini yalıtır, depo kökünü yola ekler ve Qt uygulama nesnesini oluşturur"""
+    home = _isolate_home()
+    sys.path.insert(0, REPO_DIR)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    
+    # Arayüz kıyaslaması ekransız ortamda (CI, uzak bağlantı) da pencere oluşturabilsin
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    
+    # Qt nesneleri (sinyaller, zamanlayıcılar, pencereler) için uygulama nesnesi gerekir
+    app = QApplication.instance() or QApplication([])
+    return home, app
+
+
+def _result_header(scale):
+    """Sonuç dosyasının ölçülen commit ve makine bilgilerini içeren başlığını döndürür"""
+    from benchmarks.common import SCHEMA_VERSION, git_revision, environment_info
+    return {
+        "schema": SCHEMA_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git": git_revision(REPO_DIR),
+        "environment": environment_info(),
+        "scale": scale,
+        "suites": {}
+    }
+
+
+def _write_results(results, output):
+    """Sonuçları dosyaya ya da standart çıktıya JSON olarak yazar"""
+    from benchmarks.common import max_rss_bytes
+    results["peak_rss_bytes"] = max_rss_bytes()
+    
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Sonuçlar yazıldı: {output}")
+    else:
+        print(text)
+
+
+def run_benchmarks(args):
+    """Seçilen kıyaslamaları çalıştırır ve sonuçları JSON olarak yazar"""
+    home, app = _prepare_run()
+    scale = QUICK_SCALE if args.quick else FULL_SCALE
+    suites = args.suite or list(SUITES)
+    results = _result_header("quick" if args.quick else "full")
+    try:
+        for suite in suites:
+            print(f"Kıyaslama: {suite}", flush=True)
+            started = time.perf_counter()
+            if suite == "watcher":
+                from benchmarks import bench_watcher
+                results["suites"][suite] = bench_watcher.run(count=args.files or scale["watch_files"])
+            elif suite == "queue":
+                from benchmarks import bench_queue
+                results["suites"][suite] = bench_queue.run(job_count=args.jobs or scale["queue_jobs"])
+            elif suite == "conversion":
+                from benchmarks import bench_conversion
+                results["suites"][suite] = bench_conversion.run(repeats=args.repeats or scale["repeats"])
+            elif suite == "gui":
+                from benchmarks import bench_responsiveness
+                results["suites"][suite] = bench_responsiveness.run(count=args.files or scale["gui_files"])
+            print(f"  {time.perf_counter() - started:.1f} sn", flush=True)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+    _write_results(results, args.output)
+    return 0
+
+
+def replay_traffic(args):
+    """Kaydedilen (ya da yapay) dükkan trafiğini sahte biriktiriciye karşı yeniden oynatır"""
+    if not 1 <= args.speed <= 50:
+        print("Oynatma hızı 1 ile 50 kat arasında olmalı", file=sys.stderr)
+        return 2
+    overrides = {}
+    for item in args.set or []:
+        key, _, value = item.partition("=")
+        try:
+            overrides[key] = json.loads(value)
+        except ValueError:
+            overrides[key] = value
+    # İz yolları ev dizini geçici dizinle değiştirilmeden önce çözülür
+    paths = [os.path.abspath(path) for path in args.traffic] or [TRAFFIC_FILE]
+    if not args.synthetic:
+        missing = [path for path in paths if not os.path.exists(path)]
+        if missing:
+            print(f"Trafik izi bulunamadı: {', '.join(missing)} (kayıt için traffic_recording ayarını açın)",
+                  file=sys.stderr)
+            return 1
+    
+    home, app = _prepare_run()
+    from benchmarks import replay
+    try:
+        events = replay.synthetic_traffic(args.seed, args.duration) if args.synthetic else replay.load_traffic(paths)
+        if not events:
+            print("İzde oynatılacak olay yok", file=sys.stderr)
+            return 1
+        print(f"Oynatılıyor: {len(events)} olay, {args.speed:g} kat hız", flush=True)
+        results = _result_header("synthetic" if args.synthetic else "recorded")
+        results["suites"]["replay"] = replay.run(
+            events, speed=args.speed, max_idle=args.max_idle, pages_per_minute=args.ppm,
+            job_overhead=args.overhead, workers=args.workers, observer=args.observer,
+            config_overrides=overrides
+        )
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+    _write_results(results, args.output)
+    return 0
+
+
+def flatten(data, prefix=""):
+    """İç içe sonuçları "paket.senaryo.ölçüm" anahtarlı sayısal değerlere düzleştirir"""
+    values = {}
+    for key, value in data.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            values.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[name] = value
+    return values
+
+
+def compare_results(args):
+    """İki sonuç dosyasını karşılaştırır; eşiği aşan gerilemeleri işaretler"""
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)
+    
+    old_values = flatten(baseline.get("suites", {}))
+    new_values = flatten(candidate.get("suites", {}))
+    print(f"Temel: {baseline.get('git', {}).get('commit')}  Aday: {candidate.get('git', {}).get('commit')}")
+    print(f"{'ölçüm':<52} {'temel':>12} {'aday':>12} {'fark':>9}")
+    
+    regressions = 0
+    for name in sorted(set(old_values) | set(new_values)):
+        old, new = old_values.get(name), new_values.get(name)
+        if old is None or new is None:
+            print(f"{name:<52} {_format(old):>12} {_format(new):>12} {'-':>9}")
+            continue
+        change = (new - old) / old * 100 if old else 0.0
+        marker = ""
+        if name.rsplit(".", 1)[-1] not in INFO_KEYS and abs(change) >= args.threshold:
+            # "_per_sec" / "_per_min" ölçümlerinde artış, süre ve bellek ölçümlerinde azalma iyidir
+            worse = change < 0 if name.endswith(("_per_sec", "_per_min")) else change > 0
+            marker = " GERİLEME" if worse else " iyileşme"
+            regressions += worse
+        print(f"{name:<52} {_format(old):>12} {_format(new):>12} {change:>+8.1f}%{marker}")
+    
+    print(f"{regressions} ölçümde %{args.threshold:g} üzeri gerileme")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def _format(value):
+    """Tablo hücresi için sayıyı biçimlendirir"""
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+
+def main(argv=None):
+    """Komut satırı argümanlarını işler"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="MUKAprint kıyaslamaları")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    run_parser = commands.add_parser("run", help="kıyaslamaları çalıştır")
+    run_parser.add_argument("--suite", action="append", choices=SUITES, help="yalnızca bu paketi çalıştır")
+    run_parser.add_argument("--quick", action="store_true", help="küçük ölçekle hızlı çalıştır")
+    run_parser.add_argument("--files", type=int, help="izleyici senaryosu ve arayüz kıyaslaması başına dosya sayısı")
+    run_parser.add_argument("--jobs", type=int, help="kuyruk kıyaslamasındaki iş sayısı")
+    run_parser.add_argument("--repeats", type=int, help="dönüştürme ölçüm tekrarı")
+    run_parser.add_argument("--output", "-o", help="sonuçların yazılacağı JSON dosyası")
+    run_parser.set_defaults(handler=run_benchmarks)
+    
+    replay_parser = commands.add_parser("replay", help="kaydedilen dükkan trafiğini yeniden oynat")
+    replay_parser.add_argument("traffic", nargs="*", help=f"trafik izi dosyaları (varsayılan: {TRAFFIC_FILE})")
+    replay_parser.add_argument("--speed", type=float, default=10.0, help="oynatma hızı, 1-50 kat")
+    replay_parser.add_argument("--max-idle", type=float, default=300.0,
+                               help="bundan uzun sessiz aralıklar bu süreye kısaltılır (saniye, 0: kısaltma)")
+    replay_parser.add_argument("--synthetic", action="store_true", help="kayıt yerine yapay dükkan günü oynat")
+    replay_parser.add_argument("--seed", type=int, default=0, help="yapay trafik tohumu")
+    replay_parser.add_argument("--duration", type=float, default=3600.0, help="yapay trafiğin süresi (saniye)")
+    replay_parser.add_argument("--ppm", type=float, default=30.0, help="sahte yazıcının dakikadaki sayfası")
+    replay_parser.add_argument("--overhead", type=float, default=5.0, help="sahte yazıcının iş başına ek süresi")
+    replay_parser.add_argument("--workers", type=int, help="kuyruk çalışanı sayısı (varsayılan: yazıcı sayısı)")
+    replay_parser.add_argument("--observer", choices=("native", "polling"), default="native", help="izleyici türü")
+    replay_parser.add_argument("--set", action="append", metavar="AYAR=DEĞER",
+                               help="yapılandırmayı değiştir, değer JSON olarak okunur (ör. prerender_enabled=true)")
+    replay_parser.add_argument("--output", "-o", help="sonuçların yazılacağı JSON dosyası")
+    replay_parser.set_defaults(handler=replay_traffic)
+    
+    compare_parser = commands.add_parser("compare", help="iki sonuç dosyasını karşılaştır")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="işaretlenecek en küçük fark (%%)")
+    compare_parser.add_argument("--fail-on-regression", action="store_true", help="gerileme varsa 1 ile çık")
+    compare_parser.set_defaults(handler=compare_results)
+    
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
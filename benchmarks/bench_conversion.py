@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Her dosya türü için dönüştürme ve biriktiriciye gönderim süresini ve belleğini ölçen kıyaslama
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import importlib.util
+
+from spooler import LocalSpooler
+from converter import find_libreoffice
+from document_processor import DocumentProcessor
+from benchmarks.common import (
+    summarize, measure_peak_memory, make_pdf, make_image, make_text, make_workbook
+)
+
+
+# Ölçülen örnekler: ad -> (dosya adı, üretici)
+SAMPLES = {
+    "pdf_small": ("kucuk.pdf", lambda path: make_pdf(path, 5)),
+    "pdf_large": ("buyuk.pdf", lambda path: make_pdf(path, 200)),
+    "jpg": ("foto.jpg", lambda path: make_image(path)),
+    "png": ("ekran.png", lambda path: make_image(path, size=(1600, 1000))),
+    "txt": ("metin.txt", lambda path: make_text(path)),
+    "xlsx": ("tablo.xlsx", lambda path: make_workbook(path))
+}
+
+
+def _make_docx(path):
+    """python-docx kuruluysa birkaç sayfalık Word belgesi üretir"""
+    from docx import Document
+    document = Document()
+    for index in range(60):
+        document.add_paragraph(f"Paragraf {index + 1}: " + "MUKAprint dönüştürme kıyaslaması. " * 8)
+    document.save(path)
+    return path
+
+
+def _touch(path):
+    """Dosyanın değişiklik zamanını ilerletir; önbellek anahtarı değiştiğinden dönüştürme tekrarlanır"""
+    stamp = time.time_ns() + 10 ** 9
+    os.utime(path, ns=(stamp, stamp))
+
+
+def run(repeats=3, formats=None):
+    """Her örneği repeats kez yazdırıp süreleri, bir kez de bellek kullanımını ölçer"""
+    work_dir = tempfile.mkdtemp(prefix="mukaprint_bench_convert_")
+    spooler = LocalSpooler(pages_per_minute=10 ** 7)
+    processor = DocumentProcessor({"spooler_backend": "local"}, spooler=spooler)
+    printer = spooler.list_printers()[0]
+    
+    samples = dict(SAMPLES)
+    skipped = {}
+    if find_libreoffice() is None:
+        skipped["docx"] = "LibreOffice bulunamadı"
+    elif importlib.util.find_spec("docx") is None:
+        skipped["docx"] = "python-docx kurulu değil"
+    else:
+        samples["docx"] = ("belge.docx", _make_docx)
+    
+    results = {}
+    try:
+        for name, (file_name, factory) in samples.items():
+            if formats and name not in formats:
+                continue
+            print(f"  dönüştürme: {name}", flush=True)
+            path = factory(os.path.join(work_dir, file_name))
+            is_office = name == "docx"
+            
+            def print_once():
+                if is_office:
+                    _touch(path)
+                before = len(spooler.submissions)
+                started = time.perf_counter()
+                success = processor.print_document(path, printer)
+                return time.perf_counter() - started, success, len(spooler.submissions) - before
+            
+            durations, failures, submissions = [], 0, 0
+            for _ in range(repeats):
+                duration, success, submissions = print_once()
+                durations.append(duration)
+                failures += 0 if success else 1
+            _, peak = measure_peak_memory(print_once)
+            results[name] = {
+                "file_size": os.path.getsize(path),
+                "repeats": repeats,
+                "failures": failures,
+                "spool_jobs": submissions,
+                "seconds": summarize(durations),
+                "peak_python_bytes": peak
+            }
+    finally:
+        processor.converter_pool.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    for name, reason in skipped.items():
+        results[name] = {"skipped": reason}
+    return results
\ No newline at end of file
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Yazdırma kuyruğunun sahte biriktiriciyle saniyede tamamladığı iş sayısını ölçen kıyaslama
+"""
+
+import os
+import time
+import shutil
+import tempfile
+
+from spooler import LocalSpooler
+from document_processor import DocumentProcessor
+from print_queue import PrintQueue, FINAL_STATES
+from job_journal import JobJournal
+from benchmarks.common import summarize, make_pdf, wait_until
+
+
+def run(job_count=200, printer_count=4, workers=4, pages=(1, 2, 5), spool_tracking=True):
+    """İşleri kuyruğa gönderir ve tümü sonuçlanana kadar geçen süreyi ölçer"""
+    work_dir = tempfile.mkdtemp(prefix="mukaprint_bench_queue_")
+    printers = tuple(f"Yazıcı {index + 1}" for index in range(printer_count))
+    # Yazıcı hızı sınırsıza yakın; ölçülen süre yazılımın kendi yüküdür
+    spooler = LocalSpooler(printers=printers, pages_per_minute=10 ** 7)
+    config = {
+        "spooler_backend": "local",
+        "queue_workers": workers,
+        "spool_tracking": spool_tracking,
+        "spool_poll_interval": 0.05,
+        "health_poll_interval": 3600
+    }
+    processor = DocumentProcessor(config, spooler=spooler)
+    queue = PrintQueue(processor, config, journal=JobJournal(os.path.join(work_dir, "jobs.jsonl"),
+                                                             final_states=FINAL_STATES))
+    sources = [make_pdf(os.path.join(work_dir, f"is_{count}.pdf"), count) for count in pages]
+    
+    jobs = []
+    try:
+        queue.start()
+        started_wall = time.time()
+        started = time.perf_counter()
+        submit_times = []
+        for index in range(job_count):
+            submit_started = time.perf_counter()
+            jobs.append(queue.submit(sources[index % len(sources)], printers[index % len(printers)],
+                                     source=f"kaynak_{index % 3}"))
+            submit_times.append(time.perf_counter() - submit_started)
+        submitted = time.perf_counter()
+        # İşlerin bitişi durumları üzerinden izlenir; kuyruğun kendi zaman damgaları kullanılır
+        wait_until(lambda: all(job.state in FINAL_STATES for job in jobs), timeout=job_count * 0.5 + 30)
+    finally:
+        queue.stop()
+        processor.converter_pool.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    completed = [job for job in jobs if job.finished_at]
+    elapsed = max((job.finished_at for job in completed), default=time.time()) - started_wall
+    waits = [job.started_at - job.submitted_at for job in jobs if job.started_at]
+    runs = [job.finished_at - job.started_at for job in completed if job.started_at]
+    succeeded = sum(1 for job in completed if job.success)
+    return {
+        "jobs": job_count,
+        "printers": printer_count,
+        "workers": workers,
+        "spool_tracking": spool_tracking,
+        "completed": len(completed),
+        "failed": len(completed) - succeeded,
+        "unfinished": sum(1 for job in jobs if job.state not in FINAL_STATES),
+        "submit_seconds": submitted - started,
+        "submit": summarize(submit_times),
+        "elapsed_seconds": elapsed,
+        "jobs_per_sec": len(completed) / elapsed if elapsed else 0.0,
+        "queue_wait": summarize(waits),
+        "job_run": summarize(runs),
+        "spool_submissions": len(spooler.submissions),
+        "peak_spool_concurrency": spooler.peak_in_flight
+    }
\ No newline at end of file
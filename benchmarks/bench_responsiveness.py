@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Ana pencere dosya yığınını otomatik yazdırırken arayüz olay döngüsünün gecikmesini ölçen kıyaslama
+"""
+
+import os
+import copy
+import time
+import shutil
+import tempfile
+import threading
+from PySide6.QtCore import QCoreApplication, QTimer
+
+from config import ConfigService, DEFAULT_CONFIG
+from print_queue import FINAL_STATES
+from benchmarks.common import make_pdf, make_image, make_text
+
+
+# Kıyaslamada takılma sayılan en kısa gecikme (üretimdeki eşikten hassas)
+STALL_THRESHOLD_MS = 100
+
+# Dosyalar arasındaki bekleme; WhatsApp albümü gibi art arda gelen dosyaları taklit eder
+ARRIVAL_GAP = 0.05
+
+
+def _write_files(folder, count):
+    """PDF, fotoğraf ve metin dosyalarından oluşan yığını sırayla yazar"""
+    for index in range(count):
+        kind = index % 3
+        if kind == 0:
+            make_pdf(os.path.join(folder, f"belge_{index:03d}.pdf"), 1 + index % 4)
+        elif kind == 1:
+            make_image(os.path.join(folder, f"foto_{index:03d}.jpg"), size=(1200, 900), seed=index)
+        else:
+            make_text(os.path.join(folder, f"not_{index:03d}.txt"), lines=80, seed=index)
+        time.sleep(ARRIVAL_GAP)
+
+
+def run(count=30, timeout=120):
+    """Ana pencereyi otomatik yazdırmayla çalıştırır, yığın bitene kadar olay döngüsünü ölçer"""
+    from ui.main_window import MainWindow
+    
+    work_dir = tempfile.mkdtemp(prefix="mukaprint_bench_gui_")
+    watch_dir = os.path.join(work_dir, "izlenen")
+    os.makedirs(watch_dir)
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config.update({
+        "watch_folders": [watch_dir],
+        "supported_extensions": [".pdf", ".jpg", ".txt"],
+        "auto_print": True,
+        "spooler_backend": "local",
+        "local_printers": ["Yazıcı 1", "Yazıcı 2"],
+        "metrics_port": 0,
+        "trace_log_enabled": False,
+        "stall_threshold_ms": STALL_THRESHOLD_MS
+    })
+    service = ConfigService(config, path=os.path.join(work_dir, "config.json"))
+    window = MainWindow(service)
+    window.show()
+    app = QCoreApplication.instance()
+    
+    finished = []
+    window.print_queue.job_state_changed.connect(
+        lambda job_id, state: finished.append(job_id) if state in FINAL_STATES else None
+    )
+    
+    def check_done():
+        if len(finished) >= count or time.perf_counter() > deadline:
+            app.quit()
+    
+    writer = threading.Thread(target=_write_files, args=(watch_dir, count), name="BenchWriter", daemon=True)
+    poll = QTimer()
+    poll.timeout.connect(check_done)
+    try:
+        started = time.perf_counter()
+        deadline = started + timeout
+        writer.start()
+        poll.start(100)
+        app.exec()
+        elapsed = time.perf_counter() - started
+    finally:
+        poll.stop()
+        window.close()
+        app.processEvents()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    summary = window.stall_detector.summary()
+    window.deleteLater()
+    return {
+        "files": count,
+        "jobs_finished": len(finished),
+        "elapsed_seconds": elapsed,
+        "stall_threshold_ms": STALL_THRESHOLD_MS,
+        **summary
+    }
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Klasör izleyicinin yapay dosya yığınlarını algılama gecikmesini ölçen kıyaslama
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import threading
+from PySide6.QtCore import Qt
+
+from file_watcher import FileWatcher, OBSERVER_NATIVE, OBSERVER_POLLING
+from benchmarks.common import summarize, sized_payload, write_slowly, wait_until
+
+
+# Senaryolar: (ad, dosya yazma biçimi, alt klasör derinliği)
+#   direct: dosya tek seferde yazılır
+#   rename: tarayıcı gibi önce .crdownload yazılır, bitince yeniden adlandırılır
+#   slow:   dosya parça parça, aralıklarla yazılır (ağdan inen dosya)
+#   nested: dosyalar iki seviye alt klasöre yazılır
+SCENARIOS = [
+    ("direct", "direct", 0),
+    ("rename", "rename", 0),
+    ("slow", "slow", 0),
+    ("nested", "direct", 2)
+]
+
+# Yoklama izleyicisinin kıyaslamadaki tur aralığı (saniye)
+POLL_INTERVAL = 0.5
+
+
+def _write_burst(folder, pattern, depth, count, size, completed):
+    """Dosya yığınını yazar; her dosyanın hazır olduğu anı completed sözlüğüne kaydeder"""
+    for index in range(count):
+        target_dir = folder
+        for level in range(depth):
+            target_dir = os.path.join(target_dir, f"alt{level}_{index % 3}")
+        os.makedirs(target_dir, exist_ok=True)
+        path = os.path.join(target_dir, f"belge_{index:04d}.pdf")
+        data = sized_payload(size, index)
+        
+        if pattern == "rename":
+            partial = path + ".crdownload"
+            with open(partial, "wb") as f:
+                f.write(data)
+            os.replace(partial, path)
+        elif pattern == "slow":
+            write_slowly(path, data, chunks=4, delay=0.05)
+        else:
+            with open(path, "wb") as f:
+                f.write(data)
+        completed[path] = time.perf_counter()
+
+
+def run_scenario(observer, name, pattern, depth, count, size):
+    """Tek senaryoyu çalıştırır ve algılama ölçümlerini döndürür"""
+    folder = tempfile.mkdtemp(prefix="mukaprint_bench_watch_")
+    config = {
+        "watch_folders": [folder],
+        "supported_extensions": [".pdf"],
+        "watch_profiles": {folder: {"observer": observer, "poll_interval": POLL_INTERVAL}}
+    }
+    watcher = FileWatcher(config)
+    detected = {}  # yol -> algılanma anı
+    lock = threading.Lock()
+    
+    def on_detected(path):
+        with lock:
+            detected.setdefault(path, time.perf_counter())
+    
+    # Sinyal izleyici iş parçacığında, olay döngüsü beklemeden işlensin
+    watcher.file_detected.connect(on_detected, Qt.DirectConnection)
+    completed = {}
+    try:
+        watcher.start_watching()
+        # Yoklama izleyicisi ilk taramasını bitirmeden yazılan dosyalar mevcut sayılır
+        time.sleep(POLL_INTERVAL if observer == OBSERVER_POLLING else 0.1)
+        
+        started = time.perf_counter()
+        _write_burst(folder, pattern, depth, count, size, completed)
+        written = time.perf_counter()
+        
+        # Hazır olma beklemesi dosya başına en az iki boyut ölçümü sürer
+        wait_until(lambda: len(detected) >= count, timeout=count * 1.5 + 10)
+        finished = time.perf_counter()
+    finally:
+        watcher.stop_watching()
+        shutil.rmtree(folder, ignore_errors=True)
+    
+    with lock:
+        latencies = [detected[path] - completed[path] for path in completed if path in detected]
+        unexpected = len(set(detected) - set(completed))
+        last_detection = max(detected.values()) if detected else None
+    burst_seconds = (last_detection - started) if last_detection else None
+    return {
+        "observer": observer,
+        "pattern": pattern,
+        "depth": depth,
+        "files": count,
+        "size": size,
+        "detected": len(latencies),
+        "missed": count - len(latencies),
+        "unexpected": unexpected,
+        "write_seconds": written - started,
+        "burst_seconds": burst_seconds if burst_seconds is not None else finished - started,
+        "files_per_sec": len(latencies) / burst_seconds if burst_seconds else 0.0,
+        "latency": summarize(latencies)
+    }
+
+
+def run(count=25, size=64 * 1024, observers=(OBSERVER_NATIVE, OBSERVER_POLLING)):
+    """Tüm izleyici ve senaryo birleşimlerini çalıştırır"""
+    results = {}
+    for observer in observers:
+        for name, pattern, depth in SCENARIOS:
+            # Yavaş yazma senaryosu dosya başına uzun sürdüğünden daha az dosyayla çalışır
+            scenario_count = max(1, count // 5) if pattern == "slow" else count
+            key = f"{observer}_{name}"
+            print(f"  izleyici: {key} ({scenario_count} dosya)", flush=True)
+            results[key] = run_scenario(observer, name, pattern, depth, scenario_count, size)
+    return results
\ No newline at end of file
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Kıyaslamalar için ortak ölçüm ve örnek dosya üretme yardımcıları
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import platform
+import tracemalloc
+import subprocess
+
+from PIL import Image, ImageDraw
+from PyPDF2 import PdfWriter
+
+
+# Sonuç dosyası biçiminin sürümü (alanlar değişince artırılır)
+SCHEMA_VERSION = 1
+
+# Örnek dosya üretiminde kullanılan sabit tohum; aynı commit'te aynı dosyalar üretilir
+DEFAULT_SEED = 1234
+
+
+def percentile(values, fraction):
+    """Sıralı değerlerden yüzdelik değeri (doğrusal ara değerle) döndürür"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(values):
+    """Süre listesinin özet istatistiklerini döndürür"""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values),
+        "min": min(values),
+        "p50": percentile(values, 0.5),
+        "p95": percentile(values, 0.95),
+        "max": max(values)
+    }
+
+
+def measure_peak_memory(fn, *args, **kwargs):
+    """Fonksiyonu tracemalloc altında çalıştırıp (sonuç, en yüksek Python belleği bayt) döndürür
+    
+    tracemalloc çalışmayı yavaşlattığı için süre ölçümleri ayrı bir çalıştırmada yapılır.
+    """
+    tracemalloc.start()
+    try:
+        result = fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def max_rss_bytes():
+    """Sürecin şimdiye kadarki en yüksek yerleşik bellek kullanımını döndürür (desteklenmiyorsa None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt döner
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def wait_until(predicate, timeout, interval=0.01):
+    """Koşul sağlanana ya da süre dolana kadar bekler, koşulun son değerini döndürür"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
+
+
+def git_revision(repo_dir):
+    """Ölçülen commit'i ve çalışma ağacında değişiklik olup olmadığını döndürür"""
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=repo_dir, capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    try:
+        return {"commit": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "-uno"))}
+    except (OSError, subprocess.SubprocessError):
+        return {"commit": None, "dirty": None}
+
+
+def environment_info():
+    """Sonuçları karşılaştırırken gereken makine bilgilerini döndürür"""
+    return {
+        "python": platform.python_version(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def make_pdf(path, pages, paper=(595, 842), padding=0):
+    """Boş sayfalardan oluşan PDF üretir; padding verilirse dosya üstveriyle o kadar büyütülür"""
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(*paper)
+    if padding > 0:
+        writer.add_metadata({"/Padding": "0" * padding})
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def make_image(path, size=(2400, 1800), seed=DEFAULT_SEED):
+    """Sıkıştırma oranı gerçek fotoğrafa yakın olsun diye gürültülü şekiller içeren resim üretir"""
+    rng = random.Random(seed)
+    image = Image.effect_noise(size, 40).convert("RGB")
+    draw = ImageDraw.Draw(image)
+    for _ in range(40):
+        x, y = rng.randrange(size[0]), rng.randrange(size[1])
+        radius = rng.randrange(20, 300)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color)
+    image.save(path, quality=90)
+    image.close()
+    return path
+
+
+def make_text(path, lines=600, seed=DEFAULT_SEED):
+    """Türkçe karakterler içeren düz metin dosyası üretir"""
+    rng = random.Random(seed)
+    words = ["yazdırma", "çıktı", "sayfa", "öğrenci", "ödev", "ışık", "güneş", "şehir", "kağıt", "MUKAprint"]
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(lines):
+            f.write(f"{index + 1:04d} " + " ".join(rng.choice(words) for _ in range(rng.randrange(4, 16))) + "\n")
+    return path
+
+
+def make_workbook(path, rows=400, columns=12, seed=DEFAULT_SEED):
+    """Sayı ve metin hücrelerinden oluşan çalışma kitabı üretir"""
+    from openpyxl import Workbook
+    rng = random.Random(seed)
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append([f"Sütun {index + 1}" for index in range(columns)])
+    for _ in range(rows):
+        sheet.append([rng.randrange(100000) if column % 2 else f"kalem {rng.randrange(1000)}"
+                      for column in range(columns)])
+    workbook.save(path)
+    return path
+
+
+def sized_payload(size, seed):
+    """Verilen boyutta, sıkıştırılamayan rastgele veri döndürür"""
+    return random.Random(seed).randbytes(size)
+
+
+def write_slowly(path, data, chunks, delay):
+    """Dosyayı parça parça yazar (ağdan inen ya da kopyalanan dosyayı taklit eder)"""
+    step = max(1, -(-len(data) // chunks))
+    with open(path, "wb") as f:
+        for offset in range(0, len(data), step):
+            f.write(data[offset:offset + step])
+            f.flush()
+            if delay:
+                time.sleep(delay)
+
+
+def pdf_bytes(pages):
+    """Bellekte boş sayfalı PDF verisi üretir"""
+    buffer = io.BytesIO()
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(595, 842)
+    writer.write(buffer)
+    return buffer.getvalue()
\ No newline at end of file
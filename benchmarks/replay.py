@@ -0,0 +1,364 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Kaydedilen dükkan trafiğini klasör izleyici ve yazdırma kuyruğu üzerinden hızlandırarak yeniden oynatan araç
+
+Dosyalar izdeki zamanlarda izlenen klasöre bırakılır, yazdırma istekleri kayıtlı ayarlarıyla
+kuyruğa eklenir ve işler sahte biriktiriciye (LocalSpooler) gider. Sahte yazıcının hızı da
+oynatma hızıyla ölçeklenir; yazılımın kendi süreleri (hazır olma beklemesi, dönüştürme)
+ölçeklenmez. Raporlanan süreler oynatma saniyesidir, dükkan saatine çevirmek için hızla çarpılır.
+"""
+
+import os
+import json
+import math
+import time
+import shutil
+import logging
+import tempfile
+import threading
+from PySide6.QtCore import Qt
+
+from spooler import LocalSpooler
+from document_processor import DocumentProcessor
+from file_watcher import FileWatcher, OBSERVER_NATIVE
+from print_queue import PrintQueue, FINAL_STATES, PRIORITY_NORMAL, generate_synthetic_trace
+from job_journal import JobJournal
+from benchmarks.common import summarize, percentile, wait_until, make_pdf, make_image, make_text, make_workbook
+
+
+logger = logging.getLogger(__name__)
+
+# Yeniden üretilebilen biçimler; diğerleri (Word, PowerPoint ...) aynı sayfa sayılı PDF ile değiştirilir
+PRODUCIBLE_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png", ".txt", ".xlsx"}
+
+# Boyutu kaydedilmemiş dosyalar için varsayılan boyut (bayt)
+DEFAULT_FILE_SIZE = 200 * 1024
+
+# Örnek resimlerin yaklaşık piksel başına bayt oranı ve en büyük boyutu
+IMAGE_BYTES_PER_PIXEL = 0.08
+MAX_IMAGE_PIXELS = 4000 * 3000
+
+# Raporlanan kuyruk derinliği zaman çizelgesinin en fazla nokta sayısı
+TIMELINE_POINTS = 240
+
+
+def load_traffic(paths):
+    """Trafik izi dosyalarını okur ve olayları zamana göre sıralı döndürür"""
+    events = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # Uygulama kapanırken yarım kalmış satır
+                    continue
+                if event.get("event") in ("detect", "print") and "t" in event:
+                    events.append(event)
+    events.sort(key=lambda event: event["t"])
+    return events
+
+
+def synthetic_traffic(seed=0, duration=3600):
+    """Kayıt yokken print_queue'nun yapay dükkan gününden algılama ve yazdırma olayları üretir"""
+    events = []
+    start = time.time()
+    for index, item in enumerate(generate_synthetic_trace(seed=seed, duration=duration)):
+        t = start + item["arrival"]
+        file = {"file": f"yapay{index:05d}", "ext": ".pdf", "size": None}
+        events.append({"t": t, "event": "detect", "source": item["source"], **file})
+        # Otomatik yazdırmadaki gibi istek, dosya hazır olduktan hemen sonra gelir
+        events.append({
+            "t": t + 1.0, "event": "print", "job": f"yapay{index:05d}", "files": [file],
+            "pages": item["pages"], "printer": None, "paper_size": None, "copies": item.get("copies", 1),
+            "duplex": False, "priority": item["priority"], "source": item["source"], "batches": {}, "options": {}
+        })
+    events.sort(key=lambda event: event["t"])
+    return events
+
+
+def schedule(events, max_idle=None):
+    """Olayların izin başından itibaren zamanlarını döndürür; max_idle'dan uzun boşluklar kısaltılır"""
+    offsets = []
+    offset = 0.0
+    previous = None
+    for event in events:
+        if previous is not None:
+            gap = event["t"] - previous
+            offset += min(gap, max_idle) if max_idle else gap
+        previous = event["t"]
+        offsets.append(offset)
+    return offsets
+
+
+def collect_files(events):
+    """İzde geçen her dosyanın biçimini, boyutunu, sayfa sayısını ve kaynağını toplar"""
+    files = {}
+    
+    def entry(file_key, ext, size, source):
+        info = files.setdefault(file_key, {"ext": ext, "size": size, "pages": None, "source": source,
+                                           "detected": False})
+        if info["size"] is None:
+            info["size"] = size
+        return info
+    
+    for event in events:
+        if event["event"] == "detect":
+            entry(event["file"], event["ext"], event.get("size"), event.get("source"))["detected"] = True
+            continue
+        members = event.get("files") or []
+        # Birleştirilen işlerde yalnızca toplam sayfa bilinir, dosyalara eşit dağıtılır
+        share = math.ceil(event["pages"] / len(members)) if event.get("pages") and members else None
+        for member in members:
+            info = entry(member["file"], member["ext"], member.get("size"), event.get("source"))
+            if share and not info["pages"]:
+                info["pages"] = share
+    return files
+
+
+class SampleFactory:
+    """İzdeki dosyaların biçimine ve boyutuna yakın örnek dosyalar üreten sınıf
+    
+    Aynı biçim, sayfa sayısı ve benzer boyuttaki dosyalar için tek şablon üretilip kopyalanır.
+    """
+    
+    def __init__(self, template_dir):
+        self.template_dir = template_dir
+        self.templates = {}  # (uzantı, boyut dilimi, sayfa) -> şablon yolu
+        self.substituted = 0  # PDF ile değiştirilen dosya sayısı
+        os.makedirs(template_dir, exist_ok=True)
+    
+    def create(self, base_path, ext, size, pages):
+        """base_path + uzantı yoluna örnek dosya yazar ve yolu döndürür"""
+        target_ext = ext if ext in PRODUCIBLE_EXTENSIONS else ".pdf"
+        if target_ext != ext:
+            self.substituted += 1
+        # Boyut ikinin kuvvetlerine yuvarlanır, böylece şablon sayısı sınırlı kalır
+        bucket = 2 ** round(math.log2(max(size or DEFAULT_FILE_SIZE, 1024)))
+        key = (target_ext, bucket, (pages or 1) if target_ext == ".pdf" else 1)
+        template = self.templates.get(key)
+        if template is None:
+            template = self.templates[key] = self._make_template(*key)
+        path = base_path + target_ext
+        shutil.copyfile(template, path)
+        return path
+    
+    def _make_template(self, ext, size, pages):
+        """Verilen biçim ve yaklaşık boyutta şablon dosya üretir"""
+        path = os.path.join(self.template_dir, f"sablon_{len(self.templates)}{ext}")
+        if ext == ".pdf":
+            make_pdf(path, pages)
+            padding = size - os.path.getsize(path)
+            if padding > 0:
+                make_pdf(path, pages, padding=padding)
+        elif ext in (".jpg", ".jpeg", ".png"):
+            pixels = min(MAX_IMAGE_PIXELS, max(64 * 48, int(size / IMAGE_BYTES_PER_PIXEL)))
+            width = int(math.sqrt(pixels * 4 / 3))
+            make_image(path, size=(width, width * 3 // 4))
+            # Resim okuyucular dosya sonundaki fazladan baytları yok sayar
+            padding = size - os.path.getsize(path)
+            if padding > 0:
+                with open(path, "ab") as f:
+                    f.write(b"\0" * padding)
+        elif ext == ".txt":
+            make_text(path, lines=max(1, size // 70))
+        elif ext == ".xlsx":
+            make_workbook(path, rows=max(1, size // 120))
+        return path
+
+
+def _downsample(samples, points):
+    """Zaman çizelgesini en fazla points noktaya seyreltir"""
+    step = max(1, math.ceil(len(samples) / points))
+    return [list(sample) for sample in samples[::step]]
+
+
+def run(events, speed=10.0, max_idle=300.0, pages_per_minute=30, job_overhead=5.0, workers=None,
+        observer=OBSERVER_NATIVE, sample_interval=0.25, config_overrides=None):
+    """Olayları izleyici ve kuyruk üzerinden speed kat hızla oynatır ve ölçümleri döndürür"""
+    work_dir = tempfile.mkdtemp(prefix="mukaprint_replay_")
+    watch_dir = os.path.join(work_dir, "izlenen")
+    staging_dir = os.path.join(work_dir, "hazirlik")
+    manual_dir = os.path.join(work_dir, "elle")  # izlenmeyen yerden elle eklenen dosyalar
+    for folder in (watch_dir, staging_dir, manual_dir):
+        os.makedirs(folder)
+    
+    # Dosyalar önceden üretilir; oynatma sırasında yalnızca izlenen klasöre taşınır
+    factory = SampleFactory(os.path.join(work_dir, "sablon"))
+    files = collect_files(events)
+    sources = {}  # kaynak kimliği -> gönderen alt klasörü
+    staged = {}  # dosya kimliği -> hazırlık klasöründeki yol
+    paths = {}  # dosya kimliği -> kuyruğa verilecek yol
+    for file_key, info in files.items():
+        source_dir = sources.setdefault(info["source"], f"kaynak_{len(sources) + 1}")
+        if info["detected"]:
+            staged[file_key] = factory.create(os.path.join(staging_dir, file_key), info["ext"], info["size"],
+                                              info["pages"])
+            paths[file_key] = os.path.join(watch_dir, source_dir, os.path.basename(staged[file_key]))
+        else:
+            paths[file_key] = factory.create(os.path.join(manual_dir, file_key), info["ext"], info["size"],
+                                             info["pages"])
+    for source_dir in sources.values():
+        os.makedirs(os.path.join(watch_dir, source_dir), exist_ok=True)
+    
+    # Sahte yazıcılar izdeki yazıcı adlarıyla oluşturulur, hızları oynatma hızıyla ölçeklenir
+    printers = sorted({event["printer"] for event in events if event["event"] == "print" and event.get("printer")})
+    printers = printers or ["Yerel Yazıcı"]
+    spooler = LocalSpooler(printers=printers, pages_per_minute=pages_per_minute * speed,
+                           job_overhead=job_overhead / speed)
+    config = {
+        "spooler_backend": "local",
+        "default_printer": printers[0],
+        "queue_workers": workers or len(printers),
+        "spool_tracking": True,
+        "spool_poll_interval": 0.05,
+        "health_poll_interval": 3600,
+        "watch_folders": [watch_dir],
+        "supported_extensions": sorted({os.path.splitext(path)[1] for path in paths.values()}),
+        "watch_profiles": {watch_dir: {"observer": observer, "poll_interval": 0.5}}
+    }
+    config.update(config_overrides or {})
+    processor = DocumentProcessor(config, spooler=spooler)
+    queue = PrintQueue(processor, config, journal=JobJournal(os.path.join(work_dir, "jobs.jsonl"),
+                                                             final_states=FINAL_STATES))
+    watcher = FileWatcher(config)
+    
+    detected = {}  # yol -> algılanma anı
+    placed = {}  # dosya kimliği -> izlenen klasöre bırakılma anı
+    lock = threading.Lock()
+    
+    def on_detected(path):
+        with lock:
+            detected.setdefault(path, time.perf_counter())
+        # Ana penceredeki gibi algılanan dosya boşta kalan zamanda PDF'e hazırlanır
+        processor.prerenderer.enqueue(path)
+    
+    # Sinyal izleyici iş parçacığında, olay döngüsü beklemeden işlensin
+    watcher.file_detected.connect(on_detected, Qt.DirectConnection)
+    
+    def place(file_key):
+        if file_key in staged and file_key not in placed:
+            os.replace(staged[file_key], paths[file_key])
+            placed[file_key] = time.perf_counter()
+    
+    samples = []  # (oynatma saniyesi, kuyrukta bekleyen, çalışan, sahte yazıcıda bekleyen iş)
+    stop_sampling = threading.Event()
+    
+    def sample():
+        while not stop_sampling.wait(sample_interval):
+            spooled = sum(len(spooler.poll_jobs(printer)) for printer in printers)
+            samples.append((time.perf_counter() - started, len(queue.pending_jobs()), len(queue.active_jobs), spooled))
+    
+    offsets = schedule(events, max_idle)
+    jobs = []  # (iş, gönderen alt klasörü)
+    submit_errors = 0
+    schedule_lag = 0.0
+    sampler = threading.Thread(target=sample, name="ReplaySampler", daemon=True)
+    try:
+        watcher.start_watching()
+        queue.start()
+        time.sleep(0.5 if observer != OBSERVER_NATIVE else 0.1)
+        started_wall = time.time()
+        started = time.perf_counter()
+        sampler.start()
+        
+        for offset, event in zip(offsets, events):
+            delay = started + offset / speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                schedule_lag = max(schedule_lag, -delay)
+            
+            if event["event"] == "detect":
+                place(event["file"])
+                continue
+            
+            # Algılanmadan basılan dosya (ya da algılamadan önce gelen istek) hemen bırakılır
+            members = [member["file"] for member in event.get("files") or []]
+            for file_key in members:
+                place(file_key)
+            options = dict(event.get("options") or {})
+            for key, file_keys in (event.get("batches") or {}).items():
+                options[key] = [paths[file_key] for file_key in file_keys]
+            source_dir = sources.get(event.get("source"), "elle")
+            try:
+                job = queue.submit(
+                    paths[members[0]], event.get("printer"), event.get("paper_size"), event.get("copies"),
+                    event.get("duplex"), priority=event.get("priority", PRIORITY_NORMAL),
+                    source=os.path.join(watch_dir, source_dir), **options
+                )
+            except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+                submit_errors += 1
+                logger.warning("İz olayı kuyruğa eklenemedi (%s): %s", event.get("job"), e)
+                continue
+            jobs.append((job, source_dir))
+        
+        # Kalan işler sahte yazıcının hızıyla biter; süre toplam sayfaya göre tanınır
+        remaining_pages = sum((job.page_count or 1) * max(1, job.copies or 1) for job, _ in jobs)
+        timeout = 60 + 2 * remaining_pages * 60.0 / (pages_per_minute * speed)
+        wait_until(lambda: all(job.state in FINAL_STATES for job, _ in jobs), timeout=timeout, interval=0.05)
+        wait_until(lambda: len(detected) >= len(placed), timeout=10)
+    finally:
+        stop_sampling.set()
+        watcher.stop_watching()
+        queue.stop()
+        processor.prerenderer.stop()
+        processor.converter_pool.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    with lock:
+        detect_latency = [detected[paths[key]] - moment for key, moment in placed.items() if paths[key] in detected]
+    completed = [job for job, _ in jobs if job.finished_at]
+    waits = [job.started_at - job.submitted_at for job, _ in jobs if job.started_at]
+    turnaround = [job.finished_at - job.submitted_at for job in completed]
+    pages = sum(job.page_count * max(1, job.copies or 1) for job in completed if job.success and job.page_count)
+    elapsed = max((job.finished_at for job in completed), default=time.time()) - started_wall
+    depths = [pending for _, pending, _, _ in samples]
+    spool_depths = [spooled for _, _, _, spooled in samples]
+    source_waits = {}
+    for job, source_dir in jobs:
+        if job.started_at:
+            source_waits.setdefault(source_dir, []).append(job.started_at - job.submitted_at)
+    succeeded = sum(1 for job in completed if job.success)
+    
+    return {
+        "speed": speed,
+        "events": len(events),
+        "trace_seconds": offsets[-1] if offsets else 0.0,
+        "replay_seconds": elapsed,
+        "schedule_lag_seconds": schedule_lag,
+        "printers": len(printers),
+        "workers": config["queue_workers"],
+        "files": len(files),
+        "substituted": factory.substituted,
+        "detected": len(detect_latency),
+        "missed": len(placed) - len(detect_latency),
+        "detect_latency": summarize(detect_latency),
+        "jobs": len(jobs),
+        "submit_errors": submit_errors,
+        "completed": len(completed),
+        "failed": len(completed) - succeeded,
+        "unfinished": sum(1 for job, _ in jobs if job.state not in FINAL_STATES),
+        "queue_wait": summarize(waits),
+        "turnaround": summarize(turnaround),
+        "queue_depth": {
+            "max": max(depths, default=0),
+            "mean": sum(depths) / len(depths) if depths else 0.0,
+            "p95": percentile(depths, 0.95) or 0
+        },
+        # İzlenen biriktirici işleri kuyruktan hemen çıkar; birikme yazıcı tarafında görünür
+        "spool_depth": {
+            "max": max(spool_depths, default=0),
+            "mean": sum(spool_depths) / len(spool_depths) if spool_depths else 0.0,
+            "p95": percentile(spool_depths, 0.95) or 0
+        },
+        "jobs_per_sec": len(completed) / elapsed if elapsed > 0 else 0.0,
+        "pages_per_sec": pages / elapsed if elapsed > 0 else 0.0,
+        # Dükkan saatiyle dakikada basılan sayfa
+        "trace_pages_per_min": pages / elapsed * 60 / speed if elapsed > 0 else 0.0,
+        "source_wait": {source_dir: summarize(values) for source_dir, values in sorted(source_waits.items())},
+        "depth_timeline": _downsample(samples, TIMELINE_POINTS)
+    }
@@ -7,8 +7,15 @@ Uygulama yapılandırma modülü
 """
 
 import os
+import logging
+import copy
 import json
+import threading
 from pathlib import Path
+from PySide6.QtCore import QObject, QTimer, QFileSystemWatcher
+
+
+logger = logging.getLogger(__name__)
 
 # Varsayılan yapılandırma dosyası yolu
 CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".mukaprint", "config.json")
@@ -24,21 +31,74 @@ DEFAULT_CONFIG = {
     "supported_extensions": [".pdf", ".docx", ".xlsx", ".pptx", ".jpg", ".jpeg", ".png", ".txt"],
     "auto_print": False,
     "theme": "light",
-    "last_directory": ""
+    "last_directory": "",
+    "scheduler_priority": True,
+    "scheduler_shortest_job_first": True,
+    "scheduler_fair_share": True,
+    "scheduler_fair_quantum": 20,
+    "scheduler_aging_seconds": 20,
+    "pdf_chunk_threshold": 50,
+    "pdf_first_chunk_pages": 5,
+    "pdf_chunk_pages": 25,
+    "converter_workers": 0,
+    "retry_max_attempts": 5,
+    "retry_base_delay": 5,
+    "retry_max_delay": 300,
+    "spooler_backend": "auto",
+    "spool_tracking": True,
+    "spool_poll_interval": 2.0,
+    "health_poll_interval": 15,
+    "breaker_failure_threshold": 3,
+    "breaker_reset_timeout": 60,
+    "fallback_printers": {},
+    "queue_workers": 4,
+    "prerender_enabled": False,
+    "prerender_cache_mb": 500,
+    "thumbnail_size": 48,
+    "thumbnail_cache_mb": 100,
+    "thumbnail_workers": 1,
+    "raster_dpi": 300,
+    "image_margin_mm": 5,
+    "contact_sheet_grid": [3, 4],
+    "text_font": "",
+    "text_font_size": 10,
+    "text_margin_mm": 15,
+    "xlsx_font": "",
+    "xlsx_font_size": 10,
+    "xlsx_gridlines": True,
+    "presentation_handout": 0,
+    "merge_separator_pages": False,
+    "merge_window_seconds": 0,
+    "watch_filter": {},
+    "watch_profiles": {},
+    "metrics_port": 9469,
+    "trace_log_enabled": True,
+    "trace_log_mb": 5,
+    "traffic_recording": False,
+    "stall_threshold_ms": 250,
+    "default_pages_per_minute": 20,
+    "log_level": "INFO",
+    "log_levels": {},
+    "log_file_mb": 5,
+    "log_backups": 5
 }
 
 
-def load_config():
+# Dosya değişikliği bildirimlerinden sonra yeniden okumadan önce beklenen süre (ms)
+RELOAD_DELAY_MS = 300
+
+
+def load_config(path=CONFIG_FILE):
     """Yapılandırma dosyasını yükler, yoksa varsayılan değerleri kullanır"""
     try:
         # Yapılandırma dizininin varlığını kontrol et
-        config_dir = os.path.dirname(CONFIG_FILE)
+        config_dir = os.path.dirname(path)
         if not os.path.exists(config_dir):
             os.makedirs(config_dir)
         
         # Yapılandırma dosyasını oku
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
                 
             # Eksik ayarları varsayılan değerlerle tamamla
@@ -50,27 +110,144 @@ def load_config():
             # Yapılandırma dosyası yoksa varsayılan değerleri kullan
             return DEFAULT_CONFIG.copy()
     except Exception as e:
-        print(f"Yapılandırma yüklenirken hata oluştu: {e}")
+        logger.warning("Yapılandırma yüklenirken hata oluştu: %s", e)
         return DEFAULT_CONFIG.copy()
 
 
-def save_config(config):
-    """Yapılandırmayı dosyaya kaydeder"""
+def save_config(config, path=CONFIG_FILE):
+    """Yapılandırmayı dosyaya kaydeder (önce geçici dosyaya yazılıp yerine konur)"""
     try:
         # Yapılandırma dizininin varlığını kontrol et
-        config_dir = os.path.dirname(CONFIG_FILE)
+        config_dir = os.path.dirname(path)
         if not os.path.exists(config_dir):
             os.makedirs(config_dir)
         
-        # Yapılandırmayı dosyaya yaz
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+        # Yapılandırmayı geçici dosyaya yaz; yarıda kalan yazma eski dosyayı bozmaz
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=4, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
         return True
     except Exception as e:
-        print(f"Yapılandırma kaydedilirken hata oluştu: {e}")
+        logger.error("Yapılandırma kaydedilirken hata oluştu: %s", e)
         return False
 
 
+def diff_config(old, new):
+    """Yeni yapılandırmada değeri değişen ya da eklenen ayarları {anahtar: yeni_değer} olarak döndürür"""
+    missing = object()
+    return {key: value for key, value in new.items() if old.get(key, missing) != value}
+
+
+class ConfigService(QObject):
+    """Yapılandırmayı tek yerde tutan, değişiklikleri farkıyla abonelere bildiren ve dosyayı izleyen servis
+    
+    Bileşenler aynı yapılandırma sözlüğünü paylaşır; değişiklikler bu sözlüğe yerinde
+    uygulanır. Ayarı başlangıçta kopyalayan bileşenler subscribe ile yalnızca değişen
+    anahtarları alır ve kendini yeniden başlatmadan günceller.
+    """
+    
+    def __init__(self, config=None, path=CONFIG_FILE):
+        super().__init__()
+        self.path = path
+        self.config = config if config is not None else load_config(path)
+        self._subscribers = []  # (ilgilenilen anahtarlar ya da None, geri çağırma)
+        self._lock = threading.Lock()
+        self._file_stamp = self._stat_file()
+        self._watcher = None
+        self._reload_timer = None
+    
+    def get(self, key, default=None):
+        """Ayarın güncel değerini döndürür"""
+        return self.config.get(key, default)
+    
+    def subscribe(self, callback, keys=None):
+        """Değişiklik bildirimlerine abone olur; keys verilirse yalnızca bu anahtarlar bildirilir"""
+        self._subscribers.append((set(keys) if keys is not None else None, callback))
+    
+    def update(self, changes):
+        """Değişiklikleri uygular, abonelere yalnızca değişen anahtarları bildirir ve farkı döndürür"""
+        with self._lock:
+            diff = diff_config(self.config, changes)
+            for key, value in diff.items():
+                # Paylaşılan sözlükteki listeler dışarıdan yerinde değiştirilmesin
+                self.config[key] = copy.deepcopy(value)
+        if not diff:
+            return diff
+        
+        logger.info("Yapılandırma güncellendi: %s", ', '.join(sorted(diff)))
+        for keys, callback in list(self._subscribers):
+            relevant = diff if keys is None else {key: diff[key] for key in diff if key in keys}
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                # Bir bileşenin hatası diğerlerinin güncellenmesini engellemez
+                logger.error("Yapılandırma değişikliği uygulanamadı: %s", e)
+        return diff
+    
+    def save(self):
+        """Yapılandırmayı atomik olarak diske yazar"""
+        with self._lock:
+            snapshot = copy.deepcopy(self.config)
+        saved = save_config(snapshot, self.path)
+        if saved:
+            # Kendi yazdığımız dosya yeniden okunmasın
+            self._file_stamp = self._stat_file()
+        return saved
+    
+    def watch(self):
+        """Yapılandırma dosyasını izler; dışarıdan yapılan değişiklikler farkıyla uygulanır"""
+        if self._watcher is None:
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.fileChanged.connect(self._schedule_reload)
+            self._watcher.directoryChanged.connect(self._schedule_reload)
+            self._reload_timer = QTimer(self)
+            self._reload_timer.setSingleShot(True)
+            self._reload_timer.setInterval(RELOAD_DELAY_MS)
+            self._reload_timer.timeout.connect(self.reload)
+        
+        # Dosya yeniden adlandırmayla değiştirildiğinde dosya izlemesi düşer, dizin de izlenir
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._watcher.addPath(os.path.dirname(self.path))
+        if os.path.exists(self.path):
+            self._watcher.addPath(self.path)
+    
+    def _schedule_reload(self, path):
+        """Art arda gelen dosya bildirimlerini tek yeniden okumada birleştirir"""
+        if os.path.exists(self.path) and self.path not in self._watcher.files():
+            self._watcher.addPath(self.path)
+        self._reload_timer.start()
+    
+    def _stat_file(self):
+        """Dosyanın değişip değişmediğini anlamak için (değişiklik zamanı, boyut) döndürür"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def reload(self):
+        """Dosya değiştiyse yeniden okur ve yalnızca değişen ayarları uygular"""
+        stamp = self._stat_file()
+        if stamp is None or stamp == self._file_stamp:
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            # Elle düzenlenirken bozulan dosya geçerli ayarları sıfırlamaz
+            logger.warning("Yapılandırma dosyası okunamadı, değişiklikler yok sayıldı: %s", e)
+            return {}
+        self._file_stamp = stamp
+        if not isinstance(config, dict):
+            return {}
+        return self.update(config)
+
+
 def get_whatsapp_default_download_folder():
     """WhatsApp Desktop'ın varsayılan indirme klasörünü tahmin eder"""
     # Windows'ta varsayılan indirme klasörü
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Belge dönüştürme ve dönüştürücü süreç havuzu modülü
+"""
+
+import os
+import logging
+import sys
+import shutil
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+
+logger = logging.getLogger(__name__)
+
+
+# Ofis uygulamalarıyla PDF'e dönüştürülebilen dosya türleri
+WORD_EXTENSIONS = [".doc", ".docx", ".odt", ".rtf"]
+EXCEL_EXTENSIONS = [".xls", ".xlsx", ".ods"]
+POWERPOINT_EXTENSIONS = [".ppt", ".pptx", ".odp"]
+OFFICE_EXTENSIONS = WORD_EXTENSIONS + EXCEL_EXTENSIONS + POWERPOINT_EXTENSIONS
+
+# LibreOffice'in Windows'taki olası kurulum yolları
+LIBREOFFICE_PATHS = [
+    r"C:\Program Files\LibreOffice\program\soffice.exe",
+    r"C:\Program Files (x86)\LibreOffice\program\soffice.exe"
+]
+
+# Uygulamaların uyarıları kapatma değerleri (wdAlertsNone, False, ppAlertsNone)
+OFFICE_ALERTS_OFF = {
+    "Word.Application": 0,
+    "Excel.Application": False,
+    "PowerPoint.Application": 1
+}
+
+# Çalışan süreç başına açık tutulan ofis uygulamaları (her dönüşümde yeniden başlatılmaz)
+_office_apps = {}
+
+
+def find_libreoffice():
+    """LibreOffice komut satırı aracının yolunu döndürür, bulunamazsa None"""
+    for name in ("soffice", "libreoffice"):
+        path = shutil.which(name)
+        if path:
+            return path
+    for path in LIBREOFFICE_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def convert_to_pdf(file_path, output_dir):
+    """Ofis belgesini PDF'e dönüştürür ve PDF yolunu döndürür (çalışan süreçte çağrılır)"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in OFFICE_EXTENSIONS:
+        raise ValueError(f"Dönüştürülemeyen dosya türü: {ext}")
+    
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    output_path = os.path.join(output_dir, base_name + ".pdf")
+    
+    # Windows'ta önce kurulu Microsoft Office ile dene
+    if sys.platform == "win32":
+        try:
+            return _convert_with_office(file_path, output_path, ext)
+        except Exception as e:
+            logger.warning("Office ile dönüştürme başarısız, LibreOffice deneniyor: %s", e)
+    
+    soffice = find_libreoffice()
+    if soffice is None:
+        raise RuntimeError("PDF dönüştürücü bulunamadı (Microsoft Office ya da LibreOffice gerekli)")
+    return _convert_with_libreoffice(soffice, file_path, output_dir, output_path)
+
+
+def _convert_with_libreoffice(soffice, file_path, output_dir, output_path):
+    """LibreOffice ile başsız (headless) PDF dönüşümü yapar"""
+    # Aynı anda çalışan dönüştürücüler profil kilidine takılmasın diye süreç başına ayrı profil
+    profile_dir = os.path.join(tempfile.gettempdir(), f"mukaprint_lo_{os.getpid()}")
+    profile_url = "file:///" + profile_dir.replace("\\", "/").lstrip("/")
+    subprocess.run(
+        [soffice, f"-env:UserInstallation={profile_url}", "--headless", "--norestore",
+         "--convert-to", "pdf", "--outdir", output_dir, file_path],
+        check=True, timeout=600, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    if not os.path.exists(output_path):
+        raise RuntimeError(f"LibreOffice çıktı üretmedi: {file_path}")
+    return output_path
+
+
+def _get_office_app(prog_id):
+    """Bu süreçte açık tutulan ofis uygulamasını döndürür, yoksa başlatır"""
+    import pythoncom
+    import win32com.client
+    
+    app = _office_apps.get(prog_id)
+    if app is None:
+        pythoncom.CoInitialize()
+        app = win32com.client.DispatchEx(prog_id)
+        # Uyarı pencereleri otomasyonu kilitlemesin
+        app.DisplayAlerts = OFFICE_ALERTS_OFF[prog_id]
+        _office_apps[prog_id] = app
+    return app
+
+
+def _convert_with_office(file_path, output_path, ext):
+    """Microsoft Office otomasyonu ile PDF dönüşümü yapar"""
+    file_path = os.path.abspath(file_path)
+    output_path = os.path.abspath(output_path)
+    
+    if ext in WORD_EXTENSIONS:
+        prog_id = "Word.Application"
+    elif ext in EXCEL_EXTENSIONS:
+        prog_id = "Excel.Application"
+    else:
+        prog_id = "PowerPoint.Application"
+    
+    try:
+        app = _get_office_app(prog_id)
+        if prog_id == "Word.Application":
+            document = app.Documents.Open(file_path, ReadOnly=True, AddToRecentFiles=False)
+            try:
+                document.ExportAsFixedFormat(output_path, 17)  # wdExportFormatPDF
+            finally:
+                document.Close(False)
+        elif prog_id == "Excel.Application":
+            workbook = app.Workbooks.Open(file_path, ReadOnly=True)
+            try:
+                workbook.ExportAsFixedFormat(0, output_path)  # xlTypePDF
+            finally:
+                workbook.Close(False)
+        else:
+            presentation = app.Presentations.Open(file_path, True, False, False)
+            try:
+                presentation.SaveAs(output_path, 32)  # ppSaveAsPDF
+            finally:
+                presentation.Close()
+    except Exception:
+        # Uygulama çökmüş olabilir, bir sonraki dönüşümde yeniden başlatılsın
+        _office_apps.pop(prog_id, None)
+        raise
+    
+    return output_path
+
+
+class ConverterPool:
+    """Ağır dönüştürme ve impozisyon işlerini ayrı süreçlerde çalıştıran havuz"""
+    
+    def __init__(self, config):
+        self.config = config
+        self.max_workers = config.get("converter_workers", 0) or max(1, (os.cpu_count() or 2) // 2)
+        self._executor = None
+        self._lock = threading.Lock()
+    
+    def submit(self, fn, *args, **kwargs):
+        """Fonksiyonu havuzdaki bir süreçte çalıştırır ve Future döndürür"""
+        with self._lock:
+            if self._executor is None:
+                # Süreçler ilk ihtiyaçta başlatılır ve sonraki işler için sıcak tutulur
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            executor = self._executor
+        return executor.submit(fn, *args, **kwargs)
+    
+    def convert_to_pdf(self, file_path, output_dir):
+        """Ofis belgesini havuzda PDF'e dönüştürür ve Future döndürür"""
+        return self.submit(convert_to_pdf, file_path, output_dir)
+    
+    def shutdown(self, wait=False):
+        """Havuzdaki süreçleri kapatır"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
\ No newline at end of file
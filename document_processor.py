@@ -6,20 +6,88 @@ MUKAprint - Otomatik Yazdırma Hizmeti
 Belge işleme ve yazdırma modülü
 """
 
+import io
+import logging
 import os
 import sys
+import itertools
+import shutil
 import tempfile
-import win32print
-import win32api
-import win32con
+import threading
+import subprocess
+from collections import deque
 from pathlib import Path
+import qt_compat  # noqa: F401  (PySide6 sinyal hatası düzeltmesi, sinyaller kullanılmadan önce)
 from PySide6.QtCore import QObject, Signal, Slot, QDateTime
 
 # Belge işleme kütüphaneleri
-from PyPDF2 import PdfReader
-from docx import Document
+from PyPDF2 import PdfReader, PdfWriter
 from PIL import Image
 
+from converter import ConverterPool, OFFICE_EXTENSIONS, POWERPOINT_EXTENSIONS
+from imposition import plan_sheets, needs_imposition, impose_pdf
+from print_queue import JOB_CONVERTING, JOB_SPOOLING, JOB_PRINTING
+from spooler import create_spooler
+from printer_health import PrinterHealthMonitor
+from prerender_cache import Prerenderer, cache_key
+from raster_pdf import DEFAULT_DPI, pages_to_pdf
+from image_renderer import IMAGE_EXTENSIONS, CONTACT_SHEET_GRID, image_page_count, iter_image_pages
+from text_renderer import TEXT_EXTENSIONS, TextRenderer
+from xlsx_renderer import XLSX_EXTENSIONS, WorkbookRenderer
+from batch_merge import merge_documents
+from metrics import tracer
+from metadata_cache import (
+    MetadataCache, PAGE_COUNT_TAGS, SOURCE_APP_PROPERTIES, SOURCE_LAYOUT, read_app_page_count, layout_page_count
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Temel kağıt boyutlarının DEVMODE kodları (win32con.DMPAPER_*)
+PAPER_SIZE_CODES = {
+    "A4": 9,
+    "A5": 11,
+    "Letter": 1,
+    "Legal": 5
+}
+
+# Yeniden denendiğinde düzelebilecek Windows hata kodları
+TRANSIENT_WINERRORS = {
+    21,    # ERROR_NOT_READY
+    28,    # ERROR_OUT_OF_PAPER
+    32,    # ERROR_SHARING_VIOLATION
+    33,    # ERROR_LOCK_VIOLATION
+    51,    # ERROR_REM_NOT_LIST
+    53,    # ERROR_BAD_NETPATH
+    54,    # ERROR_NETWORK_BUSY
+    59,    # ERROR_UNEXP_NET_ERR
+    64,    # ERROR_NETNAME_DELETED
+    121,   # ERROR_SEM_TIMEOUT
+    1231,  # ERROR_NETWORK_UNREACHABLE
+    1460,  # ERROR_TIMEOUT
+    1722,  # RPC_S_SERVER_UNAVAILABLE
+    1723,  # RPC_S_SERVER_TOO_BUSY
+    1726,  # RPC_S_CALL_FAILED
+    1727,  # RPC_S_CALL_FAILED_DNE
+    1753,  # EPT_S_NOT_REGISTERED
+    1798,  # ERROR_UNKNOWN_PRINTPROCESSOR (biriktirici yeniden başlarken)
+    3006   # ERROR_SPOOL_FILE_NOT_FOUND
+}
+
+
+def is_transient_error(error):
+    """Hatanın geçici olup olmadığını (yeniden denemeye değip değmediğini) döndürür"""
+    if isinstance(error, (FileNotFoundError, ValueError)):
+        return False
+    if isinstance(error, (TimeoutError, ConnectionError, subprocess.TimeoutExpired)):
+        return True
+    code = getattr(error, "winerror", None)
+    if code is None and getattr(error, "args", None) and isinstance(error.args[0], int):
+        # pywintypes.error kodu ilk argüman olarak taşır
+        code = error.args[0]
+    return code in TRANSIENT_WINERRORS
+
 
 class DocumentProcessor(QObject):
     """Belge işleme ve yazdırma işlevlerini sağlayan sınıf"""
@@ -28,43 +96,124 @@ class DocumentProcessor(QObject):
     print_started = Signal(str, str)  # dosya_yolu, yazıcı_adı
     print_completed = Signal(str, bool)  # dosya_yolu, başarılı_mı
     print_error = Signal(str, str)  # dosya_yolu, hata_mesajı
+    print_progress = Signal(str, int, int)  # dosya_yolu, gönderilen_sayfa, toplam_sayfa
+    print_submitted = Signal(str, str)  # dosya_yolu, yazıcı_adı (biriktiriciye teslim edildi)
+    page_count_ready = Signal(str, int)  # dosya_yolu, sayfa_sayısı (arka plandaki dizgi geçişi bitti)
     
-    def __init__(self, config):
+    def __init__(self, config, spooler=None):
         super().__init__()
         self.config = config
         self.print_history = []
         self.history_limit = config.get("history_limit", 100)
+        self.resume_points = {}  # iş_kimliği -> yarım kalan yazdırmanın devam noktası (yeniden deneme)
+        self.resumable = {}  # dosya_yolu -> başarısız biten işin devam noktası (elle sürdürme)
+        self.converter_pool = ConverterPool(config)
+        self.prerenderer = Prerenderer.from_config(self.converter_pool, config)
+        self.spooler = spooler if spooler is not None else create_spooler(config)
+        self.health = PrinterHealthMonitor(self.spooler, config)
+        self.metadata = MetadataCache()
+        self._layout_pending = set()  # sayfa sayısı için dönüştürülmekte olan dosyalar
+        self._layout_lock = threading.Lock()
+        self._context = threading.local()  # yazdırma iş parçacığına özel aşama ve hata bilgisi
+    
+    def apply_config(self, changes):
+        """Yapılandırmadaki değişiklikleri yazdırmayı durdurmadan uygular"""
+        if "history_limit" in changes:
+            self.history_limit = changes["history_limit"]
+            self.print_history = self.print_history[-self.history_limit:]
+        if "prerender_cache_mb" in changes:
+            # Sınır küçüldüyse fazlası bir sonraki kayıtta silinir
+            self.prerenderer.cache.max_bytes = changes["prerender_cache_mb"] * 1024 * 1024
+        if "health_poll_interval" in changes:
+            self.health.poll_interval = changes["health_poll_interval"]
+    
+    def shutdown(self):
+        """Yazıcı izleyicisini, ön hazırlayıcıyı ve dönüştürücü havuzunu durdurup bitmelerini bekler"""
+        self.health.stop()
+        self.prerenderer.stop()
+        # Süren dönüştürme biter, bekleyenler iptal edilir; ön hazırlayıcı da ardından çıkar
+        self.converter_pool.shutdown(wait=True)
+        self.prerenderer.stop(wait=True)
     
     def get_available_printers(self):
         """Sistemde kullanılabilir yazıcıların listesini döndürür"""
         printers = []
-        for printer in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS):
+        default_printer = self.spooler.default_printer()
+        for printer_name in self.spooler.list_printers():
             printers.append({
-                "name": printer[2],
-                "is_default": printer[2] == win32print.GetDefaultPrinter()
+                "name": printer_name,
+                "is_default": printer_name == default_printer
             })
         return printers
     
+    def get_default_printer(self):
+        """Yapılandırmadaki ya da sistemdeki varsayılan yazıcıyı döndürür"""
+        return self.config.get("default_printer") or self.spooler.default_printer()
+    
     def get_available_paper_sizes(self, printer_name=None):
         """Belirtilen yazıcı için kullanılabilir kağıt boyutlarını döndürür"""
         # Temel kağıt boyutları
-        paper_sizes = [
-            {"name": "A4", "value": win32con.DMPAPER_A4},
-            {"name": "A5", "value": win32con.DMPAPER_A5},
-            {"name": "Letter", "value": win32con.DMPAPER_LETTER},
-            {"name": "Legal", "value": win32con.DMPAPER_LEGAL}
-        ]
+        paper_sizes = [{"name": name, "value": value} for name, value in PAPER_SIZE_CODES.items()]
         
         # İleri seviye: Yazıcıya özel kağıt boyutlarını almak için
         # Bu kısım daha karmaşık olduğu için şimdilik temel boyutları döndürüyoruz
         return paper_sizes
     
-    def print_document(self, file_path, printer_name=None, paper_size=None, copies=None, duplex=None):
-        """Belgeyi belirtilen ayarlarla yazdırır"""
+    def print_document(self, file_path, printer_name=None, paper_size=None, copies=None, duplex=None,
+                       start_page=0, start_copy=0, page_range=None, pages_per_sheet=1, booklet=False,
+                       fit_to_page=False, on_stage=None, job_id=None, image_batch=None, contact_sheet=False,
+                       handout=None, merge_batch=None, separator_pages=False, resume_key=None):
+        """Belgeyi belirtilen ayarlarla yazdırır
+        
+        job_id verilirse başarı yalnızca biriktiriciye teslimi ifade eder; geçmiş kaydı
+        iş gerçekten bitince finish_print ile tamamlanır. Resim dosyalarında image_batch
+        ile verilen diğer fotoğraflar aynı işte (istenirse temas sayfası olarak) basılır.
+        Sunumlarda handout sayfa başına slayt sayısıdır (0: slaytlar tek tek basılır).
+        merge_batch ile verilen dosyalar belgeyle birleştirilip tek biriktirici işi olarak
+        basılır; geçmişe her dosya ayrı kaydedilir. Yarım kalan yazdırmanın devam noktası
+        resume_key (kuyruk iş kimliği) ile saklanır.
+        """
+        # Aşama bildirimleri, son hata ve gönderilen biriktirici işleri bu iş parçacığına özel tutulur
+        self._context.on_stage = on_stage
+        self._context.error = None
+        self._context.spool_jobs = []
+        self._context.merged_files = None
+        self._context.resume_key = resume_key
+        # Tahmini hazırlık gerçek yazdırmaya yol verir
+        self.prerenderer.begin_print()
+        try:
+            return self._print_document(
+                file_path, printer_name, paper_size, copies, duplex, start_page, start_copy,
+                page_range, pages_per_sheet, booklet, fit_to_page, job_id, image_batch, contact_sheet, handout,
+                merge_batch, separator_pages
+            )
+        finally:
+            if on_stage is not None and self._context.error is not None:
+                error = self._context.error
+                on_stage("error", {"message": str(error), "transient": is_transient_error(error)})
+            self._context.on_stage = None
+            self._context.error = None
+            self._context.spool_jobs = []
+            self._context.merged_files = None
+            self._context.resume_key = None
+            self.prerenderer.end_print()
+    
+    def _print_document(self, file_path, printer_name, paper_size, copies, duplex, start_page, start_copy,
+                        page_range, pages_per_sheet, booklet, fit_to_page, job_id=None,
+                        image_batch=None, contact_sheet=False, handout=None, merge_batch=None,
+                        separator_pages=False):
+        """print_document'ın asıl gövdesi"""
         try:
             # Yapılandırmadan varsayılan değerleri al
             if printer_name is None:
-                printer_name = self.config.get("default_printer", win32print.GetDefaultPrinter())
+                printer_name = self.get_default_printer()
+            
+            # Devre kesicisi açık yazıcıya gönderme; yedek yazıcıya yönlendir ya da işi beklet
+            routed_printer = self.health.route(printer_name)
+            if routed_printer != printer_name:
+                logger.info("%s kullanılamıyor, %s yazıcısına yönlendirildi: %s",
+                            printer_name, routed_printer, os.path.basename(file_path))
+                printer_name = routed_printer
             
             if paper_size is None:
                 paper_size = self.config.get("default_paper_size", "A4")
@@ -81,34 +230,98 @@ class DocumentProcessor(QObject):
             # Dosya uzantısına göre yazdırma işlemini gerçekleştir
             ext = os.path.splitext(file_path)[1].lower()
             
-            if ext == ".pdf":
-                success = self._print_pdf(file_path, printer_name, paper_size, copies, duplex)
+            # Not sayfası düzeni yalnızca sunumlara uygulanır
+            if ext not in POWERPOINT_EXTENSIONS:
+                handout = 0
+            elif handout is None:
+                handout = self.config.get("presentation_handout", 0)
+            
+            layout = {
+                "page_range": page_range,
+                "pages_per_sheet": pages_per_sheet,
+                "booklet": booklet,
+                "fit_to_page": fit_to_page,
+                "handout": handout
+            }
+            
+            # Önceden hazırlanmış PDF varsa yazdırma yalnızca biriktiriciye yazmaktan ibarettir
+            prerendered = None
+            if ext in OFFICE_EXTENSIONS and not needs_imposition(**layout):
+                prerendered = self._get_prerendered(file_path)
+            
+            if merge_batch:
+                # Birden çok küçük dosya tek biriktirici işinde basılır
+                success = self._print_merged([file_path] + list(merge_batch), printer_name, paper_size,
+                                             copies, duplex, separator_pages)
+            elif needs_imposition(**layout):
+                # Sayfa aralığı, N-up, kitapçık, sığdırma ya da not sayfası istendiyse PDF üzerinden impoze et
+                success = self._print_imposed(file_path, printer_name, paper_size, copies, layout,
+                                              start_page, start_copy)
+            elif prerendered:
+                success = self._print_prerendered(file_path, prerendered, printer_name, copies,
+                                                  start_page, start_copy)
+            elif ext == ".pdf":
+                success = self._print_pdf(file_path, printer_name, paper_size, copies, duplex,
+                                          start_page, start_copy)
+            elif ext in POWERPOINT_EXTENSIONS:
+                success = self._print_presentation(file_path, printer_name, copies, start_page, start_copy)
             elif ext == ".docx":
                 success = self._print_docx(file_path, printer_name, paper_size, copies, duplex)
-            elif ext in [".jpg", ".jpeg", ".png", ".bmp", ".gif"]:
-                success = self._print_image(file_path, printer_name, paper_size, copies, duplex)
-            elif ext in [".txt"]:
-                success = self._print_text(file_path, printer_name, paper_size, copies, duplex)
+            elif ext in IMAGE_EXTENSIONS:
+                success = self._print_image(file_path, printer_name, paper_size, copies, duplex,
+                                            start_page, start_copy, image_batch, contact_sheet)
+            elif ext in XLSX_EXTENSIONS:
+                success = self._print_xlsx(file_path, printer_name, paper_size, copies, duplex,
+                                           start_page, start_copy)
+            elif ext in TEXT_EXTENSIONS:
+                success = self._print_text(file_path, printer_name, paper_size, copies, duplex,
+                                           start_page, start_copy)
             else:
                 # Desteklenmeyen dosya türü için Windows'un varsayılan yazdırma işlemini kullan
                 success = self._print_generic(file_path, printer_name, copies)
             
-            # Yazdırma geçmişine ekle
-            self._add_to_history(file_path, printer_name, success)
+            # Yazdırma geçmişine ekle; birleştirilmiş işte her dosya kendi sayfa sayısıyla ayrı kaydedilir
+            merged_files = self._context.merged_files or [(file_path, None)]
+            if success:
+                self._set_stage(JOB_PRINTING, {
+                    "printer_name": printer_name,
+                    "spool_jobs": list(self._context.spool_jobs),
+                    "document_name": os.path.basename(file_path)
+                })
+                self._context.error = None
+                self.resume_points.pop(self._context.resume_key, None)
+                self.resumable.pop(file_path, None)
+                
+                if job_id is not None:
+                    # İş biriktiricide; sonuç izleyiciden gelince geçmiş güncellenecek
+                    for merged_path, pages in merged_files:
+                        self._add_to_history(merged_path, printer_name, None, job_id=job_id, pages=pages)
+                    self.print_submitted.emit(file_path, printer_name)
+                    return True
+            
+            resume_point = self.resume_points.get(self._context.resume_key)
+            if not success and resume_point:
+                self._add_to_history(file_path, printer_name, False,
+                                     f"Sayfa {resume_point['page'] + 1}'den devam edilebilir")
+            else:
+                for merged_path, pages in merged_files:
+                    self._add_to_history(merged_path, printer_name, success, pages=pages)
             
             # Yazdırma tamamlandı sinyali gönder
-            self.print_completed.emit(file_path, success)
+            for merged_path, _ in merged_files:
+                self.print_completed.emit(merged_path, success)
             
             return success
             
         except Exception as e:
+            self._record_error(e)
             error_msg = str(e)
-            print(f"Yazdırma hatası: {error_msg}")
+            logger.error("Yazdırma hatası: %s", error_msg)
             self.print_error.emit(file_path, error_msg)
             self._add_to_history(file_path, printer_name, False, error_msg)
             return False
     
-    def _print_pdf(self, file_path, printer_name, paper_size, copies, duplex):
+    def _print_pdf(self, file_path, printer_name, paper_size, copies, duplex, start_page=0, start_copy=0):
         """PDF belgesini yazdırır"""
         try:
             # PDF dosyasının varlığını kontrol et
@@ -116,163 +329,543 @@ class DocumentProcessor(QObject):
                 raise FileNotFoundError(f"PDF dosyası bulunamadı: {file_path}")
             
             # PyPDF2 ile PDF dosyasını aç ve sayfa sayısını kontrol et
+            # (sayfa içerikleri yalnızca erişildiğinde okunur)
             with open(file_path, 'rb') as pdf_file:
                 pdf_reader = PdfReader(pdf_file)
                 page_count = len(pdf_reader.pages)
-                print(f"PDF dosyası açıldı: {file_path}, {page_count} sayfa")
+                logger.info("PDF dosyası açıldı: %s, %s sayfa", file_path, page_count)
+                
+                # Büyük PDF'leri sayfa aralıklarına bölerek sırayla gönder
+                chunk_threshold = self.config.get("pdf_chunk_threshold", 50)
+                if page_count > chunk_threshold or start_page > 0 or start_copy > 0:
+                    return self._print_pdf_chunked(
+                        file_path, pdf_reader, page_count, printer_name, copies, start_page, start_copy
+                    )
             
-            # Alternatif yazdırma yöntemi kullan
-            # ShellExecute yerine doğrudan win32print kullan
+            # Doğrudan biriktiriciye gönder
             try:
-                # Yazıcının varlığını kontrol et
-                printers = [p[2] for p in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)]
-                if printer_name not in printers:
-                    raise ValueError(f"Yazıcı bulunamadı: {printer_name}")
+                self._check_printer(printer_name)
+                self._set_stage(JOB_SPOOLING)
                 
-                # Yazıcı bağlantısını aç
-                hPrinter = win32print.OpenPrinter(printer_name)
-                try:
-                    # Yazdırma işi başlat
-                    hJob = win32print.StartDocPrinter(hPrinter, 1, (os.path.basename(file_path), None, "RAW"))
-                    try:
-                        # PDF dosyasını doğrudan yazdırmak için GhostScript veya başka bir PDF işleyici gerekebilir
-                        # Şimdilik dosyayı doğrudan yazıcıya göndermeyi deneyelim
-                        for i in range(copies):
-                            # Dosyayı oku
-                            with open(file_path, 'rb') as f:
-                                data = f.read()
-                                # Yazıcıya gönder
-                                win32print.StartPagePrinter(hPrinter)
-                                win32print.WritePrinter(hPrinter, data)
-                                win32print.EndPagePrinter(hPrinter)
-                        return True
-                    finally:
-                        win32print.EndDocPrinter(hPrinter)
-                finally:
-                    win32print.ClosePrinter(hPrinter)
+                # PDF dosyasını doğrudan yazdırmak için GhostScript veya başka bir PDF işleyici gerekebilir
+                # Şimdilik dosyayı doğrudan yazıcıya göndermeyi deneyelim
+                self._spool_raw(printer_name, os.path.basename(file_path), file_path, copies)
+                self.print_progress.emit(file_path, page_count, page_count)
+                return True
             except Exception as e:
-                print(f"PDF doğrudan yazdırma hatası: {e}")
-                # Doğrudan yazdırma başarısız olursa, alternatif yöntem olarak varsayılan yazdırma işlemini dene
-                print("Alternatif yazdırma yöntemi deneniyor...")
-                return self._print_generic_alternative(file_path, printer_name, copies)
+                self._record_error(e)
+                logger.warning("PDF doğrudan yazdırma hatası: %s", e)
+                if is_transient_error(e):
+                    # Yazıcı kaynaklı hata; başka yöntemle aynı yazıcıyı zorlamak yerine iş bekletilir
+                    return False
+                # Doğrudan yazdırma başarısız olursa PDF uygulamasıyla hedef yazıcıya yazdırmayı dene
+                logger.info("Alternatif yazdırma yöntemi deneniyor...")
+                return self._print_generic(file_path, printer_name, copies)
             
         except FileNotFoundError as fnf:
-            print(f"PDF dosyası hatası: {fnf}")
+            self._record_error(fnf)
+            logger.error("PDF dosyası hatası: %s", fnf)
             return False
         except Exception as e:
-            print(f"PDF yazdırma hatası: {e}")
+            self._record_error(e)
+            logger.error("PDF yazdırma hatası: %s", e)
             return False
     
-    def _print_docx(self, file_path, printer_name, paper_size, copies, duplex):
-        """Word belgesini yazdırır"""
-        # Windows'un varsayılan Word yazdırma işlemini kullan
-        return self._print_generic(file_path, printer_name, copies)
+    def _print_pdf_chunked(self, file_path, pdf_reader, page_count, printer_name, copies,
+                           start_page=0, start_copy=0):
+        """Büyük PDF'i sayfa aralığı alt işlerine bölerek sırayla yazdırır"""
+        return self._spool_chunks(
+            file_path, printer_name, copies, page_count,
+            lambda first_page: self._iter_pdf_chunks(pdf_reader, page_count, first_page),
+            start_page, start_copy
+        )
     
-    def _print_image(self, file_path, printer_name, paper_size, copies, duplex):
-        """Görüntü dosyasını yazdırır"""
-        # Windows'un varsayılan görüntü yazdırma işlemini kullan
-        return self._print_generic(file_path, printer_name, copies)
+    def _print_imposed(self, file_path, printer_name, paper_size, copies, layout, start_page=0, start_copy=0):
+        """Belgeyi impozisyon ayarlarıyla yeniden düzenleyip parça parça yazdırır"""
+        work_dir = tempfile.mkdtemp(prefix="mukaprint_")
+        try:
+            self._set_stage(JOB_CONVERTING)
+            source_path = self._get_pdf_source(file_path, work_dir)
+            with open(source_path, 'rb') as pdf_file:
+                page_count = len(PdfReader(pdf_file).pages)
+            
+            sheets = plan_sheets(
+                page_count, layout["page_range"], layout["pages_per_sheet"], layout["booklet"], layout["handout"]
+            )
+            logger.info("İmpozisyon planlandı: %s, %s sayfa -> %s yüz",
+                        os.path.basename(file_path), page_count, len(sheets))
+            
+            options = {
+                "paper_size": paper_size,
+                "pages_per_sheet": layout["pages_per_sheet"],
+                "booklet": layout["booklet"],
+                "fit_to_page": layout["fit_to_page"],
+                "handout": layout["handout"]
+            }
+            return self._spool_chunks(
+                file_path, printer_name, copies, len(sheets),
+                lambda first_sheet: self._iter_imposed_chunks(source_path, sheets, options, first_sheet, work_dir),
+                start_page, start_copy, layout
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
     
-    def _print_text(self, file_path, printer_name, paper_size, copies, duplex):
-        """Metin dosyasını yazdırır"""
-        # Windows'un varsayılan metin yazdırma işlemini kullan
-        return self._print_generic(file_path, printer_name, copies)
+    def _print_presentation(self, file_path, printer_name, copies, start_page=0, start_copy=0):
+        """Sunumu dönüştürücü havuzunda PDF'e çevirip slaytları parça parça yazdırır"""
+        work_dir = tempfile.mkdtemp(prefix="mukaprint_")
+        try:
+            self._set_stage(JOB_CONVERTING)
+            try:
+                source_path = self._get_pdf_source(file_path, work_dir)
+            except Exception as e:
+                self._record_error(e)
+                logger.warning("Sunum PDF'e dönüştürülemedi: %s", e)
+                # Dönüştürücü yoksa sunumu kendi uygulamasıyla yazdırmayı dene
+                logger.info("Alternatif yazdırma yöntemi deneniyor...")
+                return self._print_generic(file_path, printer_name, copies)
+            return self._print_prerendered(file_path, source_path, printer_name, copies, start_page, start_copy)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
     
-    def _print_generic(self, file_path, printer_name, copies=1):
-        """Windows'un varsayılan yazdırma işlemini kullanarak belgeyi yazdırır"""
+    def _print_merged(self, file_paths, printer_name, paper_size, copies, duplex, separator_pages=False):
+        """Dosyaları PDF'e çevirip tek belgede birleştirir ve tek biriktirici işi olarak yazdırır"""
+        work_dir = tempfile.mkdtemp(prefix="mukaprint_")
         try:
-            # Dosyanın varlığını kontrol et
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Dosya bulunamadı: {file_path}")
-                
-            # Yazıcının varlığını kontrol et
-            printers = [p[2] for p in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)]
-            if printer_name not in printers:
-                raise ValueError(f"Yazıcı bulunamadı: {printer_name}")
+            self._set_stage(JOB_CONVERTING)
+            sources = []
+            for file_path, result in self._prepare_merge_sources(file_paths, paper_size, work_dir):
+                if isinstance(result, Exception):
+                    # Hazırlanamayan dosya tüm işi düşürmez, geçmişe ayrıca başarısız olarak yazılır
+                    logger.warning("Dosya birleştirilemedi: %s: %s", os.path.basename(file_path), result)
+                    self._add_to_history(file_path, printer_name, False, str(result))
+                    self.print_error.emit(file_path, str(result))
+                else:
+                    sources.append((file_path, result))
+            if not sources:
+                raise ValueError("Birleştirilecek dosya kalmadı")
             
-            # Varsayılan yazıcıyı geçici olarak değiştir
-            current_printer = win32print.GetDefaultPrinter()
-            win32print.SetDefaultPrinter(printer_name)
+            merged_path = os.path.join(work_dir, "merged.pdf")
+            accounting = merge_documents(sources, merged_path, paper_size, separator_pages, duplex)
+            with open(merged_path, 'rb') as pdf_file:
+                total_pages = len(PdfReader(pdf_file).pages)
+            self._context.merged_files = [(path, pages) for path, _, pages in accounting]
+            logger.info("%s dosya birleştirildi: %s sayfa", len(sources), total_pages)
             
+            # Sürücü ve yazıcı hazırlığı tüm dosyalar için bir kez yapılır
+            self._check_printer(printer_name)
+            self._set_stage(JOB_SPOOLING)
+            document_name = f"{os.path.basename(sources[0][0])} (+{len(sources) - 1} dosya)"
+            self._spool_raw(printer_name, document_name, merged_path, copies)
+            self.print_progress.emit(file_paths[0], total_pages * copies, total_pages * copies)
+            return True
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def _prepare_merge_sources(self, file_paths, paper_size, work_dir):
+        """Birleştirilecek dosyaların (dosya, PDF yolu ya da hata) çiftlerini sırayla üretir"""
+        # Dönüştürülecek ofis belgeleri önden havuza verilir, diğer dosyalar hazırlanırken paralel çevrilir
+        conversions = {}
+        for index, file_path in enumerate(file_paths):
+            ext = os.path.splitext(file_path)[1].lower()
+            if (ext in OFFICE_EXTENSIONS and ext not in XLSX_EXTENSIONS and os.path.exists(file_path)
+                    and not self.prerenderer.cache.lookup(file_path)):
+                output_dir = os.path.join(work_dir, f"convert_{index}")
+                os.makedirs(output_dir)
+                future = self.converter_pool.convert_to_pdf(file_path, output_dir)
+                conversions[index] = (cache_key(file_path), future)
+        
+        for index, file_path in enumerate(file_paths):
             try:
-                # Belgeyi yazdır
-                for i in range(copies):
-                    try:
-                        win32api.ShellExecute(
-                            0, "print", file_path, None, ".", 0
-                        )
-                    except Exception as print_error:
-                        print(f"Kopya {i+1} yazdırılırken hata: {print_error}")
-                        raise
-                
-                return True
-            finally:
-                # Varsayılan yazıcıyı geri al
+                if not os.path.exists(file_path):
+                    raise FileNotFoundError(f"Dosya bulunamadı: {file_path}")
+                if index in conversions:
+                    key, future = conversions[index]
+                    pdf_path = future.result()
+                    self.prerenderer.cache.store(key, pdf_path)
+                else:
+                    pdf_path = self._render_merge_source(file_path, paper_size, index, work_dir)
+            except Exception as e:
+                yield file_path, e
+            else:
+                yield file_path, pdf_path
+    
+    def _render_merge_source(self, file_path, paper_size, index, work_dir):
+        """Dosyanın birleştirmeye girecek PDF halini döndürür; Pillow ile çizilen türleri PDF'e yazar"""
+        ext = os.path.splitext(file_path)[1].lower()
+        dpi = self.config.get("raster_dpi", DEFAULT_DPI)
+        if ext in IMAGE_EXTENSIONS:
+            pages = iter_image_pages([file_path], paper_size, dpi, margin_mm=self.config.get("image_margin_mm", 5))
+        elif ext in XLSX_EXTENSIONS:
+            renderer = self._create_workbook_renderer(file_path, paper_size, dpi)
+            if renderer.page_count() == 0:
+                raise ValueError(f"Çalışma kitabında basılacak hücre yok: {os.path.basename(file_path)}")
+            pages = renderer.iter_pages()
+        elif ext in TEXT_EXTENSIONS:
+            pages = self._create_text_renderer(file_path, paper_size, dpi).iter_pages()
+        else:
+            # PDF olduğu gibi, ofis belgeleri önbellekteki dönüşümüyle kullanılır
+            return self._get_pdf_source(file_path, work_dir)
+        
+        pdf_path = os.path.join(work_dir, f"merge_{index}.pdf")
+        with open(pdf_path, 'wb') as f:
+            f.write(pages_to_pdf(pages, dpi))
+        return pdf_path
+    
+    def _print_raster(self, file_path, printer_name, copies, page_count, page_source, dpi,
+                      start_page=0, start_copy=0, options=None):
+        """Pillow ile çizilen sayfaları PDF parçaları halinde biriktiriciye gönderir"""
+        work_dir = tempfile.mkdtemp(prefix="mukaprint_")
+        try:
+            return self._spool_chunks(
+                file_path, printer_name, copies, page_count,
+                lambda first_page: self._iter_raster_chunks(page_source, page_count, first_page, dpi, work_dir),
+                start_page, start_copy, options
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def _print_prerendered(self, file_path, pdf_path, printer_name, copies, start_page=0, start_copy=0):
+        """Önbellekteki hazır PDF'i parça parça biriktiriciye gönderir"""
+        try:
+            with open(pdf_path, 'rb') as pdf_file:
+                pdf_reader = PdfReader(pdf_file)
+                page_count = len(pdf_reader.pages)
+                logger.info("Hazır PDF kullanılıyor: %s, %s sayfa", os.path.basename(file_path), page_count)
+                return self._spool_chunks(
+                    file_path, printer_name, copies, page_count,
+                    lambda first_page: self._iter_pdf_chunks(pdf_reader, page_count, first_page),
+                    start_page, start_copy
+                )
+        except Exception as e:
+            self._record_error(e)
+            logger.error("Hazır PDF yazdırma hatası: %s", e)
+            return False
+    
+    def _get_prerendered(self, file_path):
+        """Dosyanın önceden hazırlanmış PDF'ini döndürür, hazırlanıyorsa bitmesini bekler"""
+        if not self.config.get("prerender_enabled", False):
+            return None
+        return self.prerenderer.wait_for(file_path)
+    
+    def _get_pdf_source(self, file_path, work_dir):
+        """Belgenin PDF halini döndürür, ofis belgelerini dönüştürücü havuzunda çevirir"""
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == ".pdf":
+            return file_path
+        if ext in OFFICE_EXTENSIONS:
+            with tracer.span("prerender_wait", ext=ext) as span:
+                prerendered = self._get_prerendered(file_path) or self.prerenderer.cache.lookup(file_path)
+                span["hit"] = bool(prerendered)
+            if prerendered:
+                return prerendered
+            logger.info("Belge PDF'e dönüştürülüyor: %s", os.path.basename(file_path))
+            key = cache_key(file_path)
+            with tracer.span("office_convert", ext=ext):
+                pdf_path = self.converter_pool.convert_to_pdf(file_path, work_dir).result()
+            # Yeniden basımlarda ve farklı sayfa düzenleriyle basımda dönüştürme tekrarlanmasın
+            self.prerenderer.cache.store(key, pdf_path)
+            return pdf_path
+        raise ValueError(f"Bu dosya türü için sayfa düzeni desteklenmiyor: {ext}")
+    
+    def _spool_chunks(self, file_path, printer_name, copies, total_pages, chunk_source,
+                      start_page=0, start_copy=0, options=None):
+        """Parça üreticisinden gelen alt işleri sırayla biriktiriciye gönderir"""
+        self._check_printer(printer_name)
+        self._set_stage(JOB_SPOOLING)
+        file_name = os.path.basename(file_path)
+        
+        for copy_index in range(start_copy, copies):
+            first_page = start_page if copy_index == start_copy else 0
+            for chunk_start, chunk_end, data in chunk_source(first_page):
                 try:
-                    win32print.SetDefaultPrinter(current_printer)
-                except Exception as reset_error:
-                    print(f"Varsayılan yazıcı geri alınırken hata: {reset_error}")
+                    # Her parça ayrı bir biriktirici işi olarak gönderilir, yazıcı hemen başlayabilir
+                    document_name = f"{file_name} [{chunk_start + 1}-{chunk_end}/{total_pages}]"
+                    self._spool_raw(printer_name, document_name, data)
+                except Exception as e:
+                    self._record_error(e)
+                    # Kaldığı yeri kaydet, tekrar denemede baştan basılmasın
+                    self._save_resume_point({
+                        "file_path": file_path,
+                        "page": chunk_start,
+                        "copy": copy_index,
+                        "page_count": total_pages,
+                        "printer_name": printer_name,
+                        "copies": copies,
+                        "options": options or {}
+                    })
+                    logger.warning("Belge parçası gönderilemedi (%s-%s): %s", chunk_start + 1, chunk_end, e)
+                    return False
                 
-        except FileNotFoundError as fnf:
-            print(f"Dosya hatası: {fnf}")
-            return False
-        except ValueError as ve:
-            print(f"Yazıcı hatası: {ve}")
-            return False
+                sent_pages = copy_index * total_pages + chunk_end
+                self.print_progress.emit(file_path, sent_pages, total_pages * copies)
+                logger.debug("Belge parçası gönderildi: %s, kopya %s/%s", document_name, copy_index + 1, copies)
+        
+        self.resume_points.pop(getattr(self._context, "resume_key", None), None)
+        return True
+    
+    def _chunk_ranges(self, page_count, start_page=0):
+        """Sayfa ya da yüz aralıklarını, ilki küçük olacak şekilde döndürür"""
+        first_chunk = max(1, self.config.get("pdf_first_chunk_pages", 5))
+        chunk_pages = max(1, self.config.get("pdf_chunk_pages", 25))
+        
+        # İlk parça küçük tutulur, böylece ilk sayfa hızla çıkar
+        ranges = []
+        chunk_start = start_page
+        size = first_chunk
+        while chunk_start < page_count:
+            chunk_end = min(page_count, chunk_start + size)
+            ranges.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
+            size = chunk_pages
+        return ranges
+    
+    def _iter_pdf_chunks(self, pdf_reader, page_count, start_page=0):
+        """PDF'i sayfa aralıklarına bölerek (başlangıç, bitiş, veri) üçlüleri üretir"""
+        for chunk_start, chunk_end in self._chunk_ranges(page_count, start_page):
+            writer = PdfWriter()
+            for page_index in range(chunk_start, chunk_end):
+                writer.add_page(pdf_reader.pages[page_index])
+            buffer = io.BytesIO()
+            writer.write(buffer)
+            yield chunk_start, chunk_end, buffer.getvalue()
+    
+    def _iter_raster_chunks(self, page_source, page_count, start_page, dpi, work_dir):
+        """Sayfa üreticisini parça parça PDF'e çevirir; çizilen parçalar sonraki kopyalar için diskte tutulur"""
+        pages = None
+        for chunk_start, chunk_end in self._chunk_ranges(page_count, start_page):
+            chunk_path = os.path.join(work_dir, f"raster_{chunk_start}_{chunk_end}.pdf")
+            if os.path.exists(chunk_path):
+                with open(chunk_path, 'rb') as f:
+                    data = f.read()
+                # Sonraki çizilecek parça kendi başlangıcından yeniden üretilir
+                pages = None
+            else:
+                if pages is None:
+                    pages = page_source(chunk_start)
+                data = pages_to_pdf(itertools.islice(pages, chunk_end - chunk_start), dpi)
+                with open(chunk_path, 'wb') as f:
+                    f.write(data)
+            yield chunk_start, chunk_end, data
+    
+    def _iter_imposed_chunks(self, source_path, sheets, options, start_sheet, work_dir):
+        """İmpoze edilmiş parçaları çalışan süreçlerde hazırlatıp sırayla üretir"""
+        ranges = iter(self._chunk_ranges(len(sheets), start_sheet))
+        pending = deque()
+        
+        def submit_next():
+            chunk = next(ranges, None)
+            if chunk is not None:
+                output_path = os.path.join(work_dir, f"sheets_{chunk[0]}.pdf")
+                future = self.converter_pool.submit(
+                    impose_pdf, source_path, output_path, sheets[chunk[0]:chunk[1]], **options
+                )
+                pending.append((chunk, future))
+        
+        # Sınırlı sayıda parçayı önden hazırlat, bellek ve disk kullanımı sabit kalsın
+        for _ in range(self.converter_pool.max_workers + 1):
+            submit_next()
+        
+        try:
+            while pending:
+                (chunk_start, chunk_end), future = pending.popleft()
+                output_path = future.result()
+                submit_next()
+                with open(output_path, 'rb') as f:
+                    data = f.read()
+                os.remove(output_path)
+                yield chunk_start, chunk_end, data
+        finally:
+            for _, future in pending:
+                future.cancel()
+    
+    def _check_printer(self, printer_name):
+        """Yazıcının sistemde tanımlı olduğunu doğrular"""
+        if printer_name not in self.spooler.list_printers():
+            raise ValueError(f"Yazıcı bulunamadı: {printer_name}")
+    
+    def _spool_raw(self, printer_name, document_name, data, copies=1):
+        """Veriyi (bayt ya da dosya yolu) biriktiriciye gönderir ve iş kimliğini izleme için saklar"""
+        try:
+            with tracer.span("spool_submit", printer=printer_name):
+                spool_job_id = self.spooler.submit_raw(printer_name, document_name, data, copies)
         except Exception as e:
-            print(f"Genel yazdırma hatası: {e}")
-            print(f"Hata türü: {type(e).__name__}, Hata kodu: {getattr(e, 'winerror', 'Bilinmiyor')}")
-            return False
+            # Yalnızca yazıcı kaynaklı (geçici) hatalar devre kesiciye sayılır
+            if is_transient_error(e):
+                self.health.record_result(printer_name, False, str(e))
+            raise
+        self.health.record_result(printer_name, True)
+        spool_jobs = getattr(self._context, "spool_jobs", None)
+        if spool_jobs is not None:
+            spool_jobs.append(spool_job_id)
+        return spool_job_id
+    
+    def _print_file(self, printer_name, file_path):
+        """Dosyayı uygulaması üzerinden yazdırır ve iş kimliği biliniyorsa izleme için saklar"""
+        try:
+            with tracer.span("spool_submit", printer=printer_name, application=True):
+                spool_job_id = self.spooler.print_file(printer_name, file_path)
+        except Exception as e:
+            if is_transient_error(e):
+                self.health.record_result(printer_name, False, str(e))
+            raise
+        self.health.record_result(printer_name, True)
+        spool_jobs = getattr(self._context, "spool_jobs", None)
+        if spool_job_id is not None and spool_jobs is not None:
+            spool_jobs.append(spool_job_id)
+        return spool_job_id
+    
+    def _set_stage(self, stage, detail=None):
+        """Yürütülen işin aşamasını (varsa) kuyruğa bildirir"""
+        on_stage = getattr(self._context, "on_stage", None)
+        if on_stage is not None:
+            on_stage(stage, detail)
+    
+    def _record_error(self, error):
+        """Yürütülen işin son hatasını yeniden deneme kararı için saklar"""
+        self._context.error = error
+    
+    def _save_resume_point(self, resume_point):
+        """Yürütülen işin devam noktasını iş kimliğiyle saklar (kimliksiz yazdırmada saklanmaz)"""
+        resume_key = getattr(self._context, "resume_key", None)
+        if resume_key is not None:
+            self.resume_points[resume_key] = resume_point
+    
+    def get_resume_point(self, job_id):
+        """İşin yarım kalan yazdırmasının devam noktasını döndürür"""
+        return self.resume_points.get(job_id)
+    
+    def clear_resume_point(self, job_id, success=True):
+        """Biten işin devam noktasını siler; iş başarısız bittiyse nokta dosya için elle sürdürmeye saklanır"""
+        resume_point = self.resume_points.pop(job_id, None)
+        if resume_point is not None and not success:
+            self.resumable[resume_point["file_path"]] = resume_point
+        return resume_point
     
-    def _print_generic_alternative(self, file_path, printer_name, copies=1):
-        """ShellExecute'e alternatif olarak belgeyi yazdırır"""
+    def get_resumable(self, file_path):
+        """Dosyanın elle sürdürülebilecek yarım yazdırmasını döndürür"""
+        return self.resumable.get(file_path)
+    
+    def take_resumable(self, file_path):
+        """Dosyanın elle sürdürülecek devam noktasını döndürür ve siler"""
+        return self.resumable.pop(file_path, None)
+    
+    def _print_docx(self, file_path, printer_name, paper_size, copies, duplex):
+        """Word belgesini yazdırır"""
+        # Windows'un varsayılan Word yazdırma işlemini kullan
+        return self._print_generic(file_path, printer_name, copies)
+    
+    def _print_image(self, file_path, printer_name, paper_size, copies, duplex, start_page=0, start_copy=0,
+                     image_batch=None, contact_sheet=False):
+        """Görüntü dosyalarını yazıcı çözünürlüğünde kağıda sığdırıp tek iş olarak yazdırır"""
+        file_paths = [file_path] + [path for path in image_batch or [] if path != file_path]
+        for path in file_paths:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Resim dosyası bulunamadı: {path}")
+        
+        dpi = self.config.get("raster_dpi", DEFAULT_DPI)
+        grid = tuple(self.config.get("contact_sheet_grid", CONTACT_SHEET_GRID))
+        margin_mm = self.config.get("image_margin_mm", 5)
+        page_count = image_page_count(len(file_paths), contact_sheet, grid)
+        logger.info("Resim sayfaları hazırlanıyor: %s, %s resim -> %s sayfa",
+                    os.path.basename(file_path), len(file_paths), page_count)
+        
+        # Devam ederken aynı fotoğraf kümesi ve yerleşim kullanılsın
+        options = {"image_batch": file_paths[1:], "contact_sheet": contact_sheet}
+        return self._print_raster(
+            file_path, printer_name, copies, page_count,
+            lambda first_page: iter_image_pages(file_paths, paper_size, dpi, first_page, contact_sheet,
+                                                grid, margin_mm),
+            dpi, start_page, start_copy, options
+        )
+    
+    def _print_text(self, file_path, printer_name, paper_size, copies, duplex, start_page=0, start_copy=0):
+        """Metin dosyasını kodlamasını tanıyarak sayfalara dizer ve parça parça yazdırır"""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Metin dosyası bulunamadı: {file_path}")
+        
+        dpi = self.config.get("raster_dpi", DEFAULT_DPI)
+        renderer = self._create_text_renderer(file_path, paper_size, dpi)
+        self._set_stage(JOB_CONVERTING)
+        page_count = renderer.page_count()
+        logger.info("Metin dosyası sayfalandı: %s, %s, %s sayfa",
+                    os.path.basename(file_path), renderer.encoding, page_count)
+        return self._print_raster(
+            file_path, printer_name, copies, page_count, renderer.iter_pages, dpi, start_page, start_copy
+        )
+    
+    def _print_xlsx(self, file_path, printer_name, paper_size, copies, duplex, start_page=0, start_copy=0):
+        """Excel çalışma kitabını yazdırma alanı, sayfa sonları ve sığdırma ayarlarıyla Excel'siz yazdırır"""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Çalışma kitabı bulunamadı: {file_path}")
+        
+        dpi = self.config.get("raster_dpi", DEFAULT_DPI)
+        self._set_stage(JOB_CONVERTING)
+        renderer = self._create_workbook_renderer(file_path, paper_size, dpi)
+        page_count = renderer.page_count()
+        if page_count == 0:
+            raise ValueError(f"Çalışma kitabında basılacak hücre yok: {os.path.basename(file_path)}")
+        logger.info("Çalışma kitabı sayfalandı: %s, %s sayfa -> %s kağıt",
+                    os.path.basename(file_path), len(renderer.pagers), page_count)
+        return self._print_raster(
+            file_path, printer_name, copies, page_count, renderer.iter_pages, dpi, start_page, start_copy
+        )
+    
+    def _create_text_renderer(self, file_path, paper_size, dpi):
+        """Yapılandırmadaki yazı tipi ve kenar boşluğuyla metin işleyicisi oluşturur"""
+        return TextRenderer(
+            file_path, paper_size, dpi,
+            font_name=self.config.get("text_font") or None,
+            font_size=self.config.get("text_font_size", 10),
+            margin_mm=self.config.get("text_margin_mm", 15)
+        )
+    
+    def _create_workbook_renderer(self, file_path, paper_size, dpi):
+        """Yapılandırmadaki yazı tipi ve kılavuz çizgisi ayarıyla çalışma kitabı işleyicisi oluşturur"""
+        return WorkbookRenderer(
+            file_path, paper_size, dpi,
+            font_name=self.config.get("xlsx_font") or None,
+            font_size=self.config.get("xlsx_font_size", 10),
+            gridlines=self.config.get("xlsx_gridlines", True)
+        )
+    
+    def _print_generic(self, file_path, printer_name, copies=1):
+        """Belgeyi kendi uygulamasıyla doğrudan hedef yazıcıya yazdırır"""
         try:
             # Dosyanın varlığını kontrol et
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Dosya bulunamadı: {file_path}")
-                
-            # Yazıcının varlığını kontrol et
-            printers = [p[2] for p in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)]
-            if printer_name not in printers:
-                raise ValueError(f"Yazıcı bulunamadı: {printer_name}")
             
-            # Varsayılan yazıcıyı geçici olarak değiştir
-            current_printer = win32print.GetDefaultPrinter()
-            win32print.SetDefaultPrinter(printer_name)
+            # Yazıcının varlığını kontrol et
+            self._check_printer(printer_name)
+            self._set_stage(JOB_SPOOLING)
             
-            try:
-                # Alternatif yazdırma yöntemi: win32api.ShellExecute yerine subprocess kullan
-                import subprocess
-                for i in range(copies):
-                    try:
-                        # Yazdırma komutu oluştur
-                        print_cmd = f'rundll32.exe printui.dll,PrintUIEntry /k /n "{printer_name}" "{file_path}"'
-                        subprocess.run(print_cmd, shell=True, check=True)
-                    except subprocess.SubprocessError as print_error:
-                        print(f"Kopya {i+1} yazdırılırken hata: {print_error}")
-                        raise
-                
-                return True
-            finally:
-                # Varsayılan yazıcıyı geri al
+            # Yazıcı her işe açıkça verilir; sistemin varsayılan yazıcısı değiştirilmez,
+            # böylece farklı yazıcılara giden işler aynı anda güvenle yürütülebilir
+            for i in range(copies):
                 try:
-                    win32print.SetDefaultPrinter(current_printer)
-                except Exception as reset_error:
-                    print(f"Varsayılan yazıcı geri alınırken hata: {reset_error}")
-                
+                    self._print_file(printer_name, file_path)
+                except Exception as print_error:
+                    logger.warning("Kopya %s yazdırılırken hata: %s", i + 1, print_error)
+                    raise
+            
+            return True
+            
         except FileNotFoundError as fnf:
-            print(f"Dosya hatası: {fnf}")
+            self._record_error(fnf)
+            logger.error("Dosya hatası: %s", fnf)
             return False
         except ValueError as ve:
-            print(f"Yazıcı hatası: {ve}")
+            self._record_error(ve)
+            logger.error("Yazıcı hatası: %s", ve)
             return False
         except Exception as e:
-            print(f"Alternatif yazdırma hatası: {e}")
-            print(f"Hata türü: {type(e).__name__}, Hata kodu: {getattr(e, 'winerror', 'Bilinmiyor')}")
+            self._record_error(e)
+            logger.exception("Genel yazdırma hatası: %s", e)
+            logger.error("Hata türü: %s, Hata kodu: %s", type(e).__name__, getattr(e, 'winerror', 'Bilinmiyor'))
             return False
     
-    def _add_to_history(self, file_path, printer_name, success, error_msg=None):
-        """Yazdırma işlemini geçmişe ekler"""
+    def _add_to_history(self, file_path, printer_name, success, error_msg=None, job_id=None, pages=None):
+        """Yazdırma işlemini geçmişe ekler (success None ise iş biriktiricide bekliyor)"""
         history_item = {
             "file_path": file_path,
             "file_name": os.path.basename(file_path),
@@ -284,12 +877,35 @@ class DocumentProcessor(QObject):
         if error_msg:
             history_item["error"] = error_msg
         
+        if job_id is not None:
+            history_item["job_id"] = job_id
+        
+        if pages is not None:
+            history_item["pages"] = pages
+        
         self.print_history.append(history_item)
         
         # Geçmiş limitini kontrol et
         if len(self.print_history) > self.history_limit:
             self.print_history = self.print_history[-self.history_limit:]
     
+    def finish_print(self, job_id, file_path, success, error_msg=None):
+        """Biriktiricide izlenen iş bittiğinde geçmiş kaydını günceller ve sonucu bildirir"""
+        # Birleştirilmiş işte aynı işe ait her dosyanın kaydı birlikte sonuçlanır
+        file_paths = []
+        for history_item in self.print_history:
+            if history_item.get("job_id") == job_id and history_item["success"] is None:
+                history_item["success"] = success
+                history_item["timestamp"] = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
+                if error_msg:
+                    history_item["error"] = error_msg
+                file_paths.append(history_item["file_path"])
+        
+        for completed_path in file_paths or [file_path]:
+            if not success and error_msg:
+                self.print_error.emit(completed_path, error_msg)
+            self.print_completed.emit(completed_path, success)
+    
     def get_print_history(self):
         """Yazdırma geçmişini döndürür"""
         return self.print_history
@@ -299,52 +915,56 @@ class DocumentProcessor(QObject):
         self.print_history = []
         return True
     
-    def _print_generic_alternative(self, file_path, printer_name, copies=1):
-        """ShellExecute'e alternatif olarak belgeyi yazdırır"""
-        try:
-            # Dosyanın varlığını kontrol et
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Dosya bulunamadı: {file_path}")
-                
-            # Yazıcının varlığını kontrol et
-            printers = [p[2] for p in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)]
-            if printer_name not in printers:
-                raise ValueError(f"Yazıcı bulunamadı: {printer_name}")
-            
-            # Varsayılan yazıcıyı geçici olarak değiştir
-            current_printer = win32print.GetDefaultPrinter()
-            win32print.SetDefaultPrinter(printer_name)
-            
+    def get_page_count(self, file_path):
+        """Ofis belgesinin sayfa sayısını ve kaynağını ucuz yollardan döndürür
+        
+        Önbellek, docProps/app.xml ve önceden hazırlanmış PDF sırayla denenir. Hiçbiri
+        sonuç vermezse dönüştürücü havuzunda arka planda bir dizgi geçişi başlatılır
+        ve (None, None) döndürülür; sonuç önbelleğe yazılınca sonraki çağrılar bulur.
+        """
+        cached = self.metadata.get(file_path)
+        if cached.get("page_count"):
+            return cached["page_count"], cached.get("page_count_source")
+        if cached.get("page_count_error"):
+            # Dönüştürülemeyen dosya değişmedikçe yeniden denenmez
+            return None, None
+        
+        page_count = read_app_page_count(file_path)
+        if page_count is not None:
+            self.metadata.update(file_path, page_count=page_count, page_count_source=SOURCE_APP_PROPERTIES)
+            return page_count, SOURCE_APP_PROPERTIES
+        
+        prerendered = self.prerenderer.cache.lookup(file_path)
+        if prerendered:
+            with open(prerendered, "rb") as f:
+                page_count = len(PdfReader(f).pages)
+            self.metadata.update(file_path, page_count=page_count, page_count_source=SOURCE_LAYOUT)
+            return page_count, SOURCE_LAYOUT
+        
+        self._schedule_layout_pass(file_path)
+        return None, None
+    
+    def _schedule_layout_pass(self, file_path):
+        """Sayfa sayısı için belgeyi dönüştürücü havuzunda bir kez dizdirir"""
+        with self._layout_lock:
+            if file_path in self._layout_pending:
+                return
+            self._layout_pending.add(file_path)
+        
+        def on_done(future):
+            with self._layout_lock:
+                self._layout_pending.discard(file_path)
             try:
-                # Alternatif yazdırma yöntemi: win32api.ShellExecute yerine subprocess kullan
-                import subprocess
-                for i in range(copies):
-                    try:
-                        # Yazdırma komutu oluştur
-                        print_cmd = f'rundll32.exe printui.dll,PrintUIEntry /k /n "{printer_name}" "{file_path}"'
-                        subprocess.run(print_cmd, shell=True, check=True)
-                    except subprocess.SubprocessError as print_error:
-                        print(f"Kopya {i+1} yazdırılırken hata: {print_error}")
-                        raise
-                
-                return True
-            finally:
-                # Varsayılan yazıcıyı geri al
-                try:
-                    win32print.SetDefaultPrinter(current_printer)
-                except Exception as reset_error:
-                    print(f"Varsayılan yazıcı geri alınırken hata: {reset_error}")
-                
-        except FileNotFoundError as fnf:
-            print(f"Dosya hatası: {fnf}")
-            return False
-        except ValueError as ve:
-            print(f"Yazıcı hatası: {ve}")
-            return False
-        except Exception as e:
-            print(f"Alternatif yazdırma hatası: {e}")
-            print(f"Hata türü: {type(e).__name__}, Hata kodu: {getattr(e, 'winerror', 'Bilinmiyor')}")
-            return False
+                page_count = future.result()
+            except Exception as e:
+                logger.warning("Sayfa sayısı hesaplanamadı: %s: %s", os.path.basename(file_path), e)
+                self.metadata.update(file_path, page_count_error=str(e))
+                return
+            self.metadata.update(file_path, page_count=page_count, page_count_source=SOURCE_LAYOUT)
+            # Kuyrukta bu dosyayı bekleyen işlerin maliyeti ve tahmini süresi güncellensin
+            self.page_count_ready.emit(file_path, page_count)
+        
+        self.converter_pool.submit(layout_page_count, file_path).add_done_callback(on_done)
     
     def get_document_info(self, file_path):
         """Belge hakkında temel bilgileri döndürür"""
@@ -365,19 +985,22 @@ class DocumentProcessor(QObject):
                     pdf = PdfReader(f)
                     file_info["page_count"] = len(pdf.pages)
             
-            elif ext == ".docx":
-                doc = Document(file_path)
-                file_info["page_count"] = len(doc.sections)  # Yaklaşık değer
+            elif ext in PAGE_COUNT_TAGS:
+                page_count, source = self.get_page_count(file_path)
+                if page_count is not None:
+                    file_info["page_count"] = page_count
+                    file_info["page_count_source"] = source
             
-            elif ext in [".jpg", ".jpeg", ".png", ".bmp", ".gif"]:
-                img = Image.open(file_path)
-                file_info["dimensions"] = f"{img.width}x{img.height}"
-                file_info["format"] = img.format
+            elif ext in IMAGE_EXTENSIONS:
+                with Image.open(file_path) as img:
+                    file_info["dimensions"] = f"{img.width}x{img.height}"
+                    file_info["format"] = img.format
+                file_info["page_count"] = 1
             
             return file_info
             
         except Exception as e:
-            print(f"Belge bilgisi alınırken hata: {e}")
+            logger.warning("Belge bilgisi alınırken hata: %s", e)
             return {
                 "file_path": file_path,
                 "file_name": os.path.basename(file_path),
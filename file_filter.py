@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+İzlenen klasörlerdeki dosya olaylarını önceden derlenmiş kurallarla eleyen süzgeç modülü
+"""
+
+import os
+import re
+import fnmatch
+
+
+# Kural listelerinde düzenli ifadeyi glob deseninden ayıran önek
+REGEX_PREFIX = "re:"
+
+# Klasör profili verilmediğinde kullanılan süzgeç ayarları
+DEFAULT_FILTER = {
+    "include": [],
+    "exclude": ["*.crdownload", "*.part", "*.partial", "*.tmp", "~$*", ".~lock.*", "Thumbs.db", "desktop.ini"],
+    "min_size": 1,
+    "max_size_mb": 200,
+    "max_depth": None,
+    "include_hidden": False
+}
+
+
+def _compile_patterns(patterns):
+    """Desenleri (dosya adı düzenli ifadesi, göreli yol düzenli ifadesi) çiftine derler
+    
+    Yol ayırıcı içermeyen glob desenleri yalnızca dosya adına, diğerleri ve 're:'
+    önekli düzenli ifadeler klasöre göreli yola ('/' ayırıcılı) uygulanır.
+    """
+    name_parts, path_parts = [], []
+    for pattern in patterns or []:
+        if pattern.startswith(REGEX_PREFIX):
+            path_parts.append(f"(?:{pattern[len(REGEX_PREFIX):]})")
+        elif "/" in pattern or "\\" in pattern:
+            path_parts.append(fnmatch.translate(pattern.replace("\\", "/")))
+        else:
+            name_parts.append(fnmatch.translate(pattern))
+    
+    def join(parts):
+        return re.compile("|".join(parts), re.IGNORECASE) if parts else None
+    
+    return join(name_parts), join(path_parts)
+
+
+class FileFilter:
+    """Uzantı, glob/düzenli ifade, boyut ve derinlik kurallarını tek seferde derleyip uygulayan sınıf
+    
+    Yol kuralları (match_path) dosya sistemine dokunmadan çalışır; boyut kuralı
+    (match_size) dosyanın ilk ölçümüyle birlikte denetlenir.
+    """
+    
+    def __init__(self, extensions=(), include=(), exclude=(), min_size=0, max_size=None, max_depth=None,
+                 include_hidden=False):
+        self.extensions = frozenset(ext.lower() for ext in extensions)
+        self.include_name, self.include_path = _compile_patterns(include)
+        self.exclude_name, self.exclude_path = _compile_patterns(exclude)
+        self.has_include = bool(include)
+        self.min_size = min_size or 0
+        self.max_size = max_size
+        self.max_depth = max_depth
+        self.include_hidden = include_hidden
+    
+    @classmethod
+    def from_config(cls, config, folder=None):
+        """Genel süzgeç ayarlarını klasör profiliyle birleştirerek süzgeç oluşturur"""
+        settings = dict(DEFAULT_FILTER)
+        settings.update(config.get("watch_filter") or {})
+        profile = {}
+        if folder is not None:
+            profile = config.get("watch_profiles", {}).get(folder) or {}
+        for key, value in profile.items():
+            # Klasörün desenleri genel desenlere eklenir, diğer ayarlar genel ayarın yerine geçer
+            if key in ("include", "exclude"):
+                settings[key] = list(settings.get(key) or []) + list(value or [])
+            else:
+                settings[key] = value
+        max_size_mb = settings.get("max_size_mb")
+        return cls(
+            extensions=settings.get("extensions") or config.get("supported_extensions", []),
+            include=settings.get("include"),
+            exclude=settings.get("exclude"),
+            min_size=settings.get("min_size", 0),
+            max_size=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+            max_depth=settings.get("max_depth"),
+            include_hidden=settings.get("include_hidden", False)
+        )
+    
+    def match_path(self, path, root=None):
+        """Yolun kurallara uyup uymadığını dosya sistemine erişmeden döndürür (ucuzdan pahalıya)"""
+        name_start = max(path.rfind("/"), path.rfind("\\")) + 1
+        name = path[name_start:]
+        dot = name.rfind(".")
+        if dot <= 0 or name[dot:].lower() not in self.extensions:
+            return False
+        if self.exclude_name is not None and self.exclude_name.match(name):
+            return False
+        if not self.include_hidden and name.startswith("."):
+            return False
+        
+        # Göreli yol yalnızca yol kuralları ya da derinlik sınırı varsa hesaplanır
+        relative = None
+        if root is not None and (self.max_depth is not None or not self.include_hidden
+                                 or self.exclude_path is not None or self.include_path is not None):
+            if path.startswith(root):
+                relative = path[len(root):].lstrip("/\\")
+            else:
+                relative = os.path.relpath(path, root)
+            relative = relative.replace("\\", "/")
+            folders = relative.split("/")[:-1]
+            if self.max_depth is not None and len(folders) > self.max_depth:
+                return False
+            if not self.include_hidden and any(folder.startswith(".") for folder in folders):
+                return False
+        if self.exclude_path is not None and self.exclude_path.match(relative or name):
+            return False
+        
+        if not self.has_include:
+            return True
+        if self.include_name is not None and self.include_name.match(name):
+            return True
+        return self.include_path is not None and self.include_path.match(relative or name) is not None
+    
+    def match_size(self, size):
+        """Dosya boyutunun sınırlar içinde olup olmadığını döndürür"""
+        if size < self.min_size:
+            return False
+        return self.max_size is None or size <= self.max_size
\ No newline at end of file
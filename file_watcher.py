@@ -7,12 +7,39 @@ Dosya izleme modülü
 """
 
 import os
+import logging
 import time
 from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from PySide6.QtCore import QObject, Signal
 
+from file_filter import FileFilter
+from adaptive_poller import AdaptivePoller, is_network_path
+from metrics import tracer, files_detected, files_rejected
+from traffic_recorder import recorder
+
+
+logger = logging.getLogger(__name__)
+
+
+# Süzgeci etkileyen yapılandırma anahtarları
+FILTER_CONFIG_KEYS = ("supported_extensions", "watch_filter", "watch_profiles")
+
+# İzleyicinin canlı uyguladığı yapılandırma anahtarları (süzgeç, klasör profilleri ve klasör listesi)
+WATCHER_CONFIG_KEYS = FILTER_CONFIG_KEYS + ("watch_folders",)
+
+# İzleyici türleri: yerel bildirim, uyarlamalı yoklama ya da ağ paylaşımlarında yoklamaya geçen otomatik seçim
+OBSERVER_NATIVE = "native"
+OBSERVER_POLLING = "polling"
+OBSERVER_AUTO = "auto"
+
+# Klasör profilinde belirtilmeyen izleyici ayarları
+DEFAULT_WATCH_PROFILE = {
+    "observer": OBSERVER_AUTO,
+    "poll_interval": 5.0
+}
+
 
 class FileWatcher(QObject):
     """WhatsApp ve diğer klasörleri izleyen sınıf"""
@@ -23,8 +50,11 @@ class FileWatcher(QObject):
     def __init__(self, config):
         super().__init__()
         self.config = config
-        self.observers = []
+        self.observers = {}  # klasör -> izleyici
         self.supported_extensions = config.get("supported_extensions", [])
+        self.file_filter = FileFilter.from_config(config)
+        self.folder_filters = {}  # klasör -> klasör profiline göre derlenmiş süzgeç
+        self.observer_settings = {}  # klasör -> (izleyici türü, yoklama aralığı, derinlik)
         
     def start_watching(self):
         """İzleme işlemini başlatır"""
@@ -35,77 +65,177 @@ class FileWatcher(QObject):
         watch_folders = self.config.get("watch_folders", [])
         
         if not watch_folders:
-            print("İzlenecek klasör bulunamadı. Lütfen ayarlardan klasör ekleyin.")
+            logger.warning("İzlenecek klasör bulunamadı. Lütfen ayarlardan klasör ekleyin.")
             return False
         
         # Her klasör için bir izleyici oluştur
         for folder in watch_folders:
-            if os.path.exists(folder) and os.path.isdir(folder):
-                event_handler = WhatsAppFileHandler(self)
-                observer = Observer()
-                observer.schedule(event_handler, folder, recursive=True)
-                observer.start()
-                self.observers.append(observer)
-                print(f"İzleme başlatıldı: {folder}")
-            else:
-                print(f"Klasör bulunamadı: {folder}")
+            self._start_observer(folder)
         
         return len(self.observers) > 0
     
+    def _start_observer(self, folder):
+        """Tek bir klasör için izleyici başlatır"""
+        if folder in self.observers:
+            return True
+        if not (os.path.exists(folder) and os.path.isdir(folder)):
+            logger.warning("Klasör bulunamadı: %s", folder)
+            return False
+        self.folder_filters[folder] = FileFilter.from_config(self.config, folder)
+        kind, interval, max_depth = settings = self._observer_settings(folder)
+        event_handler = WhatsAppFileHandler(self, folder)
+        if kind == OBSERVER_POLLING:
+            # Ağ paylaşımında her turda klasör başına tek stat; yalnızca değişen klasörler listelenir
+            observer = AdaptivePoller(folder, event_handler, interval, max_depth)
+        else:
+            # Derinlik 0 ise alt klasörler hiç izlenmez; daha derin sınırları süzgeç uygular
+            observer = Observer()
+            observer.schedule(event_handler, folder, recursive=max_depth != 0)
+        observer.start()
+        self.observers[folder] = observer
+        self.observer_settings[folder] = settings
+        logger.info("İzleme başlatıldı: %s (%s)", folder, kind)
+        return True
+    
+    def _observer_settings(self, folder):
+        """Klasör profiline göre (izleyici türü, yoklama aralığı, derinlik) üçlüsünü döndürür"""
+        profile = dict(DEFAULT_WATCH_PROFILE)
+        profile.update(self.config.get("watch_profiles", {}).get(folder) or {})
+        kind = profile["observer"]
+        if kind not in (OBSERVER_NATIVE, OBSERVER_POLLING):
+            # Ağ paylaşımlarında yerel bildirimler bağlantı kopunca sessizce kesilir
+            kind = OBSERVER_POLLING if is_network_path(folder) else OBSERVER_NATIVE
+        return kind, max(0.5, float(profile["poll_interval"])), self.folder_filters[folder].max_depth
+    
+    def _stop_observer(self, folder):
+        """Tek bir klasörün izleyicisini durdurur"""
+        self.observer_settings.pop(folder, None)
+        observer = self.observers.pop(folder, None)
+        if observer is not None:
+            observer.stop()
+            observer.join()
+            logger.info("İzleme durduruldu: %s", folder)
+    
     def stop_watching(self):
         """İzleme işlemini durdurur"""
-        for observer in self.observers:
+        for observer in self.observers.values():
             observer.stop()
         
-        for observer in self.observers:
+        for observer in self.observers.values():
             observer.join()
         
-        self.observers = []
-        print("Tüm klasör izlemeleri durduruldu.")
+        self.observers = {}
+        self.observer_settings = {}
+        logger.info("Tüm klasör izlemeleri durduruldu.")
+    
+    def apply_config(self, changes):
+        """Değişen ayarları uygular; yalnızca eklenen ya da çıkarılan klasörlerin izleyicisi değişir"""
+        if "supported_extensions" in changes:
+            self.supported_extensions = list(changes["supported_extensions"])
+            logger.info("Desteklenen dosya türleri güncellendi: %s", ', '.join(self.supported_extensions))
+        if any(key in changes for key in FILTER_CONFIG_KEYS):
+            # Süzgeçler yeniden derlenip yerine konur; izleyiciler çalışmaya devam eder
+            self.file_filter = FileFilter.from_config(self.config)
+            self.folder_filters = {folder: FileFilter.from_config(self.config, folder) for folder in self.observers}
+            
+            # Yalnızca izleyici ayarı değişen klasörlerin izleyicisi yeniden kurulur
+            for folder in list(self.observers):
+                if self._observer_settings(folder) != self.observer_settings.get(folder):
+                    self._stop_observer(folder)
+                    self._start_observer(folder)
+        
+        # İzleme durmuşsa klasör listesi bir sonraki başlatmada kullanılır
+        if "watch_folders" in changes and self.observers:
+            folders = changes["watch_folders"]
+            for folder in [folder for folder in self.observers if folder not in folders]:
+                self._stop_observer(folder)
+            for folder in folders:
+                self._start_observer(folder)
     
     def is_supported_file(self, file_path):
         """Dosya uzantısının desteklenip desteklenmediğini kontrol eder"""
-        ext = os.path.splitext(file_path)[1].lower()
-        return ext in self.supported_extensions
+        return self.file_filter.match_path(file_path)
+    
+    def filter_for(self, folder):
+        """Klasörün profiline göre derlenmiş süzgeci döndürür"""
+        return self.folder_filters.get(folder, self.file_filter)
 
 
 class WhatsAppFileHandler(FileSystemEventHandler):
     """WhatsApp klasöründeki dosya olaylarını işleyen sınıf"""
     
-    def __init__(self, file_watcher):
+    def __init__(self, file_watcher, folder=None):
         self.file_watcher = file_watcher
+        self.folder = folder
         self.last_processed_files = set()
     
     def on_created(self, event):
         """Yeni dosya oluşturulduğunda çağrılır"""
-        if not event.is_directory and self.file_watcher.is_supported_file(event.src_path):
-            # Dosyanın tamamen yazılmasını bekle
-            self._wait_for_file_ready(event.src_path)
+        if not event.is_directory:
+            self._handle_file(event.src_path)
+    
+    def on_moved(self, event):
+        """Dosya yeniden adlandırıldığında çağrılır (tarayıcılar indirmeyi bitirince .crdownload'ı adlandırır)"""
+        if not event.is_directory:
+            self._handle_file(event.dest_path)
+    
+    def _handle_file(self, file_path):
+        """Dosyayı süzgeçten geçirir, hazır olunca bildirir"""
+        # Yol kuralları dosyaya hiç dokunmadan uygulanır; ilgisiz olaylar burada elenir
+        file_filter = self.file_watcher.filter_for(self.folder)
+        if not file_filter.match_path(file_path, self.folder):
+            files_rejected.inc(reason="path")
+            return
+        if file_path in self.last_processed_files:
+            return
+        
+        # Algılama gecikmesi: dosyanın son yazılma/oluşturulma zamanından olayın işlenmesine kadar
+        # (Windows'ta kopyalanan dosya eski değişiklik zamanını korur, oluşturma zamanı yenidir)
+        detect_latency = None
+        try:
+            stat = os.stat(file_path)
+            detect_latency = time.time() - max(stat.st_mtime, stat.st_ctime)
+        except OSError:
+            pass
+        
+        # Dosyanın tamamen yazılmasını bekle; boyut sınırını aşan dosya beklenmeden bırakılır
+        wait_started = time.perf_counter()
+        size = self._wait_for_file_ready(file_path, max_size=file_filter.max_size)
+        if size is None or not file_filter.match_size(size):
+            files_rejected.inc(reason="size")
+            return
+        
+        # Dosya daha önce işlenmediyse sinyal gönder
+        if file_path not in self.last_processed_files:
+            self.last_processed_files.add(file_path)
+            if detect_latency is not None:
+                tracer.note_file(file_path, "detect", detect_latency, folder=self.folder)
+            tracer.note_file(file_path, "ready_wait", time.perf_counter() - wait_started, size=size)
+            files_detected.inc()
+            recorder.record_detection(file_path, self.folder, size)
+            self.file_watcher.file_detected.emit(file_path)
             
-            # Dosya daha önce işlenmediyse sinyal gönder
-            if event.src_path not in self.last_processed_files:
-                self.last_processed_files.add(event.src_path)
-                self.file_watcher.file_detected.emit(event.src_path)
-                
-                # Son işlenen dosyaların sayısını sınırla
-                if len(self.last_processed_files) > 100:
-                    self.last_processed_files = set(list(self.last_processed_files)[-100:])
+            # Son işlenen dosyaların sayısını sınırla
+            if len(self.last_processed_files) > 100:
+                self.last_processed_files = set(list(self.last_processed_files)[-100:])
     
-    def _wait_for_file_ready(self, file_path, timeout=5):
-        """Dosyanın tamamen yazılmasını bekler"""
+    def _wait_for_file_ready(self, file_path, timeout=5, max_size=None):
+        """Dosyanın tamamen yazılmasını bekler ve son boyutunu döndürür (dosyaya erişilemezse None)"""
         start_time = time.time()
-        last_size = -1
+        last_size = None
         
         while time.time() - start_time < timeout:
             try:
                 current_size = os.path.getsize(file_path)
+                if max_size is not None and current_size > max_size:
+                    return current_size
                 if current_size == last_size and current_size > 0:
                     # Dosya boyutu değişmediyse, dosya hazır demektir
-                    return True
+                    return current_size
                 last_size = current_size
                 time.sleep(0.5)
             except (OSError, FileNotFoundError):
                 # Dosya henüz erişilebilir değilse bekle
                 time.sleep(0.5)
         
-        return False
\ No newline at end of file
+        return last_size
\ No newline at end of file
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Fotoğrafları yazıcı çözünürlüğünde sayfalara yerleştiren resim işleme modülü
+"""
+
+import os
+import logging
+import math
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+from raster_pdf import page_pixels, mm_to_pixels
+
+
+logger = logging.getLogger(__name__)
+
+
+# Resim olarak yazdırılan dosya türleri
+IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp"]
+
+# Temas sayfasında (sütun, satır) varsayılan yerleşim
+CONTACT_SHEET_GRID = (3, 4)
+
+# EXIF yön etiketi; 5-8 arası değerler resmi 90 derece döndürür
+EXIF_ORIENTATION = 0x0112
+SWAPPED_ORIENTATIONS = {5, 6, 7, 8}
+
+# Temas sayfasında hücreler arası boşluk ve dosya adı yazısı (mm)
+CONTACT_GAP_MM = 4
+CONTACT_CAPTION_MM = 4
+
+
+def oriented_size(image):
+    """Resmin EXIF yönü uygulandıktan sonraki boyutunu, piksel çözmeden döndürür"""
+    orientation = image.getexif().get(EXIF_ORIENTATION, 1)
+    if orientation in SWAPPED_ORIENTATIONS:
+        return image.height, image.width
+    return image.size
+
+
+def decode_to_box(image, box):
+    """Resmi kutuya sığacak en düşük çözünürlükte çözer, EXIF yönünü uygular ve kutuya ölçekler
+    
+    JPEG'ler taslak kipte 1/2, 1/4 ya da 1/8 ölçekte çözüldüğünden kameranın
+    çözünürlüğü ne olursa olsun bellek ve süre hedef kutuyla sınırlı kalır.
+    """
+    width, height = oriented_size(image)
+    scale = min(box[0] / width, box[1] / height)
+    target = (max(1, round(width * scale)), max(1, round(height * scale)))
+    
+    # Taslak boyutu döndürülmemiş (dosyadaki) yönde istenir
+    if (width, height) != image.size:
+        image.draft("RGB", (target[1], target[0]))
+    else:
+        image.draft("RGB", target)
+    image = ImageOps.exif_transpose(image)
+    
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        # Saydam alanlar kağıt rengine (beyaz) oturtulur
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+    
+    return image.resize(target, Image.LANCZOS, reducing_gap=3.0)
+
+
+def render_photo_page(file_path, paper_size, dpi, margin_mm=5):
+    """Fotoğrafı kağıda sığdırıp ortalayarak tek sayfa çizer; yatay fotoğrafı kağıda göre döndürür"""
+    page_width, page_height = page_pixels(paper_size, dpi)
+    margin = mm_to_pixels(margin_mm, dpi)
+    box = (page_width - 2 * margin, page_height - 2 * margin)
+    
+    with Image.open(file_path) as image:
+        width, height = oriented_size(image)
+        # Yatay fotoğraf dikey kağıda yan yatırılarak en büyük boyutta basılır
+        rotate = (width > height) != (box[0] > box[1])
+        photo = decode_to_box(image, (box[1], box[0]) if rotate else box)
+    if rotate:
+        photo = photo.transpose(Image.Transpose.ROTATE_90)
+    
+    page = Image.new("RGB", (page_width, page_height), "white")
+    page.paste(photo, ((page_width - photo.width) // 2, (page_height - photo.height) // 2))
+    photo.close()
+    return page
+
+
+def render_contact_sheet(file_paths, paper_size, dpi, grid=CONTACT_SHEET_GRID, margin_mm=5):
+    """Birden çok fotoğrafı dosya adlarıyla birlikte ızgara halinde tek sayfaya çizer"""
+    page_width, page_height = page_pixels(paper_size, dpi)
+    margin = mm_to_pixels(margin_mm, dpi)
+    gap = mm_to_pixels(CONTACT_GAP_MM, dpi)
+    caption = mm_to_pixels(CONTACT_CAPTION_MM, dpi)
+    columns, rows = grid
+    cell_width = (page_width - 2 * margin - (columns - 1) * gap) // columns
+    cell_height = (page_height - 2 * margin - (rows - 1) * gap) // rows
+    box = (cell_width, cell_height - caption)
+    
+    page = Image.new("RGB", (page_width, page_height), "white")
+    draw = ImageDraw.Draw(page)
+    font = ImageFont.load_default(size=max(8, caption * 3 // 4))
+    for index, file_path in enumerate(file_paths):
+        left = margin + (index % columns) * (cell_width + gap)
+        top = margin + (index // columns) * (cell_height + gap)
+        try:
+            with Image.open(file_path) as image:
+                photo = decode_to_box(image, box)
+        except (OSError, ValueError) as e:
+            # Bozuk tek bir fotoğraf tüm sayfayı düşürmez, yeri boş bırakılır
+            logger.warning("Fotoğraf temas sayfasına eklenemedi: %s: %s", os.path.basename(file_path), e)
+            draw.rectangle((left, top, left + box[0] - 1, top + box[1] - 1), outline="gray")
+        else:
+            page.paste(photo, (left + (box[0] - photo.width) // 2, top + (box[1] - photo.height) // 2))
+            photo.close()
+        
+        name = os.path.basename(file_path)
+        while len(name) > 4 and draw.textlength(name, font=font) > cell_width:
+            name = name[:-4] + "…"
+        draw.text((left + cell_width // 2, top + cell_height), name, fill="black", font=font, anchor="md")
+    return page
+
+
+def image_page_count(image_count, contact_sheet=False, grid=CONTACT_SHEET_GRID):
+    """Verilen sayıda fotoğrafın kaç sayfa tutacağını döndürür"""
+    if contact_sheet:
+        return math.ceil(image_count / (grid[0] * grid[1]))
+    return image_count
+
+
+def iter_image_pages(file_paths, paper_size, dpi, first_page=0, contact_sheet=False,
+                     grid=CONTACT_SHEET_GRID, margin_mm=5):
+    """Fotoğrafların sayfalarını sırayla, yalnızca istenen sayfadan itibaren çözüp üretir"""
+    if contact_sheet:
+        per_page = grid[0] * grid[1]
+        for page_index in range(first_page, image_page_count(len(file_paths), True, grid)):
+            batch = file_paths[page_index * per_page:(page_index + 1) * per_page]
+            yield render_contact_sheet(batch, paper_size, dpi, grid, margin_mm)
+    else:
+        for file_path in file_paths[first_page:]:
+            yield render_photo_page(file_path, paper_size, dpi, margin_mm)
\ No newline at end of file
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Sayfa aralığı, N-up ve kitapçık impozisyon modülü
+"""
+
+import re
+from PyPDF2 import PdfReader, PdfWriter, PageObject, Transformation
+from PyPDF2.generic import RectangleObject, DecodedStreamObject, NameObject
+
+
+# Kağıt boyutları (PDF noktası, 1/72 inç)
+PAPER_SIZES_PT = {
+    "A3": (841.89, 1190.55),
+    "A4": (595.28, 841.89),
+    "A5": (419.53, 595.28),
+    "Letter": (612.0, 792.0),
+    "Legal": (612.0, 1008.0)
+}
+
+# Kağıt başına sayfa -> (sütun, satır, yatay_mı)
+NUP_GRIDS = {
+    1: (1, 1, False),
+    2: (2, 1, True),
+    4: (2, 2, False),
+    6: (2, 3, False),
+    9: (3, 3, False)
+}
+
+# Sunum notu sayfası başına slayt -> (sütun, satır, yatay_mı)
+HANDOUT_GRIDS = {
+    2: (1, 2, False),
+    3: (1, 3, False),
+    6: (2, 3, False)
+}
+
+# Kenar boşluğu ve hücreler arası boşluk (nokta)
+SHEET_MARGIN = 18.0
+CELL_GAP = 6.0
+
+# Not sayfalarında kenar boşluğu, hücreler arası boşluk ve not satırı aralığı (nokta)
+HANDOUT_MARGIN = 36.0
+HANDOUT_GAP = 18.0
+NOTE_LINE_SPACING = 24.0
+
+
+def parse_page_range(text, page_count=None):
+    """'3-10, 12, 15-' biçimindeki sayfa aralığını 0 tabanlı sayfa dizinlerine çevirir"""
+    if text is None or not str(text).strip():
+        return list(range(page_count)) if page_count is not None else None
+    
+    indices = []
+    for part in re.split(r"[,;\s]+", str(text).strip()):
+        if not part:
+            continue
+        match = re.fullmatch(r"(\d*)\s*[-–]\s*(\d*)|(\d+)", part)
+        if not match or part in ("-", "–"):
+            raise ValueError(f"Geçersiz sayfa aralığı: {part}")
+        
+        if match.group(3):
+            first = last = int(match.group(3))
+        else:
+            first = int(match.group(1)) if match.group(1) else 1
+            if match.group(2):
+                last = int(match.group(2))
+            elif page_count is not None:
+                last = page_count
+            else:
+                last = first
+        if first < 1 or last < first:
+            raise ValueError(f"Geçersiz sayfa aralığı: {part}")
+        
+        # Belge sınırlarının dışına taşan kısımları kırp
+        if page_count is not None:
+            last = min(last, page_count)
+        indices.extend(range(first - 1, last))
+    
+    if page_count is not None and not indices:
+        raise ValueError(f"Sayfa aralığı belgede bulunmuyor: {text}")
+    return indices
+
+
+def booklet_order(indices):
+    """Kitapçık basımı için sayfaları katlanacak yaprak sırasına dizer (boş sayfalar None)"""
+    pages = list(indices)
+    while len(pages) % 4:
+        pages.append(None)
+    
+    order = []
+    count = len(pages)
+    for sheet in range(count // 4):
+        # Ön yüz: son sayfa + ilk sayfa, arka yüz: ikinci sayfa + sondan ikinci
+        order.extend([pages[count - 1 - 2 * sheet], pages[2 * sheet]])
+        order.extend([pages[2 * sheet + 1], pages[count - 2 - 2 * sheet]])
+    return order
+
+
+def plan_sheets(page_count, page_range=None, pages_per_sheet=1, booklet=False, handout=0):
+    """Her çıktı sayfasına yerleşecek kaynak sayfa dizinlerini döndürür"""
+    if handout and handout not in HANDOUT_GRIDS:
+        raise ValueError(f"Desteklenmeyen not sayfası düzeni: {handout}")
+    if pages_per_sheet not in NUP_GRIDS:
+        raise ValueError(f"Desteklenmeyen kağıt başına sayfa sayısı: {pages_per_sheet}")
+    
+    indices = parse_page_range(page_range, page_count)
+    if handout:
+        # Not sayfası N-up ve kitapçığın yerini alır
+        order = indices
+        per_sheet = handout
+    elif booklet:
+        order = booklet_order(indices)
+        per_sheet = 2
+    else:
+        order = indices
+        per_sheet = pages_per_sheet
+    return [order[i:i + per_sheet] for i in range(0, len(order), per_sheet)]
+
+
+def count_output_pages(page_count, page_range=None, pages_per_sheet=1, booklet=False, handout=0):
+    """İmpozisyon sonrası basılacak sayfa (yüz) sayısını döndürür"""
+    try:
+        return len(plan_sheets(page_count, page_range, pages_per_sheet, booklet, handout))
+    except ValueError:
+        return page_count
+
+
+def needs_imposition(page_range=None, pages_per_sheet=1, booklet=False, fit_to_page=False, handout=0):
+    """Ayarların belgeyi olduğu gibi göndermekten farklı bir çıktı gerektirip gerektirmediğini döndürür"""
+    return bool(page_range) or pages_per_sheet != 1 or booklet or fit_to_page or bool(handout)
+
+
+def _page_box(page):
+    """Sayfanın (sol, alt, genişlik, yükseklik) kutusunu döndürür"""
+    box = page.mediabox
+    left, bottom = float(box.left), float(box.bottom)
+    return left, bottom, float(box.width), float(box.height)
+
+
+def _normalize_rotation(page):
+    """Sayfa döndürmesini içeriğe aktarır, böylece yerleştirme doğru yönde yapılır"""
+    rotation = page.get("/Rotate", 0) or 0
+    if rotation % 360 and hasattr(page, "transfer_rotation_to_content"):
+        page.transfer_rotation_to_content()
+    return page
+
+
+def _handout_decorations(frames, note_areas):
+    """Slayt çerçevelerini ve not satırlarını çizen içerik akışını döndürür"""
+    operations = ["q 0.5 w 0.4 G"]
+    for x, y, width, height in frames:
+        operations.append(f"{x:.2f} {y:.2f} {width:.2f} {height:.2f} re S")
+    operations.append("0.7 G")
+    for x, y, width, height in note_areas:
+        line_y = y + height - NOTE_LINE_SPACING
+        while line_y >= y:
+            operations.append(f"{x:.2f} {line_y:.2f} m {x + width:.2f} {line_y:.2f} l S")
+            line_y -= NOTE_LINE_SPACING
+    operations.append("Q")
+    stream = DecodedStreamObject()
+    stream.set_data("\n".join(operations).encode("ascii"))
+    return stream
+
+
+def impose_pages(reader, sheets, paper_size="A4", pages_per_sheet=1, booklet=False, fit_to_page=False,
+                 handout=0):
+    """Planlanan her çıktı sayfasını tek tek üretir (tüm belge belleğe alınmaz)"""
+    paper_width, paper_height = PAPER_SIZES_PT.get(paper_size, PAPER_SIZES_PT["A4"])
+    if handout:
+        columns, rows, landscape = HANDOUT_GRIDS[handout]
+    else:
+        columns, rows, landscape = NUP_GRIDS[2 if booklet else pages_per_sheet]
+    if landscape:
+        paper_width, paper_height = paper_height, paper_width
+    
+    # Sayfa seçiminden başka bir şey gerekmiyorsa sayfayı olduğu gibi aktar
+    passthrough = columns * rows == 1 and not fit_to_page and not handout
+    
+    # Kitapçıkta sayfalar katlama çizgisine dayanır, kenar boşluğu bırakılmaz
+    if handout:
+        margin, gap = HANDOUT_MARGIN, HANDOUT_GAP
+    elif booklet:
+        margin, gap = 0.0, 0.0
+    else:
+        margin, gap = SHEET_MARGIN, CELL_GAP
+    cell_width = (paper_width - 2 * margin - (columns - 1) * gap) / columns
+    cell_height = (paper_height - 2 * margin - (rows - 1) * gap) / rows
+    
+    # Tek sütunlu 3'lü not sayfasında slayt sola, not satırları sağa yerleşir
+    with_notes = handout and columns == 1 and rows >= 3
+    slide_width = (cell_width - gap) / 2 if with_notes else cell_width
+    
+    for sheet in sheets:
+        if passthrough and sheet[0] is not None:
+            yield reader.pages[sheet[0]]
+            continue
+        
+        output = PageObject.create_blank_page(width=paper_width, height=paper_height)
+        frames, note_areas = [], []
+        for slot, page_index in enumerate(sheet):
+            if page_index is None:
+                continue
+            page = _normalize_rotation(reader.pages[page_index])
+            left, bottom, width, height = _page_box(page)
+            if width <= 0 or height <= 0:
+                continue
+            
+            # Hücreye orantılı sığdır ve ortala
+            scale = min(slide_width / width, cell_height / height)
+            column, row = slot % columns, slot // columns
+            cell_x = margin + column * (cell_width + gap)
+            cell_y = paper_height - margin - (row + 1) * cell_height - row * gap
+            offset_x = cell_x + (slide_width - width * scale) / 2 - left * scale
+            offset_y = cell_y + (cell_height - height * scale) / 2 - bottom * scale
+            
+            if handout:
+                # Not sayfasında slayda çerçeve, 3'lü düzende yanına not satırları çizilir
+                slide = (left * scale + offset_x, bottom * scale + offset_y, width * scale, height * scale)
+                frames.append(slide)
+                if with_notes:
+                    note_x = cell_x + slide_width + gap
+                    note_areas.append((note_x, slide[1], cell_x + cell_width - note_x, slide[3]))
+            elif booklet:
+                # Kitapçıkta sayfaları katlama çizgisine yasla
+                if column == 0:
+                    offset_x = cell_x + (cell_width - width * scale) - left * scale
+                else:
+                    offset_x = cell_x - left * scale
+            
+            # Dönüşüm kaynak sayfaya uygulanır; her kaynak sayfa yalnızca bir kez yerleştirilir.
+            # Kırpma kutuları da taşınmalı, yoksa birleştirmede içerik eski konumda kırpılır
+            page.add_transformation(Transformation().scale(scale, scale).translate(offset_x, offset_y))
+            placed = RectangleObject([
+                left * scale + offset_x, bottom * scale + offset_y,
+                (left + width) * scale + offset_x, (bottom + height) * scale + offset_y
+            ])
+            page.mediabox = placed
+            page.cropbox = placed
+            page.trimbox = placed
+            output.merge_page(page)
+        
+        if frames:
+            decorations = PageObject.create_blank_page(width=paper_width, height=paper_height)
+            decorations[NameObject("/Contents")] = _handout_decorations(frames, note_areas)
+            output.merge_page(decorations)
+        yield output
+
+
+def impose_pdf(source_path, output_path, sheets, paper_size="A4", pages_per_sheet=1,
+               booklet=False, fit_to_page=False, handout=0):
+    """Verilen çıktı sayfalarını PDF dosyasına yazar (çalışan süreçte çağrılabilir)"""
+    reader = PdfReader(source_path)
+    writer = PdfWriter()
+    for page in impose_pages(reader, sheets, paper_size, pages_per_sheet, booklet, fit_to_page, handout):
+        writer.add_page(page)
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    return output_path
\ No newline at end of file
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Yazdırma işleri için çökmeye dayanıklı, yalnızca eklemeli günlük modülü
+"""
+
+import os
+import logging
+import json
+import time
+import queue
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+# Varsayılan günlük dosyası yolu
+JOURNAL_FILE = os.path.join(os.path.expanduser("~"), ".mukaprint", "journal.jsonl")
+
+# Günlük bu boyutu aşınca yalnızca bitmemiş işlerle yeniden yazılır
+COMPACT_SIZE = 1024 * 1024
+
+
+class JobJournal:
+    """İş durum geçişlerini satır satır JSON olarak diske yazan sınıf
+    
+    record() kaydı yalnızca kuyruğa ekler; arka plandaki yazıcı iş parçacığı birikmiş
+    kayıtları tek seferde yazar ve toplu iş başına bir kez fsync yapar (grup kaydı).
+    Sıkıştırma da bu iş parçacığında yapılır; böylece kuyruk kilidini tutan çağıranlar
+    (arayüzden gönderim, öncelik değişikliği, iptal) disk beklemez.
+    """
+    
+    def __init__(self, path=JOURNAL_FILE, final_states=("done", "failed")):
+        self.path = path
+        self.final_states = set(final_states)
+        self._lock = threading.Lock()  # dosya erişimi
+        self._file = None
+        # Sınırsız kuyruk: kayıt eklemek hiçbir zaman beklemez
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+    
+    def _open(self):
+        """Günlük dosyasını ekleme kipinde açar"""
+        if self._file is None:
+            journal_dir = os.path.dirname(self.path)
+            if journal_dir and not os.path.exists(journal_dir):
+                os.makedirs(journal_dir)
+            self._file = open(self.path, "a", encoding="utf-8")
+            # Çökmede yarım kalan satırın sonuna yeni kayıt eklenmesin
+            if self._file.tell() > 0:
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        self._file.write("\n")
+        return self._file
+    
+    def record(self, job_record):
+        """İşin güncel durumunu yazılmak üzere kuyruğa ekler; diske yazma arka planda yapılır
+        
+        Kayıt çağrı anında anlık görüntü olarak JSON'a çevrilir, iş sonradan değişse de
+        günlüğe o anki durumu yazılır.
+        """
+        entry = dict(job_record)
+        entry["logged_at"] = time.time()
+        self._put(json.dumps(entry, ensure_ascii=False) + "\n")
+    
+    def flush(self):
+        """O ana kadar eklenen kayıtlar diske yazılıp fsync yapılana kadar bekler"""
+        done = threading.Event()
+        if self._put(done, start=False):
+            done.wait()
+    
+    def _put(self, item, start=True):
+        """Öğeyi yazıcının kuyruğuna ekler, gerekirse yazıcıyı başlatır; yazıcı yoksa False döndürür"""
+        with self._writer_lock:
+            if self._writer is None:
+                if not start:
+                    return False
+                self._writer = threading.Thread(target=self._run_writer, args=(self._queue,),
+                                                name="JournalWriter", daemon=True)
+                self._writer.start()
+            self._queue.put(item)
+        return True
+    
+    def _run_writer(self, items_queue):
+        """Biriken kayıtları toplu yazar ve bir kez fsync yapar; None gelince çıkar"""
+        while True:
+            items = [items_queue.get()]
+            while True:
+                try:
+                    items.append(items_queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [item for item in items if isinstance(item, str)]
+            if lines:
+                with self._lock:
+                    self._write_locked(lines)
+            # Bekleyen flush çağrıları bu toplu yazımdan sonra bırakılır
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if None in items:
+                return
+    
+    def _write_locked(self, lines):
+        """Satırları ekler, bir kez fsync yapar ve günlük büyüdüyse sıkıştırır"""
+        try:
+            f = self._open()
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        except OSError as e:
+            logger.error("İş günlüğüne yazılamadı (%s kayıt): %s", len(lines), e)
+            return
+        
+        # Günlük büyüdüyse sıkıştır
+        try:
+            if f.tell() > COMPACT_SIZE:
+                self._compact_locked()
+        except OSError as e:
+            logger.warning("İş günlüğü sıkıştırılamadı: %s", e)
+    
+    def replay(self):
+        """Günlüğü baştan okur ve bitmemiş işlerin son kayıtlarını geliş sırasıyla döndürür"""
+        self.flush()
+        with self._lock:
+            return self._read_unfinished_locked()
+    
+    def compact(self):
+        """Günlüğü yalnızca bitmemiş işlerin son kayıtlarıyla yeniden yazar"""
+        self.flush()
+        with self._lock:
+            try:
+                self._compact_locked()
+            except OSError as e:
+                logger.warning("İş günlüğü sıkıştırılamadı: %s", e)
+    
+    def close(self):
+        """Kuyruktaki kayıtları yazar, yazıcıyı durdurur ve günlük dosyasını kapatır"""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                # Sonraki kayıtlar yeni kuyruğa ve yeni yazıcıya gider; eski yazıcı None'a kadar yazar
+                self._queue.put(None)
+                self._queue = queue.SimpleQueue()
+        if writer is not None:
+            writer.join()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+    
+    def _read_unfinished_locked(self):
+        """Günlükteki her işin son kaydını katlar ve bitmemiş olanları döndürür"""
+        if not os.path.exists(self.path):
+            return []
+        
+        latest = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Çökme sırasında yarım kalmış son satır atlanır
+                    logger.warning("İş günlüğünde bozuk satır atlandı: %s", line_number)
+                    continue
+                job_id = entry.get("job_id")
+                if job_id:
+                    latest[job_id] = entry
+        
+        unfinished = [entry for entry in latest.values() if entry.get("state") not in self.final_states]
+        unfinished.sort(key=lambda entry: entry.get("submitted_at") or 0)
+        return unfinished
+    
+    def _compact_locked(self):
+        """Sıkıştırmayı geçici dosyaya yazıp atomik olarak yerine koyar"""
+        unfinished = self._read_unfinished_locked()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for entry in unfinished:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
\ No newline at end of file
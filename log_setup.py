@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Kayıtları kuyruk üzerinden arka planda dosyaya yazan günlükleme modülü
+"""
+
+import os
+import sys
+import queue
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Günlük dosyalarının tutulduğu dizin
+LOG_DIR = os.path.join(os.path.expanduser("~"), ".mukaprint", "logs")
+LOG_FILE = os.path.join(LOG_DIR, "mukaprint.log")
+
+# Dosyaya ve konsola yazılan kayıt biçimi
+LOG_FORMAT = "%(asctime)s %(levelname)-7s [%(threadName)s] %(name)s: %(message)s"
+
+# Çalışırken uygulanabilen günlükleme ayarları
+LOGGING_CONFIG_KEYS = ("log_level", "log_levels")
+
+# Kuyruğu boşaltıp kayıtları dosyaya yazan dinleyici
+_listener = None
+
+# Ayarla düzeyi verilmiş modül günlükçüleri (ayardan çıkarılınca sıfırlanır)
+_module_levels = set()
+
+
+def setup_logging(config, log_file=LOG_FILE):
+    """Kök günlükçüyü kuyruğa bağlar ve dosya/konsol yazımını arka plan iş parçacığına taşır
+    
+    Çağıran iş parçacığı (izleyici, kuyruk çalışanı) yalnızca kaydı kuyruğa ekler;
+    dosya döndürme ve konsol yazımı dinleyicinin iş parçacığında yapılır. pythonw ile
+    başlatıldığında konsol olmadığından yalnızca dosyaya yazılır.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+    try:
+        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=int(config.get("log_file_mb", 5) * 1024 * 1024),
+            backupCount=config.get("log_backups", 5), encoding="utf-8", delay=True
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    except OSError as e:
+        if sys.stderr is not None:
+            sys.stderr.write(f"Günlük dosyası açılamadı: {e}\n")
+    if sys.stderr is not None:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+    
+    # Sınırsız kuyruk: kayıt eklemek hiçbir zaman beklemez
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    apply_log_levels(config)
+    logging.captureWarnings(True)
+    
+    # pythonw altında yakalanmayan hatalar da kaybolmasın
+    sys.excepthook = _log_uncaught_exception
+    threading.excepthook = lambda args: _log_uncaught_exception(args.exc_type, args.exc_value, args.exc_traceback)
+    
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def apply_log_levels(changes):
+    """Genel düzeyi ve modül bazındaki düzeyleri ({"file_watcher": "DEBUG"} gibi) uygular"""
+    if "log_level" in changes:
+        logging.getLogger().setLevel(_parse_level(changes["log_level"], logging.INFO))
+    if "log_levels" in changes:
+        levels = changes["log_levels"] or {}
+        for name in _module_levels - set(levels):
+            # Ayardan çıkarılan modül yeniden genel düzeyi izler
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        for name, level in levels.items():
+            logging.getLogger(name).setLevel(_parse_level(level, logging.NOTSET))
+        _module_levels.clear()
+        _module_levels.update(levels)
+
+
+def _parse_level(level, default):
+    """"DEBUG" gibi adları ya da sayısal düzeyleri logging düzeyine çevirir"""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    return value if isinstance(value, int) else default
+
+
+def _log_uncaught_exception(exc_type, exc_value, exc_traceback):
+    """Yakalanmayan hatayı günlüğe yazar"""
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
+    logging.getLogger("mukaprint").critical(
+        "Yakalanmayan hata", exc_info=(exc_type, exc_value, exc_traceback)
+    )
+
+
+def shutdown_logging():
+    """Kuyrukta kalan kayıtları yazıp dinleyiciyi durdurur"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
\ No newline at end of file
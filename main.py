@@ -8,37 +8,48 @@ Ana uygulama başlatıcı modülü
 
 import sys
 import os
+import multiprocessing
+import qt_compat  # noqa: F401  (PySide6 sinyal hatası düzeltmesi, sinyaller kullanılmadan önce)
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 import qtawesome as qta
 
 from ui.main_window import MainWindow
-from config import load_config, save_config
+from config import ConfigService
+from log_setup import setup_logging, apply_log_levels, shutdown_logging, LOGGING_CONFIG_KEYS
 
 
 def main():
     """Ana uygulama başlatıcı fonksiyonu"""
-    # Uygulama yapılandırmasını yükle
-    config = load_config()
-    
     # QApplication oluştur
     app = QApplication(sys.argv)
     app.setApplicationName("MUKAprint")
     app.setApplicationDisplayName("MUKAprint - Otomatik Yazdırma Hizmeti")
     app.setWindowIcon(QIcon(qta.icon('fa5s.print', color='#1a5fb4')))
     
+    # Uygulama yapılandırmasını yükle; dosya dışarıdan değiştirilirse değişiklikler canlı uygulanır
+    config_service = ConfigService()
+    
+    # Günlük kayıtları arka planda dosyaya yazılır; modül düzeyleri çalışırken değiştirilebilir
+    setup_logging(config_service.config)
+    config_service.subscribe(apply_log_levels, LOGGING_CONFIG_KEYS)
+    config_service.watch()
+    
     # Ana pencereyi oluştur ve göster
-    window = MainWindow(config)
+    window = MainWindow(config_service)
     window.show()
     
     # Uygulama döngüsünü başlat
     exit_code = app.exec()
     
     # Çıkış yapmadan önce yapılandırmayı kaydet
-    save_config(window.get_config())
+    config_service.save()
+    shutdown_logging()
     
     return exit_code
 
 
 if __name__ == "__main__":
+    # Dönüştürücü süreç havuzu paketlenmiş (frozen) uygulamada da çalışsın
+    multiprocessing.freeze_support()
     sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Belge sayfa sayısı gibi pahalı hesaplanan bilgileri saklayan önbellek modülü
+"""
+
+import os
+import logging
+import json
+import shutil
+import zipfile
+import tempfile
+import threading
+from collections import OrderedDict
+from xml.etree.ElementTree import iterparse
+from PyPDF2 import PdfReader
+
+from converter import convert_to_pdf
+from prerender_cache import cache_key
+
+
+logger = logging.getLogger(__name__)
+
+
+# Varsayılan önbellek dosyası yolu
+METADATA_FILE = os.path.join(os.path.expanduser("~"), ".mukaprint", "metadata.json")
+
+# Office Open XML paketlerinde uygulamanın kaydettiği sayfa/slayt sayısı
+APP_PROPERTIES = "docProps/app.xml"
+APP_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}"
+PAGE_COUNT_TAGS = {".docx": "Pages", ".docm": "Pages", ".pptx": "Slides", ".pptm": "Slides"}
+
+# Sayfa sayısı kaynakları
+SOURCE_APP_PROPERTIES = "app.xml"
+SOURCE_LAYOUT = "layout"
+
+
+def read_app_page_count(file_path):
+    """Paketteki docProps/app.xml'den sayfa ya da slayt sayısını okur, yoksa None"""
+    tag = PAGE_COUNT_TAGS.get(os.path.splitext(file_path)[1].lower())
+    if tag is None or not zipfile.is_zipfile(file_path):
+        return None
+    with zipfile.ZipFile(file_path) as package:
+        if APP_PROPERTIES not in package.namelist():
+            return None
+        with package.open(APP_PROPERTIES) as f:
+            for _, elem in iterparse(f):
+                if elem.tag == APP_NS + tag:
+                    try:
+                        count = int(elem.text)
+                    except (TypeError, ValueError):
+                        return None
+                    # Bazı üreticiler alanı 0 bırakır; bu durumda gerçek sayı bilinmiyor demektir
+                    return count if count > 0 else None
+    return None
+
+
+def layout_page_count(file_path):
+    """Belgeyi PDF'e dönüştürerek gerçek sayfa sayısını bulur (çalışan süreçte çağrılır)"""
+    work_dir = tempfile.mkdtemp(prefix="mukaprint_meta_")
+    try:
+        pdf_path = convert_to_pdf(file_path, work_dir)
+        with open(pdf_path, "rb") as f:
+            return len(PdfReader(f).pages)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+class MetadataCache:
+    """Dosya kimliğine (yol, boyut, değişiklik zamanı) göre belge bilgilerini diskte tutan sınıf"""
+    
+    def __init__(self, path=METADATA_FILE, max_entries=5000):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # anahtar -> bilgi sözlüğü (eskiden yeniye)
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        """Önceki oturumdan kalan kayıtları yükler"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries.update(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning("Belge bilgisi önbelleği okunamadı: %s", e)
+    
+    def get(self, file_path):
+        """Dosyanın kayıtlı bilgilerini döndürür; dosya değiştiyse ya da kayıt yoksa boş sözlük"""
+        try:
+            key = cache_key(file_path)
+        except OSError:
+            return {}
+        with self._lock:
+            return dict(self.entries.get(key, {}))
+    
+    def update(self, file_path, **fields):
+        """Dosyanın bilgilerini günceller ve önbelleği atomik olarak diske yazar"""
+        try:
+            key = cache_key(file_path)
+        except OSError:
+            return
+        with self._lock:
+            entry = self.entries.pop(key, {})
+            entry.update(fields)
+            self.entries[key] = entry
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            try:
+                self._save_locked()
+            except OSError as e:
+                logger.warning("Belge bilgisi önbelleği yazılamadı: %s", e)
+    
+    def _save_locked(self):
+        """Kayıtları geçici dosyaya yazıp yerine koyar"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
\ No newline at end of file
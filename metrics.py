@@ -0,0 +1,448 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Algılama-dönüştürme-biriktirme hattı için sayaç, histogram ve iş izi (trace) modülü
+"""
+
+import os
+import logging
+import json
+import time
+import queue
+import bisect
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from urllib.parse import parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+logger = logging.getLogger(__name__)
+
+
+# İz kayıtlarının yazıldığı JSON satırları dosyası
+TRACE_FILE = os.path.join(os.path.expanduser("~"), ".mukaprint", "traces.jsonl")
+
+# Süre histogramlarının varsayılan kova sınırları (saniye)
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# Henüz bir işe bağlanmamış dosya izlerinin en fazla tutulacağı sayı
+MAX_PENDING_FILES = 200
+
+# Prometheus metin biçiminin içerik türü
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _label_key(labels):
+    """Etiket sözlüğünü sıralı ve değiştirilemez anahtara çevirir"""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value):
+    """Etiket değerindeki ters bölü, tırnak ve satır sonlarını kaçışlar"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key, extra=None):
+    """Etiketleri Prometheus biçiminde yazar"""
+    pairs = list(key) + list(extra or [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    """Sayıyı Prometheus biçiminde yazar"""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Yalnızca artan, etiketlere göre ayrılmış sayaç"""
+    
+    kind = "counter"
+    
+    def __init__(self, name, help_text=""):
+        self.name = name
+        self.help = help_text
+        self.values = {}  # etiket anahtarı -> değer
+        self._lock = threading.Lock()
+    
+    def inc(self, amount=1, **labels):
+        """Sayacı verilen miktar kadar artırır"""
+        key = _label_key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+    
+    def value(self, **labels):
+        """Etiketlerin güncel değerini döndürür"""
+        with self._lock:
+            return self.values.get(_label_key(labels), 0)
+    
+    def render(self):
+        """Prometheus metin satırlarını döndürür"""
+        with self._lock:
+            values = sorted(self.values.items())
+        return [f"{self.name}{_format_labels(key)} {_format_value(value)}" for key, value in values]
+
+
+class Histogram:
+    """Gözlemleri sabit kovalara dağıtan, etiketlere göre ayrılmış histogram"""
+    
+    kind = "histogram"
+    
+    def __init__(self, name, help_text="", buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.series = {}  # etiket anahtarı -> [kova sayıları, toplam, adet]
+        self._lock = threading.Lock()
+    
+    def observe(self, value, **labels):
+        """Bir gözlemi ekler"""
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+    
+    def snapshot(self, **labels):
+        """Etiketlerin (toplam, adet) çiftini döndürür"""
+        with self._lock:
+            series = self.series.get(_label_key(labels))
+            return (series[1], series[2]) if series else (0.0, 0)
+    
+    def render(self):
+        """Prometheus metin satırlarını (birikimli kovalar, toplam, adet) döndürür"""
+        with self._lock:
+            series = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self.series.items())
+        lines = []
+        for key, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key, [('le', _format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Uygulamadaki tüm sayaç ve histogramları adlarıyla tutan kayıt"""
+    
+    def __init__(self):
+        self.metrics = OrderedDict()  # ad -> ölçüm
+        self._lock = threading.Lock()
+    
+    def _get_or_create(self, cls, name, *args):
+        with self._lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, *args)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Ölçüm farklı türle kayıtlı: {name}")
+            return metric
+    
+    def counter(self, name, help_text=""):
+        """Adı verilen sayacı döndürür, yoksa oluşturur"""
+        return self._get_or_create(Counter, name, help_text)
+    
+    def histogram(self, name, help_text="", buckets=DEFAULT_BUCKETS):
+        """Adı verilen histogramı döndürür, yoksa oluşturur"""
+        return self._get_or_create(Histogram, name, help_text, buckets)
+    
+    def render(self):
+        """Tüm ölçümleri Prometheus metin biçiminde döndürür"""
+        with self._lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            if metric.help:
+                lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class TraceLog:
+    """İz kayıtlarını boyutu aşınca döndürülen JSON satırları dosyasına yazan sınıf
+    
+    Çağıran iş parçacığı (arayüz, kuyruk çalışanı) kaydı yalnızca kuyruğa ekler; dosyaya
+    yazma, boşaltma ve döndürme arka plandaki yazıcı iş parçacığında, birikmiş kayıtlar
+    için tek seferde yapılır. Varsayılan olarak kapalıdır, uygulama ayarla açar.
+    """
+    
+    def __init__(self, path=TRACE_FILE, max_bytes=5 * 1024 * 1024, backup_count=3, enabled=False):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.enabled = enabled
+        self._file = None
+        # Sınırsız kuyruk: kayıt eklemek hiçbir zaman beklemez
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+        # Kapatılan yazıcı bitmeden yenisi başlarsa dosyaya sırayla erişilsin
+        self._file_lock = threading.Lock()
+    
+    def write(self, record):
+        """Kaydı yazılmak üzere kuyruğa ekler; yazılamazsa kayıt bırakılır, hat durmaz"""
+        if not self.enabled:
+            return
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._queue.put(line)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run_writer, args=(self._queue,),
+                                                name="TraceWriter", daemon=True)
+                self._thread.start()
+    
+    def _run_writer(self, lines_queue):
+        """Kuyruktaki satırları toplu olarak dosyaya yazar; None gelince dosyayı kapatıp çıkar"""
+        while True:
+            lines = [lines_queue.get()]
+            while True:
+                try:
+                    lines.append(lines_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in lines
+            with self._file_lock:
+                self._write_lines([line for line in lines if line is not None])
+                if stop:
+                    self._close_file()
+            if stop:
+                return
+    
+    def _write_lines(self, lines):
+        """Satırları dosyaya ekler ve bir kez boşaltır (dosya kilidi tutulurken çağrılır)"""
+        if not lines:
+            return
+        try:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            for line in lines:
+                if self.max_bytes and self._file.tell() + len(line) > self.max_bytes:
+                    self._rotate()
+                self._file.write(line)
+            self._file.flush()
+        except OSError as e:
+            logger.warning("İz kaydı yazılamadı: %s", e)
+            self._close_file()
+    
+    def _rotate(self):
+        """traces.jsonl -> traces.jsonl.1 -> ... şeklinde dosyaları kaydırır (dosya kilidi tutulurken çağrılır)"""
+        self._close_file()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+    
+    def _close_file(self):
+        """Açık dosyayı kapatır (dosya kilidi tutulurken çağrılır)"""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+    
+    def close(self):
+        """Kuyrukta kalan kayıtları yazar, yazıcı iş parçacığını durdurur ve dosyayı kapatır"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            # Sonraki kayıtlar yeni kuyruğa ve yeni yazıcıya gider; eski yazıcı None'a kadar yazar
+            self._queue.put(None)
+            self._queue = queue.SimpleQueue()
+        thread.join()
+
+
+class Tracer:
+    """İş kimliğini iz kimliği olarak kullanıp hattın aşama sürelerini ölçen sınıf
+    
+    Her aşama süresi aşama etiketli histograma eklenir ve iz kaydına yazılır. Dosya
+    henüz bir işe bağlanmadan ölçülen aşamalar (algılama, hazır olma beklemesi) dosya
+    yoluna göre bekletilir ve kuyruk işi oluşturunca işin iz kimliğiyle yazılır.
+    """
+    
+    def __init__(self, registry, trace_log=None):
+        self.registry = registry
+        self.trace_log = trace_log if trace_log is not None else TraceLog()
+        self.stage_seconds = registry.histogram(
+            "mukaprint_stage_seconds", "Hat aşamalarının süresi (saniye)"
+        )
+        self.pending_files = OrderedDict()  # dosya yolu -> bekleyen aşama kayıtları
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def current(self):
+        """İş parçacığında etkin olan iz kimliğini döndürür"""
+        return getattr(self._local, "trace_id", None)
+    
+    @contextmanager
+    def activate(self, trace_id):
+        """Blok süresince iş parçacığındaki aşamaları verilen ize bağlar"""
+        previous = self.current()
+        self._local.trace_id = trace_id
+        try:
+            yield
+        finally:
+            self._local.trace_id = previous
+    
+    @contextmanager
+    def span(self, stage, trace_id=None, **attributes):
+        """Blok süresini aşama olarak ölçer; hata çıkarsa kayda hata bilgisi eklenir"""
+        start = time.time()
+        started = time.perf_counter()
+        try:
+            yield attributes
+        except BaseException as e:
+            attributes["error"] = type(e).__name__
+            raise
+        finally:
+            self.record(stage, time.perf_counter() - started, trace_id, start=start, **attributes)
+    
+    def record(self, stage, duration, trace_id=None, start=None, **attributes):
+        """Başka yerde ölçülmüş bir aşama süresini kaydeder"""
+        duration = max(0.0, duration)
+        self.stage_seconds.observe(duration, stage=stage)
+        if trace_id is None:
+            trace_id = self.current()
+        record = {
+            "trace_id": trace_id,
+            "stage": stage,
+            "start": round(start if start is not None else time.time() - duration, 6),
+            "duration": round(duration, 6)
+        }
+        record.update(attributes)
+        self.trace_log.write(record)
+    
+    def note_file(self, file_path, stage, duration, **attributes):
+        """Henüz işe bağlanmamış dosyanın aşama süresini histograma ekler ve iz için bekletir"""
+        duration = max(0.0, duration)
+        self.stage_seconds.observe(duration, stage=stage)
+        record = {"stage": stage, "start": round(time.time() - duration, 6), "duration": round(duration, 6)}
+        record.update(attributes)
+        with self._lock:
+            self.pending_files.setdefault(file_path, []).append(record)
+            self.pending_files.move_to_end(file_path)
+            # Hiç kuyruğa alınmayan dosyaların kayıtları sınırsız birikmesin
+            while len(self.pending_files) > MAX_PENDING_FILES:
+                self.pending_files.popitem(last=False)
+    
+    def claim_file(self, file_path, trace_id):
+        """Dosya için bekleyen aşama kayıtlarını işin iz kimliğiyle yazar"""
+        with self._lock:
+            records = self.pending_files.pop(file_path, [])
+        for record in records:
+            self.trace_log.write(dict(record, trace_id=trace_id, file=os.path.basename(file_path)))
+        return len(records)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """/metrics isteğine ölçümleri döndüren, kayıtlı eylemleri POST ile çalıştıran HTTP işleyicisi"""
+    
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_POST(self):
+        path, _, query = self.path.partition("?")
+        action = self.server.actions.get(path)
+        if action is None:
+            self.send_error(404)
+            return
+        try:
+            message = action(dict(parse_qsl(query)))
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+        body = f"{message}\n".encode("utf-8")
+        self.send_response(202)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        # Her kazıma isteği konsola yazılmasın
+        pass
+
+
+class MetricsServer:
+    """Ölçümleri yalnızca yerel makineye Prometheus metin biçiminde sunan, yerel kontrol eylemlerini kabul eden sunucu"""
+    
+    def __init__(self, registry, host="127.0.0.1", port=9469):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.actions = {}  # yol -> sorgu parametreleriyle çağrılıp yanıt metni döndüren işlev
+        self._server = None
+        self._thread = None
+    
+    def add_action(self, path, callback):
+        """POST ile tetiklenen yerel kontrol uç noktası ekler (ör. /profile?seconds=30)"""
+        self.actions[path] = callback
+    
+    def start(self):
+        """Sunucuyu arka planda başlatır; port kullanılıyorsa uyarı verip devam eder"""
+        if self._server is not None:
+            return True
+        try:
+            server = ThreadingHTTPServer((self.host, self.port), _MetricsRequestHandler)
+        except OSError as e:
+            logger.warning("Ölçüm sunucusu başlatılamadı (%s:%s): %s", self.host, self.port, e)
+            return False
+        server.daemon_threads = True
+        server.registry = self.registry
+        server.actions = self.actions
+        self._server = server
+        self.port = server.server_address[1]
+        self._thread = threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+        logger.info("Ölçümler sunuluyor: http://%s:%s/metrics", self.host, self.port)
+        return True
+    
+    def stop(self):
+        """Sunucuyu durdurur"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+
+# Uygulama genelinde paylaşılan ölçüm kaydı ve izleyici
+registry = MetricsRegistry()
+tracer = Tracer(registry)
+
+# Hat boyunca sayılan olaylar
+files_detected = registry.counter("mukaprint_files_detected_total", "Süzgeçten geçip hazır olan dosyalar")
+files_rejected = registry.counter("mukaprint_files_rejected_total", "Süzgeç tarafından elenen dosya olayları")
+jobs_finished = registry.counter("mukaprint_jobs_total", "Sonuçlanan yazdırma işleri")
+pages_printed = registry.counter("mukaprint_pages_printed_total", "Başarıyla basılan sayfalar (kopyalar dahil)")
+job_seconds = registry.histogram("mukaprint_job_seconds", "Kuyruğa alınmadan sonuçlanmaya kadar toplam iş süresi")
\ No newline at end of file
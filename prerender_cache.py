@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Gelen dosyaları önceden yazdırmaya hazırlayan önbellek modülü
+"""
+
+import os
+import logging
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError
+
+from converter import OFFICE_EXTENSIONS
+
+
+logger = logging.getLogger(__name__)
+
+
+# Varsayılan önbellek dizini
+PRERENDER_DIR = os.path.join(os.path.expanduser("~"), ".mukaprint", "prerender")
+
+
+def cache_key(file_path):
+    """Dosyanın yolu, boyutu ve değişiklik zamanından önbellek anahtarı üretir"""
+    stat = os.stat(file_path)
+    identity = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+class PrerenderCache:
+    """Yazdırmaya hazır PDF'leri boyut sınırlı, en uzun süredir kullanılmayan önce silinen disk önbelleği"""
+    
+    def __init__(self, cache_dir=PRERENDER_DIR, max_bytes=500 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # anahtar -> dosya boyutu (eskiden yeniye)
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        """Önceki oturumdan kalan önbellek dosyalarını kullanım sırasıyla yükler"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        files = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith(".pdf") and os.path.isfile(path):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, name[:-4], stat.st_size))
+            elif name.endswith(".tmp"):
+                # Yarım kalmış yazma
+                os.remove(path)
+        for _, key, size in sorted(files):
+            self.entries[key] = size
+            self.total_bytes += size
+    
+    def _path(self, key):
+        """Anahtarın önbellekteki dosya yolunu döndürür"""
+        return os.path.join(self.cache_dir, key + ".pdf")
+    
+    def lookup(self, file_path):
+        """Dosyanın hazır PDF'ini döndürür, yoksa ya da dosya değiştiyse None"""
+        try:
+            key = cache_key(file_path)
+        except OSError:
+            return None
+        with self._lock:
+            if key not in self.entries:
+                return None
+            path = self._path(key)
+            if not os.path.exists(path):
+                self.total_bytes -= self.entries.pop(key)
+                return None
+            self.entries.move_to_end(key)
+        # Kullanım sırası oturumlar arasında dosya zamanıyla korunur
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+    
+    def store(self, key, produced_path):
+        """Üretilen PDF'i önbelleğe taşır, sınır aşılırsa en eski girdileri siler"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        temp_path = path + ".tmp"
+        shutil.copyfile(produced_path, temp_path)
+        os.replace(temp_path, path)
+        size = os.path.getsize(path)
+        
+        with self._lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)
+            self.entries[key] = size
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                old_key, old_size = self.entries.popitem(last=False)
+                self.total_bytes -= old_size
+                try:
+                    os.remove(self._path(old_key))
+                except OSError:
+                    pass
+        return path
+
+
+class Prerenderer:
+    """Algılanan dosyaları boşta kalan zamanda PDF'e dönüştüren düşük öncelikli çalışan"""
+    
+    def __init__(self, converter_pool, cache, config):
+        self.converter_pool = converter_pool
+        self.cache = cache
+        self.config = config
+        self.pending = OrderedDict()  # dosya_yolu -> None (geliş sırası)
+        self.inflight = {}  # dosya_yolu -> (Future, önbelleğe yazılınca işaretlenen olay)
+        self.active_prints = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+    
+    @classmethod
+    def from_config(cls, converter_pool, config):
+        """Yapılandırmadaki önbellek boyutuyla oluşturur"""
+        cache = PrerenderCache(max_bytes=config.get("prerender_cache_mb", 500) * 1024 * 1024)
+        return cls(converter_pool, cache, config)
+    
+    def enqueue(self, file_path):
+        """Dosyayı önceden hazırlanacaklar listesine ekler"""
+        if not self.config.get("prerender_enabled", False):
+            return False
+        if os.path.splitext(file_path)[1].lower() not in OFFICE_EXTENSIONS:
+            return False
+        if self.cache.lookup(file_path) is not None:
+            return False
+        
+        with self._condition:
+            if file_path in self.inflight or file_path in self.pending:
+                return False
+            self.pending[file_path] = None
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, name="Prerenderer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return True
+    
+    def cancel(self, file_path):
+        """Dosyanın bekleyen ya da henüz başlamamış hazırlığını iptal eder"""
+        with self._condition:
+            self.pending.pop(file_path, None)
+            inflight = self.inflight.get(file_path)
+        if inflight is not None:
+            inflight[0].cancel()
+    
+    def begin_print(self):
+        """Gerçek bir yazdırma başladığında çağrılır; tahmini iş kaynakları bırakır"""
+        with self._condition:
+            self.active_prints += 1
+            inflight = list(self.inflight.items())
+        # Havuzda henüz başlamamış hazırlık geri çekilir, yazdırma bitince yeniden sıraya girer
+        for file_path, (future, _) in inflight:
+            if future.cancel():
+                with self._condition:
+                    self.pending[file_path] = None
+                    self.pending.move_to_end(file_path, last=False)
+    
+    def end_print(self):
+        """Gerçek yazdırma bittiğinde çağrılır"""
+        with self._condition:
+            self.active_prints = max(0, self.active_prints - 1)
+            self._condition.notify()
+    
+    def wait_for(self, file_path):
+        """Dosya şu an hazırlanıyorsa bitmesini bekler ve hazır PDF'i döndürür"""
+        with self._condition:
+            inflight = self.inflight.get(file_path)
+        if inflight is not None:
+            inflight[1].wait()
+        return self.cache.lookup(file_path)
+    
+    def stop(self, wait=False):
+        """Çalışanı durdurur, bekleyen hazırlıkları bırakır"""
+        with self._condition:
+            self._running = False
+            self.pending.clear()
+            inflight = list(self.inflight.values())
+            thread, self._thread = self._thread, None
+            self._condition.notify_all()
+        for future, _ in inflight:
+            future.cancel()
+        if wait and thread is not None:
+            thread.join()
+    
+    def _run(self):
+        """Yazdırma yokken sıradaki dosyayı tek tek dönüştürür"""
+        while True:
+            with self._condition:
+                # Gerçek yazdırma sürerken tahmini işe başlanmaz
+                while self._running and (not self.pending or self.active_prints > 0):
+                    self._condition.wait()
+                if not self._running:
+                    return
+                file_path, _ = self.pending.popitem(last=False)
+                try:
+                    key = cache_key(file_path)
+                except OSError:
+                    # Dosya bu arada silinmiş
+                    continue
+                if self.cache.lookup(file_path) is not None:
+                    continue
+                work_dir = tempfile.mkdtemp(prefix="mukaprint_pre_")
+                future = self.converter_pool.convert_to_pdf(file_path, work_dir)
+                done = threading.Event()
+                self.inflight[file_path] = (future, done)
+            
+            try:
+                self.cache.store(key, future.result())
+                logger.info("Önceden hazırlandı: %s", os.path.basename(file_path))
+            except CancelledError:
+                pass
+            except Exception as e:
+                logger.warning("Önceden hazırlama başarısız: %s: %s", os.path.basename(file_path), e)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+                with self._condition:
+                    self.inflight.pop(file_path, None)
+                done.set()
\ No newline at end of file
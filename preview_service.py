@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Dosya listesi için küçük önizleme (thumbnail) üreten arka plan hizmeti modülü
+"""
+
+import os
+import logging
+import hashlib
+import zipfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError
+from PySide6.QtCore import QObject, Signal
+
+from converter import ConverterPool, OFFICE_EXTENSIONS
+from image_renderer import IMAGE_EXTENSIONS
+
+
+logger = logging.getLogger(__name__)
+
+
+# Varsayılan önizleme önbelleği dizini
+THUMBNAIL_DIR = os.path.join(os.path.expanduser("~"), ".mukaprint", "thumbnails")
+
+# Ofis Open XML paketlerinde kaydedilmiş önizleme resimleri
+OOXML_THUMBNAILS = ("docProps/thumbnail.jpeg", "docProps/thumbnail.jpg", "docProps/thumbnail.png")
+
+# İçerik özeti okunurken kullanılan blok boyutu
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def content_hash(file_path):
+    """Dosya içeriğinin SHA-1 özetini döndürür (aynı içerik farklı adla gelse de önbellek paylaşılır)"""
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def render_thumbnail(file_path, cache_dir, size, source_pdf=None):
+    """Dosyanın ilk sayfasının önizlemesini önbelleğe yazar, (anahtar, yol) döndürür (çalışan süreçte çağrılır)"""
+    key = f"{content_hash(file_path)}_{size}"
+    thumb_path = os.path.join(cache_dir, key + ".png")
+    if os.path.exists(thumb_path):
+        return key, thumb_path
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = thumb_path + f".{os.getpid()}.tmp"
+    ext = os.path.splitext(file_path)[1].lower()
+    try:
+        if ext == ".pdf":
+            rendered = _render_pdf(file_path, temp_path, size)
+        elif ext in IMAGE_EXTENSIONS:
+            rendered = _render_image(file_path, temp_path, size)
+        elif ext in OFFICE_EXTENSIONS:
+            # Önce pakete gömülü önizleme, yoksa önceden hazırlanmış PDF'in ilk sayfası
+            rendered = _render_ooxml(file_path, temp_path, size)
+            if not rendered and source_pdf:
+                rendered = _render_pdf(source_pdf, temp_path, size)
+        else:
+            rendered = False
+        
+        if not rendered:
+            return key, None
+        os.replace(temp_path, thumb_path)
+        return key, thumb_path
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _render_pdf(pdf_path, output_path, size):
+    """PDF'in ilk sayfasını QtPdf ile verilen kutuya sığdırarak çizer"""
+    try:
+        from PySide6.QtCore import QSize
+        from PySide6.QtPdf import QPdfDocument
+    except ImportError:
+        return False
+    
+    document = QPdfDocument()
+    if document.load(pdf_path) != QPdfDocument.Error.None_ or document.pageCount() == 0:
+        return False
+    page_size = document.pagePointSize(0)
+    if page_size.width() <= 0 or page_size.height() <= 0:
+        return False
+    scale = size / max(page_size.width(), page_size.height())
+    target = QSize(max(1, round(page_size.width() * scale)), max(1, round(page_size.height() * scale)))
+    image = document.render(0, target)
+    document.close()
+    return not image.isNull() and image.save(output_path, "PNG")
+
+
+def _render_image(image_path, output_path, size):
+    """Resmi Pillow ile küçültür; JPEG'lerde taslak kip ile yalnızca gereken çözünürlük çözülür"""
+    from PIL import Image, ImageOps
+    
+    with Image.open(image_path) as image:
+        image.draft("RGB", (size, size))
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((size, size))
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        image.save(output_path, "PNG")
+    return True
+
+
+def _render_ooxml(file_path, output_path, size):
+    """Ofis Open XML paketine kaydedilmiş önizleme resmini çıkarır"""
+    if not zipfile.is_zipfile(file_path):
+        return False
+    with zipfile.ZipFile(file_path) as package:
+        names = set(package.namelist())
+        for name in OOXML_THUMBNAILS:
+            if name in names:
+                with package.open(name) as source:
+                    return _render_image(source, output_path, size)
+    return False
+
+
+class ThumbnailCache:
+    """Önizleme resimlerini boyut sınırlı, en uzun süredir kullanılmayan önce silinen disk önbelleği"""
+    
+    def __init__(self, cache_dir=THUMBNAIL_DIR, max_bytes=100 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # anahtar -> dosya boyutu (eskiden yeniye)
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        """Önceki oturumdan kalan önizlemeleri kullanım sırasıyla yükler"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        files = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith(".png") and os.path.isfile(path):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, name[:-4], stat.st_size))
+            elif name.endswith(".tmp"):
+                # Yarım kalmış yazma
+                os.remove(path)
+        for _, key, size in sorted(files):
+            self.entries[key] = size
+            self.total_bytes += size
+    
+    def touch(self, key, path):
+        """Önizlemeyi en son kullanılan olarak işaretler ve sınır aşılırsa en eskileri siler"""
+        try:
+            size = os.path.getsize(path)
+            os.utime(path)
+        except OSError:
+            return
+        with self._lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)
+            self.entries[key] = size
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                old_key, old_size = self.entries.popitem(last=False)
+                self.total_bytes -= old_size
+                try:
+                    os.remove(os.path.join(self.cache_dir, old_key + ".png"))
+                except OSError:
+                    pass
+
+
+class PreviewService(QObject):
+    """Görünen dosyaların önizlemelerini süreç havuzunda üreten ve hazır oldukça bildiren sınıf"""
+    
+    # Önizleme hazır sinyali (havuz iş parçacığından yayılır, arayüze kuyrukla ulaşır)
+    thumbnail_ready = Signal(str, str)  # dosya_yolu, önizleme_yolu
+    
+    def __init__(self, config, prerender_cache=None):
+        super().__init__()
+        self.config = config
+        self.size = config.get("thumbnail_size", 48)
+        self.cache = ThumbnailCache(max_bytes=config.get("thumbnail_cache_mb", 100) * 1024 * 1024)
+        self.prerender_cache = prerender_cache
+        # Önizlemeler yazdırma dönüşümleriyle yarışmasın diye ayrı ve küçük bir havuz
+        self.pool = ConverterPool({"converter_workers": config.get("thumbnail_workers", 1)})
+        self.known = {}  # dosya_yolu -> (boyut, değişiklik zamanı, önizleme yolu ya da None)
+        self.pending = {}  # dosya_yolu -> Future
+        self._lock = threading.Lock()
+    
+    def request(self, file_path):
+        """Önizleme hazırsa yolunu döndürür, değilse arka planda üretimini başlatır ve None döndürür"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        identity = (stat.st_size, stat.st_mtime_ns)
+        
+        with self._lock:
+            known = self.known.get(file_path)
+            if known is not None and known[:2] == identity:
+                thumb_path = known[2]
+                # Önizleme çıkarılamayan dosyalar yeniden denenmez; önbellekten silinenler yeniden üretilir
+                if thumb_path is None or os.path.exists(thumb_path):
+                    return thumb_path
+            if file_path in self.pending:
+                return None
+            
+            source_pdf = None
+            if self.prerender_cache is not None and os.path.splitext(file_path)[1].lower() in OFFICE_EXTENSIONS:
+                source_pdf = self.prerender_cache.lookup(file_path)
+            future = self.pool.submit(render_thumbnail, file_path, self.cache.cache_dir, self.size, source_pdf)
+            self.pending[file_path] = future
+        future.add_done_callback(lambda f: self._on_rendered(file_path, identity, f))
+        return None
+    
+    def retain(self, file_paths):
+        """Yalnızca verilen dosyaların bekleyen isteklerini tutar, diğerlerini (ekrandan çıkanları) iptal eder"""
+        with self._lock:
+            dropped = [future for path, future in self.pending.items() if path not in file_paths]
+        for future in dropped:
+            future.cancel()
+    
+    def stop(self):
+        """Bekleyen istekleri iptal eder ve havuzu kapatır"""
+        self.retain(set())
+        self.pool.shutdown()
+    
+    def _on_rendered(self, file_path, identity, future):
+        """Üretilen önizlemeyi kaydeder ve arayüze bildirir"""
+        with self._lock:
+            if self.pending.get(file_path) is future:
+                del self.pending[file_path]
+        try:
+            key, thumb_path = future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            logger.warning("Önizleme oluşturulamadı: %s: %s", os.path.basename(file_path), e)
+            key, thumb_path = None, None
+        
+        with self._lock:
+            self.known[file_path] = identity + (thumb_path,)
+        if thumb_path is not None:
+            self.cache.touch(key, thumb_path)
+            self.thumbnail_ready.emit(file_path, thumb_path)
\ No newline at end of file
@@ -0,0 +1,1145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Yazdırma kuyruğu ve iş zamanlama modülü
+"""
+
+import os
+import logging
+import time
+import uuid
+import random
+import itertools
+import threading
+from collections import OrderedDict, deque
+from PySide6.QtCore import Qt, QObject, Signal
+
+from imposition import count_output_pages
+from converter import POWERPOINT_EXTENSIONS
+from job_journal import JobJournal
+from spooler import SpoolerMonitor, SPOOL_BLOCKED
+from metrics import tracer, jobs_finished, pages_printed, job_seconds
+from traffic_recorder import recorder
+
+
+logger = logging.getLogger(__name__)
+
+
+# İş öncelik seviyeleri
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+PRIORITY_URGENT = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_LOW: "Düşük",
+    PRIORITY_NORMAL: "Normal",
+    PRIORITY_HIGH: "Yüksek",
+    PRIORITY_URGENT: "Acil"
+}
+
+# İş durumları (durum makinesi sırasıyla)
+JOB_QUEUED = "queued"
+JOB_CONVERTING = "converting"
+JOB_SPOOLING = "spooling"
+JOB_PRINTING = "printing"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+JOB_STATES = [JOB_QUEUED, JOB_CONVERTING, JOB_SPOOLING, JOB_PRINTING, JOB_DONE, JOB_FAILED]
+FINAL_STATES = (JOB_DONE, JOB_FAILED)
+
+JOB_STATE_NAMES = {
+    JOB_QUEUED: "Kuyrukta",
+    JOB_CONVERTING: "Dönüştürülüyor",
+    JOB_SPOOLING: "Biriktiriciye gönderiliyor",
+    JOB_PRINTING: "Yazdırılıyor",
+    JOB_DONE: "Tamamlandı",
+    JOB_FAILED: "Başarısız"
+}
+
+# Durumdan çıkarken süresi iz kaydına yazılan hat aşamaları
+TRACE_STAGES = {
+    JOB_QUEUED: "prepare",
+    JOB_CONVERTING: "convert",
+    JOB_SPOOLING: "spool",
+    JOB_PRINTING: "printer"
+}
+
+# Yazıcı hızının (sayfa/dakika) üstel hareketli ortalamasında son ölçümün ağırlığı
+SPEED_SMOOTHING = 0.3
+
+# Hız ölçümüne katılacak en kısa yazdırma süresi (saniye); önbellekten anında biten işler hızı şişirmesin
+MIN_SPEED_SAMPLE_SECONDS = 1.0
+
+# Yaşlandırma işi en fazla bu önceliğe çıkarır: düşük öncelikli işler aç kalmaz, ama uzun bekleyen
+# büyük işler yeni gelen kısa işlerin önüne geçmez (aynı katmandaki açlığı adil paylaşım önler)
+AGING_PRIORITY_CAP = PRIORITY_NORMAL
+
+# Sayfa sayısı bilinmeyen işin maliyeti dosya boyutundan kestirilir (sayfa başına ortalama bayt, kaba kestirim)
+UNKNOWN_PAGE_BYTES = 16 * 1024
+
+# Çalışırken değiştirilebilen zamanlama ayarları -> JobScheduler öznitelikleri
+SCHEDULER_CONFIG_KEYS = {
+    "scheduler_priority": "use_priority",
+    "scheduler_shortest_job_first": "shortest_job_first",
+    "scheduler_fair_share": "fair_share",
+    "scheduler_aging_seconds": "aging_seconds"
+}
+
+
+class PrintJob:
+    """Kuyruktaki tek bir yazdırma işini temsil eden sınıf"""
+    
+    # Aynı anda gelen işlerin sırasını korumak için artan sıra numarası
+    _sequence = itertools.count()
+    
+    def __init__(self, file_path, printer_name=None, paper_size=None, copies=None, duplex=None,
+                 priority=PRIORITY_NORMAL, page_count=None, source=None, submitted_at=None, options=None):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.sequence = next(PrintJob._sequence)
+        self.file_path = file_path
+        self.printer_name = printer_name
+        self.paper_size = paper_size
+        self.copies = copies
+        self.duplex = duplex
+        self.options = options or {}  # print_document'a aktarılan ek ayarlar
+        self.priority = priority
+        self.page_count = page_count
+        self.source = source or os.path.dirname(file_path)
+        self.submitted_at = submitted_at if submitted_at is not None else time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.success = None
+        self.state = JOB_QUEUED
+        self.state_entered_at = time.time()  # iz kaydı için geçerli duruma giriş zamanı
+        self.attempts = 0
+        self.not_before = 0.0  # yeniden deneme için en erken başlama zamanı
+        self.last_error = None
+        self.spool_printer = None  # işin gönderildiği yazıcı (varsayılan yazıcı çözülmüş hali)
+        self.spool_jobs = []  # biriktirici iş kimlikleri
+        self._size_pages = None  # sayfa sayısı bilinmezken dosya boyutundan kestirilen sayfa
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Günlükteki kayıttan işi yeniden oluşturur"""
+        job = cls(
+            data["file_path"], data.get("printer_name"), data.get("paper_size"), data.get("copies"),
+            data.get("duplex"), priority=data.get("priority", PRIORITY_NORMAL),
+            page_count=data.get("page_count"), source=data.get("source"),
+            submitted_at=data.get("submitted_at"), options=data.get("options")
+        )
+        job.job_id = data["job_id"]
+        job.state = data.get("state", JOB_QUEUED)
+        job.attempts = data.get("attempts", 0)
+        job.last_error = data.get("last_error")
+        job.spool_printer = data.get("spool_printer")
+        job.spool_jobs = data.get("spool_jobs") or []
+        return job
+    
+    def can_transition(self, state):
+        """Durum makinesinin verilen geçişe izin verip vermediğini döndürür"""
+        if self.state in FINAL_STATES:
+            return False
+        if state in (JOB_QUEUED, JOB_FAILED):
+            return True
+        return JOB_STATES.index(state) > JOB_STATES.index(self.state)
+    
+    @property
+    def cost(self):
+        """En kısa iş önce sıralaması için basılacak toplam sayfa sayısını döndürür
+        
+        Sayfa sayısı henüz bilinmeyen işler (sayfa bilgisi olmayan .doc/.odt, dizgi geçişi
+        sürenler) tek sayfalık sayılmaz; maliyet dosya boyutundan kestirilir.
+        """
+        pages = self.page_count if self.page_count else self.size_pages()
+        return pages * max(1, self.copies or 1)
+    
+    def size_pages(self):
+        """Dosya (ve birleştirilecek dosyalar) boyutundan kaba sayfa kestirimini döndürür"""
+        if self._size_pages is None:
+            size = 0
+            for path in [self.file_path] + list(self.options.get("merge_batch") or []):
+                try:
+                    size += os.path.getsize(path)
+                except OSError:
+                    pass
+            self._size_pages = max(1, round(size / UNKNOWN_PAGE_BYTES))
+        return self._size_pages
+    
+    def to_dict(self):
+        """İşin özetini sözlük olarak döndürür"""
+        return {
+            "job_id": self.job_id,
+            "file_path": self.file_path,
+            "file_name": os.path.basename(self.file_path),
+            "printer_name": self.printer_name,
+            "paper_size": self.paper_size,
+            "duplex": self.duplex,
+            "options": self.options,
+            "priority": self.priority,
+            "page_count": self.page_count,
+            "copies": self.copies,
+            "source": self.source,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "success": self.success,
+            "state": self.state,
+            "attempts": self.attempts,
+            "not_before": self.not_before,
+            "last_error": self.last_error,
+            "spool_printer": self.spool_printer,
+            "spool_jobs": self.spool_jobs
+        }
+
+
+class JobScheduler:
+    """Öncelik, en kısa iş önce ve kaynaklar arası adil paylaşım ile sıradaki işi seçen sınıf"""
+    
+    def __init__(self, use_priority=True, shortest_job_first=True, fair_share=True,
+                 aging_seconds=20, fair_quantum=20):
+        self.use_priority = use_priority
+        self.shortest_job_first = shortest_job_first
+        self.fair_share = fair_share
+        self.aging_seconds = aging_seconds
+        self.fair_quantum = max(1, fair_quantum)
+        self.sources = OrderedDict()  # kaynak -> iş listesi (geliş sırasıyla)
+        self.deficits = {}  # kaynak -> birikmiş sayfa hakkı (deficit round-robin)
+        self.last_source = None
+        self.decisions = deque(maxlen=500)
+        self.decision_callback = None
+    
+    @classmethod
+    def from_config(cls, config):
+        """Yapılandırmadaki zamanlama ayarlarıyla bir zamanlayıcı oluşturur"""
+        return cls(
+            use_priority=config.get("scheduler_priority", True),
+            shortest_job_first=config.get("scheduler_shortest_job_first", True),
+            fair_share=config.get("scheduler_fair_share", True),
+            aging_seconds=config.get("scheduler_aging_seconds", 20),
+            fair_quantum=config.get("scheduler_fair_quantum", 20)
+        )
+    
+    def __len__(self):
+        return sum(len(jobs) for jobs in self.sources.values())
+    
+    def push(self, job):
+        """İşi kaynağının kuyruğuna ekler"""
+        self.sources.setdefault(job.source, []).append(job)
+    
+    def remove(self, job_id):
+        """Bekleyen bir işi kuyruktan çıkarır, bulunamazsa None döndürür"""
+        for source, jobs in self.sources.items():
+            for job in jobs:
+                if job.job_id == job_id:
+                    jobs.remove(job)
+                    if not jobs:
+                        # Kuyruğu boşalan kaynak biriktirdiği hakkı kaybeder
+                        del self.sources[source]
+                        self.deficits.pop(source, None)
+                    return job
+        return None
+    
+    def pending(self):
+        """Bekleyen tüm işleri geliş sırasıyla döndürür"""
+        jobs = [job for source_jobs in self.sources.values() for job in source_jobs]
+        return sorted(jobs, key=lambda job: job.sequence)
+    
+    def predicted_order(self, now=None):
+        """Yeni iş gelmezse bekleyen işlerin seçileceği sırayı kuyruğu değiştirmeden döndürür"""
+        clone = JobScheduler(self.use_priority, self.shortest_job_first, self.fair_share,
+                             self.aging_seconds, self.fair_quantum)
+        clone.sources = OrderedDict((source, list(jobs)) for source, jobs in self.sources.items())
+        clone.deficits = dict(self.deficits)
+        clone.last_source = self.last_source
+        now = time.time() if now is None else now
+        order = []
+        while True:
+            job = clone.pop(now=now)
+            if job is None:
+                return order
+            order.append(job)
+    
+    def effective_priority(self, job, now):
+        """Bekleme süresine göre yaşlandırılmış önceliği döndürür"""
+        if not self.use_priority:
+            return 0
+        priority = job.priority
+        # Uzun süre bekleyen düşük öncelikli işler açlıktan ölmesin diye önceliği kademeli artır
+        if self.aging_seconds and self.aging_seconds > 0 and priority < AGING_PRIORITY_CAP:
+            aged = priority + int(max(0, now - job.submitted_at) // self.aging_seconds)
+            priority = min(aged, AGING_PRIORITY_CAP)
+        return priority
+    
+    def peek_priority(self, now=None):
+        """Kuyruktaki en yüksek etkin önceliği döndürür"""
+        now = time.time() if now is None else now
+        priorities = [self.effective_priority(job, now) for job in self.pending()]
+        return max(priorities) if priorities else None
+    
+    def pop(self, now=None, accept=None):
+        """Sıradaki işi seçer ve kuyruktan çıkarır; uygun iş yoksa None döndürür"""
+        now = time.time() if now is None else now
+        
+        # Yalnızca şu anda çalıştırılabilecek işleri değerlendir
+        candidates = [
+            job for source_jobs in self.sources.values() for job in source_jobs
+            if accept is None or accept(job)
+        ]
+        if not candidates:
+            return None
+        
+        # En yüksek öncelik katmanını bul
+        ranked = [(self.effective_priority(job, now), job) for job in candidates]
+        top_priority = max(priority for priority, _ in ranked)
+        top_jobs = [job for priority, job in ranked if priority == top_priority]
+        
+        if self.fair_share:
+            job = self._pick_fair(top_jobs)
+        else:
+            job = self._pick_within(top_jobs)
+        
+        self.remove(job.job_id)
+        self.last_source = job.source
+        self._record_decision(job, top_priority, len(candidates), now)
+        return job
+    
+    def _pick_within(self, jobs):
+        """İşlerden en kısasını ya da en eskisini seçer"""
+        if self.shortest_job_first:
+            return min(jobs, key=lambda j: (j.cost, j.sequence))
+        return min(jobs, key=lambda j: j.sequence)
+    
+    def _pick_fair(self, jobs):
+        """Kaynaklar arasında sayfa bazlı deficit round-robin ile iş seçer"""
+        by_source = OrderedDict()
+        for job in jobs:
+            by_source.setdefault(job.source, []).append(job)
+        
+        # Tek kaynak varsa yazıcıyı boş bekletme
+        if len(by_source) == 1:
+            return self._pick_within(next(iter(by_source.values())))
+        
+        # Round-robin sırasını son hizmet verilen kaynağın ardından başlat
+        order = [source for source in self.sources.keys() if source in by_source]
+        if self.last_source in self.sources:
+            keys = list(self.sources.keys())
+            position = keys.index(self.last_source)
+            order.sort(key=lambda source: (keys.index(source) - position - 1) % len(keys))
+        
+        # Her kaynağın aday işi için kaç tur hak biriktirmesi gerektiğini hesapla
+        best = None
+        for index, source in enumerate(order):
+            candidate = self._pick_within(by_source[source])
+            missing = candidate.cost - self.deficits.get(source, 0)
+            rounds = max(0, -(-missing // self.fair_quantum))
+            if best is None or rounds < best[0]:
+                best = (rounds, index, source, candidate)
+        
+        # Geçen turların hakkını dağıt ve seçilen kaynaktan iş maliyetini düş
+        rounds, _, source, job = best
+        if rounds:
+            for other in order:
+                self.deficits[other] = self.deficits.get(other, 0) + rounds * self.fair_quantum
+        self.deficits[source] = self.deficits.get(source, 0) - job.cost
+        return job
+    
+    def _record_decision(self, job, effective_priority, candidate_count, now):
+        """Zamanlama kararını kaydeder ve dinleyiciye bildirir"""
+        reasons = []
+        if self.use_priority:
+            reasons.append("priority")
+        if self.fair_share:
+            reasons.append("fair_share")
+        reasons.append("sjf" if self.shortest_job_first else "fifo")
+        
+        decision = {
+            "time": now,
+            "job_id": job.job_id,
+            "source": job.source,
+            "priority": job.priority,
+            "effective_priority": effective_priority,
+            "cost": job.cost,
+            "waited": max(0.0, now - job.submitted_at),
+            "candidates": candidate_count,
+            "remaining": len(self),
+            "reasons": reasons
+        }
+        self.decisions.append(decision)
+        if self.decision_callback:
+            self.decision_callback(decision)
+
+
+class PrintQueue(QObject):
+    """Yazdırma isteklerini kuyruğa alan ve arka planda sırayla yazdıran sınıf"""
+    
+    # Kuyruk durum sinyalleri
+    job_queued = Signal(str)  # iş_kimliği
+    job_started = Signal(str)  # iş_kimliği
+    job_finished = Signal(str, bool)  # iş_kimliği, başarılı_mı
+    job_state_changed = Signal(str, str)  # iş_kimliği, durum
+    job_updated = Signal(str)  # iş_kimliği (sayfa sayısı öğrenildi)
+    scheduling_decision = Signal(dict)  # karar bilgisi
+    
+    def __init__(self, document_processor, config, journal=None):
+        super().__init__()
+        self.document_processor = document_processor
+        self.config = config
+        self.scheduler = JobScheduler.from_config(config)
+        self.scheduler.decision_callback = self._on_decision
+        self.journal = journal if journal is not None else JobJournal(final_states=FINAL_STATES)
+        self.spool_tracking = config.get("spool_tracking", True)
+        self.monitor = SpoolerMonitor(
+            document_processor.spooler, poll_interval=config.get("spool_poll_interval", 2.0)
+        )
+        self.monitor.on_finished = self._on_spool_finished
+        self.monitor.on_status = self._on_spool_status
+        self.jobs = {}  # iş_kimliği -> PrintJob
+        self.active_jobs = {}  # yazıcı -> o yazıcıda yürütülen iş
+        self.worker_count = max(1, config.get("queue_workers", 4))
+        self._retiring = 0  # boşa çıkınca sonlanacak fazla çalışan sayısı
+        self._worker_ids = itertools.count(1)
+        self.printer_failures = {}  # yazıcı -> art arda geçici hata sayısı
+        self.printer_backoff_until = {}  # yazıcı -> yeniden denemeye kadar beklenecek zaman
+        self.printer_speeds = {}  # yazıcı -> ölçülen sayfa/dakika (üstel hareketli ortalama)
+        self._printer_last_finish = {}  # yazıcı -> son işin bittiği zaman
+        self._estimating = deque()  # sayfa sayısı okunacak işler
+        self._condition = threading.Condition()
+        self._workers = []
+        self._estimator = None
+        self._running = False
+        self._restored = False
+        self._default_printer = None
+        
+        # Yazıcı durumu değişince park edilmiş işler yeniden değerlendirilsin
+        document_processor.health.printer_status_changed.connect(self._on_printer_status_changed)
+        # Dizgi geçişi sayfa sayısını bulunca bekleyen işler yeniden maliyetlendirilir; sinyal dönüştürücü
+        # havuzunun iş parçacığından gelir, işleyici kilidi kendisi aldığı için doğrudan çağrılır
+        document_processor.page_count_ready.connect(self._on_page_count_ready, Qt.DirectConnection)
+    
+    def start(self):
+        """Kuyruk işleyicisini başlatır, önceki oturumdan kalan işleri geri yükler"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        if not self._restored:
+            self._restored = True
+            self.restore_from_journal()
+        # Her yazıcıya aynı anda tek iş gider; farklı yazıcılara giden işler paralel yürür
+        with self._condition:
+            self._retiring = 0
+            for _ in range(self.worker_count):
+                self._start_worker()
+            # Sayfa sayısı okuma (PDF açma, ofis düzeni) arayüz iş parçacığını bekletmesin
+            self._estimator = threading.Thread(target=self._run_estimator, name="PageEstimator", daemon=True)
+            self._estimator.start()
+    
+    def _start_worker(self):
+        """Yeni bir kuyruk çalışanı başlatır (kilit tutulurken çağrılır)"""
+        name = f"PrintQueueWorker-{next(self._worker_ids)}"
+        worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._workers.append(worker)
+        worker.start()
+    
+    def set_worker_count(self, count):
+        """Çalışan sayısını kuyruğu durdurmadan değiştirir; fazla çalışanlar elindeki iş bitince çıkar"""
+        with self._condition:
+            self.worker_count = max(1, count)
+            if not self._running:
+                return
+            extra = self.worker_count - (len(self._workers) - self._retiring)
+            if extra > 0:
+                # Önce çıkmak üzere olan çalışanlardan vazgeçilir
+                cancelled = min(extra, self._retiring)
+                self._retiring -= cancelled
+                for _ in range(extra - cancelled):
+                    self._start_worker()
+            elif extra < 0:
+                self._retiring -= extra
+                self._condition.notify_all()
+        logger.info("Kuyruk çalışanı sayısı: %s", self.worker_count)
+    
+    def apply_config(self, changes):
+        """Yapılandırmadaki değişiklikleri bekleyen ve süren işleri bozmadan uygular"""
+        with self._condition:
+            for key, attribute in SCHEDULER_CONFIG_KEYS.items():
+                if key in changes:
+                    setattr(self.scheduler, attribute, changes[key])
+            if "scheduler_fair_quantum" in changes:
+                self.scheduler.fair_quantum = max(1, changes["scheduler_fair_quantum"])
+            if "spool_tracking" in changes:
+                # Süren işler başladıkları kipte izlenmeye devam eder
+                self.spool_tracking = changes["spool_tracking"]
+            if "spool_poll_interval" in changes:
+                self.monitor.poll_interval = changes["spool_poll_interval"]
+            # Yeni sıralama ayarları bekleyen işlere hemen uygulansın
+            self._condition.notify_all()
+        if "queue_workers" in changes:
+            self.set_worker_count(changes["queue_workers"])
+    
+    def stop(self, wait=True):
+        """Kuyruk işleyicisini durdurur (çalışan iş tamamlanır)"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self.monitor.stop()
+        if wait:
+            for worker in list(self._workers) + [self._estimator]:
+                if worker is not None:
+                    worker.join()
+        self._workers = []
+        self._estimator = None
+        # O ana kadarki durum geçişleri yazılır ve günlük yazıcısı durur (sonraki kayıtlar yeniden başlatır)
+        self.journal.close()
+    
+    def submit(self, file_path, printer_name=None, paper_size=None, copies=None, duplex=None,
+               priority=PRIORITY_NORMAL, source=None, page_count=None, **options):
+        """Yazdırma işini kuyruğa ekler ve işi döndürür"""
+        batch = [file_path] + list(options.get("merge_batch") or [])
+        source_pages = page_count
+        job = PrintJob(
+            file_path, printer_name, paper_size, copies, duplex, priority=priority,
+            page_count=self._output_page_count(file_path, page_count, options), source=source, options=options
+        )
+        
+        # İş kimliği iz kimliği olur; algılama aşamaları bu işe bağlanır
+        for path in batch:
+            tracer.claim_file(path, job.job_id)
+        if source_pages is not None:
+            recorder.record_print(job, source_pages)
+        
+        with self._condition:
+            self.jobs[job.job_id] = job
+            self.scheduler.push(job)
+            self.journal.record(job.to_dict())
+            if source_pages is None:
+                # Sayfa sayısı arka planda okunana kadar iş zamanlanmaz (maliyeti bilinmiyor)
+                self._estimating.append(job)
+            
+            # Aynı yazıcıda çalışan işten daha öncelikli bir iş geldiyse, iş sınırında öne alınacağını bildir
+            running = self.active_jobs.get(self._target_printer(job))
+            if running is not None and self.scheduler.use_priority and priority > running.priority:
+                logger.info("Öncelikli iş geldi, %s bitince öne alınacak: %s",
+                            os.path.basename(running.file_path), os.path.basename(file_path))
+            
+            self._condition.notify_all()
+        
+        self.job_queued.emit(job.job_id)
+        return job
+    
+    def cancel(self, job_id):
+        """Henüz başlamamış bir işi iptal eder"""
+        with self._condition:
+            job = self.scheduler.remove(job_id)
+            if job is None:
+                return False
+            self.jobs.pop(job_id, None)
+            job.last_error = "İptal edildi"
+            self.document_processor.clear_resume_point(job_id)
+            self._set_state(job, JOB_FAILED)
+        jobs_finished.inc(result="cancelled")
+        logger.info("Yazdırma işi iptal edildi: %s", os.path.basename(job.file_path))
+        return True
+    
+    def set_priority(self, job_id, priority):
+        """Henüz başlamamış işin önceliğini değiştirir (kuyruk panosundan sıra değiştirme)"""
+        priority = min(max(priority, PRIORITY_LOW), PRIORITY_URGENT)
+        with self._condition:
+            job = next((job for job in self.scheduler.pending() if job.job_id == job_id), None)
+            if job is None or job.priority == priority:
+                return False
+            job.priority = priority
+            self.journal.record(job.to_dict())
+            self._condition.notify()
+        logger.info("İş önceliği değiştirildi (%s): %s", PRIORITY_NAMES[priority], os.path.basename(job.file_path))
+        return True
+    
+    def restore_from_journal(self):
+        """Önceki oturumda bitmemiş işleri günlükten okuyup kuyruğa geri ekler"""
+        restored = 0
+        for record in self.journal.replay():
+            try:
+                job = PrintJob.from_dict(record)
+            except (KeyError, TypeError) as e:
+                logger.warning("Günlükteki iş geri yüklenemedi: %s", e)
+                continue
+            
+            if job.state == JOB_PRINTING:
+                # İş zaten biriktiricideydi, yeniden gönderilirse iki kez basılır; yalnızca izlenir
+                if self.spool_tracking and job.spool_printer:
+                    with self._condition:
+                        self.jobs[job.job_id] = job
+                    self._track(job)
+                else:
+                    job.state = JOB_DONE
+                    self.journal.record(job.to_dict())
+                continue
+            
+            if not os.path.exists(job.file_path):
+                job.last_error = "Dosya bulunamadı"
+                job.state = JOB_FAILED
+                self.journal.record(job.to_dict())
+                continue
+            
+            # Dönüştürme ya da gönderim sırasında kesilen işler kaldıkları yerden denenir
+            job.state = JOB_QUEUED
+            with self._condition:
+                self.jobs[job.job_id] = job
+                self.scheduler.push(job)
+            self.journal.record(job.to_dict())
+            self.job_queued.emit(job.job_id)
+            restored += 1
+        
+        self.journal.compact()
+        if restored:
+            logger.info("Önceki oturumdan %s yazdırma işi geri yüklendi", restored)
+        return restored
+    
+    def pending_jobs(self):
+        """Bekleyen işleri geliş sırasıyla döndürür"""
+        with self._condition:
+            return self.scheduler.pending()
+    
+    def snapshot(self):
+        """Kuyruk panosu için yürütülen işleri, bekleyen işleri tahmini sırasıyla ve yazıcı hızlarını döndürür"""
+        with self._condition:
+            running = sorted(
+                (job for job in self.jobs.values() if job.state not in (JOB_QUEUED,) + FINAL_STATES),
+                key=lambda job: job.started_at or job.submitted_at
+            )
+            return {
+                "running": [(job.spool_printer or self._target_printer(job), job) for job in running],
+                "pending": [(self._target_printer(job), job) for job in self.scheduler.predicted_order()],
+                "speeds": dict(self.printer_speeds)
+            }
+    
+    def get_job(self, job_id):
+        """Kimliği verilen işi döndürür"""
+        return self.jobs.get(job_id)
+    
+    def _estimate_page_count(self, file_path):
+        """İşin sayfa sayısını tahmin eder, bilinmiyorsa None döndürür"""
+        info = self.document_processor.get_document_info(file_path)
+        return info.get("page_count")
+    
+    def _output_page_count(self, file_path, page_count, options):
+        """Kaynak sayfa sayısından sayfa düzeni uygulandıktan sonra basılacak yüz sayısını döndürür"""
+        # Birleştirilmiş işler sayfa düzeni uygulanmadan basılır
+        if not page_count or options.get("merge_batch"):
+            return page_count
+        
+        # Not sayfası düzeni yalnızca sunumlara uygulanır
+        handout = 0
+        if os.path.splitext(file_path)[1].lower() in POWERPOINT_EXTENSIONS:
+            handout = options.get("handout")
+            if handout is None:
+                handout = self.config.get("presentation_handout", 0)
+        
+        # N-up, not sayfası ve sayfa aralığı basılacak yüz sayısını değiştirir, maliyete yansıt
+        if (options.get("page_range") or options.get("pages_per_sheet", 1) != 1
+                or options.get("booklet") or handout):
+            page_count = count_output_pages(
+                page_count, options.get("page_range"), options.get("pages_per_sheet", 1),
+                options.get("booklet", False), handout
+            )
+        return page_count
+    
+    def _run_estimator(self):
+        """Kuyruğa eklenen işlerin sayfa sayısını arka planda okur"""
+        while True:
+            with self._condition:
+                while self._running and not self._estimating:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                job = self._estimating[0]
+            
+            batch = [job.file_path] + list(job.options.get("merge_batch") or [])
+            started = time.perf_counter()
+            # Birleştirilecek dosyaların sayfaları da işin maliyetine eklenir
+            counts = [self._estimate_page_count(path) for path in batch]
+            source_pages = None if None in counts else sum(counts)
+            if source_pages is None:
+                # Boyut kestirimi kilit dışında bir kez hesaplanır, zamanlayıcı diske dokunmaz
+                job.size_pages()
+            tracer.record("metadata", time.perf_counter() - started, job.job_id,
+                          files=len(batch), pages=source_pages)
+            
+            with self._condition:
+                self._estimating.popleft()
+                if source_pages is not None:
+                    # Bilinmiyorsa maliyet dosya boyutundan kestirilir, dizgi geçişi bitince güncellenir
+                    job.page_count = self._output_page_count(job.file_path, source_pages, job.options)
+                if job.job_id in self.jobs:
+                    self.journal.record(job.to_dict())
+                self._condition.notify_all()
+            recorder.record_print(job, source_pages)
+            self.job_updated.emit(job.job_id)
+    
+    def _on_page_count_ready(self, file_path, page_count):
+        """Arka plandaki dizgi geçişi sayfa sayısını bulunca o dosyayı bekleyen işleri günceller"""
+        with self._condition:
+            jobs = [
+                job for job in self.jobs.values()
+                if job.page_count is None and job.state not in FINAL_STATES
+                and file_path in [job.file_path] + list(job.options.get("merge_batch") or [])
+            ]
+        for job in jobs:
+            # Birleştirilen dosyaların hepsinin sayfa sayısı biliniyorsa toplam yazılır
+            batch = [job.file_path] + list(job.options.get("merge_batch") or [])
+            counts = [page_count if path == file_path else self._estimate_page_count(path) for path in batch]
+            if None in counts:
+                continue
+            with self._condition:
+                if job.page_count is not None or job.job_id not in self.jobs:
+                    continue
+                job.page_count = self._output_page_count(job.file_path, sum(counts), job.options)
+                self.journal.record(job.to_dict())
+                self._condition.notify_all()
+            logger.debug("Sayfa sayısı öğrenildi: %s (%s sayfa)", os.path.basename(job.file_path), job.page_count)
+            self.job_updated.emit(job.job_id)
+    
+    def _on_decision(self, decision):
+        """Zamanlayıcı kararını günlüğe yazar ve sinyal olarak yayar"""
+        job = self.jobs.get(decision["job_id"])
+        name = os.path.basename(job.file_path) if job else decision["job_id"]
+        logger.info("Zamanlayıcı kararı: %s (kaynak: %s, öncelik: %s, sayfa: %s, bekleme: %.1f sn, kalan: %s)",
+                    name, decision["source"], decision["effective_priority"], decision["cost"],
+                    decision["waited"], decision["remaining"])
+        self.scheduling_decision.emit(decision)
+    
+    def _set_state(self, job, state):
+        """İşi yeni duruma geçirir, günlüğe yazar ve bildirir"""
+        if job.state == state:
+            return
+        if not job.can_transition(state):
+            logger.warning("Geçersiz iş durumu geçişi yok sayıldı: %s -> %s (%s)", job.state, state, job.job_id)
+            return
+        
+        # Kuyrukta bekleme süresi _execute'ta yazılır; buradaki "prepare" yürütme başladıktan sonraki kısımdır
+        now = time.time()
+        stage = TRACE_STAGES.get(job.state)
+        if stage is not None and not (job.state == JOB_QUEUED and state in (JOB_QUEUED, JOB_FAILED)):
+            tracer.record(stage, now - job.state_entered_at, job.job_id, start=job.state_entered_at,
+                          attempt=job.attempts, next_state=state)
+        job.state_entered_at = now
+        job.state = state
+        self.journal.record(job.to_dict())
+        self.job_state_changed.emit(job.job_id, state)
+    
+    def _is_ready(self, job, now):
+        """İşin yeniden deneme, yazıcı bekleme ve devre kesici koşullarının uygun olup olmadığını döndürür"""
+        if job.not_before > now:
+            return False
+        if job in self._estimating:
+            # Sayfa sayısı okunmadan en kısa iş önce sıralaması yanılır
+            return False
+        if self._target_printer(job) in self.active_jobs:
+            # Yazıcı başka bir iş yürütüyor; sırayı koru
+            return False
+        if self.printer_backoff_until.get(job.printer_name, 0) > now:
+            return False
+        # Devre kesicisi açık (ve yedeği olmayan) yazıcının işleri gönderilmeden park edilir
+        return self.document_processor.health.can_dispatch(self._target_printer(job), now)
+    
+    def _target_printer(self, job):
+        """İşin gönderileceği yazıcıyı (varsayılan çözülmüş olarak) döndürür"""
+        if job.printer_name:
+            return job.printer_name
+        if self._default_printer is None:
+            self._default_printer = self.document_processor.get_default_printer()
+        return self._default_printer
+    
+    def _next_wakeup(self, now):
+        """Bekleyen ilk işin hazır olmasına kalan süreyi döndürür"""
+        health = self.document_processor.health
+        # Meşgul yazıcının işleri yazıcı boşalınca bildirimle uyanır, zamanlayıcıya katılmaz
+        times = [
+            max(job.not_before, self.printer_backoff_until.get(job.printer_name, 0),
+                health.retry_at(self._target_printer(job)))
+            for job in self.scheduler.pending()
+            if self._target_printer(job) not in self.active_jobs and job not in self._estimating
+        ]
+        if not times:
+            return None
+        return max(0.05, min(times) - now)
+    
+    def _backoff_delay(self, printer_name):
+        """Yazıcının art arda hata sayısına göre üstel bekleme süresini hesaplar"""
+        failures = self.printer_failures.get(printer_name, 1)
+        base = self.config.get("retry_base_delay", 5)
+        limit = self.config.get("retry_max_delay", 300)
+        delay = min(limit, base * (2 ** (failures - 1)))
+        # Aynı anda düşen işler aynı anda geri dönüp biriktiriciyi yormasın
+        return delay * random.uniform(0.8, 1.2)
+    
+    def _run(self):
+        """Kuyruktaki işleri iş sınırlarında yeniden zamanlayarak yazdırır"""
+        while True:
+            with self._condition:
+                job = None
+                while self._running:
+                    if self._retiring:
+                        # Fazla çalışan yalnızca boştayken çıkar, süren yazdırma kesilmez
+                        self._retiring -= 1
+                        if threading.current_thread() in self._workers:
+                            self._workers.remove(threading.current_thread())
+                        return
+                    now = time.time()
+                    job = self.scheduler.pop(now=now, accept=lambda j: self._is_ready(j, now))
+                    if job is not None:
+                        break
+                    self._condition.wait(self._next_wakeup(now))
+                if not self._running:
+                    return
+                printer_name = self._target_printer(job)
+                self.active_jobs[printer_name] = job
+            
+            try:
+                self._execute(job)
+            finally:
+                with self._condition:
+                    self.active_jobs.pop(printer_name, None)
+                    # Yazıcı boşaldı, bekleyen işi olan çalışanları uyandır
+                    self._condition.notify_all()
+    
+    def _execute(self, job):
+        """Tek bir işi yürütür, geçici hatalarda yeniden denemeye zamanlar"""
+        job.attempts += 1
+        job.started_at = time.time()
+        tracer.record("queue" if job.attempts == 1 else "retry_wait", job.started_at - job.state_entered_at,
+                      job.job_id, start=job.state_entered_at, printer=self._target_printer(job))
+        job.state_entered_at = job.started_at
+        self.job_started.emit(job.job_id)
+        
+        error = {}
+        
+        def on_stage(stage, detail=None):
+            # Belge işleyiciden gelen aşama bildirimleri
+            if stage == "error":
+                error.update(detail or {})
+                return
+            if stage == JOB_PRINTING and detail:
+                # Biriktirici iş kimlikleri durum kaydıyla birlikte günlüğe yazılır
+                job.spool_printer = detail.get("printer_name")
+                job.spool_jobs = detail.get("spool_jobs") or []
+            self._set_state(job, stage)
+        
+        try:
+            # Belge işleyicinin alt aşamaları (dönüştürme, biriktiriciye gönderim) bu işin izine yazılır
+            with tracer.activate(job.job_id):
+                success = self.document_processor.print_document(
+                    job.file_path, job.printer_name, job.paper_size, job.copies, job.duplex,
+                    on_stage=on_stage, job_id=job.job_id if self.spool_tracking else None,
+                    resume_key=job.job_id, **job.options
+                )
+        except Exception as e:
+            logger.error("Kuyruk işi yürütülürken hata: %s", e)
+            error = {"message": str(e), "transient": False}
+            success = False
+        
+        if success:
+            self.printer_failures.pop(job.printer_name, None)
+            self.printer_backoff_until.pop(job.printer_name, None)
+            if self.spool_tracking:
+                # Gönderim başarılı; iş biriktiricide bitene kadar "yazdırılıyor" durumunda kalır
+                self._track(job)
+            else:
+                self._finish(job, True)
+            return
+        
+        job.last_error = error.get("message")
+        
+        # Yarım kalan büyük işler yeniden denemede kaldıkları sayfadan sürer
+        resume_point = self.document_processor.get_resume_point(job.job_id)
+        if resume_point:
+            job.options["start_page"] = resume_point["page"]
+            job.options["start_copy"] = resume_point["copy"]
+        
+        max_attempts = self.config.get("retry_max_attempts", 5)
+        if error.get("transient") and job.attempts < max_attempts:
+            with self._condition:
+                # Yazıcı bazında geri çekil, aynı yazıcıdaki diğer işler de beklesin
+                failures = self.printer_failures.get(job.printer_name, 0) + 1
+                self.printer_failures[job.printer_name] = failures
+                delay = self._backoff_delay(job.printer_name)
+                job.not_before = time.time() + delay
+                self.printer_backoff_until[job.printer_name] = job.not_before
+                self._set_state(job, JOB_QUEUED)
+                self.scheduler.push(job)
+                self._condition.notify()
+            logger.warning("Geçici yazdırma hatası, %.0f sn sonra yeniden denenecek (%s/%s): %s",
+                           delay, job.attempts, max_attempts, os.path.basename(job.file_path))
+            return
+        
+        self._finish(job, False)
+    
+    def _track(self, job):
+        """Biriktiriciye teslim edilen işi ortak izleyiciye bağlar"""
+        self.monitor.track(
+            job.job_id, job.spool_printer, job.spool_jobs, os.path.basename(job.file_path)
+        )
+    
+    def _on_spool_status(self, job_id, status, message):
+        """Biriktiricideki işin durumu değiştiğinde çağrılır (izleyici iş parçacığında)"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        if message:
+            logger.warning("Yazıcı kuyruğunda bekliyor (%s): %s", message, os.path.basename(job.file_path))
+        if status == SPOOL_BLOCKED:
+            # Takılan iş varken aynı yazıcıya yeni iş yığılmasın
+            self.document_processor.health.report_blocked(job.spool_printer, message)
+    
+    def _on_printer_status_changed(self, printer_name, status):
+        """Yazıcı durumu değiştiğinde bekleyen işleri uyandırır"""
+        with self._condition:
+            self._condition.notify_all()
+    
+    def _on_spool_finished(self, job_id, success, message):
+        """Biriktiricideki iş gerçekten bittiğinde işi ve geçmişi sonuçlandırır"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        if not success:
+            job.last_error = message
+        self.document_processor.finish_print(job.job_id, job.file_path, success, message or None)
+        self._finish(job, success)
+    
+    def _finish(self, job, success):
+        """İşi son durumuna geçirir ve kuyruktan çıkarır"""
+        job.finished_at = time.time()
+        job.success = success
+        # Biten işin devam noktası yalnızca elle sürdürmeye kalır, başka işlere uygulanmaz
+        self.document_processor.clear_resume_point(job.job_id, success)
+        self._set_state(job, JOB_DONE if success else JOB_FAILED)
+        result = "done" if success else "failed"
+        jobs_finished.inc(result=result)
+        job_seconds.observe(job.finished_at - job.submitted_at, result=result)
+        if success and job.page_count:
+            pages_printed.inc(job.page_count * max(1, job.copies or 1))
+        with self._condition:
+            self.jobs.pop(job.job_id, None)
+            self._measure_speed(job)
+        self.job_finished.emit(job.job_id, success)
+    
+    def _measure_speed(self, job):
+        """Biten işin süresinden yazıcının sayfa/dakika hızını günceller (kilit tutulurken çağrılır)
+        
+        Biriktiricide sıra bekleyen işin süresi önceki iş bittiğinde başlar.
+        """
+        printer_name = job.spool_printer or self._target_printer(job)
+        busy_since = max(job.started_at or job.submitted_at, self._printer_last_finish.get(printer_name, 0))
+        self._printer_last_finish[printer_name] = job.finished_at
+        duration = job.finished_at - busy_since
+        if not job.success or not job.page_count or duration < MIN_SPEED_SAMPLE_SECONDS:
+            return
+        speed = job.cost * 60.0 / duration
+        previous = self.printer_speeds.get(printer_name)
+        self.printer_speeds[printer_name] = (
+            speed if previous is None else previous + SPEED_SMOOTHING * (speed - previous)
+        )
+
+
+class SimulatedPrinter:
+    """Zamanlayıcıyı kıyaslamak için gerçek yazıcı yerine kullanılan sahte arka uç"""
+    
+    def __init__(self, pages_per_minute=30, job_overhead=5.0):
+        self.pages_per_minute = pages_per_minute
+        self.job_overhead = job_overhead
+        self.printed = []
+    
+    def service_time(self, job):
+        """İşin yazdırılması için geçecek süreyi (saniye) döndürür"""
+        return self.job_overhead + job.cost * 60.0 / self.pages_per_minute
+    
+    def print_job(self, job, now):
+        """İşi yazdırılmış sayar ve bitiş zamanını döndürür"""
+        self.printed.append(job.job_id)
+        return now + self.service_time(job)
+
+
+def generate_synthetic_trace(seed=0, duration=3600, walk_in_rate=1 / 60.0, large_jobs=3):
+    """Gerçekçi bir dükkan gününü taklit eden yapay geliş izi üretir"""
+    rng = random.Random(seed)
+    trace = []
+    
+    # Tek sayfalık tezgah müşterileri (Poisson gelişler)
+    t = 0.0
+    while True:
+        t += rng.expovariate(walk_in_rate)
+        if t >= duration:
+            break
+        trace.append({"arrival": t, "source": f"tezgah-{rng.randint(1, 10)}",
+                      "pages": rng.randint(1, 3), "priority": PRIORITY_NORMAL})
+    
+    # E-posta ile gelen büyük işler (tez, ders notu)
+    for _ in range(large_jobs):
+        trace.append({"arrival": rng.uniform(0, duration / 2), "source": "e-posta",
+                      "pages": rng.randint(150, 400), "priority": PRIORITY_NORMAL})
+    
+    # WhatsApp albümleri: aynı kaynaktan art arda gelen tek sayfalar
+    for _ in range(max(1, int(duration // 900))):
+        start = rng.uniform(0, duration)
+        for i in range(rng.randint(10, 30)):
+            trace.append({"arrival": start + i * 0.5, "source": "whatsapp",
+                          "pages": 1, "priority": PRIORITY_LOW})
+    
+    trace.sort(key=lambda item: item["arrival"])
+    return trace
+
+
+def simulate_trace(trace, scheduler, printer=None):
+    """Geliş izini sahte yazıcıda sanal saatle oynatır ve bekleme istatistiklerini döndürür"""
+    printer = printer or SimulatedPrinter()
+    arrivals = deque(sorted(trace, key=lambda item: item["arrival"]))
+    waits = []
+    slowdowns = []
+    per_source = {}
+    now = 0.0
+    
+    while arrivals or len(scheduler):
+        # Şu ana kadar gelen işleri kuyruğa al
+        while arrivals and arrivals[0]["arrival"] <= now:
+            item = arrivals.popleft()
+            scheduler.push(PrintJob(
+                f"{item['source']}/is-{len(waits) + len(scheduler)}.pdf",
+                copies=item.get("copies", 1), priority=item.get("priority", PRIORITY_NORMAL),
+                page_count=item["pages"], source=item["source"], submitted_at=item["arrival"]
+            ))
+        
+        if not len(scheduler):
+            now = arrivals[0]["arrival"]
+            continue
+        
+        # Yazıcı boşaldı: iş sınırında yeniden zamanla
+        job = scheduler.pop(now=now)
+        wait = now - job.submitted_at
+        finished = printer.print_job(job, now)
+        waits.append(wait)
+        slowdowns.append((finished - job.submitted_at) / printer.service_time(job))
+        per_source.setdefault(job.source, []).append(wait)
+        now = finished
+    
+    waits_sorted = sorted(waits)
+    count = len(waits_sorted)
+    return {
+        "jobs": count,
+        "makespan": now,
+        "mean_wait": sum(waits) / count if count else 0.0,
+        "p95_wait": waits_sorted[int(0.95 * (count - 1))] if count else 0.0,
+        "max_wait": waits_sorted[-1] if count else 0.0,
+        "mean_slowdown": sum(slowdowns) / count if count else 0.0,
+        "source_mean_wait": {source: sum(w) / len(w) for source, w in per_source.items()},
+        "decisions": len(scheduler.decisions)
+    }
+
+
+def stress_concurrency(printer_count=4, job_count=200, seed=0, timeout=120):
+    """Sahte biriktiriciyle çok yazıcılı eşzamanlı yazdırmayı dener ve yanlış yazıcıya giden işleri sayar"""
+    import tempfile
+    from PyPDF2 import PdfWriter
+    from spooler import LocalSpooler
+    from document_processor import DocumentProcessor
+    
+    rng = random.Random(seed)
+    printers = [f"Yazıcı {i + 1}" for i in range(printer_count)]
+    work_dir = tempfile.mkdtemp(prefix="mukaprint_stress_")
+    expected = {}  # dosya_adı -> hedef yazıcı
+    
+    # Her iş benzersiz bir dosya; PDF'ler doğrudan, metinler uygulama yolu ile gönderilir
+    for i in range(job_count):
+        printer_name = rng.choice(printers)
+        if i % 3:
+            file_name = f"is-{i}.pdf"
+            writer = PdfWriter()
+            for _ in range(rng.randint(1, 8)):
+                writer.add_blank_page(width=595, height=842)
+            with open(os.path.join(work_dir, file_name), "wb") as f:
+                writer.write(f)
+        else:
+            file_name = f"is-{i}.txt"
+            with open(os.path.join(work_dir, file_name), "w", encoding="utf-8") as f:
+                f.write(f"{file_name} -> {printer_name}\n")
+        expected[file_name] = printer_name
+    
+    config = {
+        "queue_workers": printer_count,
+        "spool_poll_interval": 0.05,
+        "pdf_chunk_threshold": 4,
+        "pdf_first_chunk_pages": 2,
+        "pdf_chunk_pages": 3
+    }
+    spooler = LocalSpooler(printers, pages_per_minute=600000, submit_delay=0.002)
+    processor = DocumentProcessor(config, spooler=spooler)
+    queue = PrintQueue(processor, config, JobJournal(os.path.join(work_dir, "journal.jsonl"), FINAL_STATES))
+    
+    started = time.time()
+    queue.start()
+    for file_name, printer_name in expected.items():
+        queue.submit(os.path.join(work_dir, file_name), printer_name, "A4", 1, False,
+                     source=printer_name, page_count=1)
+    while queue.jobs and time.time() - started < timeout:
+        time.sleep(0.05)
+    elapsed = time.time() - started
+    queue.stop()
+    processor.shutdown()
+    
+    # Her biriktirici işinin belge adından kaynak dosyayı çıkar ve hedef yazıcıyla karşılaştır
+    misrouted = []
+    delivered = set()
+    for printer_name, document_name, _ in spooler.submissions:
+        file_name = document_name.split(" [")[0]
+        delivered.add(file_name)
+        if expected.get(file_name) != printer_name:
+            misrouted.append((file_name, expected.get(file_name), printer_name))
+    
+    return {
+        "jobs": job_count,
+        "printers": printer_count,
+        "spool_jobs": len(spooler.submissions),
+        "undelivered": len(set(expected) - delivered),
+        "unfinished": len(queue.jobs),
+        "misrouted": misrouted,
+        "peak_concurrency": spooler.peak_in_flight,
+        "elapsed": elapsed
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    
+    if len(sys.argv) > 1 and sys.argv[1] == "stress":
+        # Farklı yazıcılara eşzamanlı gönderimde hiçbir işin yanlış yazıcıya gitmediğini doğrula
+        result = stress_concurrency()
+        print(f"{result['jobs']} iş, {result['printers']} yazıcı, {result['spool_jobs']} biriktirici işi, "
+              f"{result['elapsed']:.1f} sn, en yüksek eşzamanlılık: {result['peak_concurrency']}")
+        print(f"Teslim edilmeyen: {result['undelivered']}, bitmeyen: {result['unfinished']}, "
+              f"yanlış yazıcı: {len(result['misrouted'])}")
+        sys.exit(1 if result["misrouted"] or result["undelivered"] or result["unfinished"] else 0)
+    
+    # Zamanlama politikalarını aynı yapay iz üzerinde karşılaştır
+    policies = {
+        "fifo": dict(use_priority=False, shortest_job_first=False, fair_share=False),
+        "priority": dict(use_priority=True, shortest_job_first=False, fair_share=False),
+        "sjf": dict(use_priority=True, shortest_job_first=True, fair_share=False),
+        "fair+sjf": dict(use_priority=True, shortest_job_first=True, fair_share=True)
+    }
+    synthetic_trace = generate_synthetic_trace()
+    results = {}
+    print(f"{'politika':<10} {'iş':>5} {'ort. bekleme':>13} {'p95 bekleme':>12} {'en uzun':>9} {'yavaşlama':>10}")
+    for policy_name, options in policies.items():
+        result = results[policy_name] = simulate_trace(synthetic_trace, JobScheduler(**options))
+        print(f"{policy_name:<10} {result['jobs']:>5} {result['mean_wait']:>12.1f}s "
+              f"{result['p95_wait']:>11.1f}s {result['max_wait']:>8.1f}s {result['mean_slowdown']:>10.2f}")
+    
+    # Varsayılan politika (fair+sjf) her ölçütte FIFO'dan iyi olmalı
+    worse = [key for key in ("mean_wait", "p95_wait", "mean_slowdown")
+             if results["fair+sjf"][key] >= results["fifo"][key]]
+    if worse:
+        print(f"Varsayılan politika FIFO'dan kötü: {', '.join(worse)}")
+    sys.exit(1 if worse else 0)
\ No newline at end of file
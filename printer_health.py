@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Yazıcı sağlık izleme ve devre kesici modülü
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from PySide6.QtCore import QObject, Signal
+
+
+logger = logging.getLogger(__name__)
+
+
+# Devre kesici durumları
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+BREAKER_STATE_NAMES = {
+    BREAKER_CLOSED: "Hazır",
+    BREAKER_OPEN: "Devre dışı",
+    BREAKER_HALF_OPEN: "Deneniyor"
+}
+
+# Yazıcı sağlık durumları (arayüzde renk ve simge seçimi için)
+HEALTH_OK = "ok"
+HEALTH_WARNING = "warning"
+HEALTH_OFFLINE = "offline"
+
+# Hata oranı hesabında dikkate alınan son gönderim sayısı
+RESULT_WINDOW = 20
+
+
+class PrinterUnavailableError(ConnectionError):
+    """Yazıcının devre kesicisi açıkken ve yedek yazıcı yokken gönderim denendiğinde yükseltilir"""
+
+
+class CircuitBreaker:
+    """Bozuk yazıcıya gönderimi durduran ve belirli aralıklarla tek bir deneme işine izin veren sınıf"""
+    
+    def __init__(self, failure_threshold=3, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.reason = ""
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self, now=None):
+        """Gönderime izin verilip verilmediğini döndürür; süre dolduysa deneme hakkı verir"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            if self.state == BREAKER_CLOSED:
+                return True
+            if self.state == BREAKER_OPEN and now - self.opened_at >= self.reset_timeout:
+                self.state = BREAKER_HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == BREAKER_HALF_OPEN and not self._probe_pending(now):
+                # Yarı açık durumda aynı anda yalnızca bir deneme işi gönderilir
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+            return False
+    
+    def available(self, now=None):
+        """Durumu değiştirmeden gönderimin mümkün olup olmadığını döndürür"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            if self.state == BREAKER_CLOSED:
+                return True
+            if self.state == BREAKER_OPEN:
+                return now - self.opened_at >= self.reset_timeout
+            return not self._probe_pending(now)
+    
+    def retry_at(self):
+        """Açık devrenin deneme hakkı vereceği zamanı döndürür"""
+        with self._lock:
+            return self.opened_at + self.reset_timeout if self.state == BREAKER_OPEN else 0.0
+    
+    def record_success(self):
+        """Başarılı gönderimi kaydeder, devreyi kapatır"""
+        with self._lock:
+            self.state = BREAKER_CLOSED
+            self.failures = 0
+            self.reason = ""
+            self._probe_in_flight = False
+    
+    def record_failure(self, reason=""):
+        """Başarısız gönderimi kaydeder, eşik aşıldıysa ya da deneme başarısızsa devreyi açar"""
+        with self._lock:
+            self.failures += 1
+            if self.state == BREAKER_HALF_OPEN or self.failures >= self.failure_threshold:
+                self._trip_locked(reason)
+    
+    def trip(self, reason=""):
+        """Devreyi hemen açar (sağlık izleyicisi yazıcıyı çevrimdışı gördüğünde)"""
+        with self._lock:
+            if self.state != BREAKER_OPEN:
+                self._trip_locked(reason)
+    
+    def probe(self):
+        """Açık devreyi yarı açık duruma alır (sağlık izleyicisi yazıcıyı yeniden hazır gördüğünde)"""
+        with self._lock:
+            if self.state == BREAKER_OPEN:
+                self.state = BREAKER_HALF_OPEN
+                self._probe_in_flight = False
+    
+    def _probe_pending(self, now):
+        """Sonucu beklenen bir deneme işi olup olmadığını döndürür (kilit alınmış olmalı)"""
+        # Gönderime hiç ulaşmayan (ör. dosya hatası) deneme sonsuza dek beklemesin
+        return self._probe_in_flight and now - self._probe_started < self.reset_timeout
+    
+    def _trip_locked(self, reason):
+        """Devreyi açar (kilit alınmış olmalı)"""
+        self.state = BREAKER_OPEN
+        self.opened_at = time.time()
+        self.reason = reason
+        self._probe_in_flight = False
+
+
+class PrinterHealthMonitor(QObject):
+    """Yazıcıların durumunu arka planda izleyen ve devre kesicilerini besleyen sınıf"""
+    
+    # Yazıcı durum sinyali (izleme iş parçacığından yayılır, arayüze kuyrukla ulaşır)
+    printer_status_changed = Signal(str, dict)  # yazıcı_adı, durum
+    
+    def __init__(self, spooler, config):
+        super().__init__()
+        self.spooler = spooler
+        self.config = config
+        self.poll_interval = config.get("health_poll_interval", 15)
+        self.breakers = {}  # yazıcı -> CircuitBreaker
+        self.statuses = {}  # yazıcı -> son yayılan durum
+        self.printer_states = {}  # yazıcı -> biriktiricinin bildirdiği son durum
+        self.results = {}  # yazıcı -> son gönderim sonuçları
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """İzleme iş parçacığını başlatır"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="PrinterHealthMonitor", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """İzleme iş parçacığını durdurur ve bitmesini bekler"""
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+    
+    def breaker(self, printer_name):
+        """Yazıcının devre kesicisini döndürür, yoksa oluşturur"""
+        with self._lock:
+            breaker = self.breakers.get(printer_name)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self.config.get("breaker_failure_threshold", 3),
+                    self.config.get("breaker_reset_timeout", 60)
+                )
+                self.breakers[printer_name] = breaker
+            return breaker
+    
+    def candidates(self, printer_name):
+        """Yazıcıyı ve yapılandırmadaki yedeklerini tercih sırasıyla döndürür"""
+        fallbacks = self.config.get("fallback_printers", {}).get(printer_name, [])
+        return [printer_name] + [name for name in fallbacks if name != printer_name]
+    
+    def route(self, printer_name):
+        """İşin gönderileceği yazıcıyı seçer; hiçbiri uygun değilse PrinterUnavailableError yükseltir"""
+        for candidate in self.candidates(printer_name):
+            breaker = self.breaker(candidate)
+            allowed = breaker.allow()
+            self._publish(candidate)
+            if allowed:
+                return candidate
+        
+        reason = self.breaker(printer_name).reason or "yazıcı yanıt vermiyor"
+        raise PrinterUnavailableError(f"Yazıcı kullanılamıyor: {printer_name} ({reason})")
+    
+    def can_dispatch(self, printer_name, now=None):
+        """Yazıcıya ya da yedeklerinden birine şu an iş gönderilip gönderilemeyeceğini döndürür"""
+        return any(self.breaker(candidate).available(now) for candidate in self.candidates(printer_name))
+    
+    def retry_at(self, printer_name):
+        """Yazıcı ya da yedeklerinden birinin yeniden denenebileceği en erken zamanı döndürür"""
+        return min(self.breaker(candidate).retry_at() for candidate in self.candidates(printer_name))
+    
+    def record_result(self, printer_name, success, reason=""):
+        """Biriktiriciye gönderim sonucunu hata oranı ve devre kesici için kaydeder"""
+        with self._lock:
+            results = self.results.setdefault(printer_name, deque(maxlen=RESULT_WINDOW))
+            results.append(success)
+        
+        breaker = self.breaker(printer_name)
+        if success:
+            breaker.record_success()
+        else:
+            breaker.record_failure(reason)
+        self._publish(printer_name)
+    
+    def report_blocked(self, printer_name, reason):
+        """Kuyruktaki bir iş takıldığında (kağıt bitti vb.) yazıcıya yeni iş gönderimini durdurur"""
+        self.breaker(printer_name).trip(reason)
+        self._publish(printer_name)
+    
+    def error_rate(self, printer_name):
+        """Son gönderimlerdeki hata oranını döndürür"""
+        with self._lock:
+            results = self.results.get(printer_name)
+            if not results:
+                return 0.0
+            return results.count(False) / len(results)
+    
+    def get_status(self, printer_name):
+        """Yazıcının son bilinen durumunu döndürür"""
+        with self._lock:
+            return dict(self.statuses.get(printer_name, {}))
+    
+    def _run(self):
+        """Yazıcı durumlarını belirli aralıklarla okur ve devre kesicilerini günceller"""
+        while not self._stop_event.is_set():
+            try:
+                printers = self.spooler.list_printers()
+            except Exception as e:
+                logger.warning("Yazıcı listesi okunamadı: %s", e)
+                printers = list(self.breakers.keys())
+            
+            for printer_name in printers:
+                if self._stop_event.is_set():
+                    return
+                self.check_printer(printer_name)
+            
+            self._stop_event.wait(self.poll_interval)
+    
+    def check_printer(self, printer_name):
+        """Tek bir yazıcının durumunu okur ve devre kesicisini buna göre günceller"""
+        try:
+            printer_state = self.spooler.printer_status(printer_name)
+        except Exception as e:
+            printer_state = {"online": False, "message": f"Durum okunamadı: {e}", "queue_depth": 0}
+        
+        with self._lock:
+            previous = self.printer_states.get(printer_name)
+            self.printer_states[printer_name] = printer_state
+        
+        breaker = self.breaker(printer_name)
+        was_online = previous is None or previous["online"]
+        if not printer_state["online"] and was_online:
+            # Yalnızca çevrimdışına geçişte açılır; durum bilgisi takılı kalsa da deneme süresi işler
+            breaker.trip(printer_state["message"])
+        elif printer_state["online"] and not was_online:
+            breaker.probe()
+        self._publish(printer_name)
+        return printer_state
+    
+    def _publish(self, printer_name):
+        """Yazıcının birleşik durumunu hesaplar, değiştiyse sinyal yayar"""
+        breaker = self.breaker(printer_name)
+        error_rate = self.error_rate(printer_name)
+        with self._lock:
+            printer_state = self.printer_states.get(printer_name, {"online": True, "message": "", "queue_depth": 0})
+        
+        if breaker.state == BREAKER_OPEN:
+            health = HEALTH_OFFLINE
+        elif breaker.state == BREAKER_HALF_OPEN or not printer_state["online"] or error_rate > 0:
+            health = HEALTH_WARNING
+        else:
+            health = HEALTH_OK
+        
+        status = {
+            "state": health,
+            "breaker": breaker.state,
+            "message": breaker.reason or printer_state["message"],
+            "queue_depth": printer_state["queue_depth"],
+            "error_rate": round(error_rate, 2)
+        }
+        with self._lock:
+            if self.statuses.get(printer_name) == status:
+                return
+            self.statuses[printer_name] = status
+        self.printer_status_changed.emit(printer_name, status)
\ No newline at end of file
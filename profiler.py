@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Uygulama çalışırken açılıp kapatılabilen örneklemeli profil çıkarıcı
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from collections import Counter
+from PySide6.QtCore import QObject, Signal, QTimer
+
+
+logger = logging.getLogger(__name__)
+
+# Profil dosyalarının yazıldığı klasör
+PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".mukaprint", "profiles")
+
+# Varsayılan profil süresi ve örnekleme aralığı (saniye)
+DEFAULT_SECONDS = 10
+DEFAULT_INTERVAL = 0.005
+
+# Profil süresinin üst sınırı; unutulan bir istek uygulamayı uzun süre yavaşlatmasın
+MAX_SECONDS = 300
+
+
+def _frame_label(frame):
+    """Çerçeveyi alev grafiği düğümü olarak "işlev (dosya)" biçiminde döndürür"""
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    # Katlanmış yığın biçiminde ";" çerçeve ayırıcısıdır
+    return f"{name} ({os.path.basename(code.co_filename)})".replace(";", ":")
+
+
+class SamplingProfiler(QObject):
+    """Tüm iş parçacıklarının yığınlarını belirli süre örnekleyip alev grafiği dosyası yazan sınıf
+    
+    Örnekler Brendan Gregg'in katlanmış yığın biçiminde (iş_parçacığı;çerçeve;... sayı) yazılır;
+    flamegraph.pl, speedscope ve inferno doğrudan okur. Profil sürerken arayüz iş parçacığında
+    olay döngüsünün doğrudan çağırdığı işleyicilerin (sinyal yuvaları, zamanlayıcılar) süresi
+    de ölçülür. Profil kapalıyken hiçbir kanca ya da iş parçacığı çalışmaz.
+    """
+    
+    profile_started = Signal(float)  # süre (saniye)
+    profile_finished = Signal(str)  # yazılan profil dosyası
+    _start_requested = Signal(float)
+    _sampling_done = Signal(object)
+    
+    def __init__(self, output_dir=PROFILE_DIR, interval=DEFAULT_INTERVAL):
+        super().__init__()
+        self.output_dir = output_dir
+        self.interval = interval
+        self.running = False
+        self._stop = threading.Event()
+        self._loop_frame = None
+        self._slot_started = {}  # çerçeve -> başlama anı
+        self._slot_times = {}  # işleyici adı -> [çağrı, toplam süre, en uzun süre]
+        self._started_at = None
+        # Başka iş parçacıklarından gelen istekler arayüz iş parçacığında başlatılır
+        self._start_requested.connect(self.start)
+        self._sampling_done.connect(self._finish)
+    
+    def request(self, seconds=DEFAULT_SECONDS):
+        """Profili herhangi bir iş parçacığından ister (ör. yerel kontrol uç noktası)"""
+        if self.running:
+            return False
+        self._start_requested.emit(float(seconds))
+        return True
+    
+    def start(self, seconds=DEFAULT_SECONDS):
+        """Profili başlatır; arayüz iş parçacığından çağrılmalıdır"""
+        if self.running:
+            return False
+        seconds = min(max(float(seconds), 0.1), MAX_SECONDS)
+        self.running = True
+        self._stop.clear()
+        self._slot_started = {}
+        self._slot_times = {}
+        self._started_at = time.time()
+        # Kanca, olay döngüsünün doğrudan çağırdığı bir işleyicide kurulur; böylece döngünün
+        # çerçevesi (işleyicilerin çağıranı) bilinir
+        QTimer.singleShot(0, self._install_slot_hook)
+        sampler = threading.Thread(target=self._sample, args=(seconds,), name="SamplingProfiler", daemon=True)
+        sampler.start()
+        logger.info("Profil çıkarılıyor: %s sn, %s ms aralıkla", seconds, self.interval * 1000)
+        self.profile_started.emit(seconds)
+        return True
+    
+    def stop(self):
+        """Süren profili erken bitirir; dosya yine yazılır"""
+        self._stop.set()
+    
+    def _install_slot_hook(self):
+        """Arayüz iş parçacığına işleyici süresi ölçen profil kancasını kurar"""
+        if not self.running:
+            return
+        self._loop_frame = sys._getframe().f_back
+        sys.setprofile(self._profile_slot)
+    
+    def _profile_slot(self, frame, event, arg):
+        """Olay döngüsünden çağrılan Python işleyicilerinin süresini ölçer"""
+        if frame.f_back is not self._loop_frame:
+            return
+        if event == "call":
+            self._slot_started[frame] = time.perf_counter()
+        elif event == "return":
+            started = self._slot_started.pop(frame, None)
+            if started is None:
+                return
+            duration = time.perf_counter() - started
+            code = frame.f_code
+            stats = self._slot_times.setdefault(getattr(code, "co_qualname", code.co_name), [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+    
+    def _sample(self, seconds):
+        """Süre dolana kadar tüm iş parçacıklarının yığınlarını örnekler"""
+        own_ident = threading.get_ident()
+        stacks = Counter()
+        samples = 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline and not self._stop.is_set():
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(ident, f"Thread-{ident}").replace(";", ":"))
+                stacks[";".join(reversed(labels))] += 1
+            samples += 1
+            self._stop.wait(self.interval)
+        self._sampling_done.emit({"stacks": stacks, "samples": samples})
+    
+    def _finish(self, result):
+        """Kancayı kaldırır ve profil ile işleyici sürelerini dosyaya yazar"""
+        sys.setprofile(None)
+        self._loop_frame = None
+        self.running = False
+        slots = sorted(self._slot_times.items(), key=lambda item: item[1][1], reverse=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started_at))
+        path = os.path.join(self.output_dir, f"profile-{stamp}.folded")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in result["stacks"].most_common():
+                    f.write(f"{stack} {count}\n")
+            with open(os.path.splitext(path)[0] + "-slots.json", "w", encoding="utf-8") as f:
+                json.dump({
+                    "started_at": self._started_at,
+                    "seconds": time.time() - self._started_at,
+                    "interval": self.interval,
+                    "samples": result["samples"],
+                    "slots": {name: {"calls": calls, "total": total, "max": longest}
+                              for name, (calls, total, longest) in slots}
+                }, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning("Profil yazılamadı: %s", e)
+            return
+        for name, (calls, total, longest) in slots[:5]:
+            logger.info("İşleyici %s: %s çağrı, toplam %.1f ms, en uzun %.1f ms",
+                        name, calls, total * 1000, longest * 1000)
+        logger.info("Profil yazıldı (%s örnek): %s", result["samples"], path)
+        self.profile_finished.emit(path)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Kullanılan PySide6 sürümündeki hatalar için geçici düzeltmeler
+"""
+
+import sys
+import ctypes
+import logging
+from PySide6.QtCore import QObject, Signal, SignalInstance
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Probe(QObject):
+    """Sinyal yayınının başvuru sayısını denetlemek için kullanılan boş nesne"""
+    
+    probed = Signal()
+
+
+def _emit_leaks_bool(samples=8):
+    """SignalInstance.emit'in döndürdüğü True/False'un başvurusunu eksik sayıp saymadığını denetler"""
+    probe = _Probe()
+    before = sys.getrefcount(True) + sys.getrefcount(False)
+    for _ in range(samples):
+        probe.probed.emit()
+    return sys.getrefcount(True) + sys.getrefcount(False) < before
+
+
+def install():
+    """emit dönüş değerinin başvuru sayısı hatası varsa emit'i dengeleyen sarmalayıcıyla değiştirir
+    
+    PySide6 6.12 emit'ten True'yu başvurusunu artırmadan döndürüyor; her yayın True'nun
+    başvuru sayısını bir düşürür ve birkaç bin yayından sonra yorumlayıcı "bool_dealloc"
+    hatasıyla çöker. Hata olmayan sürümlerde hiçbir şey değiştirilmez.
+    """
+    original = SignalInstance.emit
+    if getattr(original, "_refcount_fixed", False) or not _emit_leaks_bool():
+        return False
+    
+    def emit(self, *args):
+        result = original(self, *args)
+        # Eksik sayılan başvuruyu geri ver
+        ctypes.pythonapi.Py_IncRef(ctypes.py_object(result))
+        return result
+    
+    emit._refcount_fixed = True
+    SignalInstance.emit = emit
+    logger.debug("PySide6 emit başvuru sayısı düzeltmesi etkin")
+    return True
+
+
+install()
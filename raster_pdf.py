@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Pillow ile çizilen sayfaları biriktiriciye gönderilecek PDF parçalarına dönüştüren modül
+"""
+
+import io
+from PyPDF2 import PdfReader, PdfWriter
+
+from imposition import PAPER_SIZES_PT
+
+
+# Yazıcı çözünürlüğü bilinmediğinde kullanılan varsayılan (nokta/inç)
+DEFAULT_DPI = 300
+
+
+def page_pixels(paper_size, dpi, landscape=False):
+    """Kağıdın verilen çözünürlükteki piksel boyutunu (genişlik, yükseklik) döndürür"""
+    width_pt, height_pt = PAPER_SIZES_PT.get(paper_size, PAPER_SIZES_PT["A4"])
+    width, height = round(width_pt * dpi / 72.0), round(height_pt * dpi / 72.0)
+    return (height, width) if landscape else (width, height)
+
+
+def mm_to_pixels(mm, dpi):
+    """Milimetreyi verilen çözünürlükte piksele çevirir"""
+    return round(mm * dpi / 25.4)
+
+
+def page_to_pdf(image, dpi):
+    """Tek bir sayfa resmini sıkıştırılmış tek sayfalık PDF'e çevirir"""
+    # Siyah-beyaz sayfalar CCITT, gri ve renkli sayfalar JPEG olarak sıkıştırılır
+    if image.mode not in ("1", "L", "RGB"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, "PDF", resolution=dpi)
+    return buffer.getvalue()
+
+
+def pages_to_pdf(pages, dpi):
+    """Sayfa resimlerini tek tek sıkıştırıp birleştirerek çok sayfalı PDF verisi döndürür
+    
+    Bellekte aynı anda yalnızca bir sayfanın açık resmi ve önceki sayfaların
+    sıkıştırılmış hali tutulur.
+    """
+    writer = PdfWriter()
+    for page in pages:
+        writer.add_page(PdfReader(io.BytesIO(page_to_pdf(page, dpi))).pages[0])
+        page.close()
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
\ No newline at end of file
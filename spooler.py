@@ -0,0 +1,626 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Yazdırma biriktiricisi (spooler) arka uçları modülü
+"""
+
+import os
+import logging
+import re
+import time
+import shutil
+import itertools
+import threading
+import subprocess
+
+try:
+    import win32api
+    import win32print
+except ImportError:
+    # Windows dışında (CUPS ya da yerel biriktirici) çalışırken pywin32 bulunmaz
+    win32api = None
+    win32print = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# Biriktiricideki iş durumları
+SPOOL_PENDING = "pending"
+SPOOL_PRINTING = "printing"
+SPOOL_BLOCKED = "blocked"
+SPOOL_COMPLETED = "completed"
+SPOOL_DELETED = "deleted"
+SPOOL_UNKNOWN = "unknown"  # kuyruktan çıkan işin basıldığı ya da silindiği bilinmiyor
+
+# Windows iş durum bayrakları (winspool.h)
+JOB_STATUS_PAUSED = 0x1
+JOB_STATUS_ERROR = 0x2
+JOB_STATUS_DELETING = 0x4
+JOB_STATUS_SPOOLING = 0x8
+JOB_STATUS_PRINTING = 0x10
+JOB_STATUS_OFFLINE = 0x20
+JOB_STATUS_PAPEROUT = 0x40
+JOB_STATUS_PRINTED = 0x80
+JOB_STATUS_DELETED = 0x100
+JOB_STATUS_BLOCKED_DEVQ = 0x200
+JOB_STATUS_USER_INTERVENTION = 0x400
+JOB_STATUS_COMPLETE = 0x1000
+
+# Windows yazıcı durum bayrakları ve kullanıcıya gösterilecek karşılıkları
+PRINTER_STATUS_REASONS = [
+    (0x00000080, "Çevrimdışı"),            # PRINTER_STATUS_OFFLINE
+    (0x00001000, "Erişilemiyor"),          # PRINTER_STATUS_NOT_AVAILABLE
+    (0x00800000, "Sunucu bilinmiyor"),     # PRINTER_STATUS_SERVER_UNKNOWN
+    (0x00000010, "Kağıt bitti"),           # PRINTER_STATUS_PAPER_OUT
+    (0x00000008, "Kağıt sıkıştı"),         # PRINTER_STATUS_PAPER_JAM
+    (0x00000040, "Kağıt sorunu"),          # PRINTER_STATUS_PAPER_PROBLEM
+    (0x00400000, "Kapak açık"),            # PRINTER_STATUS_DOOR_OPEN
+    (0x00040000, "Toner bitti"),           # PRINTER_STATUS_NO_TONER
+    (0x00100000, "Kullanıcı müdahalesi"),  # PRINTER_STATUS_USER_INTERVENTION
+    (0x00000002, "Hata"),                  # PRINTER_STATUS_ERROR
+    (0x00000001, "Duraklatıldı")           # PRINTER_STATUS_PAUSED
+]
+
+# Kullanıcıya gösterilecek engel nedenleri
+BLOCKED_REASONS = [
+    (JOB_STATUS_PAPEROUT, "Kağıt bitti"),
+    (JOB_STATUS_OFFLINE, "Yazıcı çevrimdışı"),
+    (JOB_STATUS_USER_INTERVENTION, "Kullanıcı müdahalesi gerekiyor"),
+    (JOB_STATUS_BLOCKED_DEVQ, "Yazıcı kuyruğu engellendi"),
+    (JOB_STATUS_ERROR, "Yazıcı hatası"),
+    (JOB_STATUS_PAUSED, "İş duraklatıldı")
+]
+
+
+def document_matches(spooled_name, file_name):
+    """Biriktiricideki belge adının dosyaya ait olup olmadığını döndürür
+    
+    Ad dosya adının (ya da uzantısız adının) kendisi, "ad [1-25/300]" biçimindeki parça adı
+    ya da "Microsoft Word - ad" gibi uygulama önekli hali olmalıdır; "a.pdf" işi "data.pdf"
+    ya da "1.pdf" işi "11.pdf" işini sahiplenmez.
+    """
+    spooled_name = spooled_name.strip().lower()
+    file_name = file_name.lower()
+    for name in {file_name, os.path.splitext(file_name)[0]}:
+        if spooled_name == name or spooled_name.startswith(f"{name} [") or spooled_name.endswith(f" - {name}"):
+            return True
+    return False
+
+
+def count_pdf_pages(data):
+    """PDF verisindeki sayfa sayısını kaba bir taramayla tahmin eder"""
+    return max(1, len(re.findall(rb"/Type\s*/Page(?![a-zA-Z])", data)))
+
+
+class SpoolerBackend:
+    """Yazıcı listesi, iş gönderme ve iş durumu sorgulama için temel sınıf"""
+    
+    name = "base"
+    
+    def list_printers(self):
+        """Tanımlı yazıcı adlarını döndürür"""
+        raise NotImplementedError
+    
+    def default_printer(self):
+        """Sistemin varsayılan yazıcısını döndürür"""
+        printers = self.list_printers()
+        return printers[0] if printers else ""
+    
+    def submit_raw(self, printer_name, document_name, data, copies=1):
+        """Veriyi (bayt ya da dosya yolu) yazıcıya gönderir ve biriktirici iş kimliğini döndürür"""
+        raise NotImplementedError
+    
+    def print_file(self, printer_name, file_path):
+        """Dosyayı kendi uygulamasıyla belirtilen yazıcıya yazdırır; iş kimliği bilinmiyorsa None döndürür"""
+        raise NotImplementedError
+    
+    def poll_jobs(self, printer_name):
+        """Yazıcı kuyruğundaki işleri {iş_kimliği: durum_sözlüğü} olarak döndürür"""
+        raise NotImplementedError
+    
+    def job_outcomes(self, printer_name, job_ids):
+        """Kuyruktan çıkmış işlerin sonuçlarını {iş_kimliği: SPOOL_COMPLETED/SPOOL_DELETED/SPOOL_UNKNOWN} döndürür"""
+        return {job_id: SPOOL_UNKNOWN for job_id in job_ids}
+    
+    def printer_status(self, printer_name):
+        """Yazıcının {"online", "message", "queue_depth"} durumunu döndürür"""
+        raise NotImplementedError
+
+
+class Win32Spooler(SpoolerBackend):
+    """Windows biriktiricisi (winspool) arka ucu"""
+    
+    name = "win32"
+    
+    # Biriktiriciye veri gönderirken kullanılan blok boyutu
+    SPOOL_BLOCK_SIZE = 1024 * 1024
+    
+    def __init__(self):
+        # Windows kuyruktan çıkan işin sonucunu saklamaz; sonuç son görülen durum bayraklarından çıkarılır
+        self._last_seen = {}  # yazıcı -> {iş_kimliği: durum bayrakları} (son sorgu)
+        self._gone = {}  # yazıcı -> {iş_kimliği: son görülen durum bayrakları} (son sorguda kaybolanlar)
+        self._status_lock = threading.Lock()
+    
+    def list_printers(self):
+        """Tanımlı yazıcı adlarını döndürür"""
+        flags = win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
+        return [printer[2] for printer in win32print.EnumPrinters(flags)]
+    
+    def default_printer(self):
+        """Sistemin varsayılan yazıcısını döndürür"""
+        return win32print.GetDefaultPrinter()
+    
+    def submit_raw(self, printer_name, document_name, data, copies=1):
+        """Veriyi yazıcıya RAW biriktirici işi olarak gönderir"""
+        hPrinter = win32print.OpenPrinter(printer_name)
+        try:
+            # Yazdırma işi başlat (StartDocPrinter biriktirici iş kimliğini döndürür)
+            job_id = win32print.StartDocPrinter(hPrinter, 1, (document_name, None, "RAW"))
+            try:
+                for i in range(copies):
+                    win32print.StartPagePrinter(hPrinter)
+                    if isinstance(data, (bytes, bytearray)):
+                        win32print.WritePrinter(hPrinter, data)
+                    else:
+                        # Dosyayı belleğe almadan bloklar halinde gönder
+                        with open(data, 'rb') as f:
+                            for block in iter(lambda: f.read(self.SPOOL_BLOCK_SIZE), b""):
+                                win32print.WritePrinter(hPrinter, block)
+                    win32print.EndPagePrinter(hPrinter)
+                return job_id
+            finally:
+                win32print.EndDocPrinter(hPrinter)
+        finally:
+            win32print.ClosePrinter(hPrinter)
+    
+    def print_file(self, printer_name, file_path):
+        """Dosyayı 'printto' fiiliyle doğrudan hedef yazıcıya yazdırır (varsayılan yazıcı değişmez)"""
+        result = win32api.ShellExecute(0, "printto", file_path, f'"{printer_name}"', ".", 0)
+        if result <= 32:
+            # ShellExecute 32 ve altını hata kodu olarak döndürür
+            raise OSError(result, f"Dosya yazdırılamadı (ShellExecute hata kodu {result}): {file_path}")
+        return None
+    
+    def poll_jobs(self, printer_name):
+        """EnumJobs ile yazıcı kuyruğunu tek çağrıda okur"""
+        hPrinter = win32print.OpenPrinter(printer_name)
+        try:
+            jobs = win32print.EnumJobs(hPrinter, 0, -1, 1)
+        finally:
+            win32print.ClosePrinter(hPrinter)
+        
+        result = {}
+        seen = {}
+        for job in jobs:
+            status = job.get("Status", 0)
+            seen[job["JobId"]] = status
+            result[job["JobId"]] = {
+                "document_name": job.get("pDocument") or "",
+                "status": self._map_status(status),
+                "message": job.get("pStatus") or self._blocked_reason(status),
+                "pages_printed": job.get("PagesPrinted", 0),
+                "total_pages": job.get("TotalPages", 0)
+            }
+        with self._status_lock:
+            previous = self._last_seen.get(printer_name, {})
+            self._gone[printer_name] = {
+                job_id: status for job_id, status in previous.items() if job_id not in seen
+            }
+            self._last_seen[printer_name] = seen
+        return result
+    
+    def job_outcomes(self, printer_name, job_ids):
+        """Kuyruktan çıkan işlerin sonucunu son sorguda görülen durum bayraklarından çıkarır
+        
+        Silinirken görülen iş silinmiş, basılırken ya da basılmış görülen iş tamamlanmış sayılır.
+        Yalnızca beklerken görülüp iki sorgu arasında kaybolan işin sonucu bilinemez.
+        """
+        with self._status_lock:
+            gone = self._gone.get(printer_name, {})
+            outcomes = {}
+            for job_id in job_ids:
+                status = gone.get(job_id)
+                if status is None:
+                    outcomes[job_id] = SPOOL_UNKNOWN
+                elif status & (JOB_STATUS_DELETING | JOB_STATUS_DELETED):
+                    outcomes[job_id] = SPOOL_DELETED
+                elif status & (JOB_STATUS_PRINTED | JOB_STATUS_COMPLETE | JOB_STATUS_PRINTING):
+                    outcomes[job_id] = SPOOL_COMPLETED
+                else:
+                    outcomes[job_id] = SPOOL_UNKNOWN
+            return outcomes
+    
+    def printer_status(self, printer_name):
+        """GetPrinter (düzey 2) ile yazıcı durum bayraklarını ve kuyruk derinliğini okur"""
+        hPrinter = win32print.OpenPrinter(printer_name)
+        try:
+            info = win32print.GetPrinter(hPrinter, 2)
+        finally:
+            win32print.ClosePrinter(hPrinter)
+        
+        status = info.get("Status", 0)
+        reasons = [reason for flag, reason in PRINTER_STATUS_REASONS if status & flag]
+        # Çevrimdışı ve erişilemez dışındaki sorunlar (kağıt, toner) yazıcıyı kullanılamaz kılar
+        return {
+            "online": not reasons,
+            "message": ", ".join(reasons),
+            "queue_depth": info.get("cJobs", 0)
+        }
+    
+    def _map_status(self, status):
+        """Windows durum bayraklarını biriktirici durumuna çevirir"""
+        if status & (JOB_STATUS_DELETING | JOB_STATUS_DELETED):
+            return SPOOL_DELETED
+        if status & (JOB_STATUS_PRINTED | JOB_STATUS_COMPLETE):
+            return SPOOL_COMPLETED
+        if self._blocked_reason(status):
+            return SPOOL_BLOCKED
+        if status & JOB_STATUS_PRINTING:
+            return SPOOL_PRINTING
+        return SPOOL_PENDING
+    
+    def _blocked_reason(self, status):
+        """Durum bayraklarından engel nedenini döndürür"""
+        for flag, reason in BLOCKED_REASONS:
+            if status & flag:
+                return reason
+        return ""
+
+
+class CupsSpooler(SpoolerBackend):
+    """CUPS (lp/lpstat komutları) arka ucu"""
+    
+    name = "cups"
+    
+    def _run(self, args, data=None):
+        """CUPS komutunu çalıştırır ve çıktısını döndürür"""
+        result = subprocess.run(args, input=data, capture_output=True, timeout=30, check=True)
+        return result.stdout.decode("utf-8", errors="replace")
+    
+    def list_printers(self):
+        """lpstat -e ile tanımlı kuyrukları döndürür"""
+        return [line.strip() for line in self._run(["lpstat", "-e"]).splitlines() if line.strip()]
+    
+    def default_printer(self):
+        """lpstat -d ile varsayılan kuyruğu döndürür"""
+        output = self._run(["lpstat", "-d"])
+        return output.split(":", 1)[1].strip() if ":" in output else super().default_printer()
+    
+    def submit_raw(self, printer_name, document_name, data, copies=1):
+        """lp ile işi gönderir ve 'istek kimliği'ni döndürür"""
+        args = ["lp", "-d", printer_name, "-t", document_name, "-n", str(copies)]
+        if isinstance(data, (bytes, bytearray)):
+            output = self._run(args, data=bytes(data))
+        else:
+            output = self._run(args + [data])
+        match = re.search(r"-(\d+)\b", output)
+        if not match:
+            raise RuntimeError(f"CUPS iş kimliği okunamadı: {output.strip()}")
+        return int(match.group(1))
+    
+    def print_file(self, printer_name, file_path):
+        """Dosyayı lp ile gönderir, biçim dönüşümünü CUPS filtreleri yapar"""
+        return self.submit_raw(printer_name, os.path.basename(file_path), file_path)
+    
+    def poll_jobs(self, printer_name):
+        """lpstat -o ile bitmemiş işleri tek çağrıda okur"""
+        result = {}
+        for line in self._run(["lpstat", "-o", printer_name]).splitlines():
+            match = re.match(rf"{re.escape(printer_name)}-(\d+)\s", line)
+            if match:
+                result[int(match.group(1))] = {
+                    "document_name": "",
+                    "status": SPOOL_PENDING,
+                    "message": "",
+                    "pages_printed": 0,
+                    "total_pages": 0
+                }
+        return result
+    
+    def printer_status(self, printer_name):
+        """lpstat -p ile kuyruğun etkin olup olmadığını, lpstat -o ile derinliğini okur"""
+        output = self._run(["lpstat", "-p", printer_name])
+        disabled = "disabled" in output or "devre dışı" in output
+        message = ""
+        if disabled:
+            lines = [line.strip() for line in output.splitlines()[1:] if line.strip()]
+            message = lines[0] if lines else "Kuyruk devre dışı"
+        return {
+            "online": not disabled,
+            "message": message,
+            "queue_depth": len(self.poll_jobs(printer_name))
+        }
+    
+    def job_outcomes(self, printer_name, job_ids):
+        """Tamamlanan işler listesini tek çağrıda okuyup işlerin basılıp basılmadığını döndürür"""
+        output = self._run(["lpstat", "-W", "completed", "-o", printer_name])
+        completed = {int(n) for n in re.findall(rf"^{re.escape(printer_name)}-(\d+)\s", output, re.M)}
+        return {job_id: SPOOL_COMPLETED if job_id in completed else SPOOL_DELETED for job_id in job_ids}
+
+
+class LocalSpooler(SpoolerBackend):
+    """Yazıcı bağlı olmayan ortamlar (test, kıyaslama) için bellek içi biriktirici"""
+    
+    name = "local"
+    
+    def __init__(self, printers=("Yerel Yazıcı",), pages_per_minute=60, job_overhead=0.0, submit_delay=0.0):
+        self.pages_per_minute = pages_per_minute
+        self.job_overhead = job_overhead
+        self.submit_delay = submit_delay  # veri aktarımını taklit eden gönderim gecikmesi
+        self.printers = {name: {"offline": False, "paper_out": False, "busy_until": 0.0} for name in printers}
+        self.jobs = {}  # iş_kimliği -> iş bilgisi
+        self.submissions = []  # (yazıcı, belge_adı, iş_kimliği) gönderim kaydı
+        self.in_flight = 0  # o an süren gönderim sayısı
+        self.peak_in_flight = 0  # aynı anda süren en yüksek gönderim sayısı
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def list_printers(self):
+        """Tanımlı sahte yazıcıları döndürür"""
+        return list(self.printers.keys())
+    
+    def submit_raw(self, printer_name, document_name, data, copies=1):
+        """İşi kuyruğa alır ve sayfa sayısına göre bitiş zamanını hesaplar"""
+        if isinstance(data, (bytes, bytearray)):
+            pages = count_pdf_pages(data)
+        else:
+            with open(data, "rb") as f:
+                pages = count_pdf_pages(f.read())
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.submit_delay:
+                time.sleep(self.submit_delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        
+        with self._lock:
+            printer = self.printers.get(printer_name)
+            if printer is None:
+                raise ValueError(f"Yazıcı bulunamadı: {printer_name}")
+            if printer["offline"]:
+                raise ConnectionError(f"Yazıcı çevrimdışı: {printer_name}")
+            
+            now = time.time()
+            start = max(now, printer["busy_until"])
+            duration = self.job_overhead + pages * copies * 60.0 / self.pages_per_minute
+            printer["busy_until"] = start + duration
+            job_id = next(self._ids)
+            self.jobs[job_id] = {
+                "printer_name": printer_name,
+                "document_name": document_name,
+                "pages": pages * copies,
+                "start": start,
+                "done_at": start + duration,
+                "deleted": False
+            }
+            self.submissions.append((printer_name, document_name, job_id))
+        return job_id
+    
+    def print_file(self, printer_name, file_path):
+        """Dosyayı doğrudan kuyruğa alır"""
+        return self.submit_raw(printer_name, os.path.basename(file_path), file_path)
+    
+    def poll_jobs(self, printer_name):
+        """Henüz bitmemiş işleri döndürür"""
+        now = time.time()
+        result = {}
+        with self._lock:
+            printer = self.printers.get(printer_name, {})
+            for job_id, job in self.jobs.items():
+                if job["printer_name"] != printer_name or job["deleted"]:
+                    continue
+                if printer.get("paper_out") or printer.get("offline"):
+                    # Yazıcı dururken işler ilerlemez
+                    job["done_at"] = max(job["done_at"], now + 1.0)
+                    status, message = SPOOL_BLOCKED, "Kağıt bitti" if printer.get("paper_out") else "Yazıcı çevrimdışı"
+                elif job["done_at"] <= now:
+                    continue
+                else:
+                    status = SPOOL_PRINTING if job["start"] <= now else SPOOL_PENDING
+                    message = ""
+                result[job_id] = {
+                    "document_name": job["document_name"],
+                    "status": status,
+                    "message": message,
+                    "pages_printed": 0,
+                    "total_pages": job["pages"]
+                }
+        return result
+    
+    def job_outcomes(self, printer_name, job_ids):
+        """Silinen işleri SPOOL_DELETED, diğerlerini SPOOL_COMPLETED olarak döndürür"""
+        with self._lock:
+            return {
+                job_id: SPOOL_DELETED if job_id not in self.jobs or self.jobs[job_id]["deleted"] else SPOOL_COMPLETED
+                for job_id in job_ids
+            }
+    
+    def printer_status(self, printer_name):
+        """Sahte yazıcının durumunu döndürür"""
+        queue_depth = len(self.poll_jobs(printer_name))
+        with self._lock:
+            printer = self.printers[printer_name]
+            message = "Çevrimdışı" if printer["offline"] else "Kağıt bitti" if printer["paper_out"] else ""
+        return {"online": not message, "message": message, "queue_depth": queue_depth}
+    
+    def delete_job(self, job_id):
+        """Kuyruktaki bir işi siler (kullanıcının işi silmesini taklit eder)"""
+        with self._lock:
+            if job_id in self.jobs:
+                self.jobs[job_id]["deleted"] = True
+    
+    def set_printer_state(self, printer_name, offline=None, paper_out=None):
+        """Sahte yazıcının çevrimdışı ya da kağıtsız durumunu ayarlar"""
+        with self._lock:
+            printer = self.printers[printer_name]
+            if offline is not None:
+                printer["offline"] = offline
+            if paper_out is not None:
+                printer["paper_out"] = paper_out
+
+
+class SpoolerMonitor:
+    """Gönderilen biriktirici işlerini tek bir ortak iş parçacığında izleyen sınıf"""
+    
+    def __init__(self, spooler, poll_interval=2.0, resolve_timeout=60.0):
+        self.spooler = spooler
+        self.poll_interval = poll_interval
+        self.resolve_timeout = resolve_timeout  # kimliği bilinmeyen işin kuyrukta aranacağı süre
+        self.on_finished = None  # (anahtar, başarılı_mı, mesaj) geri çağrısı
+        self.on_status = None  # (anahtar, durum, mesaj) geri çağrısı
+        self._tracked = {}  # anahtar -> izlenen iş bilgisi
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+    
+    def track(self, key, printer_name, job_ids=None, document_name=None):
+        """Bir yazdırma işinin biriktirici işlerini izlemeye alır"""
+        entry = {
+            "printer_name": printer_name,
+            "pending": set(job_ids or []),
+            # İş kimliği bilinmiyorsa (uygulama üzerinden yazdırma) belge adıyla aranır
+            "document_name": None if job_ids else document_name,
+            "since": time.time(),
+            "status": None,
+            "error": None,
+            "unverified": False  # kuyruktan çıkan işlerden birinin sonucu bilinmiyor
+        }
+        with self._condition:
+            self._tracked[key] = entry
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, name="SpoolerMonitor", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+    
+    def untrack(self, key):
+        """İşi izlemeden çıkarır"""
+        with self._condition:
+            return self._tracked.pop(key, None) is not None
+    
+    def tracked_count(self):
+        """İzlenen iş sayısını döndürür"""
+        with self._condition:
+            return len(self._tracked)
+    
+    def stop(self):
+        """İzleme iş parçacığını durdurur ve bitmesini bekler"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+            thread, self._thread = self._thread, None
+        # Sonuç geri çağrısından (izleyici iş parçacığında) durdurulursa beklenmez
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+    
+    def _run(self):
+        """Her turda yazıcı başına tek sorgu yaparak izlenen tüm işleri günceller"""
+        while True:
+            with self._condition:
+                while self._running and not self._tracked:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                by_printer = {}
+                for key, entry in self._tracked.items():
+                    by_printer.setdefault(entry["printer_name"], []).append((key, entry))
+            
+            for printer_name, entries in by_printer.items():
+                try:
+                    jobs = self.spooler.poll_jobs(printer_name)
+                    gone = [job_id for _, entry in entries for job_id in entry["pending"] if job_id not in jobs]
+                    outcomes = self.spooler.job_outcomes(printer_name, gone) if gone else {}
+                except Exception as e:
+                    # Sorgu hatası işleri düşürmez, bir sonraki turda yeniden denenir
+                    logger.warning("Yazıcı kuyruğu okunamadı (%s): %s", printer_name, e)
+                    continue
+                self._update_printer(entries, jobs, outcomes)
+            
+            with self._condition:
+                if self._running:
+                    self._condition.wait(self.poll_interval)
+    
+    def _update_printer(self, entries, jobs, outcomes):
+        """Bir yazıcının kuyruk görüntüsüne göre o yazıcıdaki izlenen işleri günceller"""
+        now = time.time()
+        claimed = {job_id for _, entry in entries for job_id in entry["pending"]}
+        for key, entry in entries:
+            if entry["document_name"]:
+                self._resolve(entry, jobs, claimed, now)
+                if entry["document_name"]:
+                    if now - entry["since"] > self.resolve_timeout:
+                        # İş kuyrukta hiç görülmedi: uygulama çok hızlı bastı ya da hiç göndermedi
+                        self._finish(key, True, "Biriktirici işi bulunamadı, gönderildi kabul edildi")
+                    continue
+            
+            for job_id in list(entry["pending"]):
+                info = jobs.get(job_id)
+                if info is None:
+                    entry["pending"].discard(job_id)
+                    outcome = outcomes.get(job_id, SPOOL_UNKNOWN)
+                    if outcome == SPOOL_DELETED:
+                        entry["error"] = "Yazdırma işi kuyruktan silindi"
+                    elif outcome == SPOOL_UNKNOWN:
+                        entry["unverified"] = True
+                    continue
+                if info["status"] == SPOOL_DELETED:
+                    entry["error"] = "Yazdırma işi kuyruktan silindi"
+                elif info["status"] == SPOOL_COMPLETED:
+                    entry["pending"].discard(job_id)
+                    continue
+                if info["status"] != entry["status"]:
+                    entry["status"] = info["status"]
+                    if self.on_status:
+                        self.on_status(key, info["status"], info["message"])
+            
+            if not entry["pending"]:
+                if entry["error"] is None and entry["unverified"]:
+                    # Başarısızlık kanıtı yok ama basıldığı da doğrulanamadı
+                    self._finish(key, True, "Biriktirici sonucu doğrulanamadı")
+                else:
+                    self._finish(key, entry["error"] is None, entry["error"] or "")
+    
+    def _resolve(self, entry, jobs, claimed, now):
+        """Kimliği bilinmeyen işi belge adına göre kuyrukta bulur"""
+        for job_id, info in jobs.items():
+            if job_id not in claimed and document_matches(info["document_name"], entry["document_name"]):
+                entry["pending"].add(job_id)
+                entry["document_name"] = None
+                claimed.add(job_id)
+                return
+    
+    def _finish(self, key, success, message):
+        """İzlemeyi bitirir ve sonucu bildirir"""
+        if not self.untrack(key):
+            return
+        if self.on_finished:
+            try:
+                self.on_finished(key, success, message)
+            except Exception as e:
+                logger.error("Biriktirici sonucu işlenirken hata: %s", e)
+
+
+def create_spooler(config):
+    """Yapılandırmaya ve platforma uygun biriktirici arka ucunu oluşturur"""
+    backend = config.get("spooler_backend", "auto")
+    if backend == "auto":
+        if win32print is not None:
+            backend = "win32"
+        elif shutil.which("lp") and shutil.which("lpstat"):
+            backend = "cups"
+        else:
+            backend = "local"
+    
+    if backend == "win32":
+        if win32print is None:
+            raise RuntimeError("Windows biriktiricisi için pywin32 gerekli")
+        return Win32Spooler()
+    if backend == "cups":
+        return CupsSpooler()
+    return LocalSpooler(config.get("local_printers") or ("Yerel Yazıcı",))
\ No newline at end of file
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Arayüz olay döngüsünün gecikmesini ölçen ve takılmaları yığınıyla kaydeden bekçi
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from collections import deque
+from PySide6.QtCore import QObject, Signal, QTimer, Qt
+
+from metrics import registry
+
+
+logger = logging.getLogger(__name__)
+
+# Kalp atışı aralığı ve varsayılan takılma eşiği (milisaniye)
+DEFAULT_HEARTBEAT_MS = 50
+DEFAULT_THRESHOLD_MS = 250
+
+# Bellekte tutulan son takılma ve gecikme ölçümü sayısı
+MAX_RECORDED_STALLS = 100
+MAX_LAG_SAMPLES = 20000
+
+# Olay döngüsü gecikmesi milisaniyeler düzeyinde olduğundan dilimler daha incedir
+LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+event_loop_lag = registry.histogram(
+    "mukaprint_event_loop_lag_seconds", "Arayüz olay döngüsünün kalp atışı gecikmesi", LAG_BUCKETS
+)
+event_loop_stalls = registry.counter(
+    "mukaprint_event_loop_stalls_total", "Eşiği aşan arayüz takılmaları (çalışan işleyiciye göre)"
+)
+
+
+class StallDetector(QObject):
+    """Arayüz iş parçacığındaki kalp atışı zamanlayıcısını ayrı bir bekçi iş parçacığından izleyen sınıf
+    
+    Zamanlayıcı her atışta olay döngüsü gecikmesini ölçer. Atış eşikten uzun gecikirse
+    bekçi arayüz iş parçacığının o anki yığınını yakalar ve olay döngüsünün çağırdığı
+    işleyiciyi (sinyal yuvası, zamanlayıcı) bulur. Takılma bitince kayıt günlüğe yazılır,
+    ölçümlere eklenir ve stall_detected sinyaliyle bildirilir.
+    """
+    
+    stall_detected = Signal(object)  # takılma kaydı (sözlük)
+    
+    def __init__(self, threshold_ms=DEFAULT_THRESHOLD_MS, heartbeat_ms=DEFAULT_HEARTBEAT_MS, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000.0
+        self.heartbeat = heartbeat_ms / 1000.0
+        self.stalls = deque(maxlen=MAX_RECORDED_STALLS)
+        self.lag_samples = deque(maxlen=MAX_LAG_SAMPLES)
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._beat)
+        self._last_beat = None
+        self._loop_frame = None  # işleyicileri çağıran olay döngüsü çerçevesi
+        self._gui_ident = None
+        self._pending = None  # bekçinin yakaladığı, henüz bitmemiş takılma
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """Ölçümü başlatır; arayüz iş parçacığından çağrılmalıdır"""
+        if self._thread is not None:
+            return
+        self._gui_ident = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._timer.start(max(1, int(self.heartbeat * 1000)))
+        self._thread = threading.Thread(target=self._watch, name="StallDetector", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Ölçümü durdurur"""
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def set_threshold(self, threshold_ms):
+        """Takılma eşiğini değiştirir; 0 bekçiyi kapatır"""
+        self.threshold = threshold_ms / 1000.0
+        if threshold_ms <= 0:
+            self.stop()
+        else:
+            self.start()
+    
+    def _beat(self):
+        """Kalp atışı: gecikmeyi ölçer, süren bir takılma varsa sonuçlandırır"""
+        now = time.perf_counter()
+        if self._loop_frame is None:
+            self._loop_frame = sys._getframe().f_back
+        with self._lock:
+            lag = max(0.0, now - self._last_beat - self.heartbeat)
+            self._last_beat = now
+            stall, self._pending = self._pending, None
+        event_loop_lag.observe(lag)
+        self.lag_samples.append(lag)
+        if stall is None:
+            return
+        
+        stall["duration"] = lag
+        self.stalls.append(stall)
+        event_loop_stalls.inc(slot=stall["slot"] or "Qt")
+        logger.warning("Arayüz %.0f ms takıldı (işleyici: %s)\n%s", lag * 1000,
+                       stall["slot"] or "Qt", "\n".join(stall["stack"]))
+        self.stall_detected.emit(stall)
+    
+    def _watch(self):
+        """Kalp atışı eşikten uzun gecikince arayüz iş parçacığının yığınını yakalar"""
+        while not self._stop.wait(self.heartbeat / 2):
+            with self._lock:
+                last_beat = self._last_beat
+                if self._pending is not None:
+                    continue
+            overdue = time.perf_counter() - last_beat - self.heartbeat
+            if overdue < self.threshold:
+                continue
+            
+            frame = sys._current_frames().get(self._gui_ident)
+            stack, slot = self._describe(frame)
+            with self._lock:
+                # Yığın alınırken döngü kurtulduysa kayıt bırakılır
+                if self._last_beat == last_beat:
+                    self._pending = {
+                        "started_at": time.time() - overdue,
+                        "detected_after": overdue,
+                        "slot": slot,
+                        "stack": stack
+                    }
+    
+    def _describe(self, frame):
+        """Yığını (dıştan içe "dosya:satır işlev" satırları) ve çalışan işleyicinin adını döndürür"""
+        stack = []
+        slot = None
+        while frame is not None:
+            code = frame.f_code
+            name = getattr(code, "co_qualname", code.co_name)
+            stack.append(f"{os.path.basename(code.co_filename)}:{frame.f_lineno} {name}")
+            if self._loop_frame is not None and frame.f_back is self._loop_frame:
+                slot = name
+            frame = frame.f_back
+        stack.reverse()
+        return stack, slot
+    
+    def summary(self):
+        """Gecikme ve takılma istatistiklerini döndürür (kıyaslamalar için)"""
+        lags = sorted(self.lag_samples)
+        count = len(lags)
+        return {
+            "beats": count,
+            "lag_p50": lags[count // 2] if count else 0.0,
+            "lag_p95": lags[int(0.95 * (count - 1))] if count else 0.0,
+            "lag_max": lags[-1] if count else 0.0,
+            "stalls": len(self.stalls),
+            "stall_seconds": sum(stall["duration"] for stall in self.stalls),
+            "stall_slots": sorted({stall["slot"] or "Qt" for stall in self.stalls})
+        }
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Testler için ortak sahte biriktirici ve örnek dosyalar
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spooler import LocalSpooler
+from metrics import TraceLog, tracer
+from traffic_recorder import recorder
+from benchmarks.common import make_pdf
+
+
+class FlakySpooler(LocalSpooler):
+    """fail_on koşulunu sağlayan ilk gönderimi geçici hatayla reddeden sahte biriktirici"""
+    
+    def __init__(self, printers, fail_on=None, **kwargs):
+        super().__init__(printers, **kwargs)
+        self.fail_on = fail_on  # (yazıcı, belge_adı) -> bool
+    
+    def submit_raw(self, printer_name, document_name, data, copies=1):
+        if self.fail_on is not None and self.fail_on(printer_name, document_name):
+            self.fail_on = None
+            raise ConnectionError("Kağıt sıkıştı")
+        return super().submit_raw(printer_name, document_name, data, copies)
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Testler kullanıcının ~/.mukaprint dizinine yazmasın; iz ve trafik kayıtları geçici dizine gider
+    
+    İz kaydı uygulamadaki gibi açık tutulur ki yazma yolları testlerde de çalışsın.
+    """
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    trace_log = TraceLog(str(home / ".mukaprint" / "traces.jsonl"), enabled=True)
+    traffic_log = TraceLog(str(home / ".mukaprint" / "traffic.jsonl"))
+    monkeypatch.setattr(tracer, "trace_log", trace_log)
+    monkeypatch.setattr(recorder, "traffic_log", traffic_log)
+    yield home
+    trace_log.close()
+    traffic_log.close()
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    """Parçalara bölünerek basılan 10 sayfalık PDF"""
+    path = str(tmp_path / "tez.pdf")
+    make_pdf(path, 10)
+    return path
+
+
+@pytest.fixture
+def chunk_config():
+    """Küçük PDF'leri de 2+3+3+2 sayfalık parçalara bölen ayarlar"""
+    return {
+        "pdf_chunk_threshold": 4,
+        "pdf_first_chunk_pages": 2,
+        "pdf_chunk_pages": 3,
+        "spool_tracking": False,
+        "retry_base_delay": 0.01,
+        "retry_max_delay": 0.01
+    }
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Çok yazıcılı eşzamanlı yazdırma testleri
+"""
+
+import os
+import subprocess
+import sys
+import threading
+
+from metrics import tracer
+from print_queue import stress_concurrency
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_concurrent_jobs_reach_their_printers():
+    """Farklı yazıcılara eşzamanlı gönderilen her iş yalnızca kendi yazıcısına gitmeli"""
+    before = set(threading.enumerate())
+    result = stress_concurrency(printer_count=4, job_count=60, timeout=60)
+    
+    assert result["misrouted"] == []
+    assert result["undelivered"] == 0
+    assert result["unfinished"] == 0
+    # Kuyruk ve işlemci durdurulduktan sonra arka planda iş parçacığı kalmamalı
+    # (iz yazıcısı uygulama genelindedir, pencere kapanırken olduğu gibi kapatılır)
+    tracer.trace_log.close()
+    leftover = [t for t in threading.enumerate() if t not in before and t.is_alive()]
+    assert leftover == []
+
+
+def test_stress_process_exits_cleanly(tmp_path):
+    """Kıyaslama süreci yorumlayıcı kapanışında çökmeden sıfır kodla çıkmalı"""
+    env = dict(os.environ, HOME=str(tmp_path))
+    result = subprocess.run([sys.executable, "print_queue.py", "stress"], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=300)
+    
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "yanlış yazıcı: 0" in result.stdout
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Dosya izleyicisinin yapılandırma değişikliklerini canlı uygulama testleri
+"""
+
+from config import ConfigService
+from file_watcher import FileWatcher, WATCHER_CONFIG_KEYS
+
+
+def make_watcher(tmp_path, **overrides):
+    """Gerçek yapılandırma hizmetine arayüzdeki gibi abone olmuş izleyici döndürür"""
+    config = {"supported_extensions": [".pdf", ".docx"], "watch_folders": [], "watch_filter": {},
+              "watch_profiles": {}}
+    config.update(overrides)
+    service = ConfigService(config, path=str(tmp_path / "config.json"))
+    watcher = FileWatcher(config)
+    service.subscribe(watcher.apply_config, WATCHER_CONFIG_KEYS)
+    return service, watcher
+
+
+def test_watch_filter_change_is_applied(tmp_path):
+    """watch_filter değişikliği yeniden başlatmadan süzgece yansımalı"""
+    service, watcher = make_watcher(tmp_path)
+    assert watcher.is_supported_file("a.pdf")
+    
+    service.update({"watch_filter": {"exclude": ["*.pdf"]}})
+    
+    assert not watcher.is_supported_file("a.pdf")
+    assert watcher.is_supported_file("a.docx")
+
+
+def test_watch_profile_change_restarts_only_that_folder(tmp_path):
+    """Klasör profilindeki izleyici türü ve aralık değişikliği yalnızca o klasörün izleyicisini yenilemeli"""
+    changed, untouched = tmp_path / "ag", tmp_path / "yerel"
+    changed.mkdir()
+    untouched.mkdir()
+    service, watcher = make_watcher(tmp_path, watch_folders=[str(changed), str(untouched)])
+    watcher.start_watching()
+    try:
+        kept = watcher.observers[str(untouched)]
+        
+        service.update({"watch_profiles": {str(changed): {"observer": "polling", "poll_interval": 2,
+                                                          "max_depth": 0}}})
+        
+        assert watcher.observer_settings[str(changed)] == ("polling", 2.0, 0)
+        assert watcher.observers[str(untouched)] is kept
+    finally:
+        watcher.stop_watching()
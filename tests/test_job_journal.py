@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+İş günlüğü testleri
+"""
+
+import os
+import time
+
+import job_journal
+from job_journal import JobJournal
+
+
+def test_record_does_not_wait_for_disk(tmp_path, monkeypatch):
+    """Yavaş diskte kayıt eklemek beklememeli; kayıtlar toplu halde az sayıda fsync ile yazılmalı"""
+    fsyncs = []
+    
+    def slow_fsync(fd):
+        fsyncs.append(fd)
+        time.sleep(0.05)
+    
+    monkeypatch.setattr(job_journal.os, "fsync", slow_fsync)
+    journal = JobJournal(str(tmp_path / "journal.jsonl"))
+    
+    started = time.perf_counter()
+    for index in range(200):
+        journal.record({"job_id": f"is-{index}", "state": "queued", "submitted_at": index})
+    assert time.perf_counter() - started < 0.05
+    
+    assert len(journal.replay()) == 200
+    assert len(fsyncs) < 20
+    journal.close()
+
+
+def test_compaction_runs_on_writer(tmp_path, monkeypatch):
+    """Büyüyen günlük yazıcı iş parçacığında yalnızca bitmemiş işlerle yeniden yazılmalı"""
+    monkeypatch.setattr(job_journal, "COMPACT_SIZE", 4096)
+    path = str(tmp_path / "journal.jsonl")
+    journal = JobJournal(path)
+    for index in range(200):
+        journal.record({"job_id": f"is-{index}", "state": "queued", "submitted_at": index})
+        journal.record({"job_id": f"is-{index}", "state": "done" if index else "queued"})
+    journal.flush()
+    
+    assert os.path.getsize(path) < 8192
+    assert [entry["job_id"] for entry in journal.replay()] == ["is-0"]
+    journal.close()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+İz kaydı testleri
+"""
+
+import os
+import json
+import subprocess
+import sys
+import threading
+
+from metrics import TraceLog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_trace_log_is_disabled_by_default(tmp_path):
+    """Uygulama açmadıkça iz kaydı dosyaya yazmamalı"""
+    log = TraceLog(str(tmp_path / "traces.jsonl"))
+    log.write({"stage": "queue"})
+    log.close()
+    
+    assert not (tmp_path / "traces.jsonl").exists()
+    assert not TraceLog().enabled
+
+
+def test_records_are_written_by_background_writer(tmp_path):
+    """Kayıtlar çağıran iş parçacığında değil yazıcı iş parçacığında yazılmalı, kapatınca hepsi dosyada olmalı"""
+    path = tmp_path / "traces.jsonl"
+    log = TraceLog(str(path), max_bytes=2000, backup_count=2, enabled=True)
+    for index in range(100):
+        log.write({"stage": "spool", "index": index})
+    assert any(thread.name == "TraceWriter" for thread in threading.enumerate())
+    log.close()
+    
+    # Döndürülen dosyalar dahil son kayıtlar sırayla yazılmış olmalı
+    lines = (path.with_name("traces.jsonl.1").read_text(encoding="utf-8") + path.read_text(encoding="utf-8"))
+    indexes = [json.loads(line)["index"] for line in lines.splitlines()]
+    assert indexes == sorted(indexes) and indexes[-1] == 99
+    assert not any(thread.name == "TraceWriter" for thread in threading.enumerate())
+
+
+def test_shared_tracer_does_not_write_on_import():
+    """Modül içe aktarıldığında paylaşılan izleyici kullanıcının dizinine yazmamalı"""
+    result = subprocess.run([sys.executable, "-c", "import metrics; print(metrics.tracer.trace_log.enabled)"],
+                            cwd=ROOT, capture_output=True, text=True, timeout=60)
+    
+    assert result.stdout.strip() == "False", result.stderr
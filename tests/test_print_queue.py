@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Yazdırma kuyruğu ve zamanlayıcı testleri
+"""
+
+import os
+from concurrent.futures import Future
+
+from PySide6.QtCore import Qt
+
+from document_processor import DocumentProcessor
+from job_journal import JobJournal
+from print_queue import FINAL_STATES, JobScheduler, PrintJob, PrintQueue, generate_synthetic_trace, simulate_trace
+from spooler import LocalSpooler
+
+
+def test_default_policy_beats_fifo():
+    """Varsayılan zamanlama yapay dükkan gününde her ölçütte FIFO'dan iyi olmalı"""
+    trace = generate_synthetic_trace()
+    fifo = simulate_trace(trace, JobScheduler(use_priority=False, shortest_job_first=False, fair_share=False))
+    default = simulate_trace(trace, JobScheduler())
+    
+    assert default["jobs"] == fifo["jobs"]
+    for key in ("mean_wait", "p95_wait", "max_wait", "mean_slowdown"):
+        assert default[key] < fifo[key], key
+
+
+def test_unknown_page_count_is_costed_by_size(tmp_path):
+    """Sayfa sayısı bilinmeyen büyük belge en kısa iş önce sıralamasında tek sayfalık iş gibi öne geçmemeli"""
+    thesis = tmp_path / "tez.doc"
+    thesis.write_bytes(b"\0" * (2 * 1024 * 1024))
+    receipt = tmp_path / "dekont.pdf"
+    receipt.write_bytes(b"%PDF-1.4")
+    
+    scheduler = JobScheduler(fair_share=False)
+    large = PrintJob(str(thesis), "A", source="kaynak")
+    small = PrintJob(str(receipt), "A", page_count=2, source="kaynak")
+    scheduler.push(large)
+    scheduler.push(small)
+    
+    assert large.cost > 100
+    assert scheduler.pop().job_id == small.job_id
+
+
+def test_layout_pass_result_updates_queued_job(tmp_path):
+    """Arka plandaki dizgi geçişinin bulduğu sayfa sayısı kuyruktaki işe ve panoya yansımalı"""
+    document = tmp_path / "odev.doc"
+    document.write_bytes(b"\0" * 1024)
+    processor = DocumentProcessor({}, spooler=LocalSpooler(["A"]))
+    queue = PrintQueue(processor, processor.config,
+                       JobJournal(os.path.join(str(tmp_path), "journal.jsonl"), FINAL_STATES))
+    updated = []
+    queue.job_updated.connect(updated.append, Qt.DirectConnection)
+    try:
+        job = queue.submit(str(document), "A", copies=2)
+        assert job.page_count is None
+        
+        # Dönüştürücü havuzundaki geçiş bitmiş gibi sonuç hemen verilir
+        def finished_layout(function, file_path):
+            future = Future()
+            future.set_result(40)
+            return future
+        
+        processor.converter_pool.submit = finished_layout
+        processor._schedule_layout_pass(str(document))
+        
+        assert job.page_count == 40
+        assert job.cost == 80
+        assert updated == [job.job_id]
+    finally:
+        queue.stop()
+        processor.shutdown()
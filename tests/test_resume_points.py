@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Yarım kalan yazdırmaların devam noktası testleri
+"""
+
+import os
+import time
+
+from conftest import FlakySpooler
+from document_processor import DocumentProcessor
+from job_journal import JobJournal
+from print_queue import PrintQueue, FINAL_STATES
+
+
+def _wait_idle(queue, timeout=10):
+    """Kuyruktaki tüm işler bitene kadar bekler"""
+    deadline = time.time() + timeout
+    while queue.jobs and time.time() < deadline:
+        time.sleep(0.01)
+    assert not queue.jobs
+
+
+def test_resume_points_are_per_job(pdf_file, chunk_config):
+    """Aynı dosyanın başka yazıcıdaki başarılı basımı yarım kalan işin devam noktasını silmemeli"""
+    spooler = FlakySpooler(["A", "B"], pages_per_minute=600000,
+                           fail_on=lambda printer, name: printer == "A" and "[3-" in name)
+    processor = DocumentProcessor(chunk_config, spooler=spooler)
+    
+    assert not processor.print_document(pdf_file, "A", resume_key="is-a")
+    assert processor.print_document(pdf_file, "B", resume_key="is-b")
+    
+    assert processor.get_resume_point("is-a")["page"] == 2
+    assert processor.get_resume_point("is-b") is None
+
+
+def test_finished_job_point_is_not_reused(tmp_path, pdf_file, chunk_config):
+    """Başarısız biten işin devam noktası aynı dosyanın sonraki işinin yeniden denemesine uygulanmamalı"""
+    spooler = FlakySpooler(["A"], pages_per_minute=600000,
+                           fail_on=lambda printer, name: "[3-" in name)
+    processor = DocumentProcessor(dict(chunk_config, retry_max_attempts=1), spooler=spooler)
+    queue = PrintQueue(processor, processor.config,
+                       JobJournal(os.path.join(str(tmp_path), "journal.jsonl"), FINAL_STATES))
+    queue.start()
+    try:
+        queue.submit(pdf_file, "A", page_count=10)
+        _wait_idle(queue)
+        assert processor.resume_points == {}
+        assert processor.get_resumable(pdf_file)["page"] == 2
+        
+        # İlk parçada düşen yeni iş yeniden denemede baştan başlamalı
+        queue.config["retry_max_attempts"] = 2
+        spooler.fail_on = lambda printer, name: "[1-" in name
+        first = len(spooler.submissions)
+        queue.submit(pdf_file, "A", page_count=10)
+        _wait_idle(queue)
+    finally:
+        queue.stop()
+    
+    names = [name for _, name, _ in spooler.submissions[first:]]
+    assert names[0] == "tez.pdf [1-2/10]"
+    assert len(names) == 4
+    assert processor.resume_points == {}
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Biriktirici arka uçları ve izleyici testleri
+"""
+
+import spooler
+from spooler import (
+    Win32Spooler, SpoolerMonitor, LocalSpooler, document_matches,
+    SPOOL_COMPLETED, SPOOL_DELETED, SPOOL_UNKNOWN,
+    JOB_STATUS_DELETING, JOB_STATUS_PRINTING, JOB_STATUS_SPOOLING
+)
+
+
+def test_document_matches_exact_names_only():
+    """Belge adı alt dizgi olarak değil, tam ad ya da parça adı olarak eşleşmeli"""
+    assert document_matches("a.pdf", "a.pdf")
+    assert document_matches("a.pdf [1-25/300]", "a.pdf")
+    assert document_matches("Microsoft Word - rapor.docx", "rapor.docx")
+    assert document_matches("rapor", "rapor.docx")
+    assert not document_matches("data.pdf", "a.pdf")
+    assert not document_matches("11.pdf", "1.pdf")
+    assert not document_matches("11.pdf [1-5/10]", "1.pdf")
+
+
+def test_monitor_does_not_claim_similar_names():
+    """Kimliği bilinmeyen iş benzer adlı başka bir işin biriktirici kimliğini sahiplenmemeli"""
+    local = LocalSpooler(["A"], pages_per_minute=1)
+    local.submit_raw("A", "data.pdf", b"/Type /Page")
+    own = local.submit_raw("A", "a.pdf", b"/Type /Page")
+    monitor = SpoolerMonitor(local)
+    entry = {"document_name": "a.pdf", "pending": set()}
+    monitor._resolve(entry, local.poll_jobs("A"), set(), 0)
+    assert entry["pending"] == {own}
+
+
+class FakeWin32Print:
+    """EnumJobs sonucunu testin belirlediği sahte win32print"""
+    
+    def __init__(self):
+        self.jobs = []
+    
+    def OpenPrinter(self, name):
+        return name
+    
+    def ClosePrinter(self, handle):
+        pass
+    
+    def EnumJobs(self, handle, first, count, level):
+        return list(self.jobs)
+
+
+def test_win32_outcomes_from_last_seen_status(monkeypatch):
+    """Windows'ta kuyruktan çıkan işin sonucu son görülen durum bayraklarından çıkarılmalı"""
+    fake = FakeWin32Print()
+    monkeypatch.setattr(spooler, "win32print", fake)
+    backend = Win32Spooler()
+    fake.jobs = [
+        {"JobId": 1, "Status": JOB_STATUS_PRINTING},
+        {"JobId": 2, "Status": JOB_STATUS_DELETING},
+        {"JobId": 3, "Status": JOB_STATUS_SPOOLING}
+    ]
+    backend.poll_jobs("A")
+    fake.jobs = []
+    backend.poll_jobs("A")
+    
+    assert backend.job_outcomes("A", [1, 2, 3, 4]) == {
+        1: SPOOL_COMPLETED,
+        2: SPOOL_DELETED,
+        3: SPOOL_UNKNOWN,
+        4: SPOOL_UNKNOWN
+    }
+
+
+def test_unknown_outcome_is_not_reported_as_printed():
+    """Sonucu bilinmeyen iş başarılı değil, doğrulanamadı olarak bildirilmeli"""
+    monitor = SpoolerMonitor(LocalSpooler(["A"]))
+    results = []
+    monitor.on_finished = lambda key, success, message: results.append((key, success, message))
+    monitor._tracked["is"] = entry = {
+        "printer_name": "A", "pending": {7}, "document_name": None, "since": 0,
+        "status": None, "error": None, "unverified": False
+    }
+    monitor._update_printer([("is", entry)], {}, {7: SPOOL_UNKNOWN})
+    assert results == [("is", True, "Biriktirici sonucu doğrulanamadı")]
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Excel yazdırma alanı okuma testleri
+"""
+
+from openpyxl import Workbook
+
+from xlsx_renderer import _parse_range, _split_areas, read_workbook_layout
+
+
+def test_sheet_prefix_is_not_read_as_cell():
+    """Hücre başvurusuna benzeyen sayfa adı aralık yerine okunmamalı"""
+    assert _parse_range("'Q1'!$B$2:$D$50") == (2, 2, 4, 50)
+    assert _parse_range("A1!$C$3") == (3, 3, 3, 3)
+    assert _parse_range("Sayfa1!#REF!") is None
+
+
+def test_quoted_sheet_names_with_commas_are_not_split():
+    """Tırnaklı sayfa adındaki virgül alanları bölmemeli"""
+    text = "'Gider, 2024'!$A$1:$B$5,'Gider, 2024'!$D$1:$E$5"
+    assert _split_areas(text) == ["'Gider, 2024'!$A$1:$B$5", "'Gider, 2024'!$D$1:$E$5"]
+
+
+def test_every_print_area_is_rendered(tmp_path):
+    """Birden çok yazdırma alanının her biri ayrı düzen olarak basılmalı"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Q1"
+    for row in range(1, 61):
+        sheet.append([f"{row}-{column}" for column in range(1, 8)])
+    sheet.print_area = ["B2:D50", "F1:G3"]
+    path = tmp_path / "ceyrek.xlsx"
+    workbook.save(path)
+    
+    layouts = read_workbook_layout(str(path))
+    
+    assert [layout["name"] for layout in layouts] == ["Q1", "Q1"]
+    assert [layout["area"] for layout in layouts] == [(2, 2, 4, 50), (6, 1, 7, 3)]
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Düz metin dosyalarını kodlamasını tanıyarak sayfalara dizen metin işleme modülü
+"""
+
+import os
+import codecs
+from PIL import Image, ImageDraw, ImageFont
+
+from raster_pdf import page_pixels, mm_to_pixels
+
+
+# Metin olarak yazdırılan dosya türleri
+TEXT_EXTENSIONS = [".txt", ".log"]
+
+# Kodlama tanımada bakılan bayt sırası işaretleri (uzun olan önce)
+BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16")
+]
+
+# UTF-8 doğrulaması ve BOM'suz UTF-16 tahmini için okunan blok boyutu
+DETECT_BLOCK_SIZE = 64 * 1024
+
+# Denenen eş aralıklı yazı tipleri (Windows, ardından Linux)
+MONOSPACE_FONTS = ["consola.ttf", "cour.ttf", "DejaVuSansMono.ttf", "LiberationMono-Regular.ttf"]
+
+# Satır yüksekliğinin yazı boyutuna oranı
+LINE_SPACING = 1.2
+
+# Sekme genişliği (karakter)
+TAB_SIZE = 8
+
+
+def detect_encoding(file_path):
+    """Dosyanın kodlamasını BOM, UTF-16 ve katı UTF-8 denetimiyle belirler; hiçbiri değilse CP1254"""
+    with open(file_path, "rb") as f:
+        head = f.read(DETECT_BLOCK_SIZE)
+        for bom, encoding in BOMS:
+            if head.startswith(bom):
+                return encoding
+        
+        # BOM'suz UTF-16: ASCII ağırlıklı metinde her iki bayttan biri sıfırdır
+        if len(head) >= 4:
+            even_zeros = head[0::2].count(0)
+            odd_zeros = head[1::2].count(0)
+            half = len(head) // 2
+            if odd_zeros > half * 0.3 and even_zeros < half * 0.05:
+                return "utf-16-le"
+            if even_zeros > half * 0.3 and odd_zeros < half * 0.05:
+                return "utf-16-be"
+        
+        # Dosyanın tamamı blok blok katı UTF-8 olarak doğrulanır (bellekte tutulmaz)
+        decoder = codecs.getincrementaldecoder("utf-8")("strict")
+        block = head
+        try:
+            while block:
+                decoder.decode(block)
+                block = f.read(DETECT_BLOCK_SIZE)
+            decoder.decode(b"", final=True)
+            return "utf-8"
+        except UnicodeDecodeError:
+            # Türkçe Windows'ta kaydedilmiş metinler
+            return "cp1254"
+
+
+def load_font(font_name, size, candidates=MONOSPACE_FONTS):
+    """Verilen ya da adaylardan bulunan ilk yazı tipini yükler"""
+    for name in ([font_name] if font_name else []) + candidates:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+class GlyphCache:
+    """Karakterleri bir kez çizip maskelerini yapıştırarak satır çizen önbellek (her seferinde çizmekten hızlı)"""
+    
+    def __init__(self, font, line_height):
+        self.font = font
+        self.line_height = line_height
+        self.glyphs = {}  # karakter -> (maske ya da boşluksa None, x kayması, y kayması, ilerleme)
+    
+    def glyph(self, char):
+        """Karakterin bir kez çizilip kırpılmış maskesini ve ilerleme genişliğini döndürür"""
+        glyph = self.glyphs.get(char)
+        if glyph is not None:
+            return glyph
+        advance = self.font.getlength(char)
+        # Sola taşan ve geniş karakterler kırpılmasın diye hücre dolgulu çizilir
+        pad = self.line_height // 2
+        cell = Image.new("1", (round(advance) + 2 * pad, self.line_height + pad), 0)
+        ImageDraw.Draw(cell).text((pad, 0), char, fill=1, font=self.font)
+        bbox = cell.getbbox()
+        if bbox:
+            glyph = (cell.crop(bbox), bbox[0] - pad, bbox[1], advance)
+        else:
+            glyph = (None, 0, 0, advance)
+        self.glyphs[char] = glyph
+        return glyph
+    
+    def text_width(self, text):
+        """Metnin çizildiğinde kaplayacağı genişliği döndürür"""
+        return sum(self.glyph(char)[3] for char in text)
+    
+    def draw(self, page, x, y, text, max_width=None):
+        """Metni verilen noktadan siyah çizer; max_width verilirse sığmayan karakterlerde durur"""
+        offset = 0.0
+        for char in text:
+            mask, dx, dy, advance = self.glyph(char)
+            if max_width is not None and offset + advance > max_width:
+                break
+            if mask is not None:
+                left = x + round(offset) + dx
+                page.paste(0, (left, y + dy, left + mask.width, y + dy + mask.height), mask)
+            offset += advance
+
+
+class TextRenderer:
+    """Metin dosyasını akış halinde okuyup satır kaydırarak sayfa resimleri üreten sınıf"""
+    
+    def __init__(self, file_path, paper_size="A4", dpi=300, font_name=None, font_size=10, margin_mm=15):
+        self.file_path = file_path
+        self.dpi = dpi
+        self.encoding = detect_encoding(file_path)
+        self.page_size = page_pixels(paper_size, dpi)
+        self.margin = mm_to_pixels(margin_mm, dpi)
+        self.font = load_font(font_name, max(1, round(font_size * dpi / 72.0)))
+        
+        # Eş aralıklı yazı tipinde satıra sığan karakter ve sayfaya sığan satır sayısı
+        self.line_height = round(self.font.size * LINE_SPACING)
+        footer_height = self.line_height * 2
+        text_width = self.page_size[0] - 2 * self.margin
+        text_height = self.page_size[1] - 2 * self.margin - footer_height
+        self.columns = max(1, int(text_width // self.font.getlength("M")))
+        self.lines_per_page = max(1, text_height // self.line_height)
+        self.glyphs = GlyphCache(self.font, self.line_height)
+        self._page_count = None
+    
+    def _iter_lines(self):
+        """Dosyayı satır satır okur; çok uzun satırlar parça parça gelir, dosya belleğe alınmaz"""
+        # Uzun satır parçaları tam satır kaydırma sınırına denk gelsin
+        read_limit = self.columns * 64
+        with open(self.file_path, "r", encoding=self.encoding, errors="replace", newline=None) as f:
+            for line in iter(lambda: f.readline(read_limit), ""):
+                yield line.rstrip("\n")
+    
+    def iter_page_lines(self):
+        """Kaydırılmış satırları sayfa sayfa liste olarak üretir; form besleme yeni sayfa başlatır"""
+        page = []
+        produced = False
+        for line in self._iter_lines():
+            parts = line.split("\f")
+            for index, part in enumerate(parts):
+                if index > 0:
+                    yield page
+                    produced = True
+                    page = []
+                part = part.expandtabs(TAB_SIZE).rstrip()
+                if not part and len(parts) > 1:
+                    # Form beslemenin bitişiğindeki boşluk ayrıca boş satır bırakmaz
+                    continue
+                for start in range(0, max(1, len(part)), self.columns):
+                    page.append(part[start:start + self.columns])
+                    if len(page) == self.lines_per_page:
+                        yield page
+                        produced = True
+                        page = []
+        # Boş dosya da tek (boş) sayfa olarak basılır
+        if page or not produced:
+            yield page
+    
+    def page_count(self):
+        """Sayfa sayısını çizim yapmadan satırları kaydırarak hesaplar"""
+        if self._page_count is None:
+            self._page_count = sum(1 for _ in self.iter_page_lines())
+        return self._page_count
+    
+    def iter_pages(self, first_page=0):
+        """Sayfa resimlerini verilen sayfadan itibaren sırayla üretir; önceki sayfalar çizilmeden atlanır"""
+        total = self.page_count()
+        file_name = os.path.basename(self.file_path)
+        for page_index, lines in enumerate(self.iter_page_lines()):
+            if page_index < first_page:
+                continue
+            # Siyah-beyaz sayfa hem çizimde hem sıkıştırmada en az belleği kullanır
+            page = Image.new("1", self.page_size, 1)
+            y = self.margin
+            for text in lines:
+                self.glyphs.draw(page, self.margin, y, text)
+                y += self.line_height
+            footer = f"{file_name} - Sayfa {page_index + 1}/{total}"
+            ImageDraw.Draw(page).text((self.page_size[0] // 2, self.page_size[1] - self.margin), footer,
+                                      fill=0, font=self.font, anchor="md")
+            yield page
\ No newline at end of file
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Dükkan trafiğini (dosya algılamaları ve yazdırma istekleri) yeniden oynatılabilir iz olarak kaydeden modül
+"""
+
+import os
+import time
+import hashlib
+
+from metrics import TraceLog
+
+
+# Trafik izinin yazıldığı dosya; döndürülen eski dosyalar .1, .2 ... uzantısıyla saklanır
+TRAFFIC_FILE = os.path.join(os.path.expanduser("~"), ".mukaprint", "traffic.jsonl")
+
+# Dosya yolu listesi taşıyan yazdırma seçenekleri; ize yol yerine dosya kimlikleri yazılır
+BATCH_OPTIONS = ("merge_batch", "image_batch")
+
+
+def file_id(path):
+    """Dosya adını ize yazmadan aynı dosyayı (yeniden basımları) tanımaya yarayan kısa kimlik"""
+    normalized = os.path.normcase(os.path.abspath(path))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+def source_id(source):
+    """Müşteri adı içerebilen kaynak klasörü yerine kısa kimlik döndürür"""
+    if not source:
+        return None
+    normalized = os.path.normcase(os.path.abspath(source))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:8]
+
+
+def _file_info(path):
+    """Dosyanın kimliğini, uzantısını ve boyutunu döndürür"""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = None
+    return {"file": file_id(path), "ext": os.path.splitext(path)[1].lower(), "size": size}
+
+
+class TrafficRecorder:
+    """Algılama ve yazdırma isteklerini dosya adı içermeyen JSON satırları olarak kaydeden sınıf
+    
+    Kayıt kapalıyken çağrılar hiçbir iş yapmadan döner. İz, benchmarks paketindeki
+    yeniden oynatma aracıyla sahte biriktiriciye karşı hızlandırılarak oynatılır.
+    """
+    
+    def __init__(self, traffic_log=None):
+        self.traffic_log = traffic_log if traffic_log is not None else TraceLog(
+            TRAFFIC_FILE, max_bytes=20 * 1024 * 1024, backup_count=5
+        )
+        self.traffic_log.enabled = False
+    
+    def record_detection(self, file_path, folder, size):
+        """İzleyicinin hazır bildirdiği dosyayı kaydeder"""
+        if not self.traffic_log.enabled:
+            return
+        # Gönderen bazlı alt klasör, yazdırma kuyruğundaki kaynakla aynı şekilde bulunur
+        source = folder
+        parts = os.path.relpath(file_path, folder).split(os.sep)
+        if len(parts) > 1:
+            source = os.path.join(folder, parts[0])
+        self.traffic_log.write({
+            "t": time.time(),
+            "event": "detect",
+            "file": file_id(file_path),
+            "ext": os.path.splitext(file_path)[1].lower(),
+            "size": size,
+            "source": source_id(source)
+        })
+    
+    def record_print(self, job, source_pages=None):
+        """Kuyruğa eklenen yazdırma işini ayarlarıyla kaydeder"""
+        if not self.traffic_log.enabled:
+            return
+        options = {}
+        batches = {}
+        for key, value in job.options.items():
+            if key in BATCH_OPTIONS:
+                batches[key] = [file_id(path) for path in value or []]
+            elif value is None or isinstance(value, (str, int, float, bool)):
+                options[key] = value
+        batch_paths = [path for key in BATCH_OPTIONS for path in job.options.get(key) or []]
+        self.traffic_log.write({
+            "t": job.submitted_at,
+            "event": "print",
+            "job": job.job_id,
+            "files": [_file_info(path) for path in [job.file_path] + batch_paths],
+            "pages": source_pages,
+            "printer": job.printer_name,
+            "paper_size": job.paper_size,
+            "copies": job.copies,
+            "duplex": job.duplex,
+            "priority": job.priority,
+            "source": source_id(job.source),
+            "batches": batches,
+            "options": options
+        })
+    
+    def close(self):
+        """İz dosyasını kapatır"""
+        self.traffic_log.close()
+
+
+# Uygulama genelinde paylaşılan kaydedici
+recorder = TrafficRecorder()
@@ -10,4 +10,5 @@ UI modülü
 from ui.main_window import MainWindow
 from ui.settings_dialog import SettingsDialog
 from ui.file_list_widget import FileListWidget
-from ui.print_history_widget import PrintHistoryWidget
\ No newline at end of file
+from ui.print_history_widget import PrintHistoryWidget
+from ui.queue_widget import QueueWidget
\ No newline at end of file
@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QListWidget, QListWidgetItem, 
     QLabel, QPushButton, QHBoxLayout, QMenu, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer
 from PySide6.QtGui import QIcon, QColor, QBrush, QFont
 import qtawesome as qta
 
@@ -19,11 +19,22 @@ import qtawesome as qta
 class FileListWidget(QWidget):
     """Dosya listesi widget'ı"""
     
-    def __init__(self, document_processor):
+    # Sağ tıklama menüsünden yazdırma istendiğinde sinyal gönder
+    print_requested = Signal(list)  # dosya_yolları
+    resume_requested = Signal(list)  # dosya_yolları
+    
+    # Kaydırma bitene kadar önizleme istenmez; bu süre içindeki olaylar tek güncellemede birleşir
+    PREVIEW_DELAY_MS = 150
+    
+    def __init__(self, document_processor, preview_service=None):
         super().__init__()
         self.document_processor = document_processor
+        self.preview_service = preview_service
         self.files = {}  # Dosya yolu -> ListWidgetItem eşlemesi
         self.init_ui()
+        
+        if self.preview_service is not None:
+            self.preview_service.thumbnail_ready.connect(self.on_thumbnail_ready)
     
     def init_ui(self):
         """Kullanıcı arayüzünü oluşturur"""
@@ -50,6 +61,16 @@ class FileListWidget(QWidget):
         self.list_widget.customContextMenuRequested.connect(self.show_context_menu)
         layout.addWidget(self.list_widget)
         
+        # Önizlemeler yalnızca görünen satırlar için, kaydırma durulunca istenir
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_DELAY_MS)
+        self.preview_timer.timeout.connect(self.update_visible_previews)
+        if self.preview_service is not None:
+            size = self.preview_service.size
+            self.list_widget.setIconSize(QSize(size, size))
+            self.list_widget.verticalScrollBar().valueChanged.connect(self.schedule_previews)
+        
         # Durum etiketi
         self.status_label = QLabel("Hazır")
         layout.addWidget(self.status_label)
@@ -67,10 +88,12 @@ class FileListWidget(QWidget):
         item = QListWidgetItem(os.path.basename(file_path))
         item.setToolTip(file_path)
         item.setIcon(self._get_file_icon(file_path))
+        item.setData(Qt.UserRole, file_path)
         
         # Dosyayı listeye ekle
         self.list_widget.addItem(item)
         self.files[file_path] = item
+        self.schedule_previews()
         
         # Durum etiketini güncelle
         self.status_label.setText(f"{len(self.files)} dosya listelendi")
@@ -100,6 +123,7 @@ class FileListWidget(QWidget):
             row = self.list_widget.row(item)
             self.list_widget.takeItem(row)
             del self.files[file_path]
+            self.schedule_previews()
             
             # Durum etiketini güncelle
             self.status_label.setText(f"{len(self.files)} dosya listelendi")
@@ -109,6 +133,50 @@ class FileListWidget(QWidget):
         self.list_widget.clear()
         self.files = {}
         self.status_label.setText("Hazır")
+        if self.preview_service is not None:
+            self.preview_service.retain(set())
+    
+    def resizeEvent(self, event):
+        """Boyut değişince görünür hale gelen satırların önizlemelerini ister"""
+        super().resizeEvent(event)
+        self.schedule_previews()
+    
+    def schedule_previews(self):
+        """Görünen satırların önizleme güncellemesini zamanlayıcıyla erteler"""
+        if self.preview_service is not None:
+            self.preview_timer.start()
+    
+    def visible_files(self):
+        """Listede şu an ekranda görünen dosyaların yollarını döndürür"""
+        count = self.list_widget.count()
+        if count == 0:
+            return []
+        viewport = self.list_widget.viewport().rect()
+        first = self.list_widget.indexAt(viewport.topLeft())
+        last = self.list_widget.indexAt(viewport.bottomLeft())
+        first_row = first.row() if first.isValid() else 0
+        last_row = last.row() if last.isValid() else count - 1
+        return [self.list_widget.item(row).data(Qt.UserRole) for row in range(first_row, last_row + 1)]
+    
+    @Slot()
+    def update_visible_previews(self):
+        """Görünen satırların önizlemelerini ister, ekrandan çıkanların bekleyen isteklerini iptal eder"""
+        if self.preview_service is None:
+            return
+        visible = self.visible_files()
+        self.preview_service.retain(set(visible))
+        for file_path in visible:
+            thumb_path = self.preview_service.request(file_path)
+            if thumb_path:
+                self.on_thumbnail_ready(file_path, thumb_path)
+    
+    @Slot(str, str)
+    def on_thumbnail_ready(self, file_path, thumb_path):
+        """Hazırlanan önizlemeyi dosyanın simgesi olarak gösterir"""
+        item = self.files.get(file_path)
+        if item is not None and item.data(Qt.UserRole + 1) != thumb_path:
+            item.setIcon(QIcon(thumb_path))
+            item.setData(Qt.UserRole + 1, thumb_path)
     
     def get_selected_files(self):
         """Seçili dosyaların yollarını döndürür"""
@@ -134,6 +202,11 @@ class FileListWidget(QWidget):
             print_action = menu.addAction(QIcon(qta.icon('fa5s.print')), "Yazdır")
             print_action.triggered.connect(self._print_selected)
             
+            # Yarım kalan yazdırma varsa kaldığı yerden devam seçeneği
+            if any(self.document_processor.get_resumable(p) for p in self.get_selected_files()):
+                resume_action = menu.addAction(QIcon(qta.icon('fa5s.redo')), "Kaldığı Yerden Devam Et")
+                resume_action.triggered.connect(self._resume_selected)
+            
             # Kaldır seçeneği
             remove_action = menu.addAction(QIcon(qta.icon('fa5s.trash')), "Listeden Kaldır")
             remove_action.triggered.connect(self._remove_selected)
@@ -154,10 +227,18 @@ class FileListWidget(QWidget):
     def _print_selected(self):
         """Seçili dosyaları yazdırır"""
         selected_files = self.get_selected_files()
-        for file_path in selected_files:
-            # Bu metod, ana penceredeki print_document metoduna bağlanmalı
-            # Şimdilik doğrudan document_processor'ı kullanıyoruz
-            self.document_processor.print_document(file_path)
+        if selected_files:
+            # Ana pencere dosyaları yazdırma kuyruğuna ekler
+            self.print_requested.emit(selected_files)
+    
+    def _resume_selected(self):
+        """Seçili dosyaların yarım kalan yazdırmalarını sürdürür"""
+        resumable = [
+            file_path for file_path in self.get_selected_files()
+            if self.document_processor.get_resumable(file_path)
+        ]
+        if resumable:
+            self.resume_requested.emit(resumable)
     
     def _remove_selected(self):
         """Seçili dosyaları listeden kaldırır"""
@@ -13,37 +13,93 @@ from PySide6.QtWidgets import (
     QPushButton, QLabel, QComboBox, QSpinBox, QCheckBox,
     QListWidget, QListWidgetItem, QFileDialog, QMessageBox,
     QTabWidget, QSplitter, QGroupBox, QFormLayout, QTableWidget,
-    QTableWidgetItem, QHeaderView, QAbstractItemView, QMenu, QSizePolicy
+    QTableWidgetItem, QHeaderView, QAbstractItemView, QMenu, QSizePolicy,
+    QLineEdit
 )
-from PySide6.QtCore import Qt, QSize, Signal, Slot, QTimer
-from PySide6.QtGui import QIcon, QAction, QFont, QColor
+from PySide6.QtCore import Qt, QSize, Signal, Slot, QTimer, QUrl
+from PySide6.QtGui import QIcon, QAction, QFont, QColor, QCursor, QKeySequence, QDesktopServices
 import qtawesome as qta
 
-from file_watcher import FileWatcher
+from file_watcher import FileWatcher, WATCHER_CONFIG_KEYS
 from document_processor import DocumentProcessor
+from print_queue import PrintQueue, PRIORITY_NAMES, PRIORITY_NORMAL, JOB_STATE_NAMES, JOB_QUEUED
+from imposition import parse_page_range, NUP_GRIDS, HANDOUT_GRIDS
+from printer_health import HEALTH_OK, HEALTH_WARNING, BREAKER_STATE_NAMES
+from image_renderer import IMAGE_EXTENSIONS, CONTACT_SHEET_GRID, image_page_count
+from preview_service import PreviewService
+from metrics import registry, tracer, MetricsServer
+from traffic_recorder import recorder
+from profiler import SamplingProfiler, PROFILE_DIR, DEFAULT_SECONDS
+from stall_detector import StallDetector
 from ui.settings_dialog import SettingsDialog
 from ui.file_list_widget import FileListWidget
 from ui.print_history_widget import PrintHistoryWidget
+from ui.queue_widget import QueueWidget
 
 
 class MainWindow(QMainWindow):
     """MUKAprint ana penceresi"""
     
-    def __init__(self, config):
+    def __init__(self, config_service):
         super().__init__()
-        self.config = config
+        self.config_service = config_service
+        self.config = config = config_service.config
         self.file_watcher = FileWatcher(config)
         self.document_processor = DocumentProcessor(config)
+        self.preview_service = PreviewService(config, self.document_processor.prerenderer.cache)
+        self.print_queue = PrintQueue(self.document_processor, config)
+        self.print_queue.job_state_changed.connect(self.on_job_state_changed)
+        
+        # Aşama süreleri ~/.mukaprint/traces.jsonl'e yazılır, ölçümler yalnızca yerelden okunabilir
+        tracer.trace_log.enabled = config.get("trace_log_enabled", True)
+        tracer.trace_log.max_bytes = int(config.get("trace_log_mb", 5) * 1024 * 1024)
+        self.metrics_server = MetricsServer(registry, port=config.get("metrics_port", 9469))
+        
+        # Açıksa algılamalar ve yazdırma istekleri yeniden oynatılmak üzere ~/.mukaprint/traffic.jsonl'e yazılır
+        recorder.traffic_log.enabled = config.get("traffic_recording", False)
+        
+        # Yavaşlık anında yeniden başlatmadan profil çıkarmak için gizli menü ve yerel uç nokta
+        # (curl -X POST "http://127.0.0.1:9469/profile?seconds=30")
+        self.profiler = SamplingProfiler()
+        self.profiler.profile_started.connect(self.on_profile_started)
+        self.profiler.profile_finished.connect(self.on_profile_finished)
+        self.metrics_server.add_action("/profile", self.request_profile)
+        
+        # Arayüz iş parçacığında eşikten uzun süren işleyiciler yığınıyla günlüğe yazılır
+        self.stall_detector = StallDetector(config.get("stall_threshold_ms", 250), parent=self)
+        
+        # Bileşenler yalnızca değişen ayarları uygular, izleme ve kuyruk yeniden başlatılmaz
+        config_service.subscribe(self.file_watcher.apply_config, WATCHER_CONFIG_KEYS)
+        config_service.subscribe(self.document_processor.apply_config)
+        config_service.subscribe(self.print_queue.apply_config)
+        config_service.subscribe(self.on_config_changed)
         
         # Dosya izleme ve yazdırma sinyallerini bağla
         self.file_watcher.file_detected.connect(self.on_file_detected)
         self.document_processor.print_started.connect(self.on_print_started)
         self.document_processor.print_completed.connect(self.on_print_completed)
         self.document_processor.print_error.connect(self.on_print_error)
+        self.document_processor.print_progress.connect(self.on_print_progress)
+        self.document_processor.print_submitted.connect(self.on_print_submitted)
+        self.document_processor.health.printer_status_changed.connect(self.on_printer_status_changed)
+        
+        # Otomatik yazdırmada kısa aralıkla gelen dosyalar kaynağa göre toplanıp birleştirilir
+        self.auto_batch = {}  # kaynak -> dosya yolları
+        self.auto_batch_timer = QTimer(self)
+        self.auto_batch_timer.setSingleShot(True)
+        self.auto_batch_timer.timeout.connect(self.flush_auto_batch)
         
         self.init_ui()
         self.load_printers()
         
+        # Yazdırma kuyruğunu ve yazıcı sağlık izleyicisini başlat
+        self.print_queue.start()
+        self.document_processor.health.start()
+        if config.get("metrics_port"):
+            self.metrics_server.start()
+        if config.get("stall_threshold_ms", 250) > 0:
+            self.stall_detector.start()
+        
         # Otomatik izlemeyi başlat
         if self.config.get("watch_folders"):
             self.file_watcher.start_watching()
@@ -91,7 +147,9 @@ class MainWindow(QMainWindow):
         content_splitter = QSplitter(Qt.Horizontal)
         
         # Dosya listesi
-        self.file_list_widget = FileListWidget(self.document_processor)
+        self.file_list_widget = FileListWidget(self.document_processor, self.preview_service)
+        self.file_list_widget.print_requested.connect(self.on_print_requested)
+        self.file_list_widget.resume_requested.connect(self.on_resume_requested)
         content_splitter.addWidget(self.file_list_widget)
         
         # Yazdırma ayarları ve geçmiş sekmesi
@@ -127,8 +185,54 @@ class MainWindow(QMainWindow):
         self.duplex_check.setChecked(self.config.get("default_duplex", False))
         printer_layout.addRow("", self.duplex_check)
         
+        # İş önceliği
+        self.priority_combo = QComboBox()
+        for priority, name in sorted(PRIORITY_NAMES.items()):
+            self.priority_combo.addItem(name, priority)
+        self.priority_combo.setCurrentIndex(self.priority_combo.findData(PRIORITY_NORMAL))
+        printer_layout.addRow("Öncelik:", self.priority_combo)
+        
         print_settings_layout.addWidget(printer_group)
         
+        # Sayfa düzeni (impozisyon) grubu
+        layout_group = QGroupBox("Sayfa Düzeni")
+        layout_form = QFormLayout(layout_group)
+        
+        # Sayfa aralığı
+        self.page_range_edit = QLineEdit()
+        self.page_range_edit.setPlaceholderText("Tümü (örn: 3-10, 12)")
+        layout_form.addRow("Sayfa Aralığı:", self.page_range_edit)
+        
+        # Kağıt başına sayfa (N-up)
+        self.pages_per_sheet_combo = QComboBox()
+        for pages_per_sheet in sorted(NUP_GRIDS):
+            self.pages_per_sheet_combo.addItem(str(pages_per_sheet), pages_per_sheet)
+        layout_form.addRow("Kağıt Başına Sayfa:", self.pages_per_sheet_combo)
+        
+        # Kitapçık ve sayfaya sığdır
+        self.booklet_check = QCheckBox("Kitapçık Olarak Yazdır")
+        layout_form.addRow("", self.booklet_check)
+        self.fit_to_page_check = QCheckBox("Sayfaya Sığdır")
+        layout_form.addRow("", self.fit_to_page_check)
+        self.contact_sheet_check = QCheckBox("Fotoğrafları Temas Sayfası Olarak Yazdır")
+        layout_form.addRow("", self.contact_sheet_check)
+        
+        # Sunumlar için slayt ya da not sayfası düzeni
+        self.handout_combo = QComboBox()
+        self.handout_combo.addItem("Slaytlar", 0)
+        for handout in sorted(HANDOUT_GRIDS):
+            self.handout_combo.addItem(f"Not Sayfası ({handout} slayt)", handout)
+        handout_index = self.handout_combo.findData(self.config.get("presentation_handout", 0))
+        self.handout_combo.setCurrentIndex(max(0, handout_index))
+        layout_form.addRow("Sunum Düzeni:", self.handout_combo)
+        
+        # Birleştirilerek basılan dosyaların arasına ayraç sayfası
+        self.separator_check = QCheckBox("Birleştirilen Dosyalar Arasına Ayraç Sayfası Koy")
+        self.separator_check.setChecked(self.config.get("merge_separator_pages", False))
+        layout_form.addRow("", self.separator_check)
+        
+        print_settings_layout.addWidget(layout_group)
+        
         # Yazdırma düğmeleri
         print_buttons_layout = QHBoxLayout()
         
@@ -138,6 +242,12 @@ class MainWindow(QMainWindow):
         print_selected_button.clicked.connect(self.print_selected_files)
         print_buttons_layout.addWidget(print_selected_button)
         
+        # Seçili dosyaları tek iş olarak birleştirip yazdır
+        merge_selected_button = QPushButton("Birleştirip Yazdır")
+        merge_selected_button.setIcon(QIcon(qta.icon('fa5s.layer-group', color='blue')))
+        merge_selected_button.clicked.connect(self.merge_selected_files)
+        print_buttons_layout.addWidget(merge_selected_button)
+        
         # Tüm dosyaları yazdır
         print_all_button = QPushButton("Tüm Dosyaları Yazdır")
         print_all_button.setIcon(QIcon(qta.icon('fa5s.print', color='green')))
@@ -147,11 +257,15 @@ class MainWindow(QMainWindow):
         print_settings_layout.addLayout(print_buttons_layout)
         print_settings_layout.addStretch()
         
+        # Yazdırma kuyruğu sekmesi
+        self.queue_widget = QueueWidget(self.print_queue, self.config)
+        
         # Yazdırma geçmişi sekmesi
         self.print_history_widget = PrintHistoryWidget(self.document_processor)
         
         # Sekmeleri ekle
         right_panel.addTab(print_settings_widget, "Yazdırma Ayarları")
+        right_panel.addTab(self.queue_widget, "Yazdırma Kuyruğu")
         right_panel.addTab(self.print_history_widget, "Yazdırma Geçmişi")
         
         content_splitter.addWidget(right_panel)
@@ -166,6 +280,12 @@ class MainWindow(QMainWindow):
         
         # Durum çubuğu
         self.statusBar().showMessage("MUKAprint hazır")
+        
+        # Gizli tanılama menüsü (Ctrl+Shift+F12)
+        diagnostics_action = QAction(self)
+        diagnostics_action.setShortcut(QKeySequence("Ctrl+Shift+F12"))
+        diagnostics_action.triggered.connect(self.show_diagnostics_menu)
+        self.addAction(diagnostics_action)
     
     def load_printers(self):
         """Sistemdeki yazıcıları yükler"""
@@ -176,13 +296,48 @@ class MainWindow(QMainWindow):
         default_index = 0
         
         for i, printer in enumerate(printers):
-            self.printer_combo.addItem(printer["name"])
+            # Görünen metin duruma göre değişir, yazıcı adı öğe verisinde tutulur
+            self.printer_combo.addItem(printer["name"], printer["name"])
+            self._update_printer_item(i, self.document_processor.health.get_status(printer["name"]))
             if printer["name"] == default_printer or printer["is_default"]:
                 default_index = i
         
         if self.printer_combo.count() > 0:
             self.printer_combo.setCurrentIndex(default_index)
     
+    def on_printer_status_changed(self, printer_name, status):
+        """Yazıcı sağlık durumu değiştiğinde listeyi günceller (izleyici GUI'yi bekletmez)"""
+        index = self.printer_combo.findData(printer_name)
+        if index >= 0:
+            self._update_printer_item(index, status)
+        if status.get("state") != HEALTH_OK and status.get("message"):
+            self.statusBar().showMessage(f"Yazıcı durumu: {printer_name} - {status['message']}")
+    
+    def _update_printer_item(self, index, status):
+        """Yazıcı listesindeki öğenin metnini, simgesini ve ipucunu duruma göre ayarlar"""
+        printer_name = self.printer_combo.itemData(index)
+        state = status.get("state", HEALTH_OK)
+        
+        if state == HEALTH_OK:
+            text, icon = printer_name, qta.icon('fa5s.print', color='green')
+        elif state == HEALTH_WARNING:
+            text, icon = f"{printer_name} (uyarı)", qta.icon('fa5s.exclamation-triangle', color='orange')
+        else:
+            text = f"{printer_name} ({status.get('message') or 'devre dışı'})"
+            icon = qta.icon('fa5s.times-circle', color='red')
+        
+        self.printer_combo.setItemText(index, text)
+        self.printer_combo.setItemIcon(index, icon)
+        if status:
+            tooltip = (
+                f"Durum: {BREAKER_STATE_NAMES[status['breaker']]}\n"
+                f"Kuyruktaki iş: {status['queue_depth']}\n"
+                f"Hata oranı: %{status['error_rate'] * 100:.0f}"
+            )
+            if status.get("message"):
+                tooltip += f"\n{status['message']}"
+            self.printer_combo.setItemData(index, tooltip, Qt.ToolTipRole)
+    
     def toggle_watching(self):
         """İzleme işlemini başlatır veya durdurur"""
         if self.file_watcher.observers:
@@ -216,42 +371,103 @@ class MainWindow(QMainWindow):
         
         if folder:
             # Son dizini kaydet
-            self.config["last_directory"] = folder
+            self.config_service.update({"last_directory": folder})
             
-            # Klasörü izleme listesine ekle
+            # Klasörü izleme listesine ekle; izleme aktifse yalnızca bu klasör için izleyici başlar
             watch_folders = self.config.get("watch_folders", [])
             if folder not in watch_folders:
-                watch_folders.append(folder)
-                self.config["watch_folders"] = watch_folders
-                
-                # İzleme aktifse yeniden başlat
-                if self.file_watcher.observers:
-                    self.file_watcher.start_watching()
-                
+                self.config_service.update({"watch_folders": watch_folders + [folder]})
+                self.config_service.save()
                 self.statusBar().showMessage(f"Klasör eklendi: {folder}")
     
     def show_settings(self):
         """Ayarlar penceresini gösterir"""
         dialog = SettingsDialog(self.config, self)
         if dialog.exec():
-            # Ayarlar değiştiyse yapılandırmayı güncelle
-            self.config = dialog.get_config()
-            
-            # İzleme aktifse yeniden başlat
-            if self.file_watcher.observers:
-                self.file_watcher.start_watching()
-            
+            # Değişen ayarlar bileşenlere farkıyla uygulanır ve hemen kaydedilir
+            self.config_service.update(dialog.get_config())
+            self.config_service.save()
+    
+    def on_config_changed(self, changes):
+        """Arayüzü etkileyen ayar değişikliklerini uygular"""
+        if "default_printer" in changes:
             # Yazıcı listesini güncelle
             self.load_printers()
+        if "trace_log_enabled" in changes:
+            tracer.trace_log.enabled = changes["trace_log_enabled"]
+        if "trace_log_mb" in changes:
+            tracer.trace_log.max_bytes = int(changes["trace_log_mb"] * 1024 * 1024)
+        if "traffic_recording" in changes:
+            recorder.traffic_log.enabled = changes["traffic_recording"]
+        if "stall_threshold_ms" in changes:
+            self.stall_detector.set_threshold(changes["stall_threshold_ms"])
+        if "default_pages_per_minute" in changes:
+            self.queue_widget.set_default_speed(changes["default_pages_per_minute"])
+        if "metrics_port" in changes:
+            # Port 0 ölçüm sunucusunu kapatır
+            self.metrics_server.stop()
+            self.metrics_server.port = changes["metrics_port"]
+            if changes["metrics_port"]:
+                self.metrics_server.start()
+        self.statusBar().showMessage(f"Ayarlar uygulandı ({len(changes)} değişiklik)")
+    
+    def show_diagnostics_menu(self):
+        """Profil çıkarma seçeneklerini içeren gizli menüyü imleç konumunda gösterir"""
+        menu = QMenu(self)
+        for seconds in (DEFAULT_SECONDS, 30, 60):
+            profile_action = menu.addAction(QIcon(qta.icon('fa5s.fire')), f"Profil Çıkar ({seconds} sn)")
+            profile_action.setEnabled(not self.profiler.running)
+            profile_action.triggered.connect(lambda checked=False, seconds=seconds: self.profiler.start(seconds))
+        
+        stop_action = menu.addAction(QIcon(qta.icon('fa5s.stop')), "Profili Şimdi Bitir")
+        stop_action.setEnabled(self.profiler.running)
+        stop_action.triggered.connect(self.profiler.stop)
+        
+        menu.addSeparator()
+        folder_action = menu.addAction(QIcon(qta.icon('fa5s.folder-open')), "Profil Klasörünü Aç")
+        folder_action.triggered.connect(
+            lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(self.profiler.output_dir))
+        )
+        menu.exec(QCursor.pos())
+    
+    def request_profile(self, params):
+        """Yerel kontrol uç noktasından gelen profil isteğini işler (sunucu iş parçacığında çağrılır)"""
+        seconds = float(params.get("seconds", DEFAULT_SECONDS))
+        if not self.profiler.request(seconds):
+            return "Profil zaten çıkarılıyor"
+        return f"Profil istendi: {seconds:g} sn, {PROFILE_DIR}"
+    
+    def on_profile_started(self, seconds):
+        """Profil başladığında çağrılır"""
+        self.statusBar().showMessage(f"Profil çıkarılıyor ({seconds:g} sn)...")
+    
+    def on_profile_finished(self, path):
+        """Profil dosyası yazıldığında çağrılır"""
+        self.statusBar().showMessage(f"Profil yazıldı: {path}")
     
     def on_file_detected(self, file_path):
         """Yeni dosya algılandığında çağrılır"""
         self.statusBar().showMessage(f"Yeni dosya algılandı: {os.path.basename(file_path)}")
         self.file_list_widget.add_file(file_path)
         
+        # Personel yazdır demeden önce boşta kalan zamanda PDF'e dönüştür
+        self.document_processor.prerenderer.enqueue(file_path)
+        
         # Otomatik yazdırma etkinse dosyayı yazdır
         if self.config.get("auto_print", False):
-            self.print_document(file_path)
+            merge_window = self.config.get("merge_window_seconds", 0)
+            if merge_window > 0:
+                # Aynı kaynaktan art arda gelen dosyalar pencere kapanınca tek işte basılır
+                self.auto_batch.setdefault(self._get_file_source(file_path), []).append(file_path)
+                self.auto_batch_timer.start(int(merge_window * 1000))
+            else:
+                self.print_document(file_path)
+    
+    def flush_auto_batch(self):
+        """Birleştirme penceresinde toplanan dosyaları kaynak başına tek iş olarak yazdırır"""
+        batches, self.auto_batch = self.auto_batch, {}
+        for file_paths in batches.values():
+            self.print_files(file_paths, merge=True)
     
     def print_selected_files(self):
         """Seçili dosyaları yazdırır"""
@@ -260,8 +476,19 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Bilgi", "Lütfen yazdırılacak dosyaları seçin.")
             return
         
-        for file_path in selected_files:
-            self.print_document(file_path)
+        if not self._validate_page_range():
+            return
+        
+        self.print_files(selected_files)
+    
+    def merge_selected_files(self):
+        """Seçili dosyaları tek biriktirici işinde birleştirerek yazdırır"""
+        selected_files = self.file_list_widget.get_selected_files()
+        if len(selected_files) < 2:
+            QMessageBox.information(self, "Bilgi", "Lütfen birleştirilecek en az iki dosya seçin.")
+            return
+        
+        self.print_files(selected_files, merge=True)
     
     def print_all_files(self):
         """Listedeki tüm dosyaları yazdırır"""
@@ -270,26 +497,134 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Bilgi", "Yazdırılacak dosya bulunamadı.")
             return
         
-        for file_path in all_files:
+        if not self._validate_page_range():
+            return
+        
+        self.print_files(all_files)
+    
+    def on_print_requested(self, file_paths):
+        """Dosya listesinden yazdırma istendiğinde çağrılır"""
+        if not self._validate_page_range():
+            return
+        
+        self.print_files(file_paths)
+    
+    def on_resume_requested(self, file_paths):
+        """Yarım kalan yazdırmaları kaldıkları sayfadan kuyruğa ekler"""
+        for file_path in file_paths:
+            resume_point = self.document_processor.take_resumable(file_path)
+            if not resume_point:
+                continue
+            self.print_queue.submit(
+                file_path, resume_point["printer_name"], self.paper_size_combo.currentText(),
+                resume_point["copies"], self.duplex_check.isChecked(),
+                priority=self.priority_combo.currentData(), source=self._get_file_source(file_path),
+                start_page=resume_point["page"], start_copy=resume_point["copy"],
+                **resume_point.get("options", {})
+            )
+            self.statusBar().showMessage(
+                f"Sayfa {resume_point['page'] + 1}'den devam edilecek: {os.path.basename(file_path)}"
+            )
+    
+    def print_files(self, file_paths, merge=False):
+        """Dosyaları kuyruğa ekler; birden çok fotoğraf ya da merge ile tüm dosyalar tek iş olarak basılır"""
+        if merge and len(file_paths) > 1:
+            self.print_document(
+                file_paths[0], merge_batch=file_paths[1:], separator_pages=self.separator_check.isChecked()
+            )
+            return
+        
+        images = [path for path in file_paths if os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS]
+        if len(images) > 1:
+            contact_sheet = self.contact_sheet_check.isChecked()
+            grid = tuple(self.config.get("contact_sheet_grid", CONTACT_SHEET_GRID))
+            self.print_document(
+                images[0], image_batch=images[1:], contact_sheet=contact_sheet,
+                page_count=image_page_count(len(images), contact_sheet, grid)
+            )
+            file_paths = [path for path in file_paths if path not in images]
+        
+        for file_path in file_paths:
             self.print_document(file_path)
     
-    def print_document(self, file_path):
-        """Belgeyi yazdırır"""
-        printer_name = self.printer_combo.currentText()
+    def print_document(self, file_path, **options):
+        """Belgeyi yazdırma kuyruğuna ekler"""
+        printer_name = self.printer_combo.currentData() or self.printer_combo.currentText()
         paper_size = self.paper_size_combo.currentText()
         copies = self.copies_spin.value()
         duplex = self.duplex_check.isChecked()
+        priority = self.priority_combo.currentData()
         
-        # Yazdırma işlemini başlat
-        self.document_processor.print_document(
-            file_path, printer_name, paper_size, copies, duplex
+        # İşi kuyruğa ekle, zamanlayıcı sırasını belirler
+        self.print_queue.submit(
+            file_path, printer_name, paper_size, copies, duplex,
+            priority=priority, source=self._get_file_source(file_path),
+            **self._get_layout_options(), **options
+        )
+        self.statusBar().showMessage(
+            f"Kuyruğa eklendi: {os.path.basename(file_path)} "
+            f"({len(self.print_queue.pending_jobs())} iş bekliyor)"
         )
     
+    def _get_layout_options(self):
+        """Sayfa düzeni ayarlarını print_document seçenekleri olarak döndürür"""
+        return {
+            "page_range": self.page_range_edit.text().strip() or None,
+            "pages_per_sheet": self.pages_per_sheet_combo.currentData(),
+            "booklet": self.booklet_check.isChecked(),
+            "fit_to_page": self.fit_to_page_check.isChecked(),
+            "handout": self.handout_combo.currentData()
+        }
+    
+    def _validate_page_range(self):
+        """Girilen sayfa aralığının sözdizimini denetler"""
+        try:
+            parse_page_range(self.page_range_edit.text())
+            return True
+        except ValueError as e:
+            QMessageBox.warning(self, "Geçersiz Sayfa Aralığı", str(e))
+            return False
+    
+    def _get_file_source(self, file_path):
+        """Dosyanın geldiği kaynağı (adil paylaşım için) döndürür"""
+        normalized = os.path.normcase(os.path.abspath(file_path))
+        for folder in self.config.get("watch_folders", []):
+            root = os.path.normcase(os.path.abspath(folder))
+            if normalized.startswith(root + os.sep):
+                # Gönderen bazlı alt klasörler varsa her birini ayrı kaynak say
+                parts = os.path.relpath(normalized, root).split(os.sep)
+                if len(parts) > 1:
+                    return os.path.join(folder, parts[0])
+                return folder
+        return os.path.dirname(file_path)
+    
     def on_print_started(self, file_path, printer_name):
         """Yazdırma başladığında çağrılır"""
         self.statusBar().showMessage(f"Yazdırılıyor: {os.path.basename(file_path)}")
         self.file_list_widget.mark_file_printing(file_path)
     
+    def on_job_state_changed(self, job_id, state):
+        """Kuyruktaki bir işin durumu değiştiğinde çağrılır"""
+        job = self.print_queue.get_job(job_id)
+        if job is None:
+            return
+        if state == JOB_QUEUED and job.attempts > 0:
+            self.statusBar().showMessage(
+                f"Yeniden denenecek ({job.attempts}. deneme başarısız): {os.path.basename(job.file_path)}"
+            )
+        else:
+            self.statusBar().showMessage(f"{JOB_STATE_NAMES[state]}: {os.path.basename(job.file_path)}")
+    
+    def on_print_progress(self, file_path, sent_pages, total_pages):
+        """Büyük belgelerin parça parça gönderimi sırasında çağrılır"""
+        self.statusBar().showMessage(
+            f"Yazdırılıyor: {os.path.basename(file_path)} ({sent_pages}/{total_pages} sayfa gönderildi)"
+        )
+    
+    def on_print_submitted(self, file_path, printer_name):
+        """Belge biriktiriciye teslim edildiğinde çağrılır (yazıcı henüz basmadı)"""
+        self.statusBar().showMessage(f"Yazıcı kuyruğuna gönderildi: {os.path.basename(file_path)} ({printer_name})")
+    
     def on_print_completed(self, file_path, success):
         """Yazdırma tamamlandığında çağrılır"""
         if success:
@@ -304,6 +639,20 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(f"Yazdırma hatası: {os.path.basename(file_path)}")
         self.file_list_widget.mark_file_printed(file_path, False)
         
+    def closeEvent(self, event):
+        """Pencere kapanırken izlemeyi ve yazdırma kuyruğunu durdurur"""
+        self.file_watcher.stop_watching()
+        self.auto_batch_timer.stop()
+        self.print_queue.stop(wait=False)
+        self.document_processor.shutdown()
+        self.preview_service.stop()
+        self.metrics_server.stop()
+        self.profiler.stop()
+        self.stall_detector.stop()
+        tracer.trace_log.close()
+        recorder.close()
+        super().closeEvent(event)
+        
     def get_config(self):
         """Güncellenmiş yapılandırmayı döndürür"""
         return self.config
\ No newline at end of file
@@ -26,6 +26,7 @@ class PrintHistoryWidget(QWidget):
         
         # Yazdırma tamamlandı sinyalini bağla
         self.document_processor.print_completed.connect(self.on_print_completed)
+        self.document_processor.print_submitted.connect(self.on_print_completed)
     
     def init_ui(self):
         """Kullanıcı arayüzünü oluşturur"""
@@ -93,11 +94,21 @@ class PrintHistoryWidget(QWidget):
         time_item = QTableWidgetItem(item["timestamp"])
         self.table_widget.setItem(row, 2, time_item)
         
-        # Durum
-        status_text = "Başarılı" if item["success"] else "Hata"
+        # Durum (None: iş henüz yazıcı kuyruğunda; hatasız ama açıklamalı: sonuç doğrulanamadı)
+        if item["success"] is None:
+            status_text = "Yazdırılıyor"
+        elif item["success"] and "error" in item:
+            status_text = "Gönderildi"
+        else:
+            status_text = "Başarılı" if item["success"] else "Hata"
         status_item = QTableWidgetItem(status_text)
         
-        if item["success"]:
+        if item["success"] is None:
+            status_item.setForeground(QBrush(QColor("orange")))
+        elif item["success"] and "error" in item:
+            status_item.setForeground(QBrush(QColor("gray")))
+            status_item.setToolTip(item["error"])
+        elif item["success"]:
             status_item.setForeground(QBrush(QColor("green")))
         else:
             status_item.setForeground(QBrush(QColor("red")))
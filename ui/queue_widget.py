@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Yazdırma kuyruğu panosu widget modülü
+"""
+
+import os
+import time
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+    QLabel, QPushButton, QHBoxLayout, QHeaderView, QAbstractItemView, QMessageBox
+)
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QIcon, QFont, QColor
+import qtawesome as qta
+
+from print_queue import PRIORITY_NAMES, JOB_QUEUED, JOB_STATE_NAMES
+
+
+# Pano en fazla bu aralıkla yeniden çizilir; aradaki kuyruk olayları tek güncellemede toplanır (ms)
+REFRESH_INTERVAL_MS = 1000
+
+# Kuyrukta değişiklik olmasa da tahmini bitiş sürelerinin yenilenme aralığı (saniye)
+ETA_REFRESH_SECONDS = 10
+
+# Hızı henüz ölçülmemiş yazıcı için varsayılan sayfa/dakika
+DEFAULT_PAGES_PER_MINUTE = 20
+
+
+def estimate_finish_times(snapshot, now, default_speed=DEFAULT_PAGES_PER_MINUTE):
+    """Her işin tahmini bitiş zamanını ve yazıcıların boşalacağı zamanı döndürür
+    
+    Yazıcıdaki işler başladıkları sırayla, bekleyen işler zamanlayıcının tahmini sırasıyla
+    ölçülen yazıcı hızına göre art arda dizilir.
+    """
+    finish_times = {}  # iş_kimliği -> tahmini bitiş
+    busy_until = {}  # yazıcı -> boşalacağı zaman
+    for printer_name, job in snapshot["running"] + snapshot["pending"]:
+        speed = snapshot["speeds"].get(printer_name) or default_speed
+        duration = job.cost * 60.0 / speed
+        if printer_name in busy_until:
+            start = busy_until[printer_name]
+        elif job.state != JOB_QUEUED and job.started_at:
+            start = job.started_at
+        else:
+            start = now
+        # Süresi aşılmış iş her an bitebilir
+        finish = max(now, start + duration)
+        finish_times[job.job_id] = finish
+        busy_until[printer_name] = finish
+    return finish_times, busy_until
+
+
+def _format_eta(finish, now):
+    """Tahmini bitişi saat ve kalan dakika olarak biçimlendirir"""
+    minutes = int((finish - now) // 60)
+    remaining = "< 1 dk" if minutes < 1 else f"~{minutes} dk"
+    return f"{time.strftime('%H:%M', time.localtime(finish))} ({remaining})"
+
+
+class QueueWidget(QWidget):
+    """Yazıcı başına bekleyen ve yürütülen işleri, yazıcı hızını ve tahmini bitişleri gösteren pano"""
+    
+    def __init__(self, print_queue, config):
+        super().__init__()
+        self.print_queue = print_queue
+        self.default_speed = config.get("default_pages_per_minute", DEFAULT_PAGES_PER_MINUTE)
+        self._dirty = True
+        self._last_refresh = 0.0
+        self.init_ui()
+        
+        # Kuyruk olayları yalnızca panoyu kirli işaretler; çizim zamanlayıcıda toplu yapılır
+        self.print_queue.job_queued.connect(self.mark_dirty)
+        self.print_queue.job_state_changed.connect(self.mark_dirty)
+        self.print_queue.job_updated.connect(self.mark_dirty)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_if_needed)
+        self.refresh_timer.start(REFRESH_INTERVAL_MS)
+    
+    def init_ui(self):
+        """Kullanıcı arayüzünü oluşturur"""
+        layout = QVBoxLayout(self)
+        
+        # Başlık
+        title_layout = QHBoxLayout()
+        title_label = QLabel("Yazdırma Kuyruğu")
+        title_label.setFont(QFont("Arial", 12, QFont.Bold))
+        title_layout.addWidget(title_label)
+        title_layout.addStretch()
+        layout.addLayout(title_layout)
+        
+        # Yazıcı özetleri
+        self.printer_table = QTableWidget()
+        self.printer_table.setColumnCount(5)
+        self.printer_table.setHorizontalHeaderLabels(["Yazıcı", "Bekleyen", "Yürütülen", "Sayfa/dk", "Boşalma"])
+        self.printer_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, 5):
+            self.printer_table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        self.printer_table.verticalHeader().setVisible(False)
+        self.printer_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.printer_table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.printer_table.setMaximumHeight(120)
+        layout.addWidget(self.printer_table)
+        
+        # İş tablosu
+        self.job_table = QTableWidget()
+        self.job_table.setColumnCount(6)
+        self.job_table.setHorizontalHeaderLabels(
+            ["Dosya Adı", "Yazıcı", "Durum", "Öncelik", "Sayfa", "Tahmini Bitiş"]
+        )
+        self.job_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, 6):
+            self.job_table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        self.job_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.job_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.job_table.itemSelectionChanged.connect(self.update_buttons)
+        layout.addWidget(self.job_table)
+        
+        # Sıra değiştirme ve iptal düğmeleri
+        buttons_layout = QHBoxLayout()
+        
+        self.raise_button = QPushButton("Öne Al")
+        self.raise_button.setIcon(QIcon(qta.icon('fa5s.arrow-up', color='green')))
+        self.raise_button.setToolTip("Seçili işlerin önceliğini bir kademe artırır")
+        self.raise_button.clicked.connect(lambda: self.change_priority(1))
+        buttons_layout.addWidget(self.raise_button)
+        
+        self.lower_button = QPushButton("Geri Al")
+        self.lower_button.setIcon(QIcon(qta.icon('fa5s.arrow-down', color='gray')))
+        self.lower_button.setToolTip("Seçili işlerin önceliğini bir kademe düşürür")
+        self.lower_button.clicked.connect(lambda: self.change_priority(-1))
+        buttons_layout.addWidget(self.lower_button)
+        
+        self.cancel_button = QPushButton("İptal Et")
+        self.cancel_button.setIcon(QIcon(qta.icon('fa5s.times', color='red')))
+        self.cancel_button.clicked.connect(self.cancel_selected)
+        buttons_layout.addWidget(self.cancel_button)
+        
+        buttons_layout.addStretch()
+        layout.addLayout(buttons_layout)
+        
+        # Durum etiketi
+        self.status_label = QLabel("Kuyruk boş")
+        layout.addWidget(self.status_label)
+        
+        self.update_buttons()
+    
+    def mark_dirty(self, *args):
+        """Kuyruk değiştiğinde çağrılır; pano bir sonraki zamanlayıcı turunda yenilenir"""
+        self._dirty = True
+    
+    def set_default_speed(self, pages_per_minute):
+        """Hızı ölçülmemiş yazıcılar için kullanılan sayfa/dakikayı değiştirir"""
+        self.default_speed = pages_per_minute
+        self._dirty = True
+    
+    def showEvent(self, event):
+        """Sekme görünür olduğunda panoyu hemen günceller"""
+        super().showEvent(event)
+        self.refresh()
+    
+    def refresh_if_needed(self):
+        """Kuyruk değiştiyse ya da tahminler eskidiyse panoyu yeniler; sekme gizliyken çizim yapılmaz"""
+        if not self.isVisible():
+            return
+        if self._dirty or (self.job_table.rowCount() and time.time() - self._last_refresh >= ETA_REFRESH_SECONDS):
+            self.refresh()
+    
+    def refresh(self):
+        """Kuyruğun anlık görüntüsünü alıp tabloları yeniden doldurur"""
+        self._dirty = False
+        now = time.time()
+        self._last_refresh = now
+        snapshot = self.print_queue.snapshot()
+        finish_times, busy_until = estimate_finish_times(snapshot, now, self.default_speed)
+        rows = snapshot["running"] + snapshot["pending"]
+        selected = set(self.get_selected_jobs())
+        
+        self.job_table.setUpdatesEnabled(False)
+        self.job_table.blockSignals(True)
+        try:
+            self.job_table.clearSelection()
+            self.job_table.setRowCount(len(rows))
+            for row, (printer_name, job) in enumerate(rows):
+                pages = job.page_count * max(1, job.copies or 1) if job.page_count else None
+                values = [
+                    os.path.basename(job.file_path),
+                    printer_name or "",
+                    JOB_STATE_NAMES.get(job.state, job.state),
+                    PRIORITY_NAMES.get(job.priority, str(job.priority)),
+                    str(pages) if pages else "?",
+                    _format_eta(finish_times[job.job_id], now)
+                ]
+                for column, value in enumerate(values):
+                    item = self.job_table.item(row, column)
+                    if item is None:
+                        item = QTableWidgetItem()
+                        self.job_table.setItem(row, column, item)
+                    item.setText(value)
+                    item.setData(Qt.UserRole, job.job_id)
+                    # Yürütülen işler kalın, tekrar deneme bekleyenler turuncu gösterilir
+                    font = item.font()
+                    font.setBold(job.state != JOB_QUEUED)
+                    item.setFont(font)
+                    item.setForeground(QColor("orange") if job.attempts and job.state == JOB_QUEUED else QColor())
+                if job.job_id in selected:
+                    self.job_table.selectRow(row)
+        finally:
+            self.job_table.blockSignals(False)
+            self.job_table.setUpdatesEnabled(True)
+        
+        self._refresh_printers(snapshot, busy_until, now)
+        pending = len(snapshot["pending"])
+        running = len(snapshot["running"])
+        if rows:
+            self.status_label.setText(f"{pending} iş bekliyor, {running} iş yürütülüyor")
+        else:
+            self.status_label.setText("Kuyruk boş")
+        self.update_buttons()
+    
+    def _refresh_printers(self, snapshot, busy_until, now):
+        """Yazıcı başına bekleyen/yürütülen iş sayısını, hızı ve boşalma zamanını gösterir"""
+        printers = {}
+        for key in ("running", "pending"):
+            for printer_name, _ in snapshot[key]:
+                counts = printers.setdefault(printer_name, {"running": 0, "pending": 0})
+                counts[key] += 1
+        for printer_name in snapshot["speeds"]:
+            printers.setdefault(printer_name, {"running": 0, "pending": 0})
+        
+        self.printer_table.setRowCount(len(printers))
+        for row, printer_name in enumerate(sorted(printers, key=str)):
+            speed = snapshot["speeds"].get(printer_name)
+            values = [
+                printer_name or "",
+                str(printers[printer_name]["pending"]),
+                str(printers[printer_name]["running"]),
+                f"{speed:.1f}" if speed else f"{self.default_speed} (varsayılan)",
+                _format_eta(busy_until[printer_name], now) if printer_name in busy_until else "Boşta"
+            ]
+            for column, value in enumerate(values):
+                self.printer_table.setItem(row, column, QTableWidgetItem(value))
+    
+    def get_selected_jobs(self):
+        """Seçili satırların iş kimliklerini döndürür"""
+        job_ids = []
+        for index in self.job_table.selectionModel().selectedRows():
+            item = self.job_table.item(index.row(), 0)
+            if item is not None:
+                job_ids.append(item.data(Qt.UserRole))
+        return job_ids
+    
+    def _selected_pending_jobs(self):
+        """Seçili işlerden henüz başlamamış olanları döndürür"""
+        jobs = [self.print_queue.get_job(job_id) for job_id in self.get_selected_jobs()]
+        return [job for job in jobs if job is not None and job.state == JOB_QUEUED]
+    
+    def update_buttons(self):
+        """Düğmeleri yalnızca bekleyen iş seçiliyken etkinleştirir"""
+        has_pending = bool(self._selected_pending_jobs())
+        self.raise_button.setEnabled(has_pending)
+        self.lower_button.setEnabled(has_pending)
+        self.cancel_button.setEnabled(has_pending)
+    
+    def change_priority(self, step):
+        """Seçili bekleyen işlerin önceliğini değiştirir; zamanlayıcı sırayı buna göre yeniden kurar"""
+        for job in self._selected_pending_jobs():
+            self.print_queue.set_priority(job.job_id, job.priority + step)
+        self.refresh()
+    
+    def cancel_selected(self):
+        """Seçili bekleyen işleri onay alarak iptal eder"""
+        jobs = self._selected_pending_jobs()
+        if not jobs:
+            return
+        names = "\n".join(os.path.basename(job.file_path) for job in jobs[:10])
+        answer = QMessageBox.question(self, "İşleri İptal Et", f"{len(jobs)} iş iptal edilsin mi?\n\n{names}")
+        if answer != QMessageBox.Yes:
+            return
+        for job in jobs:
+            self.print_queue.cancel(job.job_id)
+        self.refresh()
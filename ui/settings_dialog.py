@@ -69,6 +69,10 @@ class SettingsDialog(QDialog):
         self.auto_print_check = QCheckBox("Yeni dosyaları otomatik yazdır")
         general_layout.addWidget(self.auto_print_check)
         
+        # Önceden hazırlama seçeneği
+        self.prerender_check = QCheckBox("Yeni ofis belgelerini boşta kalan zamanda yazdırmaya hazırla")
+        general_layout.addWidget(self.prerender_check)
+        
         # Yazdırma ayarları sekmesi
         print_tab = QWidget()
         print_layout = QVBoxLayout(print_tab)
@@ -155,6 +159,9 @@ class SettingsDialog(QDialog):
         # Otomatik yazdırma
         self.auto_print_check.setChecked(self.config.get("auto_print", False))
         
+        # Önceden hazırlama
+        self.prerender_check.setChecked(self.config.get("prerender_enabled", False))
+        
         # Varsayılan yazıcı
         default_printer = self.config.get("default_printer", "")
         if default_printer and self.default_printer_combo.findText(default_printer) >= 0:
@@ -270,6 +277,9 @@ class SettingsDialog(QDialog):
         # Otomatik yazdırma ayarını güncelle
         self.config["auto_print"] = self.auto_print_check.isChecked()
         
+        # Önceden hazırlama ayarını güncelle
+        self.config["prerender_enabled"] = self.prerender_check.isChecked()
+        
         # Varsayılan yazıcı ayarını güncelle
         self.config["default_printer"] = self.default_printer_combo.currentText()
         
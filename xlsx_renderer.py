@@ -0,0 +1,413 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MUKAprint - Otomatik Yazdırma Hizmeti
+Excel çalışma kitaplarını yazdırma alanı ve sayfa sonlarına uyarak sayfalara dizen modül
+"""
+
+import re
+import logging
+import zipfile
+import datetime
+import posixpath
+from xml.etree.ElementTree import iterparse
+from PIL import Image, ImageDraw
+from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string
+
+from raster_pdf import page_pixels
+from text_renderer import GlyphCache, load_font
+
+
+logger = logging.getLogger(__name__)
+
+
+# Excel olmadan yazdırılabilen çalışma kitabı türleri
+XLSX_EXTENSIONS = [".xlsx", ".xlsm"]
+
+# SpreadsheetML ad alanları
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Hücre yazıları için denenen yazı tipleri (Windows, ardından Linux)
+CELL_FONTS = ["calibri.ttf", "arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"]
+
+# Excel varsayılanları: sütun genişliği (karakter), satır yüksekliği (nokta), kenar boşlukları (inç)
+DEFAULT_COLUMN_WIDTH = 8.43
+DEFAULT_ROW_HEIGHT = 15.0
+DEFAULT_MARGINS = {"left": 0.7, "right": 0.7, "top": 0.75, "bottom": 0.75}
+
+# Hücre içi yatay boşluk (1/96 inç piksel)
+CELL_PADDING = 2
+
+# "$A$1:$F$40" biçimindeki hücre aralığı (sayfa öneki ayrıldıktan sonra)
+RANGE_PATTERN = re.compile(r"\$?([A-Z]{1,3})\$?(\d+)(?::\$?([A-Z]{1,3})\$?(\d+))?")
+CELL_PATTERN = re.compile(r"([A-Z]{1,3})(\d+)")
+
+
+def _split_areas(text):
+    """Virgülle ayrılmış yazdırma alanlarını ayırır; tırnaklı sayfa adlarındaki virgüller bölmez"""
+    areas, current, quoted = [], [], False
+    for char in text or "":
+        if char == "'":
+            # Sayfa adındaki '' kaçışı tırnağı iki kez çevirir, sonuç değişmez
+            quoted = not quoted
+        elif char == "," and not quoted:
+            areas.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    areas.append("".join(current).strip())
+    return [area for area in areas if area]
+
+
+def _parse_range(text):
+    """Hücre aralığını (ilk_sütun, ilk_satır, son_sütun, son_satır) olarak döndürür, anlaşılmazsa None
+    
+    "'Q1'!$B$2:$D$50" gibi sayfa önekli metinlerde önek atılır; adı hücre
+    başvurusuna benzeyen sayfalar aralık sanılmasın diye metnin tamamı eşleşmelidir.
+    """
+    match = RANGE_PATTERN.fullmatch((text or "").rpartition("!")[2].strip())
+    if not match:
+        return None
+    first_col, first_row = column_index_from_string(match.group(1)), int(match.group(2))
+    if match.group(3):
+        last_col, last_row = column_index_from_string(match.group(3)), int(match.group(4))
+    else:
+        last_col, last_row = first_col, first_row
+    return first_col, first_row, last_col, last_row
+
+
+def _read_workbook(package):
+    """Sayfa adlarını, XML yollarını, gizlilik durumlarını ve yazdırma alanlarını okur"""
+    targets = {}
+    with package.open("xl/_rels/workbook.xml.rels") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == PACKAGE_REL_NS + "Relationship":
+                target = elem.get("Target")
+                if target.startswith("/"):
+                    target = target.lstrip("/")
+                else:
+                    target = posixpath.normpath(posixpath.join("xl", target))
+                targets[elem.get("Id")] = target
+    
+    sheets = []
+    print_areas = {}  # sayfa sırası -> aralık metinleri
+    with package.open("xl/workbook.xml") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == MAIN_NS + "sheet":
+                sheets.append({
+                    "name": elem.get("name"),
+                    "path": targets.get(elem.get(REL_NS + "id")),
+                    "hidden": elem.get("state", "visible") != "visible"
+                })
+            elif elem.tag == MAIN_NS + "definedName" and elem.get("name") == "_xlnm.Print_Area":
+                if elem.get("localSheetId") is not None:
+                    print_areas[int(elem.get("localSheetId"))] = _split_areas(elem.text)
+    return sheets, print_areas
+
+
+def _read_sheet_layout(package, sheet_path):
+    """Sayfa XML'ini akış halinde tarayarak sütun genişliklerini, sayfa sonlarını ve sayfa yapısını okur
+    
+    Hücre değerleri burada tutulmaz; satırlar okundukça bırakılır, böylece büyük
+    sayfalarda da bellek kullanımı sabit kalır.
+    """
+    layout = {
+        "column_widths": {},  # sütun -> genişlik (karakter), gizliyse 0
+        "default_width": DEFAULT_COLUMN_WIDTH,
+        "default_height": DEFAULT_ROW_HEIGHT,
+        "hidden_rows": set(),
+        "row_breaks": set(),  # bu satırdan sonra yeni sayfa
+        "col_breaks": set(),  # bu sütundan sonra yeni sayfa
+        "max_row": 0,
+        "max_col": 0,
+        "margins": dict(DEFAULT_MARGINS),
+        "landscape": False,
+        "fit_to_page": False,
+        "fit_width": 1,
+        "fit_height": 1,
+        "scale": 100,
+        "gridlines": False
+    }
+    with package.open(sheet_path) as f:
+        for _, elem in iterparse(f):
+            tag = elem.tag[len(MAIN_NS):] if elem.tag.startswith(MAIN_NS) else elem.tag
+            if tag in ("c", "v", "f", "is", "t"):
+                # Hücre içerikleri satırla birlikte bırakılır
+                continue
+            if tag == "row":
+                row = int(elem.get("r", layout["max_row"] + 1))
+                if len(elem):
+                    layout["max_row"] = row
+                    match = CELL_PATTERN.match(elem[-1].get("r") or "")
+                    if match:
+                        layout["max_col"] = max(layout["max_col"], column_index_from_string(match.group(1)))
+                if elem.get("hidden") in ("1", "true"):
+                    layout["hidden_rows"].add(row)
+                # Okunan satırın hücreleri bırakılır
+                elem.clear()
+            elif tag == "col":
+                width = 0 if elem.get("hidden") in ("1", "true") else float(elem.get("width", DEFAULT_COLUMN_WIDTH))
+                for column in range(int(elem.get("min")), min(int(elem.get("max")), 16384) + 1):
+                    layout["column_widths"][column] = width
+            elif tag == "sheetFormatPr":
+                layout["default_width"] = float(elem.get("defaultColWidth") or
+                                                float(elem.get("baseColWidth", 8)) + 0.43)
+                layout["default_height"] = float(elem.get("defaultRowHeight", DEFAULT_ROW_HEIGHT))
+            elif tag == "pageSetUpPr":
+                layout["fit_to_page"] = elem.get("fitToPage") in ("1", "true")
+            elif tag == "pageMargins":
+                for side in DEFAULT_MARGINS:
+                    layout["margins"][side] = float(elem.get(side, DEFAULT_MARGINS[side]))
+            elif tag == "pageSetup":
+                layout["landscape"] = elem.get("orientation") == "landscape"
+                layout["fit_width"] = int(elem.get("fitToWidth", 1))
+                layout["fit_height"] = int(elem.get("fitToHeight", 1))
+                layout["scale"] = int(elem.get("scale", 100))
+            elif tag == "printOptions":
+                layout["gridlines"] = elem.get("gridLines") in ("1", "true")
+            elif tag in ("rowBreaks", "colBreaks"):
+                breaks = layout["row_breaks"] if tag == "rowBreaks" else layout["col_breaks"]
+                for brk in elem:
+                    if int(brk.get("id", 0)) > 0:
+                        breaks.add(int(brk.get("id")))
+    return layout
+
+
+def read_workbook_layout(file_path):
+    """Görünen her sayfanın adını, basılacak hücre aralığını ve sayfa yapısını döndürür
+    
+    Birden çok yazdırma alanı olan sayfalar için (Excel'deki gibi her alan yeni
+    kağıttan başlasın diye) alan başına ayrı bir düzen döndürülür.
+    """
+    layouts = []
+    with zipfile.ZipFile(file_path) as package:
+        sheets, print_areas = _read_workbook(package)
+        for index, sheet in enumerate(sheets):
+            if sheet["hidden"] or not sheet["path"]:
+                continue
+            layout = _read_sheet_layout(package, sheet["path"])
+            layout["name"] = sheet["name"]
+            areas = []
+            for text in print_areas.get(index, []):
+                area = _parse_range(text)
+                if area is None:
+                    logger.warning("%s: '%s' sayfasındaki yazdırma alanı anlaşılamadı, atlandı: %s",
+                                   file_path, sheet["name"], text)
+                else:
+                    areas.append(area)
+            if not areas:
+                if layout["max_row"] == 0:
+                    # Boş sayfa basılmaz
+                    continue
+                # Yazdırma alanı yoksa kullanılan aralık basılır
+                areas.append((1, 1, layout["max_col"], layout["max_row"]))
+            for area in areas:
+                layouts.append(dict(layout, area=area))
+    return layouts
+
+
+def format_value(value):
+    """Hücre değerini sayfada görüneceği metne çevirir"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "DOĞRU" if value else "YANLIŞ"
+    if isinstance(value, datetime.datetime):
+        if value.time() == datetime.time(0):
+            return value.strftime("%d.%m.%Y")
+        return value.strftime("%d.%m.%Y %H:%M")
+    if isinstance(value, datetime.date):
+        return value.strftime("%d.%m.%Y")
+    if isinstance(value, datetime.time):
+        return value.strftime("%H:%M")
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return f"{value:.10g}".replace(".", ",")
+    return str(value)
+
+
+class SheetPager:
+    """Bir sayfanın basılacak aralığını kağıtlara bölen ve kağıtları sırayla çizen sınıf"""
+    
+    def __init__(self, layout, paper_size="A4", dpi=300, font_name=None, font_size=10, gridlines=True):
+        self.layout = layout
+        self.dpi = dpi
+        self.gridlines = gridlines or layout["gridlines"]
+        self.page_size = page_pixels(paper_size, dpi, layout["landscape"])
+        margins = layout["margins"]
+        self.origin = (round(margins["left"] * dpi), round(margins["top"] * dpi))
+        printable_width = self.page_size[0] - round((margins["left"] + margins["right"]) * dpi)
+        printable_height = self.page_size[1] - round((margins["top"] + margins["bottom"]) * dpi)
+        
+        first_col, first_row, last_col, last_row = layout["area"]
+        self.columns = [column for column in range(first_col, last_col + 1) if self._column_width(column) > 0]
+        self.rows = (first_row, last_row)
+        visible_rows = last_row - first_row + 1 - sum(
+            1 for row in layout["hidden_rows"] if first_row <= row <= last_row
+        )
+        
+        # Ölçek: sayfaya sığdırma (genişlik/yükseklik sayfa sayısı) ya da yüzde ölçek
+        natural_width = sum(self._column_pixels(column, 1.0) for column in self.columns)
+        natural_height = visible_rows * self._row_pixels(1.0)
+        if layout["fit_to_page"]:
+            scale = 1.0
+            if layout["fit_width"] > 0 and natural_width > 0:
+                scale = min(scale, layout["fit_width"] * printable_width / natural_width)
+            if layout["fit_height"] > 0 and natural_height > 0:
+                scale = min(scale, layout["fit_height"] * printable_height / natural_height)
+        else:
+            scale = layout["scale"] / 100.0
+        self.scale = max(0.1, scale)
+        
+        # Aşağı yuvarlanır ki sığdırılan sütunların toplamı kağıdı aşmasın
+        self.row_height = max(1, int(self._row_pixels(self.scale)))
+        self.widths = {column: max(1, int(self._column_pixels(column, self.scale))) for column in self.columns}
+        self.bands = self._split_columns(printable_width)
+        self.row_pages = self._split_rows(printable_height)
+        
+        font = load_font(font_name, max(1, round(font_size * dpi / 72.0 * self.scale)), CELL_FONTS)
+        self.glyphs = GlyphCache(font, self.row_height)
+        self.padding = max(1, round(CELL_PADDING * dpi / 96.0 * self.scale))
+    
+    def _column_width(self, column):
+        """Sütunun karakter cinsinden genişliğini döndürür (gizliyse 0)"""
+        return self.layout["column_widths"].get(column, self.layout["default_width"])
+    
+    def _column_pixels(self, column, scale):
+        """Sütun genişliğini Excel'in karakter birimi üzerinden yazıcı pikseline çevirir"""
+        # Excel: genişlik w karakter -> yaklaşık 7w + 5 piksel (96 dpi)
+        return (self._column_width(column) * 7 + 5) * self.dpi / 96.0 * scale
+    
+    def _row_pixels(self, scale):
+        """Satır yüksekliğini yazıcı pikseline çevirir"""
+        return self.layout["default_height"] * self.dpi / 72.0 * scale
+    
+    def _split_columns(self, printable_width):
+        """Sütunları kağıt genişliğine ve sütun sayfa sonlarına göre şeritlere böler"""
+        bands, band, width = [], [], 0
+        for column in self.columns:
+            column_width = self.widths[column]
+            if band and width + column_width > printable_width:
+                bands.append(band)
+                band, width = [], 0
+            band.append(column)
+            width += column_width
+            if column in self.layout["col_breaks"]:
+                bands.append(band)
+                band, width = [], 0
+        if band:
+            bands.append(band)
+        return bands
+    
+    def _split_rows(self, printable_height):
+        """Satırları kağıt yüksekliğine ve satır sayfa sonlarına göre (ilk, son) aralıklarına böler"""
+        rows_per_page = max(1, printable_height // self.row_height)
+        first_row, last_row = self.rows
+        hidden = self.layout["hidden_rows"]
+        breaks = self.layout["row_breaks"]
+        pages, start, count = [], first_row, 0
+        for row in range(first_row, last_row + 1):
+            if row not in hidden:
+                count += 1
+            if count == rows_per_page or row in breaks:
+                pages.append((start, row))
+                start, count = row + 1, 0
+        if start <= last_row or not pages:
+            pages.append((start, max(start, last_row)))
+        return pages
+    
+    def page_count(self):
+        """Sayfanın kaç kağıt tutacağını döndürür"""
+        return len(self.bands) * len(self.row_pages)
+    
+    def iter_pages(self, worksheet, first_page=0):
+        """Kağıtları Excel'in sırasıyla (önce aşağı, sonra sağa) üretir; her şerit için satırlar akışla okunur"""
+        per_band = len(self.row_pages)
+        for band_index, band in enumerate(self.bands):
+            if (band_index + 1) * per_band <= first_page:
+                continue
+            first_row_page = max(0, first_page - band_index * per_band)
+            start_row = self.row_pages[first_row_page][0]
+            rows = worksheet.iter_rows(
+                min_row=start_row, max_row=self.rows[1], min_col=band[0], max_col=band[-1], values_only=True
+            )
+            row_index = start_row
+            for page_first, page_last in self.row_pages[first_row_page:]:
+                page_rows = []
+                while row_index <= page_last:
+                    values = next(rows, ())
+                    if row_index not in self.layout["hidden_rows"]:
+                        page_rows.append(values)
+                    row_index += 1
+                yield self._render_page(band, page_rows)
+    
+    def _render_page(self, band, page_rows):
+        """Bir kağıda düşen satırları hücre hücre çizer"""
+        page = Image.new("1", self.page_size, 1)
+        draw = ImageDraw.Draw(page)
+        left, top = self.origin
+        # Salt okunur modda yalnızca aralıktaki sütunlar gelir; ilk sütun şeridin ilk sütunudur
+        offsets = [(band_column - band[0], self.widths[band_column]) for band_column in band]
+        right = left + sum(width for _, width in offsets)
+        bottom = top + len(page_rows) * self.row_height
+        
+        y = top
+        for values in page_rows:
+            x = left
+            for index, width in offsets:
+                value = values[index] if index < len(values) else None
+                text = format_value(value)
+                if text:
+                    inner = width - 2 * self.padding
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        # Sayılar sağa yaslanır
+                        text_x = x + width - self.padding - min(inner, self.glyphs.text_width(text))
+                    else:
+                        text_x = x + self.padding
+                    self.glyphs.draw(page, round(text_x), y, text, max_width=inner)
+                x += width
+            y += self.row_height
+        
+        if self.gridlines and page_rows:
+            x = left
+            draw.line((x, top, x, bottom), fill=0)
+            for _, width in offsets:
+                x += width
+                draw.line((x, top, x, bottom), fill=0)
+            for row in range(len(page_rows) + 1):
+                draw.line((left, top + row * self.row_height, right, top + row * self.row_height), fill=0)
+        return page
+
+
+class WorkbookRenderer:
+    """Çalışma kitabının görünen sayfalarını sırayla kağıtlara dizen sınıf"""
+    
+    def __init__(self, file_path, paper_size="A4", dpi=300, font_name=None, font_size=10, gridlines=True):
+        self.file_path = file_path
+        self.pagers = [
+            SheetPager(layout, paper_size, dpi, font_name, font_size, gridlines)
+            for layout in read_workbook_layout(file_path)
+        ]
+    
+    def page_count(self):
+        """Tüm sayfaların toplam kağıt sayısını döndürür"""
+        return sum(pager.page_count() for pager in self.pagers)
+    
+    def iter_pages(self, first_page=0):
+        """Kağıtları sayfa sayfa üretir; değerler salt okunur modda akışla okunur"""
+        workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            offset = 0
+            for pager in self.pagers:
+                count = pager.page_count()
+                if offset + count > first_page:
+                    worksheet = workbook[pager.layout["name"]]
+                    yield from pager.iter_pages(worksheet, max(0, first_page - offset))
+                offset += count
+        finally:
+            workbook.close()
\ No newline at end of file